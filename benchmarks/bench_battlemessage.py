@@ -0,0 +1,182 @@
+# benchmarks/bench_battlemessage.py
+
+"""Benchmark suite for BattleMessage.from_message, replaying the per-gen battle logs under tests/fixtures/battlelogs.
+
+Measures overall, per-gen and per-BMType parsing throughput in lines/sec, along with the peak memory of parsing every
+log, and compares them against the committed baseline in benchmarks/baselines/battlemessage.json. Any measurement that
+regresses past the threshold is flagged, and the run exits with status 1.
+
+Run from the repository root with `python -m benchmarks.bench_battlemessage`, adding `--update-baseline` to record a new
+baseline after an intended change. Baselines are machine specific, so only compare runs from the same machine.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from poketypes.showdown import BattleMessage, ParseStats, disable_parse_stats, enable_parse_stats
+
+REPO_ROOT = Path(__file__).parents[1]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "battlelogs"
+BASELINE_PATH = REPO_ROOT / "benchmarks" / "baselines" / "battlemessage.json"
+
+# BMTypes seen fewer times than this per pass are too noisy to flag regressions on
+MIN_BMTYPE_CALLS = 20
+
+
+def load_fixtures() -> Dict[str, List[str]]:
+    """Read every fixture battle log.
+
+    Returns:
+        Dict[str, List[str]]: The newline-stripped lines of each log, keyed by the log's name (like `gen9randombattle`).
+    """
+    return {path.stem: path.read_text(encoding="utf8").splitlines() for path in sorted(FIXTURE_DIR.glob("gen*.log"))}
+
+
+def time_lines(lines: List[str], repeat: int, number: int) -> float:
+    """Time parsing a list of lines, returning the best throughput over several repeats.
+
+    Args:
+        lines (List[str]): The battle message lines to parse.
+        repeat (int): The number of timing repeats, the best is reported.
+        number (int): The number of passes over the lines per timing repeat.
+
+    Returns:
+        float: The best throughput, in lines/sec.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            for line in lines:
+                BattleMessage.from_message(line)
+        best = min(best, time.perf_counter() - start)
+
+    return len(lines) * number / best
+
+
+def measure(fixtures: Dict[str, List[str]], repeat: int, number: int) -> Dict[str, Dict[str, float]]:
+    """Run every measurement of the benchmark suite.
+
+    Args:
+        fixtures (Dict[str, List[str]]): The lines of each fixture log.
+        repeat (int): The number of timing repeats, the best is reported.
+        number (int): The number of passes over the lines per timing repeat.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The overall, per-gen and per-BMType lines/sec, and the peak memory in bytes.
+    """
+    all_lines = [line for lines in fixtures.values() for line in lines]
+
+    # Warm up the parser caches, so every measurement sees the same steady state
+    BattleMessage.parse_many(all_lines)
+
+    results = {
+        "overall": {"lines_per_s": time_lines(all_lines, repeat, number)},
+        "gens": {name: time_lines(lines, repeat, number) for name, lines in fixtures.items()},
+    }
+
+    # Per-BMType throughput comes from the median parse time instrumentation saw, which shrugs off gc pauses
+    stats = enable_parse_stats(ParseStats())
+    try:
+        for _ in range(repeat * number):
+            for line in all_lines:
+                BattleMessage.from_message(line)
+    finally:
+        disable_parse_stats()
+
+    per_type = stats.snapshot().get("BattleMessage", {})
+    results["bmtypes"] = {
+        key: 1e6 / summary["p50_us"]
+        for key, summary in sorted(per_type.items())
+        if summary["calls"] >= MIN_BMTYPE_CALLS
+    }
+
+    tracemalloc.start()
+    try:
+        messages = BattleMessage.parse_many(all_lines)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del messages
+
+    results["memory"] = {"peak_bytes": peak}
+
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """Compare a run against the baseline, listing every measurement that regressed past the threshold.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The measurements of this run.
+        baseline (Dict[str, Dict[str, float]]): The baseline measurements.
+        threshold (float): The allowed relative regression, like 0.2 for 20%.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+
+    for section in ["overall", "gens", "bmtypes"]:
+        for key, base in baseline.get(section, {}).items():
+            current = results[section].get(key)
+            if current is not None and current < base * (1 - threshold):
+                regressions.append(f"{section}/{key}: {current:,.0f} lines/s vs baseline {base:,.0f} lines/s")
+
+    base_peak = baseline.get("memory", {}).get("peak_bytes")
+    peak = results["memory"]["peak_bytes"]
+    if base_peak is not None and peak > base_peak * (1 + threshold):
+        regressions.append(f"memory/peak_bytes: {peak:,} bytes vs baseline {base_peak:,} bytes")
+
+    return regressions
+
+
+def main():
+    """Run the benchmark suite, print the results, and check them against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="Number of timing repeats, the best is reported")
+    parser.add_argument("--number", type=int, default=10, help="Passes over the logs per timing repeat")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative regression to flag, like 0.2 for 20%%")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Path of the baseline JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    results = measure(fixtures, args.repeat, args.number)
+
+    print(f"{'overall':>24}: {results['overall']['lines_per_s']:>12,.0f} lines/s")
+    for name, lines_per_s in results["gens"].items():
+        print(f"{name:>24}: {lines_per_s:>12,.0f} lines/s")
+    for key, lines_per_s in results["bmtypes"].items():
+        print(f"{key:>24}: {lines_per_s:>12,.0f} lines/s")
+    print(f"{'peak memory':>24}: {results['memory']['peak_bytes']:>12,} bytes")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf8")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to record one")
+        return
+
+    regressions = find_regressions(results, json.loads(args.baseline.read_text(encoding="utf8")), args.threshold)
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
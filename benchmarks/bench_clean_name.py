@@ -0,0 +1,92 @@
+# benchmarks/bench_clean_name.py
+
+"""Micro-benchmark for poketypes.dex.clean_name against the original chained str.replace implementation.
+
+Run from the repository root with `python -m benchmarks.bench_clean_name`.
+"""
+
+import argparse
+import timeit
+import unicodedata
+from typing import List, Optional
+
+from poketypes.dex import DexAbility, DexItem, DexMove, DexPokemon, clean_name
+
+
+def legacy_clean_name(name: Optional[str]) -> Optional[str]:
+    """Clean a name the way clean_name did before it switched to a translation table.
+
+    Args:
+        name (Optional[str]): An optional name to clean.
+
+    Returns:
+        Optional[str]: The clean-form of the input name, if it wasn't None or blank.
+    """
+    if name is None or name == "":
+        return None
+
+    return (
+        unicodedata.normalize(
+            "NFKD",
+            name.upper()
+            .replace("-", "")
+            .replace("’", "")
+            .replace("'", "")
+            .replace(" ", "")
+            .replace("*", "")
+            .replace(":", "")
+            .replace("%", "")
+            .replace(".", "")
+            .replace(")", "")
+            .replace("(", ""),
+        )
+        .encode("ASCII", "ignore")
+        .decode("ASCII")
+    )
+
+
+def build_corpus() -> List[str]:
+    """Build display-like names from the Dex enums, along with some names that need unicode normalization.
+
+    Returns:
+        List[str]: The names to clean.
+    """
+    names = []
+    for dex_class, prefix in [
+        (DexPokemon, "POKEMON_"),
+        (DexMove, "MOVE_"),
+        (DexItem, "ITEM_"),
+        (DexAbility, "ABILITY_"),
+    ]:
+        names.extend(name.removeprefix(prefix).title() for name in dex_class.keys())
+
+    names.extend(["Flabébé", "Farfetch’d", "Mr. Mime", "Type: Null", "Zygarde-10%", "U-turn", "King's Rock"])
+    return names
+
+
+def main():
+    """Time both implementations over the corpus and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repeats, the best is reported")
+    parser.add_argument("--number", type=int, default=20, help="Passes over the corpus per timing repeat")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    assert [clean_name(name) for name in corpus] == [legacy_clean_name(name) for name in corpus]
+
+    # Timings are interleaved so that both implementations see the same machine noise
+    funcs = {"legacy": legacy_clean_name, "clean_name": clean_name}
+    results = {label: float("inf") for label in funcs}
+    for _ in range(args.repeat):
+        for label, func in funcs.items():
+            elapsed = timeit.timeit(lambda func=func: [func(name) for name in corpus], number=args.number)
+            results[label] = min(results[label], elapsed / (args.number * len(corpus)) * 1e9)
+
+    for label, best in results.items():
+        print(f"{label:>12}: {best:8.1f} ns/name")
+
+    print(f"{'speedup':>12}: {results['legacy'] / results['clean_name']:8.2f}x over {len(corpus)} names")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/bench_state.py
+
+"""Benchmark for BattleState, comparing copy-on-write forks against copy.deepcopy on the per-gen fixture battle logs.
+
+Each fixture log is replayed up to its midpoint, and the resulting state is then forked (or deep copied), both on its
+own and followed by applying the next turn's messages, the way a search would expand a node. Also measures how fast
+messages are applied to a BattleState, and the cost of rolling back to a snapshot.
+
+Run from the repository root with `python -m benchmarks.bench_state`.
+"""
+
+import argparse
+import copy
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from poketypes.showdown import BattleMessage, BattleState, BMType
+
+REPO_ROOT = Path(__file__).parents[1]
+FIXTURE_DIR = REPO_ROOT / "tests" / "fixtures" / "battlelogs"
+
+
+def load_battles() -> List[Tuple[List[BattleMessage], List[BattleMessage]]]:
+    """Parse every fixture battle log, splitting each at the turn nearest its midpoint.
+
+    Returns:
+        List[Tuple[List[BattleMessage], List[BattleMessage]]]: For each log, the messages up to the middle turn, and
+            the messages of the turn after it.
+    """
+    battles = []
+    for path in sorted(FIXTURE_DIR.glob("gen*.log")):
+        messages = BattleMessage.parse_many(path.read_text(encoding="utf8").splitlines())
+
+        turns = [i for i, m in enumerate(messages) if m.BMTYPE == BMType.turn]
+        start, end = turns[len(turns) // 2], turns[len(turns) // 2 + 1]
+        battles.append((messages[:start], messages[start:end]))
+
+    return battles
+
+
+def best_us(func: Callable[[], object], repeat: int, number: int) -> float:
+    """Time a function, returning the best time per call over several repeats.
+
+    Args:
+        func (Callable[[], object]): The function to time.
+        repeat (int): The number of timing repeats, the best is reported.
+        number (int): The number of calls per timing repeat.
+
+    Returns:
+        float: The best time per call, in microseconds.
+    """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1e6
+
+
+def expand(copier: Callable[[], BattleState], messages: List[BattleMessage]):
+    """Copy a state and apply messages to the copy, as a search would when expanding a node.
+
+    Args:
+        copier (Callable[[], BattleState]): Returns the copy to apply messages to.
+        messages (List[BattleMessage]): The messages to apply.
+    """
+    copier().apply_many(messages)
+
+
+def measure(
+    battles: List[Tuple[List[BattleMessage], List[BattleMessage]]], repeat: int, number: int
+) -> Dict[str, float]:
+    """Time forking, deep copying, restoring and applying messages, averaged over the battles.
+
+    Args:
+        battles (List[Tuple[List[BattleMessage], List[BattleMessage]]]): The split battles, as from `load_battles`.
+        repeat (int): The number of timing repeats, the best is reported.
+        number (int): The number of calls per timing repeat.
+
+    Returns:
+        Dict[str, float]: The average time of each operation, in microseconds.
+    """
+    totals: Dict[str, float] = {}
+
+    def add(label: str, elapsed: float):
+        totals[label] = totals.get(label, 0.0) + elapsed / len(battles)
+
+    for history, turn in battles:
+        state = BattleState.from_messages(history)
+        snapshot = state.snapshot()
+
+        add("fork", best_us(state.fork, repeat, number))
+        add("deepcopy", best_us(partial(copy.deepcopy, state), repeat, number))
+        add("fork + turn", best_us(partial(expand, state.fork, turn), repeat, number))
+        add("deepcopy + turn", best_us(partial(expand, partial(copy.deepcopy, state), turn), repeat, number))
+        add("restore", best_us(partial(state.restore, snapshot), repeat, number))
+        add("apply per message", best_us(partial(expand, BattleState, history), repeat, number) / len(history))
+
+    return totals
+
+
+def main():
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing repeats, the best is reported")
+    parser.add_argument("--number", type=int, default=200, help="Calls per timing repeat")
+    args = parser.parse_args()
+
+    battles = load_battles()
+    results = measure(battles, args.repeat, args.number)
+
+    for label, us in results.items():
+        print(f"{label:>20}: {us:10.2f} us")
+
+    print(f"{'fork speedup':>20}: {results['deepcopy'] / results['fork']:10.1f}x over {len(battles)} battles")
+    print(f"{'fork + turn speedup':>20}: {results['deepcopy + turn'] / results['fork + turn']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
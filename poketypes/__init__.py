@@ -6,4 +6,9 @@ Modules exported by this package:
     - `protos`: Contains tools related to protobuf generation.
 """
 
+import logging
+
 __version__ = "0.2.6"
+
+# Libraries shouldn't emit log records unless the application configures logging itself
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -8,10 +8,14 @@ Additionally, there is the pre-initialized POKEDEX object, which contain filled
 For example, POKEDEX.Gen(5).Pokemon(DexPokemon.POKEMON_MAGIKARP) will return a PokedexPokemon object with gen-5 relevant
 information for the pokemon Magikarp. POKEDEX.Gen(6).Item(DexItem.ITEM_ABSOLITE) will return information about the
 item Absolite as it is in gen6, etc..
+
+Since Dex values are sparse (DexPokemon values are {dex_number}{3-digit forme number}), dense_index maps the values of
+each Dex Enum to contiguous, versioned indices and back, such as for embedding tables or array lookups.
 """
 
 
-from .dexdata import AnyDex, cast2dex, clean_forme, clean_name
+from .denseindex import DenseIndex, dense_index, dense_index_version
+from .dexdata import AnyDex, cast2dex, cast2dex_many, clean_forme, clean_name, dex_lookup
 from .dexdata_pb2 import (
     DexAbility,
     DexCondition,
@@ -28,3 +32,4 @@ from .dexdata_pb2 import (
     DexWeather,
 )
 from .pokedex import PokedexItem, PokedexMove, PokedexPokemon
+from .pokedexinstance import POKEDEX, Pokedex, PokedexGen
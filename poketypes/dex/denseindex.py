@@ -0,0 +1,250 @@
+# poketypes/dex/denseindex.py
+
+"""Provides dense, contiguous indices for the sparse values of every Dex Enum, such as for embedding tables.
+
+Dex values are sparse on purpose: DexPokemon values are {dex_number}{3-digit forme number}, like 129000 for Magikarp or
+208001 for Scizor-Mega, so they can't index an array directly. dense_index maps each value of a Dex Enum to a dense
+index from 0 (always the enum's UNASSIGNED member) up to the number of values, and back.
+
+The dense order is stored in the generated `denseindex.json`, rather than derived from the Enums at runtime, so that it
+stays stable across data updates. Regenerating it after the Enums change (see protogen's `densegen`) only ever appends
+new values to the end of each Enum's order, and bumps the latest version, as given by dense_index_version. A model
+trained at one version can keep encoding with that version's dense indices by passing it to dense_index, which maps any
+value added since to 0. The file is only read the first time a dense index or the version is needed, not on import.
+"""
+
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .dexdata import DEX_PREFIXES, AnyDex
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# The generated file holding the dense order of every Dex Enum, and the size of each order at every version
+DENSE_INDEX_PATH = Path(__file__).with_name("denseindex.json")
+
+_dense_data: Optional[Dict] = None
+_dense_indices: Dict[Tuple[AnyDex, int], "DenseIndex"] = {}
+
+
+class DenseIndex:
+    """The dense index of every value of a Dex Enum, at a single version of the dense order.
+
+    The dense indices are held in a tuple and a dict, for single lookups, and as NumPy arrays (built on first use) for
+    the vectorized `to_dense` and `from_dense`.
+
+    Args:
+        dex_class (AnyDex): The Dex Enum.
+        version (int): The version of the dense order.
+        ids (Iterable[int]): The Enum values, in dense order.
+
+    Attributes:
+        DEX_CLASS (AnyDex): The Dex Enum
+        VERSION (int): The version of the dense order
+        IDS (Tuple[int, ...]): The Enum value of each dense index, in order
+        TO_DENSE (Dict[int, int]): The dense index of each Enum value
+    """
+
+    __slots__ = ("DEX_CLASS", "VERSION", "IDS", "TO_DENSE", "_arrays")
+
+    DEX_CLASS: AnyDex
+    VERSION: int
+    IDS: Tuple[int, ...]
+    TO_DENSE: Dict[int, int]
+
+    def __init__(self, dex_class: AnyDex, version: int, ids: Iterable[int]):  # noqa: D107
+        self.DEX_CLASS = dex_class
+        self.VERSION = version
+        self.IDS = tuple(ids)
+        self.TO_DENSE = {value: index for index, value in enumerate(self.IDS)}
+        self._arrays: Optional[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]] = None
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self.IDS)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"DenseIndex({self.DEX_CLASS.DESCRIPTOR.name}, version={self.VERSION}, size={len(self.IDS)})"
+
+    def _numpy_arrays(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Get the NumPy arrays of the index, building them on first use.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The Enum value of each dense index, the Enum values in sorted
+                order, and the dense index of each of the sorted values.
+        """
+        if self._arrays is None:
+            np = require_numpy("dense index arrays")
+            ids = np.array(self.IDS, dtype=np.int32)
+            order = np.argsort(ids, kind="stable").astype(np.int32)
+            self._arrays = (ids, ids[order], order)
+
+        return self._arrays
+
+    def to_dense(self, ids: "ArrayLike") -> "np.ndarray":
+        """Map an array of Enum values to their dense indices.
+
+        Args:
+            ids (ArrayLike): The Enum values, of any shape. Values that aren't part of this version of the dense order
+                (like ones added in a later version) map to 0, the index of the UNASSIGNED member. Requires numpy,
+                which raises an ImportError if it isn't installed.
+
+        Returns:
+            np.ndarray: An int32 array of the dense index of each value, of the same shape.
+        """
+        np = require_numpy("dense index arrays")
+        _, sorted_ids, order = self._numpy_arrays()
+
+        ids = np.asarray(ids)
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        return np.where(sorted_ids[positions] == ids, order[positions], 0).astype(np.int32, copy=False)
+
+    def from_dense(self, indices: "ArrayLike") -> "np.ndarray":
+        """Map an array of dense indices back to their Enum values.
+
+        Args:
+            indices (ArrayLike): The dense indices, of any shape. Indices past the end of this version of the dense
+                order raise an IndexError. Requires numpy, which raises an ImportError if it isn't installed.
+
+        Returns:
+            np.ndarray: An int32 array of the Enum value of each index, of the same shape.
+        """
+        ids, _, _ = self._numpy_arrays()
+        return ids[indices]
+
+
+def require_numpy(feature: str) -> ModuleType:
+    """Import NumPy, which poketypes only needs with its `ml` extra, explaining how to get it if it isn't installed.
+
+    Args:
+        feature (str): What numpy is needed for, like `encoding battle states`, to name in the error.
+
+    Raises:
+        ImportError: If numpy isn't installed.
+
+    Returns:
+        ModuleType: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError as ex:
+        raise ImportError(
+            f"numpy is required for {feature}, and can be installed with `pip install poketypes[ml]`"
+        ) from ex
+
+    return numpy
+
+
+def load_dense_data() -> Dict:
+    """Load the generated dense order of every Dex Enum, reading `denseindex.json` once on first use.
+
+    Returns:
+        Dict: The `version` of the dense order, and for each Enum (by name) under `enums`, its `ids` in dense order and
+            the `sizes` of its order at every version. This is shared, so it should not be modified.
+    """
+    global _dense_data
+
+    if _dense_data is None:
+        with open(DENSE_INDEX_PATH, "r", encoding="utf8") as f:
+            _dense_data = json.load(f)
+
+    return _dense_data
+
+
+def build_dense_data(previous: Optional[Dict] = None) -> Dict:
+    """Build the dense order of every Dex Enum, appending any values that are new since the previous dense order.
+
+    Every value keeps its dense index from the previous order, including values that were since removed from their
+    Enum. New values are appended in value order, and if there are any, the version goes up by one.
+
+    Args:
+        previous (Optional[Dict], optional): The previous dense data, as from load_dense_data. Defaults to None, to
+            start a new dense order at version 1.
+
+    Returns:
+        Dict: The new dense data, which is the previous data itself if no Enum gained a value.
+    """
+    previous_enums = previous["enums"] if previous is not None else {}
+
+    orders: Dict[str, List[int]] = {}
+    changed = previous is None
+    for dex_class in DEX_PREFIXES:
+        name = dex_class.DESCRIPTOR.name
+        ids = list(previous_enums[name]["ids"]) if name in previous_enums else []
+
+        seen = set(ids)
+        added = sorted({value for value in dex_class.values() if value not in seen})
+        changed = changed or bool(added)
+        orders[name] = ids + added
+
+    if not changed:
+        return previous
+
+    version = previous["version"] + 1 if previous is not None else 1
+    enums = {}
+    for name, ids in orders.items():
+        sizes = previous_enums[name]["sizes"] if name in previous_enums else []
+        # Enums that didn't exist yet had no values at the earlier versions
+        sizes = sizes + [0] * (version - 1 - len(sizes)) + [len(ids)]
+        enums[name] = {"ids": ids, "sizes": sizes}
+
+    return {"version": version, "enums": enums}
+
+
+def _check_version(version: int, latest: int) -> None:
+    """Check that a version of the dense order exists.
+
+    Args:
+        version (int): The requested version.
+        latest (int): The latest version.
+
+    Raises:
+        ValueError: If the version is below 1, or past the latest version.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if not 1 <= version <= latest:
+        raise ValueError(f"Dense index version {version} doesn't exist, the latest version is {latest}")
+
+
+def dense_index(dex_class: AnyDex, version: Optional[int] = None) -> DenseIndex:
+    """Get the dense index of every value of a Dex Enum.
+
+    EX:
+    dense_index(DexPokemon).TO_DENSE[DexPokemon.POKEMON_UNASSIGNED] -> 0
+
+    Args:
+        dex_class (AnyDex): Which Dex Enum to get the dense index of. Must be a valid Dex{NAME} class.
+        version (Optional[int], optional): The version of the dense order, such as the one a model was trained at.
+            Defaults to None, for the latest version (see dense_index_version). Versions that don't exist raise a
+            ValueError.
+
+    Returns:
+        DenseIndex: The dense index, which is built once per Enum and version, and shared by every call afterwards.
+    """
+    data = load_dense_data()
+    if version is None:
+        version = data["version"]
+
+    index = _dense_indices.get((dex_class, version))
+    if index is None:
+        _check_version(version, data["version"])
+
+        order = data["enums"][dex_class.DESCRIPTOR.name]
+        index = DenseIndex(dex_class, version, order["ids"][: order["sizes"][version - 1]])
+        _dense_indices[(dex_class, version)] = index
+
+    return index
+
+
+def dense_index_version() -> int:
+    """Get the latest version of the dense order, reading `denseindex.json` on first use.
+
+    Returns:
+        int: The latest version, which dense_index uses by default.
+    """
+    return load_dense_data()["version"]
@@ -3,7 +3,8 @@
 """Provides tools for cleaning Dex IDs back and forth from strings, as well as other utility functions."""
 
 import unicodedata
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
 
 from .dexdata_pb2 import (
     DexAbility,
@@ -37,10 +38,19 @@ AnyDex = Union[
     type[DexWeather],
 ]
 
+# Characters that clean_name strips from names in a single translate pass. Pure ASCII names go through the bytes
+# version, which is noticeably faster than str.translate with deletions
+_CLEAN_NAME_DELETE = "-’' *:%.)("
+_CLEAN_NAME_TABLE = str.maketrans("", "", _CLEAN_NAME_DELETE)
+_CLEAN_NAME_ASCII_DELETE = _CLEAN_NAME_DELETE.replace("’", "").encode("ASCII")
+
 
 def clean_name(name: Optional[str]) -> Optional[str]:
     """Format a given uncleaned string name as the format needed for searching the corresponding Enum.
 
+    Punctuation and spaces are stripped in one translation pass, and accented characters (like in Flabébé) are reduced
+    to ASCII. Names that are already pure ASCII skip the unicode normalization entirely.
+
     Args:
         name (Optional[str]): An optional name to clean. If None is given, we immediately return None.
 
@@ -50,25 +60,11 @@ def clean_name(name: Optional[str]) -> Optional[str]:
     if name is None or name == "":
         return None
 
-    clean_id = (
-        unicodedata.normalize(
-            "NFKD",
-            name.upper()
-            .replace("-", "")
-            .replace("’", "")
-            .replace("'", "")
-            .replace(" ", "")
-            .replace("*", "")
-            .replace(":", "")
-            .replace("%", "")
-            .replace(".", "")
-            .replace(")", "")
-            .replace("(", ""),
-        )
-        .encode("ASCII", "ignore")
-        .decode("ASCII")
-    )
-    return clean_id
+    if name.isascii():
+        return name.encode("ASCII").upper().translate(None, _CLEAN_NAME_ASCII_DELETE).decode("ASCII")
+
+    clean_id = name.upper().translate(_CLEAN_NAME_TABLE)
+    return unicodedata.normalize("NFKD", clean_id).encode("ASCII", "ignore").decode("ASCII")
 
 
 def clean_forme(species: DexPokemon.ValueType) -> DexPokemon.ValueType:
@@ -88,6 +84,54 @@ def clean_forme(species: DexPokemon.ValueType) -> DexPokemon.ValueType:
     return clean_species
 
 
+# Prefix that protoc puts in front of every entry name of each Dex Enum
+DEX_PREFIXES: Dict[AnyDex, str] = {
+    DexAbility: "ABILITY_",
+    DexCondition: "CONDITION_",
+    DexGen: "GEN_",
+    DexItem: "ITEM_",
+    DexMove: "MOVE_",
+    DexMoveCategory: "MOVECATEGORY_",
+    DexMoveTarget: "MOVETARGET_",
+    DexNature: "NATURE_",
+    DexPokemon: "POKEMON_",
+    DexStat: "STAT_",
+    DexStatus: "STATUS_",
+    DexType: "TYPE_",
+    DexWeather: "WEATHER_",
+}
+
+# Maximum number of distinct (name, dex_class) pairs that cast2dex remembers
+CAST2DEX_CACHE_SIZE = 8192
+
+_dex_lookups: Dict[AnyDex, Dict[str, int]] = {}
+
+
+def dex_lookup(dex_class: AnyDex) -> Dict[str, int]:
+    """Get the reverse lookup for a Dex Enum, mapping each cleaned name (without the enum prefix) to its value.
+
+    The lookup is built from the Enum once, on first use, and shared by every call afterwards. Aliased entries, such as
+    STAT_ATT and STAT_ATTACK, are all present and map to the same value.
+
+    EX:
+    dex_lookup(DexPokemon)["SCIZORMEGA"] -> 208001
+
+    Args:
+        dex_class (AnyDex): Which Dex Enum to build the lookup for. Must be a valid Dex{NAME} class.
+
+    Returns:
+        Dict[str, int]: The mapping of cleaned names to enum values. This is shared, so it should not be modified.
+    """
+    lookup = _dex_lookups.get(dex_class)
+    if lookup is None:
+        cut = len(DEX_PREFIXES[dex_class])
+        lookup = {name[cut:]: value for name, value in dex_class.items()}
+        _dex_lookups[dex_class] = lookup
+
+    return lookup
+
+
+@lru_cache(maxsize=CAST2DEX_CACHE_SIZE)
 def cast2dex(name: str, dex_class: AnyDex) -> int:
     """Clean and cast name to the corresponding entry in the given dex_class.
 
@@ -97,41 +141,46 @@ def cast2dex(name: str, dex_class: AnyDex) -> int:
     EX:
     Scizor-Mega -> Cleaned to: SCIZORMEGA -> DexPokemon.POKEMON_SCIZORMEGA (Which is secretly the int 208001)
 
+    Results are cached on the raw (name, dex_class) pair, so repeated names skip cleaning entirely and cost a single
+    cache lookup. Names that fail to cast are not cached.
+
     Args:
         name (str): The name of the entry.
         dex_class (AnyDex): Which Dex Enum to use in labeling. Must be a valid Dex{NAME} class.
 
+    Raises:
+        ValueError: If the cleaned name isn't an entry of the given dex_class.
+
     Returns:
         int: The corresponding value for this cleaned entry.
     """
     clean_id = clean_name(name)
 
-    if clean_id is None:
-        return clean_id
-
-    if dex_class == DexAbility:
-        return DexAbility.Value(f"ABILITY_{clean_id}")
-    elif dex_class == DexCondition:
-        return DexCondition.Value(f"CONDITION_{clean_id}")
-    elif dex_class == DexGen:
-        return DexGen.Value(f"GEN_{clean_id}")
-    elif dex_class == DexItem:
-        return DexItem.Value(f"ITEM_{clean_id}")
-    elif dex_class == DexMove:
-        return DexMove.Value(f"MOVE_{clean_id}")
-    elif dex_class == DexMoveCategory:
-        return DexMoveCategory.Value(f"MOVECATEGORY_{clean_id}")
-    elif dex_class == DexMoveTarget:
-        return DexMoveTarget.Value(f"MOVETARGET_{clean_id}")
-    elif dex_class == DexNature:
-        return DexNature.Value(f"NATURE_{clean_id}")
-    elif dex_class == DexPokemon:
-        return DexPokemon.Value(f"POKEMON_{clean_id}")
-    elif dex_class == DexStat:
-        return DexStat.Value(f"STAT_{clean_id}")
-    elif dex_class == DexStatus:
-        return DexStatus.Value(f"STATUS_{clean_id}")
-    elif dex_class == DexType:
-        return DexType.Value(f"TYPE_{clean_id}")
-    elif dex_class == DexWeather:
-        return DexWeather.Value(f"WEATHER_{clean_id}")
+    if clean_id is None or dex_class not in DEX_PREFIXES:
+        return None
+
+    try:
+        return dex_lookup(dex_class)[clean_id]
+    except KeyError:
+        pass  # fall out to break exception chaining
+
+    raise ValueError(
+        f"Enum {dex_class.DESCRIPTOR.name} has no value defined for name {DEX_PREFIXES[dex_class] + clean_id!r}"
+    )
+
+
+def cast2dex_many(names: Iterable[Optional[str]], dex_class: AnyDex) -> List[int]:
+    """Clean and cast every name to the corresponding entry in the given dex_class.
+
+    EX:
+    ["Scizor-Mega", None, "Magikarp"] -> [208001, None, 129000]
+
+    Args:
+        names (Iterable[Optional[str]]): The names of the entries. None or blank names are cast to None.
+        dex_class (AnyDex): Which Dex Enum to use in labeling. Must be a valid Dex{NAME} class.
+
+    Returns:
+        List[int]: The corresponding values for each of the names, in order. Like cast2dex, a ValueError is raised
+            if any of the cleaned names isn't an entry of the given dex_class.
+    """
+    return [cast2dex(name, dex_class) for name in names]
@@ -0,0 +1,413 @@
+# poketypes/dex/pokedexinstance.py
+
+"""Provides the pre-initialized POKEDEX object, which looks up the PokedexClass of any Dex ID as of any generation.
+
+EX:
+POKEDEX.Gen(5).Pokemon(DexPokemon.POKEMON_MAGIKARP) -> PokedexPokemon for Magikarp, as it was in gen 5
+
+The data comes from the per-gen json files that protogen's `fetch_latest` writes into `poketypes/protos/json`, one per
+generation and data type (like `gen5_pokedex.json`). Nothing is read up front: each generation's pokedex, moves and
+items tables are only read the first time one of their entries is looked up, so a bot that only plays gen 9 never reads
+the tables of gens 1 through 8. Each PokedexClass is likewise only built from its table entry on first lookup, and
+cached for every lookup afterwards.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from ..protos.statics import CURRENT_GEN
+from .dexdata import AnyDex, clean_name, dex_lookup
+from .dexdata_pb2 import (
+    DexAbility,
+    DexItem,
+    DexMove,
+    DexMoveCategory,
+    DexMoveTarget,
+    DexPokemon,
+    DexStat,
+    DexType,
+    DexWeather,
+)
+from .pokedex import PokedexItem, PokedexMove, PokedexPokemon, StatBlock
+
+# The directory that protogen's fetch_latest writes the per-gen json files into
+POKEDEX_DATA_DIR = Path(__file__).parents[1] / "protos" / "json"
+
+PokedexClass = Union[PokedexPokemon, PokedexMove, PokedexItem]
+
+# Boolean fields of moves.ts entries, mapped to the PokedexMove field each one sets
+_MOVE_BOOLEANS = {
+    "breaksProtect": "breaks_protect",
+    "ignoreAbility": "ignore_ability",
+    "ignoreDefensive": "ignore_defensive",
+    "ignoreEvasion": "ignore_evasion",
+    "ignoreImmunity": "ignore_immunity",
+    "multiaccuracy": "multiaccuracy",
+    "ohko": "ohko",
+    "stallingMove": "stalling_move",
+    "willCrit": "will_crit",
+    "hasCrashDamage": "has_crash_damage",
+    "hasSheerForce": "has_sheer_force",
+    "stealsBoosts": "steals_boosts",
+    "forceSwitch": "force_switch",
+    "mindBlownRecoil": "mindblown_recoil",
+    "struggleRecoil": "struggle_recoil",
+    "smartTarget": "smart_target",
+    "thawsTarget": "thaws_target",
+    "tracksTarget": "tracks_target",
+    "sleepUsable": "sleep_usable",
+    "noMetronome": "no_metronome",
+    "noSketch": "no_sketch",
+    "noPPBoosts": "no_ppboosts",
+}
+
+# The PokedexMove field set by each value of a moves.ts `selfSwitch`
+_SELF_SWITCHES = {True: "selfswitch_standard", "copyvolatile": "selfswitch_volatile", "shedtail": "selfswitch_shedtail"}
+
+# The DexStat of each stat key in a moves.ts `boosts`, which don't all match a DexStat label (like `atk`)
+_BOOST_STATS = {
+    "atk": DexStat.STAT_ATTACK,
+    "def": DexStat.STAT_DEFENCE,
+    "spa": DexStat.STAT_SPECIAL_ATTACK,
+    "spd": DexStat.STAT_SPECIAL_DEFENCE,
+    "spe": DexStat.STAT_SPEED,
+    "accuracy": DexStat.STAT_ACCURACY,
+    "evasion": DexStat.STAT_EVASION,
+}
+
+
+def _dex(name: Optional[str], dex_class: AnyDex) -> int:
+    """Cast a name from the showdown data to its Dex ID, or to the UNASSIGNED ID (0) if it has none, like type `???`."""
+    return dex_lookup(dex_class).get(clean_name(name), 0)
+
+
+def _build_pokemon(dex_id: int, entry: Dict) -> PokedexPokemon:
+    """Build a PokedexPokemon from its pokedex.ts entry.
+
+    Args:
+        dex_id (int): The DexPokemon ID of the pokemon.
+        entry (Dict): The pokemon's entry in the pokedex table.
+
+    Returns:
+        PokedexPokemon: The pokemon's PokedexClass.
+    """
+    base_name = entry.get("baseSpecies", entry["name"])
+    stats = entry["baseStats"]
+
+    return PokedexPokemon(
+        name=entry["name"],
+        id=dex_id,
+        base_name=base_name,
+        base_id=_dex(base_name, DexPokemon),
+        types=[_dex(ptype, DexType) for ptype in entry["types"]],
+        base_stats=StatBlock(
+            hp_stat=stats["hp"],
+            atk_stat=stats["atk"],
+            def_stat=stats["def"],
+            spa_stat=stats["spa"],
+            spd_stat=stats["spd"],
+            spe_stat=stats["spe"],
+        ),
+        abilities=[_dex(ability, DexAbility) for ability in entry.get("abilities", {}).values()],
+    )
+
+
+def _build_move(dex_id: int, entry: Dict) -> PokedexMove:
+    """Build a PokedexMove from its moves.ts entry.
+
+    Args:
+        dex_id (int): The DexMove ID of the move.
+        entry (Dict): The move's entry in the moves table.
+
+    Returns:
+        PokedexMove: The move's PokedexClass.
+    """
+    fields = {
+        "name": entry["name"],
+        "id": dex_id,
+        "base_power": entry.get("basePower", 0),
+        "pp": entry.get("pp", 0),
+        "priority": entry.get("priority", 0),
+        "crit_ratio": entry.get("critRatio", 1),
+        "category": _dex(entry.get("category"), DexMoveCategory),
+        "target": _dex(entry.get("target"), DexMoveTarget),
+        "mtype": _dex(entry.get("type"), DexType),
+    }
+
+    for key, field in _MOVE_BOOLEANS.items():
+        if entry.get(key):
+            fields[field] = True
+
+    for flag in entry.get("flags", {}):
+        if f"flag_{flag}" in PokedexMove.model_fields:
+            fields[f"flag_{flag}"] = True
+
+    if entry.get("selfdestruct") == "always":
+        fields["selfdestruct_always"] = True
+    elif entry.get("selfdestruct") == "ifHit":
+        fields["selfdestruct_ifhit"] = True
+
+    if entry.get("selfSwitch") in _SELF_SWITCHES:
+        fields[_SELF_SWITCHES[entry["selfSwitch"]]] = True
+
+    if entry.get("damage") == "level":
+        fields["level_damage"] = True
+    elif isinstance(entry.get("damage"), int):
+        fields["direct_damage"] = entry["damage"]
+
+    # Moves that can't miss have an accuracy of `true`
+    if not isinstance(entry.get("accuracy", True), bool):
+        fields["accuracy"] = entry["accuracy"]
+
+    multihit = entry.get("multihit")
+    if multihit is not None:
+        fields["multihit"] = (multihit, multihit) if isinstance(multihit, int) else tuple(multihit)
+
+    for key in ("drain", "heal", "recoil"):
+        if key in entry:
+            fields[key] = tuple(entry[key])
+
+    if "boosts" in entry:
+        fields["boosts"] = {_BOOST_STATS[stat]: boost for stat, boost in entry["boosts"].items()}
+
+    if "weather" in entry:
+        fields["weather"] = _dex(entry["weather"], DexWeather)
+
+    return PokedexMove(**fields)
+
+
+def _build_item(dex_id: int, entry: Dict) -> PokedexItem:
+    """Build a PokedexItem from its items.ts entry.
+
+    Args:
+        dex_id (int): The DexItem ID of the item.
+        entry (Dict): The item's entry in the items table.
+
+    Returns:
+        PokedexItem: The item's PokedexClass.
+    """
+    natural_gift = entry.get("naturalGift", {})
+    z_move = entry.get("zMove")
+    mega_stone = entry.get("megaStone")
+    mega_evolves = entry.get("megaEvolves")
+
+    return PokedexItem(
+        name=entry["name"],
+        id=dex_id,
+        is_gem=entry.get("isGem", False),
+        is_berry=entry.get("isBerry", False),
+        naturalgift_base_power=natural_gift.get("basePower"),
+        naturalgift_type=_dex(natural_gift["type"], DexType) if "type" in natural_gift else None,
+        item_users=[_dex(user, DexPokemon) for user in entry.get("itemUser", [])],
+        zmove_to=_dex(z_move, DexMove) if isinstance(z_move, str) else None,
+        zmove_from=_dex(entry["zMoveFrom"], DexMove) if "zMoveFrom" in entry else None,
+        mega_evolves=_dex(mega_evolves, DexPokemon) if isinstance(mega_evolves, str) else None,
+        mega_forme=_dex(mega_stone, DexPokemon) if isinstance(mega_stone, str) else None,
+        ignore_klutz=entry.get("ignoreKlutz", False),
+        fling_basepower=entry.get("fling", {}).get("basePower"),
+    )
+
+
+# The Dex Enum of each table's keys, and the function that builds a PokedexClass from one of its entries
+_TABLES: Dict[str, Tuple[AnyDex, Callable[[int, Dict], PokedexClass]]] = {
+    "pokedex": (DexPokemon, _build_pokemon),
+    "moves": (DexMove, _build_move),
+    "items": (DexItem, _build_item),
+}
+
+
+def _index_table(table: str, data: Dict[str, Dict]) -> Dict[int, Dict]:
+    """Key the entries of a table by Dex ID, including the cosmetic formes of each pokemon.
+
+    Args:
+        table (str): The table name, one of `pokedex`, `moves` or `items`.
+        data (Dict[str, Dict]): The table's json data, keyed by showdown id.
+
+    Returns:
+        Dict[int, Dict]: The entries of every key that has a Dex ID, keyed by that ID.
+    """
+    lookup = dex_lookup(_TABLES[table][0])
+
+    entries: Dict[int, Dict] = {}
+    for key, entry in data.items():
+        dex_id = lookup.get(key.upper())
+        if dex_id is None:
+            continue
+        entries[dex_id] = entry
+
+        # Cosmetic formes share their base forme's entry, under their own name and ID
+        for cosmetic in entry.get("cosmeticFormes", []) if table == "pokedex" else ():
+            cosmetic_id = lookup.get(clean_name(cosmetic))
+            if cosmetic_id is not None:
+                entries[cosmetic_id] = {
+                    **entry,
+                    "name": cosmetic,
+                    "baseSpecies": entry.get("baseSpecies", entry["name"]),
+                }
+
+    return entries
+
+
+def _check_entry(entry: Optional[Dict], table: str, gen: int, dex_id: int) -> None:
+    """Check that a table had an entry for a Dex ID.
+
+    Args:
+        entry (Optional[Dict]): The entry found, if any.
+        table (str): The table name.
+        gen (int): The generation of the table.
+        dex_id (int): The looked up Dex ID.
+
+    Raises:
+        ValueError: If there was no entry.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if entry is None:
+        raise ValueError(f"The gen {gen} {table} data has no entry for {_TABLES[table][0].DESCRIPTOR.name} {dex_id}")
+
+
+def _check_gen(gen: int) -> None:
+    """Check that a generation exists.
+
+    Args:
+        gen (int): The generation.
+
+    Raises:
+        ValueError: If the generation is below 1, or past CURRENT_GEN.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if not 1 <= gen <= CURRENT_GEN:
+        raise ValueError(f"Gen {gen} doesn't exist, expected a gen from 1 to {CURRENT_GEN}")
+
+
+class PokedexGen:
+    """The pokedex of a single generation, which reads each of its tables on first use.
+
+    Looking up an ID that the generation's data has no entry for raises a ValueError, and looking up any ID from a table
+    whose json file wasn't written (see protogen's `fetch_latest`) raises a FileNotFoundError.
+
+    Args:
+        gen (int): The generation.
+        data_dir (Path): The directory holding the per-gen json files.
+    """
+
+    __slots__ = ("GEN", "_data_dir", "_tables", "_models")
+
+    def __init__(self, gen: int, data_dir: Path):  # noqa: D107
+        self.GEN = gen
+        self._data_dir = data_dir
+        self._tables: Dict[str, Dict[int, Dict]] = {}
+        self._models: Dict[Tuple[str, int], PokedexClass] = {}
+
+    def Pokemon(self, pokemon: DexPokemon.ValueType) -> PokedexPokemon:  # noqa: N802
+        """Look up a pokemon species (or forme) as it was in this generation.
+
+        Args:
+            pokemon (DexPokemon.ValueType): The DexPokemon ID of the pokemon.
+
+        Returns:
+            PokedexPokemon: The pokemon's PokedexClass, which is built once and shared by every lookup afterwards.
+        """
+        return self._lookup("pokedex", pokemon)
+
+    def Move(self, move: DexMove.ValueType) -> PokedexMove:  # noqa: N802
+        """Look up a move as it was in this generation.
+
+        Args:
+            move (DexMove.ValueType): The DexMove ID of the move.
+
+        Returns:
+            PokedexMove: The move's PokedexClass, which is built once and shared by every lookup afterwards.
+        """
+        return self._lookup("moves", move)
+
+    def Item(self, item: DexItem.ValueType) -> PokedexItem:  # noqa: N802
+        """Look up an item as it was in this generation.
+
+        Args:
+            item (DexItem.ValueType): The DexItem ID of the item.
+
+        Returns:
+            PokedexItem: The item's PokedexClass, which is built once and shared by every lookup afterwards.
+        """
+        return self._lookup("items", item)
+
+    def _lookup(self, table: str, dex_id: int) -> PokedexClass:
+        """Look up the PokedexClass of an ID in one of the generation's tables, building and caching it on first use.
+
+        Args:
+            table (str): The table name, one of `pokedex`, `moves` or `items`.
+            dex_id (int): The Dex ID to look up.
+
+        Returns:
+            PokedexClass: The ID's PokedexClass.
+        """
+        model = self._models.get((table, dex_id))
+        if model is None:
+            entry = self._table(table).get(dex_id)
+            _check_entry(entry, table, self.GEN, dex_id)
+
+            model = self._models[(table, dex_id)] = _TABLES[table][1](dex_id, entry)
+
+        return model
+
+    def _table(self, table: str) -> Dict[int, Dict]:
+        """Get one of the generation's tables, reading its json file on first use.
+
+        Args:
+            table (str): The table name, one of `pokedex`, `moves` or `items`.
+
+        Returns:
+            Dict[int, Dict]: The table's entries, keyed by Dex ID.
+        """
+        entries = self._tables.get(table)
+        if entries is None:
+            with open(self._data_dir / f"gen{self.GEN}_{table}.json", "r", encoding="utf8") as f:
+                entries = self._tables[table] = _index_table(table, json.load(f))
+
+        return entries
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"PokedexGen({self.GEN}, loaded={sorted(self._tables)})"
+
+
+class Pokedex:
+    """The pokedex of every generation, which are only created (and read) once they are first used.
+
+    Args:
+        data_dir (Path, optional): The directory holding the per-gen json files. Defaults to POKEDEX_DATA_DIR.
+    """
+
+    __slots__ = ("_data_dir", "_gens")
+
+    def __init__(self, data_dir: Path = POKEDEX_DATA_DIR):  # noqa: D107
+        self._data_dir = Path(data_dir)
+        self._gens: Dict[int, PokedexGen] = {}
+
+    def Gen(self, gen: Optional[int] = None) -> PokedexGen:  # noqa: N802
+        """Get the pokedex of a generation.
+
+        Args:
+            gen (Optional[int], optional): The generation, from 1 to CURRENT_GEN. Defaults to None, for CURRENT_GEN.
+                Generations that don't exist raise a ValueError.
+
+        Returns:
+            PokedexGen: The generation's pokedex, which is created once and shared by every call afterwards.
+        """
+        if gen is None:
+            gen = CURRENT_GEN
+
+        pokedex_gen = self._gens.get(gen)
+        if pokedex_gen is None:
+            _check_gen(gen)
+            pokedex_gen = self._gens[gen] = PokedexGen(gen, self._data_dir)
+
+        return pokedex_gen
+
+
+# The pre-initialized pokedex of every generation, read from POKEDEX_DATA_DIR
+POKEDEX = Pokedex()
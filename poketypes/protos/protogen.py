@@ -472,6 +472,25 @@ def protogen():
         f.write(proto_str)
 
 
+def densegen():
+    """Update the dense index order of every Dex Enum in "poketypes/dex/denseindex.json".
+
+    This must be run after the python Enums were recreated with `protoc`, since the dense order is built from them.
+    Values that are new since the last update are appended to the end of each Enum's dense order, so the dense index of
+    every existing value is unchanged, and the dense index version goes up by one. If no Enum gained a value, the file
+    is left as it is.
+    """
+    from poketypes.dex.denseindex import DENSE_INDEX_PATH, build_dense_data, load_dense_data
+
+    previous = load_dense_data() if DENSE_INDEX_PATH.exists() else None
+    data = build_dense_data(previous)
+
+    if data is not previous:
+        with open(DENSE_INDEX_PATH, "w", encoding="utf8") as f:
+            json.dump(data, f, indent=1)
+            f.write("\n")
+
+
 def fetch_latest(verbose: bool = True):
     """Fetch and process the latest Pokemon Showdown typescript data files into more usable json files.
 
@@ -532,3 +551,4 @@ if __name__ == "__main__":
     # fetch_latest()
 
     protogen()
+    # densegen()
@@ -5,7 +5,75 @@ related to a specific battle or is a general message. Then, you should pass each
 to either Message.from_message or BattleMessage.from_message, which will parse, validate, and return the corresponding
 Message/BattleMessage object to you. The returned object will be a subclass of Message/BattleMessage, unless an error
 in parsing ocurred, in which case it will be a plain Message/BattleMessage with error information.
+
+Parsing failures are never printed. They are recorded with the current ParseErrorSink (see get_error_sink and
+set_error_sink), which counts failures per message key and error state, samples a few failing lines, and logs a single
+warning to the `poketypes` logger the first time each kind of failure is seen.
+
+To find out which message types dominate parsing time, enable_parse_stats turns on per message type call counts,
+failure counts, and parse latency percentiles, which can be read at any time from the returned ParseStats' snapshot.
+
+If most of the battle messages will only ever be dispatched on their BMTYPE, LazyBattleMessage.from_message can be used
+instead, which defers parsing the rest of the message until one of its fields is first read.
+
+Whole multi-line battle frames can be handed to BattleMessage.parse_block (or a batch of lines to
+BattleMessage.parse_many), which parses every line in one pass and collects failures as ParseFailure records instead of
+printing them. When only some BMTypes matter, a BattleMessageParser built with an allow-list or deny-list of BMTypes
+only fully parses those, leaving every other message as an unparsed LazyBattleMessage (or skipping it). Frames still
+in their raw bytes can go to BattleMessage.parse_bytes (or BattleMessageParser.parse_bytes) instead, which only decodes
+the lines it parses, leaving text and HTML payloads like `|raw|` and `|c|` undecoded until they're read.
+
+Saved battle logs (plain or gzip compressed) can be streamed with iter_battle_log, which reads and parses the log in
+fixed-size chunks rather than loading the whole file into memory. Whole corpora of battle logs can be parsed across
+several worker processes with parse_corpus, which also tallies the corpus' parse errors by ERR_STATE.
+
+Bots that multiplex many rooms over one websocket can hand each raw frame to a FrameRouter, which works out each
+frame's room, parses battle rooms with BattleMessage and every other room with Message, and puts the messages on a
+bounded, ordered queue per room that a consumer task per room reads from with asyncio.
+
+For load testing without real logs, synthetic_battle generates a seeded, randomly played battle for any gen, drawing
+its species, moves, items and abilities from the Dex Enums. iter_synthetic_log, write_synthetic_log and
+write_synthetic_corpus produce back to back synthetic battles up to a target size, or a whole corpus of battle logs.
+
+The JSON payloads of messages like `|request|` are decoded with the fastest installed JSON library (orjson, then ujson,
+then the standard library's json), which get_json_backend and set_json_backend can inspect or override. Since the
+server resends the whole team with every request, a battle's requests can also be parsed with a RequestCache, which
+reuses the RequestPoke and ActiveOption objects of every pokemon and active slot that didn't change since the last one.
+
+Agents can hand a parsed request to encode_request, which encodes every legal move, switch, gimmick and target of each
+active slot into a fixed-size NumPy mask (numpy being an optional dependency), along with the matching `/choose`
+strings, in singles and doubles.
+
+Rather than every consumer tracking the battle by hand, a BattleState follows a battle as its messages are applied one
+at a time, keeping the HP, status, boosts, volatiles, items and abilities of each pokemon (PokemonState), the active
+pokemon and side conditions of each side (SideState), and the weather, terrain and field conditions in compact
+`__slots__` classes.
+
+For training models, a StateEncoder encodes BattleStates (a batch of battles at once, or every turn of a replay) into
+preallocated NumPy arrays of the features declared by a FeatureSpec, with embedding indices or one-hot columns for
+species, moves, items, abilities, types, status and weather, and HP fractions and boost stages for each pokemon.
 """
 
-from .battlemessage import BattleMessage, BMType, PokemonIdentifier
+from .actions import LegalActions, encode_request
+from .battlelog import iter_battle_log
+from .battlemessage import (
+    BattleMessage,
+    BattleMessageParser,
+    BMType,
+    LazyBattleMessage,
+    MessageTokens,
+    ParseFailure,
+    PokemonDetails,
+    PokemonIdentifier,
+    RequestCache,
+    parse_condition,
+)
+from .corpus import BattleLogResult, CorpusReport, parse_corpus
+from .errors import ParseErrorSink, get_error_sink, set_error_sink
+from .features import EncodedStates, FeatureSpec, StateEncoder
+from .instrumentation import ParseStats, disable_parse_stats, enable_parse_stats, get_parse_stats
+from .jsonbackend import get_json_backend, set_json_backend
+from .router import GLOBAL_ROOM, FrameRouter
 from .showdownmessage import Message, MType
+from .state import BattleState, PokemonState, SideState
+from .synthetic import iter_synthetic_log, synthetic_battle, write_synthetic_corpus, write_synthetic_log
@@ -0,0 +1,338 @@
+# poketypes/showdown/actions.py
+
+"""Contains an encoder that turns a BattleMessage_request into a fixed-size legal-action mask and `/choose` strings.
+
+Every decision a player can make for one active slot is numbered in a fixed action space of SLOT_ACTIONS actions:
+
+- `move N [TARGET] [GIMMICK]`, for each of the ACTION_MOVES moves, MOVE_GIMMICKS and MOVE_TARGETS
+- `switch N`, for each of the ACTION_TEAM team members (`team N` during team preview)
+- `pass`
+
+A request is encoded into a mask of shape (ACTION_SLOTS, SLOT_ACTIONS), where `mask[slot, action]` is True if the action
+is legal for that active slot, along with a table of the matching choice strings. This covers singles and doubles. The
+mask only holds per-slot legality, so choices that depend on both slots in doubles (only one gimmick per turn, or not
+switching both slots to the same pokemon) are left for the caller to check.
+
+NumPy is an optional dependency of poketypes, installed with the `ml` extra, and is only imported once a mask is built.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..dex import DexMoveTarget
+from ..dex.denseindex import require_numpy
+from .battlemessage import ActiveOption, BattleMessage_request, RequestPoke
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The most active slots per side that the action space covers (doubles)
+ACTION_SLOTS = 2
+# The most moves a pokemon can have
+ACTION_MOVES = 4
+# The most pokemon a team can have
+ACTION_TEAM = 6
+
+# The gimmicks a move can be used with, in action order. The empty gimmick uses the move as is
+MOVE_GIMMICKS: Tuple[str, ...] = ("", "mega", "zmove", "dynamax", "terastallize")
+# The targets a move can be aimed at, in action order. None leaves the target to the server, as in singles
+MOVE_TARGETS: Tuple[Optional[int], ...] = (None, 1, 2, -1, -2)
+
+# The number of move actions, which come first in a slot's actions
+MOVE_ACTIONS = ACTION_MOVES * len(MOVE_GIMMICKS) * len(MOVE_TARGETS)
+# The index of the first switch action, for the first team member
+SWITCH_ACTION = MOVE_ACTIONS
+# The index of the pass action
+PASS_ACTION = SWITCH_ACTION + ACTION_TEAM
+# The number of actions of a single active slot
+SLOT_ACTIONS = PASS_ACTION + 1
+
+# The DexMoveTarget values whose target has to be picked in doubles, mapped to who can be picked: foes, the ally, and/or
+# the user itself. Every other move target is left to the server.
+_CHOSEN_TARGETS: Dict[int, Tuple[bool, bool, bool]] = {
+    DexMoveTarget.MOVETARGET_NORMAL: (True, True, False),
+    DexMoveTarget.MOVETARGET_ANY: (True, True, False),
+    DexMoveTarget.MOVETARGET_ADJACENTFOE: (True, False, False),
+    DexMoveTarget.MOVETARGET_ADJACENTALLY: (False, True, False),
+    DexMoveTarget.MOVETARGET_ADJACENTALLYORSELF: (False, True, True),
+}
+
+
+class LegalActions(NamedTuple):
+    """The legal actions of a request, as encoded by `encode_request`.
+
+    Attributes:
+        REQUEST_TYPE (str): The REQUEST_TYPE of the encoded request
+        SLOTS (int): The number of active slots that have to make a choice (1 in singles, 2 in doubles, 0 while
+            waiting)
+        MASK (np.ndarray): A bool array of shape (ACTION_SLOTS, SLOT_ACTIONS), True for each legal action of each slot
+        CHOICES (Tuple[Tuple[str, ...], ...]): The choice string of every action of every slot, or an empty string if
+            the action is never legal for this request type
+    """
+
+    REQUEST_TYPE: str
+    SLOTS: int
+    MASK: "np.ndarray"
+    CHOICES: Tuple[Tuple[str, ...], ...]
+
+    def choose(self, actions: Sequence[int]) -> str:
+        """Build the `/choose` command for one action per active slot.
+
+        Args:
+            actions (Sequence[int]): The index of the chosen action of each active slot, in slot order. Any actions past
+                SLOTS are ignored.
+
+        Raises:
+            ValueError: If fewer actions than SLOTS are given, or a chosen action isn't legal.
+
+        Returns:
+            str: The choice, like `move 1 +2 terastallize, switch 3`, to be sent as `/choose CHOICE|RQID`.
+        """
+        if len(actions) < self.SLOTS:
+            raise ValueError(f"Expected an action for each of the {self.SLOTS} slots, got {len(actions)}")
+
+        choices = []
+        for slot, action in enumerate(actions[: self.SLOTS]):
+            if not self.MASK[slot, action]:
+                raise ValueError(f"Action {action} ({self.CHOICES[slot][action]!r}) isn't legal for slot {slot}")
+            choices.append(self.CHOICES[slot][action])
+
+        return ", ".join(choices)
+
+
+def move_action(move: int, gimmick: str = "", target: Optional[int] = None) -> int:
+    """Get the index of a move action.
+
+    Args:
+        move (int): The index of the move in the pokemon's moves, from 0.
+        gimmick (str, optional): The gimmick to use the move with, one of MOVE_GIMMICKS. Defaults to "".
+        target (Optional[int], optional): The target of the move, one of MOVE_TARGETS. Defaults to None.
+
+    Returns:
+        int: The index of the action in a slot's actions.
+    """
+    return (move * len(MOVE_GIMMICKS) + MOVE_GIMMICKS.index(gimmick)) * len(MOVE_TARGETS) + MOVE_TARGETS.index(target)
+
+
+def switch_action(position: int) -> int:
+    """Get the index of a switch action (or a team action during team preview).
+
+    Args:
+        position (int): The index of the pokemon in the request's POKEMON, from 0.
+
+    Returns:
+        int: The index of the action in a slot's actions.
+    """
+    return SWITCH_ACTION + position
+
+
+@lru_cache(maxsize=None)
+def choice_table(request_type: str) -> Tuple[Tuple[str, ...], ...]:
+    """Get the choice string of every action of every slot, for a request type.
+
+    The table only depends on the request type, so it is built once per type and shared by every encoded request.
+
+    Args:
+        request_type (str): One of the REQUEST_TYPEs of BattleMessage_request.
+
+    Returns:
+        Tuple[Tuple[str, ...], ...]: For each of the ACTION_SLOTS slots, the SLOT_ACTIONS choice strings, with an empty
+            string for actions that are never legal for this request type.
+    """
+    choices = [""] * SLOT_ACTIONS
+
+    if request_type == "ACTIVE":
+        for move in range(ACTION_MOVES):
+            for gimmick in MOVE_GIMMICKS:
+                for target in MOVE_TARGETS:
+                    choice = f"move {move + 1}"
+                    if target is not None:
+                        choice += f" {target:+d}"
+                    if gimmick:
+                        choice += f" {gimmick}"
+                    choices[move_action(move, gimmick, target)] = choice
+
+    if request_type in ("ACTIVE", "FORCESWITCH"):
+        for position in range(ACTION_TEAM):
+            choices[switch_action(position)] = f"switch {position + 1}"
+        choices[PASS_ACTION] = "pass"
+    elif request_type == "TEAMPREVIEW":
+        for position in range(ACTION_TEAM):
+            choices[switch_action(position)] = f"team {position + 1}"
+
+    return tuple(tuple(choices) for _ in range(ACTION_SLOTS))
+
+
+@lru_cache(maxsize=None)
+def _target_actions(slots: int, slot: int, move_target: Optional[int]) -> Tuple[int, ...]:
+    """Get the indices in MOVE_TARGETS that a move can be aimed at.
+
+    Args:
+        slots (int): The number of active slots per side.
+        slot (int): The index of the user's active slot, from 0.
+        move_target (Optional[int]): The DexMoveTarget of the move, if known.
+
+    Returns:
+        Tuple[int, ...]: The indices of the legal targets in MOVE_TARGETS.
+    """
+    if slots == 1 or move_target not in _CHOSEN_TARGETS:
+        return (MOVE_TARGETS.index(None),)
+
+    foes, ally, user = _CHOSEN_TARGETS[move_target]
+
+    targets = []
+    if foes:
+        targets.extend(MOVE_TARGETS.index(foe) for foe in range(1, slots + 1))
+    if ally:
+        targets.append(MOVE_TARGETS.index(-(slots - slot)))
+    if user:
+        targets.append(MOVE_TARGETS.index(-(slot + 1)))
+
+    return tuple(targets)
+
+
+def _healthy(poke: RequestPoke) -> bool:
+    """Whether a pokemon hasn't fainted.
+
+    Args:
+        poke (RequestPoke): The pokemon.
+
+    Returns:
+        bool: Whether the pokemon has HP left.
+    """
+    return poke.CUR_HP > 0
+
+
+def _mark_active_slot(
+    mask: bytearray, offset: int, slots: int, slot: int, option: ActiveOption, poke: RequestPoke, bench: List[int]
+) -> None:
+    """Mark the legal actions of an active slot in an ACTIVE request.
+
+    Args:
+        mask (bytearray): The flattened mask being built.
+        offset (int): The index of the slot's first action in the flattened mask.
+        slots (int): The number of active slots per side.
+        slot (int): The index of the active slot, from 0.
+        option (ActiveOption): The slot's options from the request.
+        poke (RequestPoke): The pokemon in the slot.
+        bench (List[int]): The positions of the pokemon that can be switched in.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if not _healthy(poke) or poke.COMMANDING:
+        mask[offset + PASS_ACTION] = 1
+        return
+
+    for move, data in enumerate(option.MOVES[:ACTION_MOVES]):
+        if data.DISABLED:
+            continue
+
+        gimmicks = [(0, data.TARGET)]
+        if option.CAN_MEGA:
+            gimmicks.append((1, data.TARGET))
+        if data.CAN_ZMOVE:
+            gimmicks.append((2, data.ZMOVE_TARGET if data.ZMOVE_TARGET is not None else data.TARGET))
+        if option.CAN_DYNA:
+            gimmicks.append((3, data.DYNAMAX_TARGET if data.DYNAMAX_TARGET is not None else data.TARGET))
+        if option.CAN_TERA:
+            gimmicks.append((4, data.TARGET))
+
+        for gimmick, move_target in gimmicks:
+            start = offset + (move * len(MOVE_GIMMICKS) + gimmick) * len(MOVE_TARGETS)
+            for target in _target_actions(slots, slot, move_target):
+                mask[start + target] = 1
+
+    if not option.TRAPPED:
+        for position in bench:
+            mask[offset + SWITCH_ACTION + position] = 1
+
+
+def _check_slots(slots: int) -> None:
+    """Check that a request's active slots fit in the action space.
+
+    Args:
+        slots (int): The number of active slots of the request.
+
+    Raises:
+        ValueError: If the request has more than ACTION_SLOTS active slots, such as in triples.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if slots > ACTION_SLOTS:
+        raise ValueError(f"Requests with {slots} active slots don't fit in the {ACTION_SLOTS} slot action space")
+
+
+def encode_request(request: BattleMessage_request) -> LegalActions:
+    """Encode the legal actions of a request into a fixed-size mask, and the choice strings to send for them.
+
+    For ACTIVE requests, each move that isn't disabled is legal, alone or with each gimmick the slot can use, aimed at
+    each target its move target allows in doubles. Switching to any healthy benched pokemon is legal unless the slot is
+    trapped, and a slot whose pokemon has fainted (or is commanding) can only pass.
+
+    For FORCESWITCH requests, forced slots can switch to any healthy benched pokemon (or any fainted one, when picking
+    who Revival Blessing revives), and can only pass if there aren't enough pokemon left to switch every forced slot.
+    Every other slot passes.
+
+    For TEAMPREVIEW requests, the first slot picks which pokemon leads. WAIT requests have no legal actions.
+
+    Args:
+        request (BattleMessage_request): The request to encode. Moves past ACTION_MOVES and pokemon past ACTION_TEAM
+            are left out of the mask, and requests for more than ACTION_SLOTS active slots raise a ValueError.
+            Encoding requires numpy, which raises an ImportError if it isn't installed.
+
+    Returns:
+        LegalActions: The legal action mask and the matching choice strings.
+    """
+    np = require_numpy("encoding legal actions")
+
+    request_type = request.REQUEST_TYPE
+    pokemon = request.POKEMON[:ACTION_TEAM]
+    mask = bytearray(ACTION_SLOTS * SLOT_ACTIONS)
+
+    if request_type == "ACTIVE":
+        slots = len(request.ACTIVE_OPTIONS)
+    elif request_type == "FORCESWITCH":
+        slots = len(request.FORCESWITCH_SLOTS)
+    elif request_type == "TEAMPREVIEW":
+        slots = 1
+    else:
+        slots = 0
+
+    _check_slots(slots)
+
+    if request_type == "ACTIVE":
+        bench = [position for position, poke in enumerate(pokemon) if not poke.ACTIVE and _healthy(poke)]
+        for slot, option in enumerate(request.ACTIVE_OPTIONS):
+            _mark_active_slot(mask, slot * SLOT_ACTIONS, slots, slot, option, pokemon[slot], bench)
+    elif request_type == "FORCESWITCH":
+        forced = sum(request.FORCESWITCH_SLOTS)
+        for slot, is_forced in enumerate(request.FORCESWITCH_SLOTS):
+            offset = slot * SLOT_ACTIONS
+            if not is_forced:
+                mask[offset + PASS_ACTION] = 1
+                continue
+
+            reviving = slot < len(pokemon) and pokemon[slot].REVIVING
+            bench = [
+                position
+                for position, poke in enumerate(pokemon)
+                if not poke.ACTIVE and _healthy(poke) != bool(reviving)
+            ]
+            for position in bench:
+                mask[offset + SWITCH_ACTION + position] = 1
+            if len(bench) < forced:
+                mask[offset + PASS_ACTION] = 1
+    elif request_type == "TEAMPREVIEW":
+        for position in range(len(pokemon)):
+            mask[SWITCH_ACTION + position] = 1
+
+    return LegalActions(
+        REQUEST_TYPE=request_type,
+        SLOTS=slots,
+        MASK=np.frombuffer(mask, dtype=np.bool_).reshape(ACTION_SLOTS, SLOT_ACTIONS),
+        CHOICES=choice_table(request_type),
+    )
@@ -0,0 +1,173 @@
+# poketypes/showdown/battlelog.py
+
+"""Contains helpers for streaming BattleMessages out of saved battle logs.
+
+Battle logs are plain text files holding one battle message per line, optionally gzip compressed. Rather than reading a
+whole log into memory, `iter_battle_log` reads it in fixed-size chunks and parses each chunk's lines as they arrive, so
+even multi-GB archives are processed with bounded memory.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import zlib
+from itertools import chain
+from typing import IO, Iterator, List, Optional, Union
+
+from .battlemessage import BattleMessage, ParseFailure
+
+# Number of bytes (or characters, for text file objects) read from a battle log at a time
+LOG_CHUNK_SIZE = 1 << 20
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _read_chunks(log: IO, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    """Read a file object in fixed-size chunks until it is exhausted.
+
+    Args:
+        log (IO): The open file object, in text or binary mode.
+        chunk_size (int): How much to read from the file object at a time.
+
+    Yields:
+        Union[str, bytes]: The next chunk of the file.
+    """
+    while True:
+        chunk = log.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _gunzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Incrementally decompress a stream of gzip data, including files made of several concatenated gzip members.
+
+    Args:
+        chunks (Iterator[bytes]): The raw gzip compressed chunks, in order.
+
+    Yields:
+        bytes: The decompressed data, in order.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        while chunk:
+            yield decompressor.decompress(chunk)
+
+            if not decompressor.eof:
+                break
+
+            # Start the next gzip member with whatever followed the end of this one
+            chunk = decompressor.unused_data
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    yield decompressor.flush()
+
+
+def _decode_chunks(chunks: Iterator[bytes]) -> Iterator[str]:
+    """Incrementally decode a stream of UTF-8 data, even when characters are split across chunks.
+
+    Args:
+        chunks (Iterator[bytes]): The raw UTF-8 encoded chunks, in order.
+
+    Yields:
+        str: The decoded text, in order.
+    """
+    decoder = codecs.getincrementaldecoder("utf8")()
+
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_log_text(log: IO, chunk_size: int) -> Iterator[str]:
+    """Read a battle log file object as chunks of text, decompressing and decoding binary file objects as needed.
+
+    Args:
+        log (IO): The open battle log, in text or binary mode. Binary logs may be gzip compressed.
+        chunk_size (int): How much to read from the file object at a time.
+
+    Yields:
+        str: The next chunk of text of the log. Chunks don't line up with line boundaries.
+    """
+    chunks = _read_chunks(log, chunk_size)
+
+    # Make sure the first chunk is long enough to hold the gzip magic bytes, even with tiny chunk sizes
+    first = next(chunks, None)
+    if first is None:
+        return
+    while len(first) < len(GZIP_MAGIC):
+        more = next(chunks, None)
+        if more is None:
+            break
+        first += more
+
+    chunks = chain([first], chunks)
+
+    if isinstance(first, bytes):
+        if first.startswith(GZIP_MAGIC):
+            chunks = _gunzip_chunks(chunks)
+        chunks = _decode_chunks(chunks)
+
+    yield from chunks
+
+
+def _iter_log_lines(log: IO, chunk_size: int) -> Iterator[List[str]]:
+    """Read a battle log file object as batches of whole battle message lines.
+
+    Lines that span a chunk boundary are held back and completed by the next chunk. Blank lines and `>roomid` lines
+    aren't battle messages, so they are dropped.
+
+    Args:
+        log (IO): The open battle log, in text or binary mode. Binary logs may be gzip compressed.
+        chunk_size (int): How much to read from the file object at a time.
+
+    Yields:
+        List[str]: The next batch of newline-stripped battle message lines.
+    """
+    partial = ""
+
+    for chunk in _iter_log_text(log, chunk_size):
+        lines = chunk.split("\n")
+        lines[0] = partial + lines[0]
+        partial = lines.pop()
+
+        yield [line for line in lines if line.strip() != "" and not line.startswith(">")]
+
+    if partial.strip() != "" and not partial.startswith(">"):
+        yield [partial]
+
+
+def iter_battle_log(
+    log: Union[str, os.PathLike, IO],
+    chunk_size: int = LOG_CHUNK_SIZE,
+    validate: bool = True,
+    errors: Optional[List[ParseFailure]] = None,
+) -> Iterator[BattleMessage]:
+    """Stream the BattleMessages of a saved battle log, without ever holding the whole log in memory.
+
+    The log is read `chunk_size` at a time, and each chunk's lines are parsed with `BattleMessage.parse_many` before the
+    next chunk is read. Gzip compressed logs are detected from their magic bytes, so `.log` and `.log.gz` files (or
+    binary file objects) are handled the same way. Blank lines and `>roomid` lines are skipped.
+
+    Args:
+        log (Union[str, os.PathLike, IO]): The path to the battle log, or an already open file object in text or binary
+            mode. File objects are read from their current position, and are left open.
+        chunk_size (int, optional): How much to read from the log at a time. Defaults to LOG_CHUNK_SIZE.
+        validate (bool, optional): Whether to run pydantic validation on the parsed fields. See
+            `BattleMessage.from_message`. Defaults to True.
+        errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every line that
+            fails to parse. See `BattleMessage.parse_many`. Defaults to None.
+
+    Yields:
+        BattleMessage: The parsed messages of the log, in order.
+    """
+    if isinstance(log, (str, os.PathLike)):
+        with open(log, "rb") as log_file:
+            yield from iter_battle_log(log_file, chunk_size=chunk_size, validate=validate, errors=errors)
+        return
+
+    for lines in _iter_log_lines(log, chunk_size):
+        yield from BattleMessage.parse_many(lines, validate=validate, errors=errors)
@@ -9,10 +9,26 @@ message corresponds to, and return the associated subclass (or an error detailin
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from enum import Enum, unique
-from typing import Dict, List, Literal, Optional, Type, Union
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +45,53 @@ from ..dex import (
     cast2dex,
     clean_name,
 )
+from . import instrumentation, jsonbackend
+from .errors import get_error_sink, message_key
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Set by BattleMessage.from_message(..., validate=False) for the duration of a single parse
+_TRUSTED: ContextVar[bool] = ContextVar("_TRUSTED", default=False)
+_TRUSTED_DEFAULTS: Dict[Type[BaseModel], Dict[str, object]] = {}
+_object_setattr = object.__setattr__
+
+# Maximum number of distinct identifier strings that PokemonIdentifier.from_string interns
+IDENTIFIER_CACHE_SIZE = 1024
+# Maximum number of distinct DETAILS strings that PokemonDetails.from_details_string remembers
+DETAILS_CACHE_SIZE = 1024
+# Maximum number of distinct HP STATUS strings that parse_condition remembers
+CONDITION_CACHE_SIZE = 4096
+
+
+def _construct(model: Type[ModelT], **fields) -> ModelT:
+    """Build a model from parser-produced fields, skipping pydantic validation when in trusted mode.
+
+    Trusted construction relies on the parser handing over values that already have their final types, so every
+    `from_message` must convert its values itself (int(), PokeStat(), etc) rather than leaning on pydantic coercion.
+
+    Args:
+        model (Type[ModelT]): The BaseModel class to build.
+        **fields: The field values to build the model with.
+
+    Returns:
+        ModelT: The newly built model.
+    """
+    if not _TRUSTED.get():
+        return model(**fields)
+
+    # BaseModel.model_construct re-inspects every field on each call, which costs more than validating in pydantic-core.
+    # None of these models use default factories, private attributes or extras, so the defaults can be resolved once
+    defaults = _TRUSTED_DEFAULTS.get(model)
+    if defaults is None:
+        defaults = {name: info.default for name, info in model.model_fields.items() if not info.is_required()}
+        _TRUSTED_DEFAULTS[model] = defaults
+
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", {**defaults, **fields})
+    _object_setattr(instance, "__pydantic_fields_set__", set(fields))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
 
 
 @unique
@@ -167,13 +230,18 @@ class PokeStat(str, Enum):
     accuracy = "accuracy"
 
 
-class PokemonIdentifier(BaseModel):
-    """A BaseModel giving details about which Pokemon is being talked about.
+class PokemonIdentifier(BaseModel, frozen=True):
+    """An immutable record giving details about which Pokemon is being talked about.
+
+    The same few identifier strings (`p1a: Arcanine`) are repeated many times over a battle, so identifiers built with
+    `from_string` are interned on the raw string. Repeated mentions share one instance, which can be compared by
+    identity and used directly as a dictionary key.
 
     Attributes:
-        IDENTITY: The unique identifier for a pokemon. Looks like `ARCANINE` if the input is `p1: Arcanine`
-        PLAYER: The player this pokemon belongs to
-        SLOT: Optionally, the slot this pokemon is in. Will be None if slot info isn't given in the message
+        IDENTITY (str): The unique identifier for a pokemon. Looks like `ARCANINE` if the input is `p1: Arcanine`
+        PLAYER (str): The player this pokemon belongs to
+        SLOT (Optional[str]): Optionally, the slot this pokemon is in. Will be None if slot info isn't given in the
+            message
     """
 
     IDENTITY: str = Field(
@@ -197,7 +265,9 @@ class PokemonIdentifier(BaseModel):
         Returns:
             PokemonIdentifier: A newly created PokemonIdentifier object from this string
         """
-        return PokemonIdentifier(IDENTITY=ident.split(":")[1].strip().upper(), PLAYER=ident.split(":")[0], SLOT=None)
+        player, _, identity = ident.partition(":")
+
+        return PokemonIdentifier(IDENTITY=identity.strip().upper(), PLAYER=player, SLOT=None)
 
     @staticmethod
     def from_slot_string(slot: str) -> PokemonIdentifier:
@@ -209,26 +279,116 @@ class PokemonIdentifier(BaseModel):
         Returns:
             PokemonIdentifier: A newly created PokemonIdentifier object from this string
         """
-        return PokemonIdentifier(
-            IDENTITY=slot.split(":")[1].strip().upper(), PLAYER=slot[:2].split(":")[0], SLOT=slot[2]
-        )
+        _, _, identity = slot.partition(":")
+
+        return PokemonIdentifier(IDENTITY=identity.strip().upper(), PLAYER=slot[:2], SLOT=slot[2])
 
     @staticmethod
+    @lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
     def from_string(string: str) -> PokemonIdentifier:
         """Auto-Create a new PokemonIdentifier based on which type of identity string is given.
 
+        Identifiers are interned, so every call with the same string returns the same shared object. The least recently
+        used identifiers are evicted once more than `IDENTIFIER_CACHE_SIZE` distinct strings have been seen, and the
+        cache can be emptied with `PokemonIdentifier.from_string.cache_clear()`.
+
         Args:
             string (str): An input string to extract field information from. Looks like "p1a: Arcanine"
 
         Returns:
-            PokemonIdentifier: A newly created PokemonIdentifier object from this string
+            PokemonIdentifier: The (potentially shared) PokemonIdentifier object for this string
         """
-        if len(string.split(":")[0]) == 3:
+        if string.find(":") == 3:
             return PokemonIdentifier.from_slot_string(string)
         else:
             return PokemonIdentifier.from_ident_string(string)
 
 
+class PokemonDetails(BaseModel, frozen=True):
+    """An immutable record of the fields held in a pokemon DETAILS string.
+
+    DETAILS strings look like `Scizor-Mega, L75, M, shiny, tera:Bug`, and are shared by switch, drag, poke, replace,
+    detailschange and request messages. Since a battle only ever contains a handful of distinct DETAILS strings, parsed
+    records are cached on the raw string and shared between messages.
+
+    Attributes:
+        SPECIES (DexPokemon.ValueType): The species for this pokemon, including forme
+        LEVEL (int): The level of this pokemon
+        GENDER (Optional[Literal["M", "F"]]): The gender of this pokemon
+        SHINY (bool): Whether the pokemon is shiny or not
+        TERA (Optional[str]): If this pokemon is teratyped, the string type of the new type. Else None.
+    """
+
+    SPECIES: DexPokemon.ValueType = Field(..., description="The species for this pokemon, including forme")
+    LEVEL: int = Field(100, description="The level of this pokemon")
+    GENDER: Optional[Literal["M", "F"]] = Field(None, description="The gender of this pokemon")
+    SHINY: bool = Field(False, description="Whether the pokemon is shiny or not")
+    TERA: Optional[str] = Field(
+        None,
+        description="If this pokemon is teratyped, the string type of the new type. Else None.",
+    )
+
+    @staticmethod
+    @lru_cache(maxsize=DETAILS_CACHE_SIZE)
+    def from_details_string(details: str) -> PokemonDetails:
+        """Create a new PokemonDetails from a DETAILS string, reusing the cached record if it was seen before.
+
+        Args:
+            details (str): An input string to extract field information from. Looks like "Toxicroak, L81, F"
+
+        Returns:
+            PokemonDetails: The (potentially shared) PokemonDetails object for this string
+        """
+        details_split = details.split(",")
+
+        species = details_split[0].strip()
+        level = 100
+        gender = None
+        shiny = False
+        tera = None
+
+        for detail in details_split[1:]:
+            detail = detail.strip()
+            if "tera" in detail:
+                tera = detail.split(":")[1].strip()
+            elif "shiny" in detail:
+                shiny = True
+            elif "L" in detail:
+                level = int(detail[1:])
+            elif "M" in detail:
+                gender = "M"
+            elif "F" in detail:
+                gender = "F"
+
+        return PokemonDetails(
+            SPECIES=cast2dex(species, DexPokemon),
+            LEVEL=level,
+            GENDER=gender,
+            SHINY=shiny,
+            TERA=tera,
+        )
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def parse_condition(condition: str) -> Tuple[int, Optional[int], Optional[DexStatus.ValueType]]:
+    """Decode a pokemon condition string into its HP and status, reusing the cached result if it was seen before.
+
+    Conditions look like `180/281 tox` for exact HP, `45/100` for percentage HP, or `0 fnt` for a fainted pokemon.
+
+    Args:
+        condition (str): The condition string to decode, formatted as "HP STATUS".
+
+    Returns:
+        Tuple[int, Optional[int], Optional[DexStatus.ValueType]]: The current HP, the maximum HP (None if not given,
+            such as when fainted), and the status (None if there is no status).
+    """
+    hp_part, _, status = condition.partition(" ")
+
+    cur_hp, _, max_hp = hp_part.partition("/")
+
+    return int(cur_hp), int(max_hp) if max_hp else None, cast2dex(status.split(" ")[0], DexStatus)
+
+
 class EffectType(str, Enum):
     """Helper class to identify which category of effect is being activated."""
 
@@ -242,6 +402,18 @@ class EffectType(str, Enum):
     pokemon = "pokemon"
 
 
+def _effect_type(eff_type: Optional[str]) -> Optional[EffectType]:
+    """Convert a parsed effect category string into an EffectType, keeping None as None.
+
+    Args:
+        eff_type (Optional[str]): The string effect category, such as `ability` or `move`.
+
+    Returns:
+        Optional[EffectType]: The matching EffectType, or None if no category was given.
+    """
+    return None if eff_type is None else EffectType(eff_type)
+
+
 class Effect(BaseModel):
     """A helper class for many Battle Message types that rely on *something* happening to cause the message effect."""
 
@@ -261,6 +433,124 @@ class Effect(BaseModel):
     )
 
 
+class MessageTokens(NamedTuple):
+    """A battle message split a single time into its positional arguments and its bracketed protocol tags.
+
+    Every BattleMessage subclass builds itself from these tokens, rather than re-scanning the raw message for tags like
+    `[from]` or `[of]`. For example `|-damage|p2a: Leavanny|180/281 tox|[from] item: Life Orb|[of] p1a: Sceptile`
+    tokenizes to ARGS `["p2a: Leavanny", "180/281 tox"]` and TAGS `{"from": "item: Life Orb", "of": "p1a: Sceptile"}`.
+
+    Attributes:
+        ARGS (List[str]): The positional arguments following the message key, in order
+        TAGS (Dict[str, str]): The bracketed tags of the message, mapping the tag name to its value. Flag tags like
+            `[still]` map to ""
+    """
+
+    ARGS: List[str]
+    TAGS: Dict[str, str]
+
+    @staticmethod
+    def from_message(battle_message: str, parse_tags: bool = True) -> MessageTokens:
+        """Split a raw battle message into its positional arguments and bracketed tags in one pass.
+
+        A tag is any part that starts with a lowercase bracketed name, such as `[from] item: Leftovers` or `[still]`.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+            parse_tags (bool, optional): Whether to pull out bracketed tags at all. Messages carrying free text (chat,
+                html, titles) should set this to False, so their text is kept as-is. Defaults to True.
+
+        Returns:
+            MessageTokens: The positional arguments and tags of the message.
+        """
+        parts = battle_message.split("|")[2:]
+
+        if not parse_tags:
+            return MessageTokens(parts, {})
+
+        args = []
+        tags = {}
+        for part in parts:
+            if part[:1] == "[":
+                name, sep, value = part[1:].partition("]")
+                if sep and name.isalpha() and name.islower():
+                    tags[name] = value.strip()
+                    continue
+
+            args.append(part)
+
+        return MessageTokens(args, tags)
+
+    def arg(self, index: int) -> Optional[str]:
+        """Get a positional argument, treating missing or blank arguments as None.
+
+        Args:
+            index (int): The index of the positional argument to get.
+
+        Returns:
+            Optional[str]: The stripped argument, or None if it is missing or blank.
+        """
+        if index >= len(self.ARGS):
+            return None
+
+        arg = self.ARGS[index].strip()
+        return arg if arg != "" else None
+
+    def first_tag(self) -> Optional[str]:
+        """Get the first bracketed tag of the message, written back in its raw `[name] value` form.
+
+        Returns:
+            Optional[str]: The first tag, like `[weak]` or `[msg] text`, or None if the message has no tags.
+        """
+        for name, value in self.TAGS.items():
+            return f"[{name}] {value}".strip()
+        return None
+
+    def source(self) -> Optional[PokemonIdentifier]:
+        """Get the pokemon given by the `[of]` tag, if any.
+
+        Returns:
+            Optional[PokemonIdentifier]: The identifier of the `[of]` pokemon, or None if the message has no such tag.
+        """
+        of = self.TAGS.get("of")
+        return PokemonIdentifier.from_string(of) if of else None
+
+    def effect(self, default_type: Optional[str] = None) -> Optional[Effect]:
+        """Build the Effect given by the `[from]` and `[of]` tags, if any.
+
+        The `[from]` tag looks like `[from] item: Life Orb`, where the category before the colon is optional.
+
+        Args:
+            default_type (Optional[str], optional): The effect category to use when the `[from]` tag doesn't name one.
+                Defaults to None.
+
+        Returns:
+            Optional[Effect]: The effect, or None if the message has no `[from]` tag.
+        """
+        from_tag = self.TAGS.get("from")
+        if from_tag is None:
+            return None
+
+        return _construct(Effect, **_split_effect(from_tag, default_type), EFFECT_SOURCE=self.source())
+
+
+def _split_effect(effect: str, default_type: Optional[str] = None) -> Dict[str, Any]:
+    """Split an effect string like `item: Life Orb` into the EFFECT_TYPE and EFFECT_NAME fields of an Effect.
+
+    Args:
+        effect (str): The effect string, with an optional category before a colon.
+        default_type (Optional[str], optional): The category to use if the effect doesn't name one. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: The EFFECT_TYPE and EFFECT_NAME fields.
+    """
+    eff_type, sep, eff_name = effect.partition(":")
+    if not sep:
+        return {"EFFECT_TYPE": _effect_type(default_type), "EFFECT_NAME": effect.strip()}
+
+    return {"EFFECT_TYPE": _effect_type(eff_type.strip()), "EFFECT_NAME": eff_name.strip()}
+
+
 class BattleMessage(BaseModel):
     """The base class for all specific BattleMessage subclasses to be built from.
 
@@ -290,52 +580,258 @@ class BattleMessage(BaseModel):
     ] = Field(None, description="The error type of this battle message if it failed to parse")
 
     @staticmethod
-    def from_message(battle_message: str) -> "BattleMessage":
+    def from_message(battle_message: str, validate: bool = True) -> "BattleMessage":
         """Create a specific BattleMessage object from a raw message.
 
         For example, given a message '|faint|p2a: Umbreon', this will create a new BattleMessage_faint with fields
         extracted from the text properly.
+
+        If the message can't be parsed, the failure is recorded with the current error sink (see
+        `poketypes.showdown.get_error_sink`), and a plain BattleMessage with its ERR_STATE set is returned.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+            validate (bool, optional): Whether to run pydantic validation on the parsed fields. Setting this to False
+                builds the same subclass without validation, which is faster but trusts that the parser produced
+                correctly typed values. Defaults to True.
+
+        Returns:
+            BattleMessage: An initialized subclass of `BattleMessage`, for the corresponding class for this message
+                type.
         """
-        if battle_message.strip() == "" or (
-            battle_message.split("|")[1] == "request" and battle_message.split("|")[2] == ""
-        ):
-            return BattleMessage(BMTYPE=BMType.empty, BATTLE_MESSAGE="")
+        stats = instrumentation.active_stats
 
+        token = _TRUSTED.set(not validate)
         try:
-            bmtype = BMType(battle_message.split("|")[1])
-            bm_class = bmtype_to_bmclass[bmtype]
-        except ValueError:
-            print(
-                f"Failed to identify which BMType we should use for battle message key {battle_message.split('|')[1]}."
-            )
-            print()
+            if stats is None:
+                bm, failure = _parse_message(battle_message)
+            else:
+                bm, failure = _timed_parse_message(battle_message, stats)
+        finally:
+            _TRUSTED.reset(token)
 
-            bm = BattleMessage(BMTYPE="unknown", BATTLE_MESSAGE=battle_message, ERR_STATE="UNKNOWN_BMTYPE")
+        if failure is not None:
+            _report_failure(failure)
 
-            return bm
-        except KeyError:
-            print(f"BMType {bmtype} does not have a class in the dictionary! This is probably an error!")
-            print()
+        return bm
 
-            bm = BattleMessage(BMTYPE="unknown", BATTLE_MESSAGE=battle_message, ERR_STATE="MISSING_DICT_CLASS")
+    @staticmethod
+    def parse_many(
+        lines: Iterable[str], validate: bool = True, errors: Optional[List[ParseFailure]] = None
+    ) -> List["BattleMessage"]:
+        """Create a specific BattleMessage object for every raw message in a batch of lines.
 
-            return bm
+        This gives the same messages as calling `from_message` on each line, but handles the whole batch in a single
+        loop, and can collect any failures into `errors` rather than reporting them to the error sink.
 
+        Args:
+            lines (Iterable[str]): The single string battle messages as sent by the server. Trailing newlines are
+                stripped.
+            validate (bool, optional): Whether to run pydantic validation on the parsed fields. See `from_message`.
+                Defaults to True.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every line
+                that fails to parse. If not given, failures are recorded with the current error sink instead. Defaults
+                to None.
+
+        Returns:
+            List[BattleMessage]: The parsed messages, one per line and in the same order.
+        """
+        messages = []
+        stats = instrumentation.active_stats
+
+        token = _TRUSTED.set(not validate)
         try:
-            bm = bm_class.from_message(battle_message)
-        except NotImplementedError:
-            print(f"BMType {bmtype}'s extraction implementation isn't ready yet!")
-            print(battle_message)
-            print()
+            for line in lines:
+                line = line.rstrip("\r\n")
+
+                if stats is None:
+                    bm, failure = _parse_message(line)
+                else:
+                    bm, failure = _timed_parse_message(line, stats)
+
+                if failure is not None:
+                    _report_failure(failure, errors)
+
+                messages.append(bm)
+        finally:
+            _TRUSTED.reset(token)
+
+        return messages
+
+    @staticmethod
+    def parse_block(
+        frame: str, validate: bool = True, errors: Optional[List[ParseFailure]] = None
+    ) -> List["BattleMessage"]:
+        """Create a specific BattleMessage object for every line in a multi-line frame sent by the server.
+
+        Battle frames hold one message per line, like `|move|p1a: Sceptile|Leaf Blade|p2a: Espeon`. The leading
+        `>roomid` line, if present, only names the battle room and is skipped.
+
+        Args:
+            frame (str): The full frame as sent by the server.
+            validate (bool, optional): Whether to run pydantic validation on the parsed fields. See `from_message`.
+                Defaults to True.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every line
+                that fails to parse. See `parse_many`. Defaults to None.
+
+        Returns:
+            List[BattleMessage]: The parsed messages, one per line of the frame and in the same order.
+        """
+        return BattleMessage.parse_many(_frame_lines(frame), validate=validate, errors=errors)
+
+    @staticmethod
+    def parse_bytes(
+        frame: Union[bytes, bytearray, memoryview], validate: bool = True, errors: Optional[List[ParseFailure]] = None
+    ) -> List[Union["BattleMessage", "LazyBattleMessage"]]:
+        """Create a specific BattleMessage object for every line in a multi-line frame received as raw UTF-8 bytes.
+
+        Unlike decoding the frame and calling `parse_block`, the frame is split into lines and message keys as bytes,
+        and each line is only decoded if it is parsed. Lines whose message key is in BYTES_DEFERRED_KEYS (the HTML of
+        `|raw|`, the text of `|c|`, and so on) aren't decoded or parsed at all, and come back as LazyBattleMessages
+        holding the raw bytes, which are decoded the first time their BATTLE_MESSAGE or any field is read.
+
+        Args:
+            frame (Union[bytes, bytearray, memoryview]): The full frame as received from the server.
+            validate (bool, optional): Whether to run pydantic validation on the parsed fields. See `from_message`.
+                Defaults to True.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every line
+                that fails to parse. See `parse_many`. Defaults to None.
+
+        Returns:
+            List[Union[BattleMessage, LazyBattleMessage]]: The parsed messages, one per line of the frame and in the
+                same order, with deferred lines left as unparsed LazyBattleMessages.
+        """
+        return _parse_frame_bytes(frame, lambda key: key not in BYTES_DEFERRED_KEYS, False, validate, errors)
+
+
+class ParseFailure(NamedTuple):
+    """A record of a battle message that failed to parse, as collected by `BattleMessage.parse_many`.
+
+    Attributes:
+        BATTLE_MESSAGE (str): The raw message line that failed to parse
+        ERR_STATE (str): The error type given to the failed BattleMessage
+        DETAIL (str): A description of what went wrong
+    """
+
+    BATTLE_MESSAGE: str
+    ERR_STATE: str
+    DETAIL: str
+
+
+def _report_failure(failure: ParseFailure, errors: Optional[List[ParseFailure]] = None) -> None:
+    """Hand a parse failure to the caller's list of errors if one was given, or else to the current error sink.
+
+    Args:
+        failure (ParseFailure): The failure to report.
+        errors (Optional[List[ParseFailure]], optional): The caller's list of errors, if any. Defaults to None.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if errors is not None:
+        errors.append(failure)
+    else:
+        get_error_sink().record(
+            message_key(failure.BATTLE_MESSAGE), failure.ERR_STATE, failure.BATTLE_MESSAGE, failure.DETAIL
+        )
+
 
-            bm = BattleMessage(BMTYPE="unknown", BATTLE_MESSAGE=battle_message, ERR_STATE="IMPLEMENTATION_NOT_READY")
+def _frame_lines(frame: str) -> List[str]:
+    """Split a frame into its message lines, without its `>roomid` header line.
+
+    Only a newline (and a carriage return before it) ends a line. Unlike `str.splitlines`, this keeps characters such
+    as form feeds or unicode line separators inside the chat and html payloads they belong to, and splits the frame the
+    same way as the bytes path.
+
+    Args:
+        frame (str): The full frame as sent by the server.
+
+    Returns:
+        List[str]: The frame's lines, with their line endings stripped.
+    """
+    lines = [line[:-1] if line.endswith("\r") else line for line in frame.split("\n")]
+    if lines[-1] == "":
+        del lines[-1]
+    if lines and lines[0].startswith(">"):
+        del lines[0]
+
+    return lines
+
+
+def _message_key(battle_message: str) -> Optional[str]:
+    """Get the message key of a raw message, which is the whole message if it has no `|` key at all.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+
+    Returns:
+        Optional[str]: The message key, or None if the message is empty, including a `|request|` with no payload.
+    """
+    bm_split = battle_message.split("|", 3)
+    key = bm_split[1] if len(bm_split) > 1 else battle_message
+
+    if battle_message.strip() == "" or (key == "request" and bm_split[2:3] in ([], [""])):
+        return None
+
+    return key
+
+
+def _parse_message(battle_message: str) -> Tuple[BattleMessage, Optional[ParseFailure]]:
+    """Create a specific BattleMessage object from a raw message, reporting any failure instead of printing it.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+
+    Returns:
+        Tuple[BattleMessage, Optional[ParseFailure]]: The parsed message (or a plain BattleMessage with error
+            information), and a record of the failure if the message couldn't be parsed.
+    """
+    key = _message_key(battle_message)
+
+    if key is None:
+        return BattleMessage(BMTYPE=BMType.empty, BATTLE_MESSAGE=""), None
+
+    try:
+        bmtype = BMType(key)
+        bm_class = bmtype_to_bmclass[bmtype]
+    except ValueError:
+        err_state = "UNKNOWN_BMTYPE"
+        detail = f"Failed to identify which BMType we should use for battle message key {key}."
+    except KeyError:
+        err_state = "MISSING_DICT_CLASS"
+        detail = f"BMType {bmtype} does not have a class in the dictionary! This is probably an error!"
+    else:
+        try:
+            return bm_class.from_message(battle_message), None
+        except NotImplementedError:
+            err_state = "IMPLEMENTATION_NOT_READY"
+            detail = f"BMType {bmtype}'s extraction implementation isn't ready yet!\n{battle_message}"
         except Exception as ex:
-            print(f"BMType {bmtype} failed to build from message {battle_message} due to a(n) {type(ex)}: {ex}")
-            print()
+            err_state = "PARSE_ERROR"
+            detail = f"BMType {bmtype} failed to build from message {battle_message} due to a(n) {type(ex)}: {ex}"
 
-            bm = BattleMessage(BMTYPE="unknown", BATTLE_MESSAGE=battle_message, ERR_STATE="PARSE_ERROR")
+    bm = BattleMessage(BMTYPE=BMType.unknown, BATTLE_MESSAGE=battle_message, ERR_STATE=err_state)
+
+    return bm, ParseFailure(battle_message, err_state, detail)
 
-        return bm
+
+def _timed_parse_message(
+    battle_message: str, stats: instrumentation.ParseStats
+) -> Tuple[BattleMessage, Optional[ParseFailure]]:
+    """Parse a raw message like `_parse_message`, recording how long it took to the given ParseStats.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+        stats (instrumentation.ParseStats): The ParseStats to record the parse time to.
+
+    Returns:
+        Tuple[BattleMessage, Optional[ParseFailure]]: The parsed message, and a record of the failure if any.
+    """
+    start = perf_counter_ns()
+    bm, failure = _parse_message(battle_message)
+    stats.record("BattleMessage", message_key(battle_message), perf_counter_ns() - start, failure is not None)
+
+    return bm, failure
 
 
 class BattleMessage_player(BattleMessage):
@@ -366,15 +862,16 @@ class BattleMessage_player(BattleMessage):
     @staticmethod
     def from_message(battle_message: str) -> "BattleMessage_player":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_player(
+        return _construct(
+            BattleMessage_player,
             BMTYPE=BMType.player,
             BATTLE_MESSAGE=battle_message,
-            PLAYER=bm_split[2],
-            USERNAME=bm_split[3],
-            AVATAR=bm_split[4] if not bm_split[4].isnumeric() else int(bm_split[4]),
-            RATING=None if bm_split[5] == "" else bm_split[5],
+            PLAYER=tokens.ARGS[0],
+            USERNAME=tokens.ARGS[1],
+            AVATAR=tokens.ARGS[2] if not tokens.ARGS[2].isnumeric() else int(tokens.ARGS[2]),
+            RATING=None if tokens.ARGS[3] == "" else int(tokens.ARGS[3]),
         )
 
 
@@ -401,13 +898,14 @@ class BattleMessage_teamsize(BattleMessage):
     @staticmethod
     def from_message(battle_message: str) -> "BattleMessage_teamsize":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_teamsize(
+        return _construct(
+            BattleMessage_teamsize,
             BMTYPE=BMType.teamsize,
             BATTLE_MESSAGE=battle_message,
-            PLAYER=bm_split[2],
-            NUMBER=bm_split[3],
+            PLAYER=tokens.ARGS[0],
+            NUMBER=int(tokens.ARGS[1]),
         )
 
 
@@ -434,12 +932,13 @@ class BattleMessage_gametype(BattleMessage):
     @staticmethod
     def from_message(battle_message: str) -> "BattleMessage_gametype":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_gametype(
+        return _construct(
+            BattleMessage_gametype,
             BMTYPE=BMType.gametype,
             BATTLE_MESSAGE=battle_message,
-            GAMETYPE=bm_split[2],
+            GAMETYPE=tokens.ARGS[0],
         )
 
 
@@ -463,12 +962,13 @@ class BattleMessage_gen(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_gen":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_gen(
+        return _construct(
+            BattleMessage_gen,
             BMTYPE=BMType.gen,
             BATTLE_MESSAGE=battle_message,
-            GENNUM=bm_split[2],
+            GENNUM=int(tokens.ARGS[0]),
         )
 
 
@@ -492,12 +992,13 @@ class BattleMessage_tier(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_tier":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_tier(
+        return _construct(
+            BattleMessage_tier,
             BMTYPE=BMType.tier,
             BATTLE_MESSAGE=battle_message,
-            FORMATNAME=bm_split[2],
+            FORMATNAME=tokens.ARGS[0],
         )
 
 
@@ -521,12 +1022,13 @@ class BattleMessage_rated(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_rated":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_rated(
+        return _construct(
+            BattleMessage_rated,
             BMTYPE=BMType.rated,
             BATTLE_MESSAGE=battle_message,
-            MESSAGE=bm_split[2],
+            MESSAGE=tokens.ARGS[0],
         )
 
 
@@ -552,13 +1054,14 @@ class BattleMessage_rule(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_rule":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_rule(
+        return _construct(
+            BattleMessage_rule,
             BMTYPE=BMType.rule,
             BATTLE_MESSAGE=battle_message,
-            RULE=bm_split[2].split(":")[0],
-            DESCRIPTION=":".join(bm_split[2].split(":")[1:]).strip(),
+            RULE=tokens.ARGS[0].split(":")[0],
+            DESCRIPTION=":".join(tokens.ARGS[0].split(":")[1:]).strip(),
         )
 
 
@@ -577,7 +1080,8 @@ class BattleMessage_clearpoke(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_clearpoke":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_clearpoke(
+        return _construct(
+            BattleMessage_clearpoke,
             BMTYPE=BMType.clearpoke,
             BATTLE_MESSAGE=battle_message,
         )
@@ -620,42 +1124,21 @@ class BattleMessage_poke(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_poke":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        details = bm_split[3].split(",")
+        tokens = MessageTokens.from_message(battle_message)
 
-        species = details[0].strip()
-        level = 100
-        gender = None
-        shiny = False
-        tera = None
+        details = PokemonDetails.from_details_string(tokens.ARGS[1])
 
-        item = details[-1] == "item"
-
-        if len(details) > 1:
-            for detail in details[1:]:
-                detail = detail.strip()
-                if "tera" in detail:
-                    tera = detail.split(":")[1].strip()
-                elif "shiny" in detail:
-                    shiny = True
-                elif "L" in detail:
-                    level = int(detail[1:])
-                elif "M" in detail:
-                    gender = "M"
-                elif "F" in detail:
-                    gender = "F"
-
-        return BattleMessage_poke(
+        return _construct(
+            BattleMessage_poke,
             BMTYPE=BMType.poke,
             BATTLE_MESSAGE=battle_message,
-            PLAYER=bm_split[2],
-            SPECIES=cast2dex(species, DexPokemon),
-            LEVEL=level,
-            GENDER=gender,
-            SHINY=shiny,
-            TERA=cast2dex(tera, DexType),
-            HAS_ITEM=item,
+            PLAYER=tokens.ARGS[0],
+            SPECIES=details.SPECIES,
+            LEVEL=details.LEVEL,
+            GENDER=details.GENDER,
+            SHINY=details.SHINY,
+            TERA=cast2dex(details.TERA, DexType),
+            HAS_ITEM=tokens.arg(2) == "item",
         )
 
 
@@ -674,7 +1157,8 @@ class BattleMessage_start(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_start":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_start(
+        return _construct(
+            BattleMessage_start,
             BMTYPE=BMType.start,
             BATTLE_MESSAGE=battle_message,
         )
@@ -695,7 +1179,8 @@ class BattleMessage_teampreview(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_teampreview":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_teampreview(
+        return _construct(
+            BattleMessage_teampreview,
             BMTYPE=BMType.teampreview,
             BATTLE_MESSAGE=battle_message,
         )
@@ -716,7 +1201,8 @@ class BattleMessage_empty(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_empty":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_empty(
+        return _construct(
+            BattleMessage_empty,
             BMTYPE=BMType.empty,
             BATTLE_MESSAGE=battle_message,
         )
@@ -920,161 +1406,178 @@ class BattleMessage_request(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_request":
         """Create a specific BattleMessage object from a raw message."""
-        request = json.loads(battle_message.split("|")[2])
-
-        if request.get("teamPreview", False):
-            request_type = "TEAMPREVIEW"
-        elif request.get("forceSwitch") is not None:
-            request_type = "FORCESWITCH"
-        elif len(request.get("active", [])) > 0:
-            request_type = "ACTIVE"
-        else:
-            request_type = "WAIT"
-
-        if request_type == "ACTIVE":
-            # Process the active options
-            active_options = []
-
-            for ao_data in request.get("active", []):
-                moves = []
-                for e, m_data in enumerate(ao_data.get("moves", [])):
-                    # Extract target information for the standard variant of the move
-                    target = None if m_data.get("target") is None else cast2dex(m_data["target"], DexMoveTarget)
-
-                    # Extract zmove information if applicable
-                    zmove_data = m_data.get("canZMove", [None for _ in range(4)])[e]
-                    if zmove_data is not None:
-                        zmove = zmove_data["move"]
-                        if clean_name(zmove) == f"Z{clean_name(m_data['id'])}":
-                            zmove = cast2dex(m_data["id"], DexMove)
-                        else:
-                            zmove = cast2dex(zmove, DexMove)
-                        zmove_target = cast2dex(zmove_data["target"], DexMoveTarget)
-                    else:
-                        zmove = None
-                        zmove_target = None
-
-                    # Extract dynamax information if applicable
-                    can_dyna = m_data.get("canDynamax", False)
-                    if can_dyna:
-                        max_move_info = m_data.get("maxMoves", {}).get("maxMoves", [None for _ in range(4)])[e]
-                        if max_move_info is not None:
-                            dyna_move = cast2dex(max_move_info["move"], DexMove)
-                            dyna_target = cast2dex(max_move_info["target"], DexMoveTarget)
-                        else:
-                            dyna_move = None
-                            dyna_target = None
-                    else:
-                        dyna_move = None
-                        dyna_target = None
-
-                    m = MoveData(
-                        NAME=m_data["move"],
-                        ID=cast2dex(m_data["id"], DexMove),
-                        CUR_PP=m_data.get("pp"),
-                        MAX_PP=m_data.get("maxpp"),
-                        TARGET=target,
-                        DISABLED=isinstance(m_data.get("disabled"), str) or m_data.get("disabled"),
-                        CAN_ZMOVE=zmove is not None,
-                        ZMOVE=zmove,
-                        ZMOVE_TARGET=zmove_target,
-                        CAN_DYNAMAX=can_dyna,
-                        DYNAMAX_MOVE=dyna_move,
-                        DYNAMAX_TARGET=dyna_target,
-                    )
-                    moves.append(m)
-
-                ao = ActiveOption(
-                    MOVES=moves,
-                    CAN_MEGA=ao_data.get("canMegaEvo", False),
-                    CAN_ZMOVE=len(ao_data.get("canZMove", [])) > 0,
-                    CAN_DYNA=ao_data.get("canDynamax", False),
-                    CAN_TERA=ao_data.get("canTerastallize", "") != "",
-                    TRAPPED=ao_data.get("trapped", ao_data.get("maybeTrapped", False)),
-                )
-                active_options.append(ao)
+        return _build_request(battle_message, jsonbackend.loads(_request_payload(battle_message)))
+
+
+def _request_payload(battle_message: str) -> str:
+    """Get the JSON payload of a raw `|request|` message, which (unlike other arguments) may itself contain `|`.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+
+    Returns:
+        str: The request JSON.
+    """
+    return battle_message.split("|", 2)[2]
+
+
+def _build_active_option(ao_data: Dict[str, Any]) -> ActiveOption:
+    """Build the ActiveOption of a single active slot from its decoded request JSON.
+
+    Args:
+        ao_data (Dict[str, Any]): The slot's entry in the request's `active` list.
+
+    Returns:
+        ActiveOption: The options available to the pokemon in this slot.
+    """
+    moves = []
+    for e, m_data in enumerate(ao_data.get("moves", [])):
+        # Extract target information for the standard variant of the move
+        target = None if m_data.get("target") is None else cast2dex(m_data["target"], DexMoveTarget)
+
+        # Extract zmove information if applicable
+        zmove_data = m_data.get("canZMove", [None for _ in range(4)])[e]
+        if zmove_data is not None:
+            zmove = zmove_data["move"]
+            if clean_name(zmove) == f"Z{clean_name(m_data['id'])}":
+                zmove = cast2dex(m_data["id"], DexMove)
+            else:
+                zmove = cast2dex(zmove, DexMove)
+            zmove_target = cast2dex(zmove_data["target"], DexMoveTarget)
         else:
-            active_options = None
-
-        pokemon = []
-
-        for p_data in request["side"]["pokemon"]:
-            details = p_data["details"].split(",")
-
-            species = details[0].strip()
-            species = cast2dex(species, DexPokemon)
-
-            level = 100
-            gender = None
-            shiny = False
-            tera = None
-
-            if len(details) > 1:
-                for detail in details[1:]:
-                    detail = detail.strip()
-                    if "tera" in detail:
-                        tera = detail.split(":")[1].strip()
-                    elif "shiny" in detail:
-                        shiny = True
-                    elif "L" in detail:
-                        level = int(detail[1:])
-                    elif "M" in detail:
-                        gender = "M"
-                    elif "F" in detail:
-                        gender = "F"
-
-            condition = p_data["condition"]
-
-            hp_part = condition.split(" ")[0]
-
-            if "/" in hp_part:
-                cur_hp = int(hp_part.split("/")[0])
-                max_hp = int(hp_part.split("/")[1])
+            zmove = None
+            zmove_target = None
+
+        # Extract dynamax information if applicable
+        can_dyna = m_data.get("canDynamax", False)
+        if can_dyna:
+            max_move_info = m_data.get("maxMoves", {}).get("maxMoves", [None for _ in range(4)])[e]
+            if max_move_info is not None:
+                dyna_move = cast2dex(max_move_info["move"], DexMove)
+                dyna_target = cast2dex(max_move_info["target"], DexMoveTarget)
             else:
-                cur_hp = int(hp_part)
-                max_hp = None
+                dyna_move = None
+                dyna_target = None
+        else:
+            dyna_move = None
+            dyna_target = None
+
+        m = _construct(
+            MoveData,
+            NAME=m_data["move"],
+            ID=cast2dex(m_data["id"], DexMove),
+            CUR_PP=m_data.get("pp"),
+            MAX_PP=m_data.get("maxpp"),
+            TARGET=target,
+            DISABLED=isinstance(m_data.get("disabled"), str) or m_data.get("disabled"),
+            CAN_ZMOVE=zmove is not None,
+            ZMOVE=zmove,
+            ZMOVE_TARGET=zmove_target,
+            CAN_DYNAMAX=can_dyna,
+            DYNAMAX_MOVE=dyna_move,
+            DYNAMAX_TARGET=dyna_target,
+        )
+        moves.append(m)
+
+    return _construct(
+        ActiveOption,
+        MOVES=moves,
+        CAN_MEGA=ao_data.get("canMegaEvo", False),
+        CAN_ZMOVE=len(ao_data.get("canZMove", [])) > 0,
+        CAN_DYNA=ao_data.get("canDynamax", False),
+        CAN_TERA=ao_data.get("canTerastallize", "") != "",
+        TRAPPED=ao_data.get("trapped", ao_data.get("maybeTrapped", False)),
+    )
 
-            if len(condition.split(" ")) > 1:
-                status = condition.split(" ")[1]
-            else:
-                status = None
-
-            p = RequestPoke(
-                IDENT=PokemonIdentifier.from_string(p_data["ident"]),
-                SPECIES=species,
-                LEVEL=level,
-                GENDER=gender,
-                SHINY=shiny,
-                TERA=cast2dex(tera, DexType),
-                CUR_HP=cur_hp,
-                MAX_HP=max_hp,
-                STATUS=cast2dex(status, DexStatus),
-                ACTIVE=p_data.get("active"),
-                STATS=p_data.get("stats"),
-                MOVES=[cast2dex(m, DexMove) for m in p_data.get("moves")],
-                BASE_ABILITY=cast2dex(p_data.get("baseAbility"), DexAbility),
-                ABILITY=cast2dex(p_data.get("ability"), DexAbility),
-                ITEM=cast2dex(p_data.get("item"), DexItem),
-                POKEBALL=p_data.get("pokeball"),
-                COMMANDING=p_data.get("commanding"),
-                REVIVING=p_data.get("reviving"),
-                TERATYPE=cast2dex(p_data.get("teraType"), DexType),
-                TERASTALLIZED=cast2dex(p_data.get("terastallized"), DexType),
-            )
 
-            pokemon.append(p)
+def _build_request_poke(p_data: Dict[str, Any]) -> RequestPoke:
+    """Build the RequestPoke of a single pokemon from its decoded request JSON.
+
+    Args:
+        p_data (Dict[str, Any]): The pokemon's entry in the request's `side.pokemon` list.
+
+    Returns:
+        RequestPoke: The details of the pokemon.
+    """
+    details = PokemonDetails.from_details_string(p_data["details"])
+
+    cur_hp, max_hp, status = parse_condition(p_data["condition"])
+
+    return _construct(
+        RequestPoke,
+        IDENT=PokemonIdentifier.from_string(p_data["ident"]),
+        SPECIES=details.SPECIES,
+        LEVEL=details.LEVEL,
+        GENDER=details.GENDER,
+        SHINY=details.SHINY,
+        TERA=cast2dex(details.TERA, DexType),
+        CUR_HP=cur_hp,
+        MAX_HP=max_hp,
+        STATUS=status,
+        ACTIVE=p_data.get("active"),
+        STATS={PokeStat(stat): value for stat, value in p_data.get("stats").items()},
+        MOVES=[cast2dex(m, DexMove) for m in p_data.get("moves")],
+        BASE_ABILITY=cast2dex(p_data.get("baseAbility"), DexAbility),
+        ABILITY=cast2dex(p_data.get("ability"), DexAbility),
+        ITEM=cast2dex(p_data.get("item"), DexItem),
+        POKEBALL=p_data.get("pokeball"),
+        COMMANDING=p_data.get("commanding"),
+        REVIVING=p_data.get("reviving"),
+        TERATYPE=cast2dex(p_data.get("teraType"), DexType),
+        TERASTALLIZED=cast2dex(p_data.get("terastallized"), DexType),
+    )
 
-        return BattleMessage_request(
-            BMTYPE=BMType.request,
-            BATTLE_MESSAGE=battle_message,
-            USERNAME=request["side"]["name"],
-            PLAYER=request["side"]["id"],
-            RQID=request.get("rqig", None),
-            ACTIVE_OPTIONS=active_options,
-            POKEMON=pokemon,
-            REQUEST_TYPE=request_type,
-            FORCESWITCH_SLOTS=request.get("forceSwitch"),
-        )
+
+def _build_request(
+    battle_message: str, request: Dict[str, Any], cache: Optional[RequestCache] = None
+) -> BattleMessage_request:
+    """Build a BattleMessage_request from its decoded request JSON, optionally reusing a battle's previous objects.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+        request (Dict[str, Any]): The decoded request JSON.
+        cache (Optional[RequestCache], optional): The battle's RequestCache, to reuse the RequestPoke and ActiveOption
+            objects of any unchanged JSON subtrees from. Defaults to None, which builds every object anew.
+
+    Returns:
+        BattleMessage_request: The parsed request.
+    """
+    if request.get("teamPreview", False):
+        request_type = "TEAMPREVIEW"
+    elif request.get("forceSwitch") is not None:
+        request_type = "FORCESWITCH"
+    elif len(request.get("active", [])) > 0:
+        request_type = "ACTIVE"
+    else:
+        request_type = "WAIT"
+
+    if request_type == "ACTIVE":
+        if cache is None:
+            active_options = [_build_active_option(ao_data) for ao_data in request.get("active", [])]
+        else:
+            active_options = [
+                cache._active_option(slot, ao_data) for slot, ao_data in enumerate(request.get("active", []))
+            ]
+    else:
+        active_options = None
+
+    if cache is None:
+        pokemon = [_build_request_poke(p_data) for p_data in request["side"]["pokemon"]]
+    else:
+        pokemon = [cache._request_poke(p_data) for p_data in request["side"]["pokemon"]]
+
+    return _construct(
+        BattleMessage_request,
+        BMTYPE=BMType.request,
+        BATTLE_MESSAGE=battle_message,
+        USERNAME=request["side"]["name"],
+        PLAYER=request["side"]["id"],
+        RQID=request.get("rqig", None),
+        ACTIVE_OPTIONS=active_options,
+        POKEMON=pokemon,
+        REQUEST_TYPE=request_type,
+        FORCESWITCH_SLOTS=request.get("forceSwitch"),
+    )
 
 
 class BattleMessage_inactive(BattleMessage):
@@ -1097,12 +1600,13 @@ class BattleMessage_inactive(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_inactive":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_inactive(
+        return _construct(
+            BattleMessage_inactive,
             BMTYPE=BMType.inactive,
             BATTLE_MESSAGE=battle_message,
-            MESSAGE=bm_split[2],
+            MESSAGE=tokens.ARGS[0],
         )
 
 
@@ -1126,12 +1630,13 @@ class BattleMessage_inactiveoff(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_inactiveoff":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_inactiveoff(
+        return _construct(
+            BattleMessage_inactiveoff,
             BMTYPE=BMType.inactiveoff,
             BATTLE_MESSAGE=battle_message,
-            MESSAGE=bm_split[2],
+            MESSAGE=tokens.ARGS[0],
         )
 
 
@@ -1150,7 +1655,8 @@ class BattleMessage_upkeep(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_upkeep":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_upkeep(
+        return _construct(
+            BattleMessage_upkeep,
             BMTYPE=BMType.upkeep,
             BATTLE_MESSAGE=battle_message,
         )
@@ -1176,12 +1682,13 @@ class BattleMessage_turn(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_turn":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_turn(
+        return _construct(
+            BattleMessage_turn,
             BMTYPE=BMType.turn,
             BATTLE_MESSAGE=battle_message,
-            NUMBER=bm_split[2],
+            NUMBER=int(tokens.ARGS[0]),
         )
 
 
@@ -1205,12 +1712,13 @@ class BattleMessage_win(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_win":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_win(
+        return _construct(
+            BattleMessage_win,
             BMTYPE=BMType.win,
             BATTLE_MESSAGE=battle_message,
-            USERNAME=bm_split[2],
+            USERNAME=tokens.ARGS[0],
         )
 
 
@@ -1229,7 +1737,8 @@ class BattleMessage_tie(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_tie":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_tie(
+        return _construct(
+            BattleMessage_tie,
             BMTYPE=BMType.tie,
             BATTLE_MESSAGE=battle_message,
         )
@@ -1250,7 +1759,8 @@ class BattleMessage_expire(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_expire":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_expire(
+        return _construct(
+            BattleMessage_expire,
             BMTYPE=BMType.expire,
             BATTLE_MESSAGE=battle_message,
         )
@@ -1276,9 +1786,14 @@ class BattleMessage_t(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_t":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_t(BMTYPE=BMType.t, BATTLE_MESSAGE=battle_message, TIMESTAMP=int(bm_split[2]))
+        return _construct(
+            BattleMessage_t,
+            BMTYPE=BMType.t,
+            BATTLE_MESSAGE=battle_message,
+            TIMESTAMP=datetime.fromtimestamp(int(tokens.ARGS[0]), tz=timezone.utc),
+        )
 
 
 class BattleMessage_move(BattleMessage):
@@ -1320,37 +1835,29 @@ class BattleMessage_move(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_move":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        user = PokemonIdentifier.from_string(bm_split[2])
-        move = cast2dex(bm_split[3], DexMove)
+        user = PokemonIdentifier.from_string(tokens.ARGS[0])
+        move = cast2dex(tokens.ARGS[1], DexMove)
 
-        target = bm_split[4]
+        target = tokens.arg(2)
 
-        if target == "null" or "[still]" in target or target == "":
+        if target is None or target == "null":
             target = None
         else:
             target = PokemonIdentifier.from_string(target)
 
-        if "[from]" in battle_message:
-            for bm_part in bm_split:
-                if "[from]" in bm_part:
-                    break
-
-            if ":" in bm_part:
-                # For whatever reason there is no space between [from] and ability/item/move in this message :<
-                eff_type = bm_part.split(":")[0].split("]")[1]
-                eff_name = " ".join(bm_part.split(" ")[1:])
-            else:
-                eff_type = "move"
-                eff_name = bm_part.split("]")[1]
+        # For whatever reason there is sometimes no space between [from] and ability/item/move in this message :<
+        eff = tokens.effect("move")
 
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type)
-        else:
-            eff = None
-
-        return BattleMessage_move(
-            BMTYPE=BMType.move, BATTLE_MESSAGE=battle_message, POKEMON=user, MOVE=move, TARGET=target, EFFECT=eff
+        return _construct(
+            BattleMessage_move,
+            BMTYPE=BMType.move,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=user,
+            MOVE=move,
+            TARGET=target,
+            EFFECT=eff,
         )
 
 
@@ -1393,61 +1900,30 @@ class BattleMessage_switch(BattleMessage):
     # Condition
     CUR_HP: int = Field(..., description="The current HP of the pokemon")
     MAX_HP: int = Field(None, description="The maximum HP of the pokemon")
-    STATUS: Optional[str] = Field(None, description="The status of the pokemon. Can be None if there is no status")
+    STATUS: Optional[DexStatus.ValueType] = Field(
+        None, description="The status of the pokemon. Can be None if there is no status"
+    )
 
     def from_message(battle_message: str) -> "BattleMessage_switch":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        details = bm_split[3].split(",")
+        details = PokemonDetails.from_details_string(tokens.ARGS[1])
 
-        species = details[0].strip()
-        level = 100
-        gender = None
-        shiny = False
-        tera = None
-
-        if len(details) > 1:
-            for detail in details[1:]:
-                detail = detail.strip()
-                if "tera" in detail:
-                    tera = detail.split(":")[1].strip()
-                elif "shiny" in detail:
-                    shiny = True
-                elif "L" in detail:
-                    level = int(detail[1:])
-                elif "M" in detail:
-                    gender = "M"
-                elif "F" in detail:
-                    gender = "F"
-
-        condition = bm_split[4]
-
-        hp_part = condition.split(" ")[0]
-
-        if "/" in hp_part:
-            cur_hp = int(hp_part.split("/")[0])
-            max_hp = int(hp_part.split("/")[1])
-        else:
-            cur_hp = int(hp_part)
-            max_hp = None
-
-        if len(condition.split(" ")) > 1:
-            status = condition.split(" ")[1]
-        else:
-            status = None
+        cur_hp, max_hp, status = parse_condition(tokens.ARGS[2])
 
-        return BattleMessage_switch(
+        return _construct(
+            BattleMessage_switch,
             BMTYPE=BMType.switch,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
-            SPECIES=cast2dex(species, DexPokemon),
-            LEVEL=level,
-            GENDER=gender,
-            SHINY=shiny,
-            TERA=tera,
+            SPECIES=details.SPECIES,
+            LEVEL=details.LEVEL,
+            GENDER=details.GENDER,
+            SHINY=details.SHINY,
+            TERA=details.TERA,
             CUR_HP=cur_hp,
             MAX_HP=max_hp,
             STATUS=status,
@@ -1493,61 +1969,30 @@ class BattleMessage_drag(BattleMessage):
     # Condition
     CUR_HP: int = Field(..., description="The current HP of the pokemon")
     MAX_HP: int = Field(None, description="The maximum HP of the pokemon")
-    STATUS: Optional[str] = Field(None, description="The status of the pokemon. Can be None if there is no status")
+    STATUS: Optional[DexStatus.ValueType] = Field(
+        None, description="The status of the pokemon. Can be None if there is no status"
+    )
 
     def from_message(battle_message: str) -> "BattleMessage_drag":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        details = bm_split[3].split(",")
+        details = PokemonDetails.from_details_string(tokens.ARGS[1])
 
-        species = details[0].strip()
-        level = 100
-        gender = None
-        shiny = False
-        tera = None
+        cur_hp, max_hp, status = parse_condition(tokens.ARGS[2])
 
-        if len(details) > 1:
-            for detail in details[1:]:
-                detail = detail.strip()
-                if "tera" in detail:
-                    tera = detail.split(":")[1].strip()
-                elif "shiny" in detail:
-                    shiny = True
-                elif "L" in detail:
-                    level = int(detail[1:])
-                elif "M" in detail:
-                    gender = "M"
-                elif "F" in detail:
-                    gender = "F"
-
-        condition = bm_split[4]
-
-        hp_part = condition.split(" ")[0]
-
-        if "/" in hp_part:
-            cur_hp = int(hp_part.split("/")[0])
-            max_hp = int(hp_part.split("/")[1])
-        else:
-            cur_hp = int(hp_part)
-            max_hp = None
-
-        if len(condition.split(" ")) > 1:
-            status = condition.split(" ")[1]
-        else:
-            status = None
-
-        return BattleMessage_drag(
+        return _construct(
+            BattleMessage_drag,
             BMTYPE=BMType.drag,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
-            SPECIES=cast2dex(species, DexPokemon),
-            LEVEL=level,
-            GENDER=gender,
-            SHINY=shiny,
-            TERA=tera,
+            SPECIES=details.SPECIES,
+            LEVEL=details.LEVEL,
+            GENDER=details.GENDER,
+            SHINY=details.SHINY,
+            TERA=details.TERA,
             CUR_HP=cur_hp,
             MAX_HP=max_hp,
             STATUS=status,
@@ -1592,41 +2037,22 @@ class BattleMessage_detailschange(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_detailschange":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        details = bm_split[3].split(",")
-
-        species = details[0].strip()
-        level = 100
-        gender = None
-        shiny = False
-        tera = None
+        details = PokemonDetails.from_details_string(tokens.ARGS[1])
 
-        if len(details) > 1:
-            for detail in details[1:]:
-                detail = detail.strip()
-                if "tera" in detail:
-                    tera = detail.split(":")[1].strip()
-                elif "shiny" in detail:
-                    shiny = True
-                elif "L" in detail:
-                    level = int(detail[1:])
-                elif "M" in detail:
-                    gender = "M"
-                elif "F" in detail:
-                    gender = "F"
-
-        return BattleMessage_detailschange(
+        return _construct(
+            BattleMessage_detailschange,
             BMTYPE=BMType.detailschange,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
-            SPECIES=cast2dex(species, DexPokemon),
-            LEVEL=level,
-            GENDER=gender,
-            SHINY=shiny,
-            TERA=tera,
+            SPECIES=details.SPECIES,
+            LEVEL=details.LEVEL,
+            GENDER=details.GENDER,
+            SHINY=details.SHINY,
+            TERA=details.TERA,
         )
 
 
@@ -1668,41 +2094,22 @@ class BattleMessage_replace(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_replace":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        details = bm_split[3].split(",")
+        details = PokemonDetails.from_details_string(tokens.ARGS[1])
 
-        species = details[0].strip()
-        level = 100
-        gender = None
-        shiny = False
-        tera = None
-
-        if len(details) > 1:
-            for detail in details[1:]:
-                detail = detail.strip()
-                if "tera" in detail:
-                    tera = detail.split(":")[1].strip()
-                elif "shiny" in detail:
-                    shiny = True
-                elif "L" in detail:
-                    level = int(detail[1:])
-                elif "M" in detail:
-                    gender = "M"
-                elif "F" in detail:
-                    gender = "F"
-
-        return BattleMessage_replace(
+        return _construct(
+            BattleMessage_replace,
             BMTYPE=BMType.replace,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
-            SPECIES=cast2dex(species, DexPokemon),
-            LEVEL=level,
-            GENDER=gender,
-            SHINY=shiny,
-            TERA=tera,
+            SPECIES=details.SPECIES,
+            LEVEL=details.LEVEL,
+            GENDER=details.GENDER,
+            SHINY=details.SHINY,
+            TERA=details.TERA,
         )
 
 
@@ -1737,28 +2144,20 @@ class BattleMessage_swap(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_swap":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        pos = int(bm_split[3].strip())
-
-        if "[from]" in battle_message:
-            from_str = bm_split[4].strip()
+        tokens = MessageTokens.from_message(battle_message)
 
-            eff_type = from_str.split(" ")[1][:-1]
-            eff_name = " ".join(from_str.split(" ")[2:])
-
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[5].split(" ")[1:]))
-            else:
-                eff_source = None
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        pos = int(tokens.ARGS[1].strip())
 
-            eff = Effect(EFFECT_TYPE=eff_type, EFFECT_NAME=eff_name, EFFECT_SOURCE=eff_source)
-        else:
-            eff = None
+        eff = tokens.effect()
 
-        return BattleMessage_swap(
-            BMTYPE=BMType.swap, BATTLE_MESSAGE=battle_message, POKEMON=poke, POSITION=pos, EFFECT=eff
+        return _construct(
+            BattleMessage_swap,
+            BMTYPE=BMType.swap,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            POSITION=pos,
+            EFFECT=eff,
         )
 
 
@@ -1793,13 +2192,14 @@ class BattleMessage_cant(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_cant":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        reason = bm_split[3].strip()
-        move = None if len(bm_split) <= 4 else bm_split[4].strip()
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        reason = tokens.ARGS[1].strip()
+        move = None if len(tokens.ARGS) <= 2 else tokens.ARGS[2].strip()
 
-        return BattleMessage_cant(
+        return _construct(
+            BattleMessage_cant,
             BMTYPE=BMType.cant,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -1828,11 +2228,11 @@ class BattleMessage_faint(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_faint":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        return BattleMessage_faint(BMTYPE=BMType.faint, BATTLE_MESSAGE=battle_message, POKEMON=poke)
+        return _construct(BattleMessage_faint, BMTYPE=BMType.faint, BATTLE_MESSAGE=battle_message, POKEMON=poke)
 
 
 class BattleMessage_fail(BattleMessage):
@@ -1865,74 +2265,47 @@ class BattleMessage_fail(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_fail":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-
-        if len(bm_split) > 3:
-            # In this case there is more details than just a Pokemon, so we can build and return an Effect
-            if "[from]" in battle_message:
-                # In this case, our main effect is whatever is detailed in the [from] string,
-                # while anything in bm_split[3] is a secondary effect
-                sec_effect = bm_split[3]
-
-                for from_str in bm_split:
-                    if "[from]" in from_str:
-                        break
-
-                # It seems things can fail due to weather that doesn't get a `weather:`` for some reason
-                if ":" not in from_str:
-                    eff_type = "weather"
-                    eff_name = " ".join(from_str.split(" ")[1:])
-                else:
-                    eff_type = from_str.split(" ")[1][:-1]
-                    eff_name = " ".join(from_str.split(" ")[2:])
-
-                if "[of]" in battle_message:
-                    for of_str in bm_split:
-                        if "[of]" in of_str:
-                            break
-
-                    eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                else:
-                    eff_source = None
-
-            elif bm_split[3] == bm_split[3].lower():
-                # In this case we either have a status or a volatile condition as the reason
+        tokens = MessageTokens.from_message(battle_message)
+
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+
+        if "from" in tokens.TAGS:
+            # In this case, our main effect is whatever is detailed in the [from] tag, while anything in the second
+            # argument is a secondary effect. It seems things can fail due to weather that doesn't get a `weather:`
+            eff = _construct(
+                Effect,
+                **_split_effect(tokens.TAGS["from"], "weather"),
+                EFFECT_SOURCE=tokens.source(),
+                SEC_EFFECT_NAME=tokens.arg(1),
+            )
 
-                if len(bm_split[3]) == 3:
-                    eff_type = "status"
-                else:
-                    eff_type = "volatile"
+        elif len(tokens.ARGS) > 1 and tokens.ARGS[1] == tokens.ARGS[1].lower():
+            # In this case we either have a status or a volatile condition as the reason
+            eff_type = "status" if len(tokens.ARGS[1]) == 3 else "volatile"
 
-                eff_name = bm_split[3]
-                eff_source = None
-                sec_effect = None
+            eff = _construct(Effect, EFFECT_NAME=tokens.ARGS[1], EFFECT_TYPE=_effect_type(eff_type))
 
+        elif len(tokens.ARGS) > 1:
+            # In this case, our primary effect is the second argument with potentially any details that come later
+            # (like [weak] for substitute) added as secondary
+            if "move:" in tokens.ARGS[1]:
+                eff_name = " ".join(tokens.ARGS[1].split(" ")[1:])
             else:
-                # In this case, our primary effect is bm_split[3] with potentially any details that come later
-                # (like [weak] for substitute) added as secondary
-                eff_type = "move"
-                eff_source = None
+                eff_name = tokens.ARGS[1]
 
-                if "move:" in bm_split[3]:
-                    eff_name = " ".join(bm_split[3].split(" ")[1:])
-                else:
-                    eff_name = bm_split[3]
-
-                if len(bm_split) > 4:
-                    sec_effect = bm_split[4]
-                else:
-                    sec_effect = None
+            if len(tokens.ARGS) > 2:
+                sec_effect = tokens.ARGS[2]
+            else:
+                sec_effect = tokens.first_tag()
 
-            eff = Effect(
-                EFFECT_NAME=eff_name, EFFECT_SOURCE=eff_source, EFFECT_TYPE=eff_type, SEC_EFFECT_NAME=sec_effect
-            )
+            eff = _construct(Effect, EFFECT_NAME=eff_name, EFFECT_TYPE=_effect_type("move"), SEC_EFFECT_NAME=sec_effect)
 
         else:
             eff = None
 
-        return BattleMessage_fail(BMTYPE=BMType.fail, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff)
+        return _construct(
+            BattleMessage_fail, BMTYPE=BMType.fail, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff
+        )
 
 
 class BattleMessage_block(BattleMessage):
@@ -1961,21 +2334,15 @@ class BattleMessage_block(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_block":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-
-        eff_type = bm_split[3].split(" ")[0][:-1]
-        eff_name = " ".join(bm_split[3].split(" ")[1:])
-
-        if "[of]" in battle_message:
-            eff_source = PokemonIdentifier.from_string(" ".join(bm_split[4].split(" ")[1:]))
-        else:
-            eff_source = None
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        eff = Effect(EFFECT_TYPE=eff_type, EFFECT_NAME=eff_name, EFFECT_SOURCE=eff_source)
+        eff = _construct(Effect, **_split_effect(tokens.ARGS[1]), EFFECT_SOURCE=tokens.source())
 
-        return BattleMessage_block(BMTYPE=BMType.block, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff)
+        return _construct(
+            BattleMessage_block, BMTYPE=BMType.block, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff
+        )
 
 
 class BattleMessage_notarget(BattleMessage):
@@ -1999,14 +2366,15 @@ class BattleMessage_notarget(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_notarget":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        if len(bm_split) == 2:
+        if len(tokens.ARGS) == 0:
             poke = None
         else:
-            poke = PokemonIdentifier.from_string(bm_split[2])
+            poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        return BattleMessage_notarget(
+        return _construct(
+            BattleMessage_notarget,
             BMTYPE=BMType.notarget,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2038,16 +2406,18 @@ class BattleMessage_miss(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_miss":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        source = PokemonIdentifier.from_string(bm_split[2])
+        source = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        if len(bm_split) > 3:
-            target = PokemonIdentifier.from_string(bm_split[3])
+        if len(tokens.ARGS) > 1:
+            target = PokemonIdentifier.from_string(tokens.ARGS[1])
         else:
             target = None
 
-        return BattleMessage_miss(BMTYPE=BMType.miss, BATTLE_MESSAGE=battle_message, SOURCE=source, TARGET=target)
+        return _construct(
+            BattleMessage_miss, BMTYPE=BMType.miss, BATTLE_MESSAGE=battle_message, SOURCE=source, TARGET=target
+        )
 
 
 class BattleMessage_damage(BattleMessage):
@@ -2075,53 +2445,25 @@ class BattleMessage_damage(BattleMessage):
     # Condition
     CUR_HP: int = Field(..., description="The current HP of the pokemon")
     MAX_HP: Optional[int] = Field(None, description="The maximum HP of the pokemon. None if the pokemon is fainted")
-    STATUS: Optional[str] = Field(None, description="The status of the pokemon. Can be None if there is no status")
+    STATUS: Optional[DexStatus.ValueType] = Field(
+        None, description="The status of the pokemon. Can be None if there is no status"
+    )
 
     EFFECT: Optional[Effect] = Field(None, description="The reason this damage was dealt, if not from a move")
 
     def from_message(battle_message: str) -> "BattleMessage_damage":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-
-        condition = bm_split[3]
+        tokens = MessageTokens.from_message(battle_message)
 
-        hp_part = condition.split(" ")[0]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        if "/" in hp_part:
-            cur_hp = int(hp_part.split("/")[0])
-            max_hp = int(hp_part.split("/")[1])
-        else:
-            cur_hp = int(hp_part)
-            max_hp = None
-
-        if len(condition.split(" ")) > 1:
-            status = condition.split(" ")[1]
-        else:
-            status = None
-
-        if len(bm_split) >= 5 and "[from]" in bm_split[4]:
-            # Parse this message assuming the form |-damage|p2a: Leavanny|180/281 tox|[from] psn
-            from_split = bm_split[4].split(" ")
+        cur_hp, max_hp, status = parse_condition(tokens.ARGS[1])
 
-            if ":" not in bm_split[4]:
-                effect_type = None
-                effect_name = " ".join(from_split[1:]).strip()
-            else:
-                effect_type = from_split[1].strip()[:-1]
-                effect_name = " ".join(from_split[2:]).strip()
-
-            if len(bm_split) >= 6 and "[of]" in bm_split[5]:
-                source = PokemonIdentifier.from_string(bm_split[5][5:])
-            else:
-                source = None
+        # Parse any effect assuming the form |-damage|p2a: Leavanny|180/281 tox|[from] psn
+        effect = tokens.effect()
 
-            effect = Effect(EFFECT_TYPE=effect_type, EFFECT_NAME=effect_name, EFFECT_SOURCE=source)
-        else:
-            effect = None
-
-        return BattleMessage_damage(
+        return _construct(
+            BattleMessage_damage,
             BMTYPE=BMType.damage,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2159,53 +2501,25 @@ class BattleMessage_heal(BattleMessage):
     # Condition
     CUR_HP: int = Field(..., description="The current HP of the pokemon")
     MAX_HP: int = Field(None, description="The maximum HP of the pokemon")
-    STATUS: Optional[str] = Field(None, description="The status of the pokemon. Can be None if there is no status")
+    STATUS: Optional[DexStatus.ValueType] = Field(
+        None, description="The status of the pokemon. Can be None if there is no status"
+    )
 
     EFFECT: Optional[Effect] = Field(None, description="The reason this health was healed, if not from a move")
 
     def from_message(battle_message: str) -> "BattleMessage_heal":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-
-        condition = bm_split[3]
-
-        hp_part = condition.split(" ")[0]
-
-        if "/" in hp_part:
-            cur_hp = int(hp_part.split("/")[0])
-            max_hp = int(hp_part.split("/")[1])
-        else:
-            cur_hp = int(hp_part)
-            max_hp = None
-
-        if len(condition.split(" ")) > 1:
-            status = condition.split(" ")[1]
-        else:
-            status = None
+        tokens = MessageTokens.from_message(battle_message)
 
-        if len(bm_split) >= 5 and "[from]" in bm_split[4]:
-            # Parse this message assuming the form |-heal|p2a: Leavanny|197/281 tox|[from] item: Leftovers
-            from_split = bm_split[4].split(" ")
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-            if ":" not in bm_split[4]:
-                effect_type = None
-                effect_name = " ".join(from_split[1:]).strip()
-            else:
-                effect_type = from_split[1].strip()[:-1]
-                effect_name = " ".join(from_split[2:]).strip()
+        cur_hp, max_hp, status = parse_condition(tokens.ARGS[1])
 
-            if len(bm_split) >= 6 and "[of]" in bm_split[5]:
-                source = PokemonIdentifier.from_string(bm_split[5][5:])
-            else:
-                source = None
+        # Parse any effect assuming the form |-heal|p2a: Leavanny|197/281 tox|[from] item: Leftovers
+        effect = tokens.effect()
 
-            effect = Effect(EFFECT_TYPE=effect_type, EFFECT_NAME=effect_name, EFFECT_SOURCE=source)
-        else:
-            effect = None
-
-        return BattleMessage_heal(
+        return _construct(
+            BattleMessage_heal,
             BMTYPE=BMType.heal,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2240,53 +2554,25 @@ class BattleMessage_sethp(BattleMessage):
 
     CUR_HP: int = Field(..., description="The current HP of the pokemon")
     MAX_HP: int = Field(None, description="The maximum HP of the pokemon")
-    STATUS: Optional[str] = Field(None, description="The status of the pokemon. Can be None if there is no status")
+    STATUS: Optional[DexStatus.ValueType] = Field(
+        None, description="The status of the pokemon. Can be None if there is no status"
+    )
 
     EFFECT: Optional[Effect] = Field(None, description="The reason this health was healed")
 
     def from_message(battle_message: str) -> "BattleMessage_sethp":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        tokens = MessageTokens.from_message(battle_message)
 
-        condition = bm_split[3]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        hp_part = condition.split(" ")[0]
+        cur_hp, max_hp, status = parse_condition(tokens.ARGS[1])
 
-        if "/" in hp_part:
-            cur_hp = int(hp_part.split("/")[0])
-            max_hp = int(hp_part.split("/")[1])
-        else:
-            cur_hp = int(hp_part)
-            max_hp = None
+        # Parse any effect assuming the form |-sethp|p2a: Exeggutor|94/100 par|[from] move: Pain Split|[silent]
+        effect = tokens.effect()
 
-        if len(condition.split(" ")) > 1:
-            status = condition.split(" ")[1]
-        else:
-            status = None
-
-        if len(bm_split) >= 5 and "[from]" in bm_split[4]:
-            # Parse this message assuming the form |-sethp|p2a: Exeggutor|94/100 par|[from] move: Pain Split|[silent]
-            from_split = bm_split[4].split(" ")
-
-            if ":" not in bm_split[4]:
-                effect_type = None
-                effect_name = " ".join(from_split[1:]).strip()
-            else:
-                effect_type = from_split[1].strip()[:-1]
-                effect_name = " ".join(from_split[2:]).strip()
-
-            if len(bm_split) >= 6 and "[of]" in bm_split[5]:
-                source = PokemonIdentifier.from_string(bm_split[5][5:])
-            else:
-                source = None
-
-            effect = Effect(EFFECT_TYPE=effect_type, EFFECT_NAME=effect_name, EFFECT_SOURCE=source)
-        else:
-            effect = None
-
-        return BattleMessage_sethp(
+        return _construct(
+            BattleMessage_sethp,
             BMTYPE=BMType.sethp,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2320,14 +2606,18 @@ class BattleMessage_status(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_status":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        status = bm_split[3]
+        status = tokens.ARGS[1]
 
-        return BattleMessage_status(
-            BMTYPE=BMType.status, BATTLE_MESSAGE=battle_message, POKEMON=poke, STATUS=cast2dex(status, DexStatus)
+        return _construct(
+            BattleMessage_status,
+            BMTYPE=BMType.status,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            STATUS=cast2dex(status, DexStatus),
         )
 
 
@@ -2354,14 +2644,18 @@ class BattleMessage_curestatus(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_curestatus":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        status = bm_split[3]
+        status = tokens.ARGS[1]
 
-        return BattleMessage_curestatus(
-            BMTYPE=BMType.curestatus, BATTLE_MESSAGE=battle_message, POKEMON=poke, STATUS=cast2dex(status, DexStatus)
+        return _construct(
+            BattleMessage_curestatus,
+            BMTYPE=BMType.curestatus,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            STATUS=cast2dex(status, DexStatus),
         )
 
 
@@ -2385,15 +2679,15 @@ class BattleMessage_cureteam(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_cureteam":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        eff_source = PokemonIdentifier.from_string(bm_split[2])
-        eff_type = bm_split[3].split(" ")[1][:-1]
-        eff_name = " ".join(bm_split[3].split(" ")[2:])
-
-        effect = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
+        effect = _construct(
+            Effect,
+            **_split_effect(tokens.TAGS["from"]),
+            EFFECT_SOURCE=PokemonIdentifier.from_string(tokens.ARGS[0]),
+        )
 
-        return BattleMessage_cureteam(BMTYPE=BMType.cureteam, BATTLE_MESSAGE=battle_message, EFFECT=effect)
+        return _construct(BattleMessage_cureteam, BMTYPE=BMType.cureteam, BATTLE_MESSAGE=battle_message, EFFECT=effect)
 
 
 class BattleMessage_boost(BattleMessage):
@@ -2423,13 +2717,14 @@ class BattleMessage_boost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_boost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        stat = bm_split[3]
-        amount = bm_split[4]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        stat = PokeStat(tokens.ARGS[1])
+        amount = int(tokens.ARGS[2])
 
-        return BattleMessage_boost(
+        return _construct(
+            BattleMessage_boost,
             BMTYPE=BMType.boost,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2465,13 +2760,14 @@ class BattleMessage_unboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_unboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        stat = bm_split[3]
-        amount = bm_split[4]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        stat = PokeStat(tokens.ARGS[1])
+        amount = int(tokens.ARGS[2])
 
-        return BattleMessage_unboost(
+        return _construct(
+            BattleMessage_unboost,
             BMTYPE=BMType.unboost,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2504,13 +2800,14 @@ class BattleMessage_setboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_setboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        stat = bm_split[3]
-        amount = bm_split[4]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        stat = PokeStat(tokens.ARGS[1])
+        amount = int(tokens.ARGS[2])
 
-        return BattleMessage_setboost(
+        return _construct(
+            BattleMessage_setboost,
             BMTYPE=BMType.setboost,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -2544,7 +2841,8 @@ class BattleMessage_swapboost(BattleMessage):
         """Create a specific BattleMessage object from a raw message."""
         raise NotImplementedError
 
-        return BattleMessage_swapboost(
+        return _construct(
+            BattleMessage_swapboost,
             BMTYPE=BMType.swapboost,
             BATTLE_MESSAGE=battle_message,
         )
@@ -2570,12 +2868,13 @@ class BattleMessage_invertboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_invertboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_invertboost(
+        return _construct(
+            BattleMessage_invertboost,
             BMTYPE=BMType.invertboost,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -2599,12 +2898,13 @@ class BattleMessage_clearboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_clearboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_clearboost(
+        return _construct(
+            BattleMessage_clearboost,
             BMTYPE=BMType.clearboost,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -2623,7 +2923,8 @@ class BattleMessage_clearallboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_clearallboost":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_clearallboost(
+        return _construct(
+            BattleMessage_clearallboost,
             BMTYPE=BMType.clearallboost,
             BATTLE_MESSAGE=battle_message,
         )
@@ -2652,18 +2953,22 @@ class BattleMessage_clearpositiveboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_clearpositiveboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        eff_source = PokemonIdentifier.from_string(bm_split[3])
-        eff_type = bm_split[4].split(" ")[0][:-1]
-        eff_name = " ".join(bm_split[4].split(" ")[1:])
+        eff_source = PokemonIdentifier.from_string(tokens.ARGS[1])
+        eff_type = tokens.ARGS[2].split(" ")[0][:-1]
+        eff_name = " ".join(tokens.ARGS[2].split(" ")[1:])
 
-        eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
+        eff = _construct(Effect, EFFECT_NAME=eff_name, EFFECT_TYPE=_effect_type(eff_type), EFFECT_SOURCE=eff_source)
 
-        return BattleMessage_clearpositiveboost(
-            BMTYPE=BMType.clearpositiveboost, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff
+        return _construct(
+            BattleMessage_clearpositiveboost,
+            BMTYPE=BMType.clearpositiveboost,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            EFFECT=eff,
         )
 
 
@@ -2687,12 +2992,13 @@ class BattleMessage_clearnegativeboost(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_clearnegativeboost":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_clearnegativeboost(
+        return _construct(
+            BattleMessage_clearnegativeboost,
             BMTYPE=BMType.clearnegativeboost,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -2721,7 +3027,8 @@ class BattleMessage_copyboost(BattleMessage):
         """Create a specific BattleMessage object from a raw message."""
         raise NotImplementedError
 
-        return BattleMessage_copyboost(
+        return _construct(
+            BattleMessage_copyboost,
             BMTYPE=BMType.copyboost,
             BATTLE_MESSAGE=battle_message,
         )
@@ -2749,30 +3056,17 @@ class BattleMessage_weather(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_weather":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        weather = bm_split[2]
-
-        if ("[upkeep]" not in battle_message) and (len(bm_split) >= 4) and ("[from]" in bm_split[3]):
-            from_split = bm_split[3].split(" ")
+        tokens = MessageTokens.from_message(battle_message)
 
-            if ":" not in bm_split[3]:
-                effect_type = None
-                effect_name = " ".join(from_split[1:]).strip()
-            else:
-                effect_type = from_split[1].strip()[:-1]
-                effect_name = " ".join(from_split[2:]).strip()
-
-            if len(bm_split) >= 5 and "[of]" in bm_split[4]:
-                source = PokemonIdentifier.from_string(bm_split[4][5:])
-            else:
-                source = None
+        weather = tokens.ARGS[0]
 
-            effect = Effect(EFFECT_TYPE=effect_type, EFFECT_NAME=effect_name, EFFECT_SOURCE=source)
+        if "upkeep" not in tokens.TAGS:
+            effect = tokens.effect()
         else:
             effect = None
 
-        return BattleMessage_weather(
+        return _construct(
+            BattleMessage_weather,
             BMTYPE=BMType.weather,
             BATTLE_MESSAGE=battle_message,
             WEATHER=cast2dex(weather, DexWeather),
@@ -2803,33 +3097,18 @@ class BattleMessage_fieldstart(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_fieldstart":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        eff_type = bm_split[2].split(" ")[0][:-1]
-        eff_name = " ".join(bm_split[2].split(" ")[1:])
-
-        if "[from]" in battle_message:
-            # In this case we want to pull the effect name from this from to set as the sec_effect
-            # TODO: Add a secondary effect type for all uses of sec_effect (why didn't I think of this earlier :<<<<)
-            sec_effect_name = " ".join(bm_split[3].split(" ")[1:])
-
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[4].split(" ")[1:]))
-            else:
-                eff_source = None
-        else:
-            sec_effect_name = None
-
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[3].split(" ")[1:]))
-            else:
-                eff_source = None
-
-        eff = Effect(
-            EFFECT_NAME=eff_name, EFFECT_SOURCE=eff_source, EFFECT_TYPE=eff_type, SEC_EFFECT_NAME=sec_effect_name
+        tokens = MessageTokens.from_message(battle_message)
+
+        # If there is a [from] tag, we want to pull the effect name from it to set as the sec_effect
+        # TODO: Add a secondary effect type for all uses of sec_effect (why didn't I think of this earlier :<<<<)
+        eff = _construct(
+            Effect,
+            **_split_effect(tokens.ARGS[0]),
+            EFFECT_SOURCE=tokens.source(),
+            SEC_EFFECT_NAME=tokens.TAGS.get("from"),
         )
 
-        return BattleMessage_fieldstart(BMTYPE=BMType.fieldstart, BATTLE_MESSAGE=battle_message, EFFECT=eff)
+        return _construct(BattleMessage_fieldstart, BMTYPE=BMType.fieldstart, BATTLE_MESSAGE=battle_message, EFFECT=eff)
 
 
 class BattleMessage_fieldend(BattleMessage):
@@ -2855,18 +3134,11 @@ class BattleMessage_fieldend(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_fieldend":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        if ":" in bm_split[2]:
-            eff_type = bm_split[2].split(" ")[0][:-1]
-            eff_name = " ".join(bm_split[2].split(" ")[1:])
-        else:
-            eff_type = "move"
-            eff_name = bm_split[2]
-
-        eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type)
+        eff = _construct(Effect, **_split_effect(tokens.ARGS[0], "move"))
 
-        return BattleMessage_fieldend(BMTYPE=BMType.fieldend, BATTLE_MESSAGE=battle_message, EFFECT=eff)
+        return _construct(BattleMessage_fieldend, BMTYPE=BMType.fieldend, BATTLE_MESSAGE=battle_message, EFFECT=eff)
 
 
 class BattleMessage_sidestart(BattleMessage):
@@ -2893,17 +3165,21 @@ class BattleMessage_sidestart(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_sidestart":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        player = bm_split[2].split(":")[0]
+        player = tokens.ARGS[0].split(":")[0]
 
-        if ":" in bm_split[3]:
-            condition = " ".join(bm_split[3].split(" ")[1:])
+        if ":" in tokens.ARGS[1]:
+            condition = " ".join(tokens.ARGS[1].split(" ")[1:])
         else:
-            condition = bm_split[3]
+            condition = tokens.ARGS[1]
 
-        return BattleMessage_sidestart(
-            BMTYPE=BMType.sidestart, BATTLE_MESSAGE=battle_message, PLAYER=player, CONDITION=condition
+        return _construct(
+            BattleMessage_sidestart,
+            BMTYPE=BMType.sidestart,
+            BATTLE_MESSAGE=battle_message,
+            PLAYER=player,
+            CONDITION=condition,
         )
 
 
@@ -2936,37 +3212,29 @@ class BattleMessage_sideend(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_sideend":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        player = bm_split[2].split(":")[0]
+        player = tokens.ARGS[0].split(":")[0]
 
-        if ":" in bm_split[3]:
-            condition = " ".join(bm_split[3].split(" ")[1:])
+        if ":" in tokens.ARGS[1]:
+            condition = " ".join(tokens.ARGS[1].split(" ")[1:])
         else:
-            condition = bm_split[3]
-
-        if "[of]" in battle_message and "[from]" not in battle_message:
-            eff_type = "volatile"
-            eff_name = "existence"
-
-            eff_source = PokemonIdentifier.from_string(" ".join(bm_split[4].split(" ")[1:]))
-
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
-        elif "[from]" in battle_message:
-            eff_type = bm_split[4].split(" ")[1][:-1]
-            eff_name = " ".join(bm_split[4].split(" ")[2:])
-
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[5].split(" ")[1:]))
-            else:
-                eff_source = None
+            condition = tokens.ARGS[1]
 
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
+        if "of" in tokens.TAGS and "from" not in tokens.TAGS:
+            eff = _construct(
+                Effect, EFFECT_NAME="existence", EFFECT_TYPE=_effect_type("volatile"), EFFECT_SOURCE=tokens.source()
+            )
         else:
-            eff = None
+            eff = tokens.effect()
 
-        return BattleMessage_sideend(
-            BMTYPE=BMType.sideend, BATTLE_MESSAGE=battle_message, PLAYER=player, CONDITION=condition, EFFECT=eff
+        return _construct(
+            BattleMessage_sideend,
+            BMTYPE=BMType.sideend,
+            BATTLE_MESSAGE=battle_message,
+            PLAYER=player,
+            CONDITION=condition,
+            EFFECT=eff,
         )
 
 
@@ -2985,7 +3253,8 @@ class BattleMessage_swapsideconditions(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_swapsideconditions":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_swapsideconditions(
+        return _construct(
+            BattleMessage_swapsideconditions,
             BMTYPE=BMType.swapsideconditions,
             BATTLE_MESSAGE=battle_message,
         )
@@ -3021,71 +3290,39 @@ class BattleMessage_volstart(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_volstart":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        volatile = tokens.ARGS[1]
 
-        if bm_split[3] == "typechange":
+        if volatile == "typechange":
             # Special case and formatting for typechange notification
-            sec_effect_name = bm_split[4]
+            sec_effect_name = tokens.ARGS[2]
 
-            if "[from]" in battle_message:
-                from_str = bm_split[5]
-
-                eff_type = from_str.split(" ")[1][:-1]
-                eff_name = " ".join(from_str.split(" ")[2:])
-
-                if "[of]" in battle_message:
-                    of_str = bm_split[6]
-                    eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                else:
-                    eff_source = None
+            if "from" in tokens.TAGS:
+                eff = _split_effect(tokens.TAGS["from"])
+                eff_source = tokens.source()
             else:
-                eff_type = "volatile"
-                eff_name = "typechange"
+                eff = _split_effect("typechange", "volatile")
                 eff_source = None
 
-        elif bm_split[3] == bm_split[3].lower():
+        elif volatile == volatile.lower():
             # TODO: Replace with better volatile checking if needed
 
-            if "[from]" in battle_message:
-                sec_effect_name = bm_split[3]
-
-                for from_str in bm_split:
-                    if "[from]" in from_str:
-                        break
-
-                eff_type = from_str.split(" ")[1][:-1]
-                eff_name = " ".join(from_str.split(" ")[2:])
-
-                if "[of]" in battle_message:
-                    for of_str in bm_split:
-                        if "[of]" in of_str:
-                            break
-
-                    eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                else:
-                    eff_source = None
+            if "from" in tokens.TAGS:
+                eff = _split_effect(tokens.TAGS["from"])
+                sec_effect_name = volatile
+                eff_source = tokens.source()
             else:
-                eff_name = bm_split[3]
-                eff_type = "volatile"
+                eff = _split_effect(volatile, "volatile")
                 sec_effect_name = None
                 eff_source = None
-        elif ":" in bm_split[3]:
-            # This means that the move here in bm_split[3] is being used ON the POKEMON, not BY
+        elif ":" in volatile:
+            # This means that the move here is being used ON the POKEMON, not BY
             # This also means there is not secondary effect of this one, since we didn't see [from]
-            eff_type = bm_split[3].split(":")[0]
-            eff_name = " ".join(bm_split[3].split(" ")[1:])
+            eff = _split_effect(volatile)
             sec_effect_name = None
-
-            if "[of]" in battle_message:
-                for of_str in bm_split:
-                    if "[of]" in of_str:
-                        break
-
-                eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-            else:
-                eff_source = None
+            eff_source = tokens.source()
         else:
             # Theres a couple of options from here. It could either be:
             #   A - |-start|POKEMON|MOVE
@@ -3094,60 +3331,21 @@ class BattleMessage_volstart(BattleMessage):
             #   D - |-start|POKEMON|MOVE|MOVE|[from] OR |-start|POKEMON|MOVE|MOVE|[from]|[of]
             # Double moves are for things like disable or mimic. In these cases, the first move is the disable/mimic/etc
             # while the second move is the thing `being` disabled/mimic'd/etc
-            move1 = bm_split[3]
-
-            if len(bm_split) < 5:
-                # Process case A here
-                eff_type = "move"
-                eff_name = move1
-                sec_effect_name = None
-                eff_source = None
-            elif "[from]" not in battle_message:
-                # Process cases B here
-                eff_type = "move"
-                eff_name = move1
-                sec_effect_name = bm_split[4]
-                eff_source = None
+            if "from" in tokens.TAGS:
+                # Process cases C and D here
+                eff = _split_effect(tokens.TAGS["from"])
+                sec_effect_name = tokens.ARGS[2] if len(tokens.ARGS) > 2 else volatile
+                eff_source = tokens.source()
             else:
-                if "[from]" in bm_split[4]:
-                    # Process case C here
-                    eff_type = bm_split[4].split(" ")[1][:-1]
-                    eff_name = " ".join(bm_split[4].split(" ")[1:])
-                    sec_effect_name = move1
-
-                    if "[of]" in battle_message:
-                        for of_str in bm_split:
-                            if "[of]" in of_str:
-                                break
-
-                        eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                    else:
-                        eff_source = None
-                else:
-                    # Process case D here
-                    move1 = bm_split[4]
-
-                    eff_type = bm_split[5].split(" ")[1][:-1]
-                    eff_name = " ".join(bm_split[5].split(" ")[1:])
-                    sec_effect_name = move1
-
-                    if "[of]" in battle_message:
-                        for of_str in bm_split:
-                            if "[of]" in of_str:
-                                break
-
-                        eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                    else:
-                        eff_source = None
+                # Process cases A and B here
+                eff = _split_effect(volatile, "move")
+                sec_effect_name = tokens.ARGS[2] if len(tokens.ARGS) > 2 else tokens.first_tag()
+                eff_source = None
 
-        eff = Effect(
-            EFFECT_TYPE=eff_type,
-            EFFECT_NAME=eff_name,
-            SEC_EFFECT_NAME=sec_effect_name,
-            EFFECT_SOURCE=eff_source,
-        )
+        eff = _construct(Effect, **eff, SEC_EFFECT_NAME=sec_effect_name, EFFECT_SOURCE=eff_source)
 
-        return BattleMessage_volstart(
+        return _construct(
+            BattleMessage_volstart,
             BMTYPE=BMType.volstart,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -3183,53 +3381,30 @@ class BattleMessage_volend(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_volend":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        volatile = tokens.ARGS[1]
 
-        silent = "[silent]" in battle_message
+        silent = "silent" in tokens.TAGS
 
-        if bm_split[3] == bm_split[3].lower():
+        if volatile == volatile.lower():
             # TODO: Replace with better volatile checking if needed
 
-            if "[from]" in battle_message:
-                sec_effect_name = bm_split[3]
-
-                for from_str in bm_split:
-                    if "[from]" in from_str:
-                        break
-
-                eff_type = from_str.split(" ")[1][:-1]
-                eff_name = " ".join(from_str.split(" ")[2:])
-
-                if "[of]" in battle_message:
-                    for of_str in bm_split:
-                        if "[of]" in of_str:
-                            break
-
-                    eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                else:
-                    eff_source = None
+            if "from" in tokens.TAGS:
+                eff = _split_effect(tokens.TAGS["from"])
+                sec_effect_name = volatile
+                eff_source = tokens.source()
             else:
-                eff_name = bm_split[3]
-                eff_type = "volatile"
+                eff = _split_effect(volatile, "volatile")
                 sec_effect_name = None
                 eff_source = None
-        elif ":" in bm_split[3]:
-            # This means that the move here in bm_split[3] was being used ON the POKEMON, not BY
+        elif ":" in volatile:
+            # This means that the move here was being used ON the POKEMON, not BY
             # This also means there is not secondary effect of this one, since we didn't see [from]
-            eff_type = bm_split[3].split(":")[0]
-            eff_name = " ".join(bm_split[3].split(" ")[1:])
+            eff = _split_effect(volatile)
             sec_effect_name = None
-
-            if "[of]" in battle_message:
-                for of_str in bm_split:
-                    if "[of]" in of_str:
-                        break
-
-                eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-            else:
-                eff_source = None
+            eff_source = tokens.source()
         else:
             # Theres a couple of options from here. It could either be:
             # A - |-end|POKEMON|MOVE
@@ -3237,43 +3412,26 @@ class BattleMessage_volend(BattleMessage):
             # C - |-end|POKEMON|MOVE|[from] OR |-end|POKEMON|MOVE|[from]|[of]
             # We will assign MOVE to EFFECT_NAME unless there is a from, in which case it will become the secondary
             # If there is not a [from] but instead a [DETAIL], MOVE will be the EFFECT_NAME instead
-            move = bm_split[3]
-
-            if len(bm_split) < 5:
-                # Process case A here
-                eff_type = "move"
-                eff_name = move
-                sec_effect_name = None
-                eff_source = None
-            elif "[from]" not in battle_message:
-                # Process cases B here
-                eff_type = "move"
-                eff_name = move
-                sec_effect_name = bm_split[4]
-                eff_source = None
+            if "from" in tokens.TAGS:
+                # Process case C here
+                eff = _split_effect(tokens.TAGS["from"])
+                sec_effect_name = volatile
+                eff_source = tokens.source()
             else:
-                eff_type = bm_split[4].split(" ")[1][:-1]
-                eff_name = " ".join(bm_split[4].split(" ")[1:])
-                sec_effect_name = move
-
-                if "[of]" in battle_message:
-                    for of_str in bm_split:
-                        if "[of]" in of_str:
-                            break
-
-                    eff_source = PokemonIdentifier.from_string(" ".join(of_str.split(" ")[1:]))
-                else:
-                    eff_source = None
+                # Process cases A and B here
+                eff = _split_effect(volatile, "move")
+                sec_effect_name = tokens.ARGS[2] if len(tokens.ARGS) > 2 else tokens.first_tag()
+                eff_source = None
 
-        eff = Effect(
-            EFFECT_TYPE=eff_type,
-            EFFECT_NAME=eff_name,
-            SEC_EFFECT_NAME=sec_effect_name,
-            EFFECT_SOURCE=eff_source,
-        )
+        eff = _construct(Effect, **eff, SEC_EFFECT_NAME=sec_effect_name, EFFECT_SOURCE=eff_source)
 
-        return BattleMessage_volend(
-            BMTYPE=BMType.volend, BATTLE_MESSAGE=battle_message, POKEMON=poke, SILENT=silent, EFFECT=eff
+        return _construct(
+            BattleMessage_volend,
+            BMTYPE=BMType.volend,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            SILENT=silent,
+            EFFECT=eff,
         )
 
 
@@ -3297,12 +3455,13 @@ class BattleMessage_crit(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_crit":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_crit(
+        return _construct(
+            BattleMessage_crit,
             BMTYPE=BMType.crit,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -3326,12 +3485,13 @@ class BattleMessage_supereffective(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_supereffective":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_supereffective(
+        return _construct(
+            BattleMessage_supereffective,
             BMTYPE=BMType.supereffective,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -3355,12 +3515,13 @@ class BattleMessage_resisted(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_resisted":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_resisted(
+        return _construct(
+            BattleMessage_resisted,
             BMTYPE=BMType.resisted,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -3384,12 +3545,13 @@ class BattleMessage_immune(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_immune":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_immune(
+        return _construct(
+            BattleMessage_immune,
             BMTYPE=BMType.immune,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=PokemonIdentifier.from_string(bm_split[2]),
+            POKEMON=PokemonIdentifier.from_string(tokens.ARGS[0]),
         )
 
 
@@ -3422,30 +3584,15 @@ class BattleMessage_item(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_item":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        item = cast2dex(bm_split[3], DexItem)
-
-        if len(bm_split) > 4:
-            # This means there is at least a [from] clause and possibly also a [of] clause
+        tokens = MessageTokens.from_message(battle_message)
 
-            from_str = bm_split[4]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        item = cast2dex(tokens.ARGS[1], DexItem)
 
-            eff_type = from_str.split(" ")[1][:-1]
-            eff_name = " ".join(from_str.split(" ")[2:])
+        eff = tokens.effect()
 
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[5].split(" ")[1:]))
-            else:
-                eff_source = None
-
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
-        else:
-            eff = None
-
-        return BattleMessage_item(
-            BMTYPE=BMType.item, BATTLE_MESSAGE=battle_message, POKEMON=poke, ITEM=item, EFFECT=eff
+        return _construct(
+            BattleMessage_item, BMTYPE=BMType.item, BATTLE_MESSAGE=battle_message, POKEMON=poke, ITEM=item, EFFECT=eff
         )
 
 
@@ -3479,56 +3626,40 @@ class BattleMessage_enditem(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_enditem":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        item = cast2dex(bm_split[3], DexItem)
-
-        # We do some quick filtering on the bm_split to get rid of any single detail things like [silent] or [eat]
-        bm_split = [bm for bm in bm_split if len(bm.strip()) > 0 and bm.strip()[0] != "[" and bm.strip()[-1] != "]"]
-
-        if len(bm_split) > 4:
-            # This means there is at least a [from] clause and possibly also a [of] clause
-            # However, enditem uses weird |[from] ATTRIBUTE|[move] MOVE or |[from] ATTRIBUTE syntax sometimes
-
-            if ":" in bm_split[4] and "[from]" in bm_split[4]:
-                # this implies that bm_split[4] is a standard syntax from statement, which we can process as normal
-                from_str = bm_split[4]
-
-                eff_type = from_str.split(" ")[1][:-1]
-                eff_name = " ".join(from_str.split(" ")[2:])
-
-                if "[of]" in battle_message:
-                    eff_source = PokemonIdentifier.from_string(" ".join(bm_split[5].split(" ")[1:]))
-                else:
-                    eff_source = None
-
-                eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
-            elif "[from]" in bm_split[4] and len(bm_split) > 5:
-                # This implies the weird split formatting syntax mentioned above
-                # EX: |-enditem|p2a: Ditto|Sitrus Berry|[from] stealeat|[move] Bug Bite|[of] p1a: Ariados
-                # For our purposes, we will set stealeat as the sec_effect, Bug Bite as eff_name, move as eff_type, and
-                # p1a: Ariados as eff_source
-
-                sec_effect = " ".join(bm_split[4].split(" ")[1:])
-                eff_type = bm_split[5].split(" ")[0][1:-1]
-                eff_name = " ".join(bm_split[5].split(" ")[1:])
-
-                if "[of]" in battle_message:
-                    eff_source = PokemonIdentifier.from_string(" ".join(bm_split[6].split(" ")[1:]))
-                else:
-                    eff_source = None
-
-                eff = Effect(
-                    EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source, SEC_EFFECT_NAME=sec_effect
-                )
-            else:
-                eff = None
+        tokens = MessageTokens.from_message(battle_message)
+
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        item = cast2dex(tokens.ARGS[1], DexItem)
+
+        # Single detail tags like [silent] or [eat] are ignored, but enditem uses weird |[from] ATTRIBUTE|[move] MOVE
+        # or |[from] ATTRIBUTE syntax sometimes
+        from_tag = tokens.TAGS.get("from", "")
+
+        if ":" in from_tag:
+            # this implies that the [from] tag is a standard syntax from statement, which we can process as normal
+            eff = tokens.effect()
+        elif from_tag and "move" in tokens.TAGS:
+            # This implies the weird split formatting syntax mentioned above
+            # EX: |-enditem|p2a: Ditto|Sitrus Berry|[from] stealeat|[move] Bug Bite|[of] p1a: Ariados
+            # For our purposes, we will set stealeat as the sec_effect, Bug Bite as eff_name, move as eff_type, and
+            # p1a: Ariados as eff_source
+            eff = _construct(
+                Effect,
+                EFFECT_NAME=tokens.TAGS["move"],
+                EFFECT_TYPE=_effect_type("move"),
+                EFFECT_SOURCE=tokens.source(),
+                SEC_EFFECT_NAME=from_tag,
+            )
         else:
             eff = None
 
-        return BattleMessage_enditem(
-            BMTYPE=BMType.enditem, BATTLE_MESSAGE=battle_message, POKEMON=poke, ITEM=item, EFFECT=eff
+        return _construct(
+            BattleMessage_enditem,
+            BMTYPE=BMType.enditem,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            ITEM=item,
+            EFFECT=eff,
         )
 
 
@@ -3562,33 +3693,16 @@ class BattleMessage_ability(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_ability":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        ability = bm_split[3]
+        tokens = MessageTokens.from_message(battle_message)
 
-        if len(bm_split) >= 5 and "[from]" in bm_split[4]:
-            # Parse this message assuming the form:
-            #  |-ability|p1a: Gardevoir|Swarm|[from] ability: Trace|[of] p2a: Leavanny
-            from_split = bm_split[4].split(" ")
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        ability = tokens.ARGS[1]
 
-            if len(from_split) == 2:
-                effect_type = None
-                effect_name = from_split[1].strip()
-            else:
-                effect_type = from_split[1].strip()[:-1]
-                effect_name = from_split[2].strip()
-
-            if len(bm_split) >= 6 and "[of]" in bm_split:
-                source = PokemonIdentifier.from_string(bm_split[5][5:])
-            else:
-                source = None
-
-            effect = Effect(EFFECT_TYPE=effect_type, EFFECT_NAME=effect_name, EFFECT_SOURCE=source)
-        else:
-            effect = None
+        # Parse any effect assuming the form |-ability|p1a: Gardevoir|Swarm|[from] ability: Trace|[of] p2a: Leavanny
+        effect = tokens.effect()
 
-        return BattleMessage_ability(
+        return _construct(
+            BattleMessage_ability,
             BMTYPE=BMType.ability,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -3617,11 +3731,13 @@ class BattleMessage_endability(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_endability":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        return BattleMessage_endability(BMTYPE=BMType.endability, BATTLE_MESSAGE=battle_message, POKEMON=poke)
+        return _construct(
+            BattleMessage_endability, BMTYPE=BMType.endability, BATTLE_MESSAGE=battle_message, POKEMON=poke
+        )
 
 
 class BattleMessage_transform(BattleMessage):
@@ -3650,27 +3766,20 @@ class BattleMessage_transform(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_transform":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        source = PokemonIdentifier.from_string(bm_split[2])
-        target = PokemonIdentifier.from_string(bm_split[3])
+        tokens = MessageTokens.from_message(battle_message)
 
-        if "[from]" in battle_message:
-            eff_type = bm_split[4].split(" ")[1][:-1]
-            eff_name = " ".join(bm_split[4].split(" ")[2:])
+        source = PokemonIdentifier.from_string(tokens.ARGS[0])
+        target = PokemonIdentifier.from_string(tokens.ARGS[1])
 
-            if "[of]" in battle_message:
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[5].split(" ")[1:]))
-            else:
-                eff_source = None
-
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source)
-
-        else:
-            eff = None
+        eff = tokens.effect()
 
-        return BattleMessage_transform(
-            BMTYPE=BMType.transform, BATTLE_MESSAGE=battle_message, SOURCE=source, TARGET=target, EFFECT=eff
+        return _construct(
+            BattleMessage_transform,
+            BMTYPE=BMType.transform,
+            BATTLE_MESSAGE=battle_message,
+            SOURCE=source,
+            TARGET=target,
+            EFFECT=eff,
         )
 
 
@@ -3698,13 +3807,14 @@ class BattleMessage_mega(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_mega":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        base_species = cast2dex(bm_split[3], DexPokemon)
-        mega_stone = cast2dex(bm_split[4], DexItem)
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        base_species = cast2dex(tokens.ARGS[1], DexPokemon)
+        mega_stone = cast2dex(tokens.ARGS[2], DexItem)
 
-        return BattleMessage_mega(
+        return _construct(
+            BattleMessage_mega,
             BMTYPE=BMType.mega,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -3735,12 +3845,14 @@ class BattleMessage_primal(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_primal":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        item = cast2dex(bm_split[3], DexItem)
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        item = cast2dex(tokens.ARGS[1], DexItem)
 
-        return BattleMessage_primal(BMTYPE=BMType.primal, BATTLE_MESSAGE=battle_message, POKEMON=poke, ITEM=item)
+        return _construct(
+            BattleMessage_primal, BMTYPE=BMType.primal, BATTLE_MESSAGE=battle_message, POKEMON=poke, ITEM=item
+        )
 
 
 class BattleMessage_burst(BattleMessage):
@@ -3768,7 +3880,8 @@ class BattleMessage_burst(BattleMessage):
         """Create a specific BattleMessage object from a raw message."""
         raise NotImplementedError
 
-        return BattleMessage_burst(
+        return _construct(
+            BattleMessage_burst,
             BMTYPE=BMType.burst,
             BATTLE_MESSAGE=battle_message,
         )
@@ -3794,11 +3907,11 @@ class BattleMessage_zpower(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_zpower":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        return BattleMessage_zpower(BMTYPE=BMType.zpower, BATTLE_MESSAGE=battle_message, POKEMON=poke)
+        return _construct(BattleMessage_zpower, BMTYPE=BMType.zpower, BATTLE_MESSAGE=battle_message, POKEMON=poke)
 
 
 class BattleMessage_zbroken(BattleMessage):
@@ -3821,11 +3934,15 @@ class BattleMessage_zbroken(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_zbroken":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
+
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        return _construct(BattleMessage_zbroken, BMTYPE=BMType.zbroken, BATTLE_MESSAGE=battle_message, POKEMON=poke)
 
-        return BattleMessage_zbroken(BMTYPE=BMType.zbroken, BATTLE_MESSAGE=battle_message, POKEMON=poke)
+
+# The tags that are never the secondary effect of an `-activate` message. None is for messages with no tags at all
+_ACTIVATE_SKIPPED_TAGS = frozenset([None, "of", "damage", "consumed"])
 
 
 class BattleMessage_activate(BattleMessage):
@@ -3855,59 +3972,44 @@ class BattleMessage_activate(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_activate":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        activated = tokens.ARGS[1]
 
-        if bm_split[3].lower() == bm_split[3]:
+        if activated.lower() == activated:
             # This means this is a volatile status (like confusion)
-            eff = Effect(EFFECT_TYPE="volatile", EFFECT_NAME=bm_split[3])
+            eff = _construct(Effect, EFFECT_TYPE=_effect_type("volatile"), EFFECT_NAME=activated)
         else:
-            if ":" not in bm_split[3]:
-                # This means it's a move, though this branch is only for older formats
-                eff_type = "move"
-                eff_name = bm_split[3]
-            else:
-                # This means that an effect cause is described here
-                eff_type = bm_split[3].split(" ")[0][:-1]
-                eff_name = " ".join(bm_split[3].split(" ")[1:])
-
-            if len(bm_split) > 4 and "[of]" in bm_split[4]:
-                # process the source poke information, the break because "[of]" is a last block only message
-                eff_source = PokemonIdentifier.from_string(" ".join(bm_split[4].split(" ")[1:]))
-                sec_effect_name = None
-            elif len(bm_split) > 4 and ("[damage]" in bm_split[4] or "[consumed]" in bm_split[4]):
-                # These are redundant as we'll see messages elsewhere with more helpful info
-                # At least this tells us there is no "[of]" part so it saves us even needing to look :/
-                sec_effect_name = None
-                eff_source = None
-            elif len(bm_split) > 4:
-                # This means theres a secondary part to the effect, such as a move being mimic'd or an ability being
-                # overwritten with Mummy
-                # In general, EFFECT_NAME should be the `more` relevant thing. So if you're activating the ability Mummy
-                # and losing Battle Armorthen we would have Mummy be the EFFECT_NAME and SEC_EFFECT_NAME is
-                # Battle Armor. This is because we know for sure what category the primary EFFECT_NAME belongs to as
-                # it is told to us directly, but theoretically the secondary could be any type and we are not informed
-                # Lastly, if you're reading this, you have my deepest apologies, we're in this mess together at least!
-                sec_effect_name = bm_split[4]
-
-                if "[of]" in battle_message:
-                    for bm_part in bm_split:
-                        if "[of]" in bm_part:
-                            eff_source = PokemonIdentifier.from_string(" ".join(bm_part.split(" ")[1:]))
-                            break
-                else:
-                    eff_source = None
+            # Without an effect cause described here, it's a move, though that is only for older formats
+            # Any [damage] or [consumed] tags are redundant as we'll see messages elsewhere with more helpful info
+
+            # If there is a secondary part to the effect, such as a move being mimic'd or an ability being overwritten
+            # with Mummy, then it comes next
+            # In general, EFFECT_NAME should be the `more` relevant thing. So if you're activating the ability Mummy
+            # and losing Battle Armorthen we would have Mummy be the EFFECT_NAME and SEC_EFFECT_NAME is
+            # Battle Armor. This is because we know for sure what category the primary EFFECT_NAME belongs to as
+            # it is told to us directly, but theoretically the secondary could be any type and we are not informed
+            # Lastly, if you're reading this, you have my deepest apologies, we're in this mess together at least!
+            # A tag-only secondary part (like the `[fromitem]` of a Booster Energy activating Quark Drive) is kept
+            # as-is, besides the [of] source and the redundant [damage]/[consumed] tags
+            if len(tokens.ARGS) > 2:
+                sec_effect_name = tokens.ARGS[2]
+            elif next(iter(tokens.TAGS), None) not in _ACTIVATE_SKIPPED_TAGS:
+                sec_effect_name = tokens.first_tag()
             else:
-                # No other information here, so we just create the effect and return
                 sec_effect_name = None
-                eff_source = None
 
-            eff = Effect(
-                EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type, EFFECT_SOURCE=eff_source, SEC_EFFECT_NAME=sec_effect_name
+            eff = _construct(
+                Effect,
+                **_split_effect(activated, "move"),
+                EFFECT_SOURCE=tokens.source(),
+                SEC_EFFECT_NAME=sec_effect_name,
             )
 
-        return BattleMessage_activate(BMTYPE=BMType.activate, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff)
+        return _construct(
+            BattleMessage_activate, BMTYPE=BMType.activate, BATTLE_MESSAGE=battle_message, POKEMON=poke, EFFECT=eff
+        )
 
 
 class BattleMessage_hint(BattleMessage):
@@ -3930,9 +4032,9 @@ class BattleMessage_hint(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_hint":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_hint(BMTYPE=BMType.hint, BATTLE_MESSAGE=battle_message, MESSAGE=bm_split[2])
+        return _construct(BattleMessage_hint, BMTYPE=BMType.hint, BATTLE_MESSAGE=battle_message, MESSAGE=tokens.ARGS[0])
 
 
 class BattleMessage_center(BattleMessage):
@@ -3950,7 +4052,8 @@ class BattleMessage_center(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_center":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_center(
+        return _construct(
+            BattleMessage_center,
             BMTYPE=BMType.center,
             BATTLE_MESSAGE=battle_message,
         )
@@ -3976,9 +4079,11 @@ class BattleMessage_message(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_message":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_message(BMTYPE=BMType.message, BATTLE_MESSAGE=battle_message, MESSAGE=bm_split[2])
+        return _construct(
+            BattleMessage_message, BMTYPE=BMType.message, BATTLE_MESSAGE=battle_message, MESSAGE=tokens.ARGS[0]
+        )
 
 
 class BattleMessage_combine(BattleMessage):
@@ -3996,7 +4101,8 @@ class BattleMessage_combine(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_combine":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_combine(
+        return _construct(
+            BattleMessage_combine,
             BMTYPE=BMType.combine,
             BATTLE_MESSAGE=battle_message,
         )
@@ -4027,7 +4133,8 @@ class BattleMessage_waiting(BattleMessage):
         """Create a specific BattleMessage object from a raw message."""
         raise NotImplementedError
 
-        return BattleMessage_waiting(
+        return _construct(
+            BattleMessage_waiting,
             BMTYPE=BMType.waiting,
             BATTLE_MESSAGE=battle_message,
         )
@@ -4056,12 +4163,14 @@ class BattleMessage_prepare(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_prepare":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        move = cast2dex(bm_split[3], DexMove)
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        move = cast2dex(tokens.ARGS[1], DexMove)
 
-        return BattleMessage_prepare(BMTYPE=BMType.prepare, BATTLE_MESSAGE=battle_message, POKEMON=poke, MOVE=move)
+        return _construct(
+            BattleMessage_prepare, BMTYPE=BMType.prepare, BATTLE_MESSAGE=battle_message, POKEMON=poke, MOVE=move
+        )
 
 
 class BattleMessage_mustrecharge(BattleMessage):
@@ -4084,12 +4193,13 @@ class BattleMessage_mustrecharge(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_mustrecharge":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        return BattleMessage_mustrecharge(
+        return _construct(
+            BattleMessage_mustrecharge,
             BMTYPE=BMType.mustrecharge,
             BATTLE_MESSAGE=battle_message,
-            POKEMON=bm_split[2],
+            POKEMON=tokens.ARGS[0],
         )
 
 
@@ -4108,7 +4218,8 @@ class BattleMessage_nothing(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_nothing":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_nothing(
+        return _construct(
+            BattleMessage_nothing,
             BMTYPE=BMType.nothing,
             BATTLE_MESSAGE=battle_message,
         )
@@ -4136,12 +4247,14 @@ class BattleMessage_hitcount(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_hitcount":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        num = bm_split[3]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        num = int(tokens.ARGS[1])
 
-        return BattleMessage_hitcount(BMTYPE=BMType.hitcount, BATTLE_MESSAGE=battle_message, POKEMON=poke, NUM=num)
+        return _construct(
+            BattleMessage_hitcount, BMTYPE=BMType.hitcount, BATTLE_MESSAGE=battle_message, POKEMON=poke, NUM=num
+        )
 
 
 class BattleMessage_singlemove(BattleMessage):
@@ -4167,13 +4280,17 @@ class BattleMessage_singlemove(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_singlemove":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        move = bm_split[3]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        move = tokens.ARGS[1]
 
-        return BattleMessage_singlemove(
-            BMTYPE=BMType.singlemove, BATTLE_MESSAGE=battle_message, POKEMON=poke, MOVE=cast2dex(move, DexMove)
+        return _construct(
+            BattleMessage_singlemove,
+            BMTYPE=BMType.singlemove,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            MOVE=cast2dex(move, DexMove),
         )
 
 
@@ -4200,16 +4317,20 @@ class BattleMessage_singleturn(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_singleturn":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
-        move = bm_split[3]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
+        move = tokens.ARGS[1]
 
         if ":" in move:
             move = move.split(":")[-1].strip()
 
-        return BattleMessage_singleturn(
-            BMTYPE=BMType.singleturn, BATTLE_MESSAGE=battle_message, POKEMON=poke, MOVE=cast2dex(move, DexMove)
+        return _construct(
+            BattleMessage_singleturn,
+            BMTYPE=BMType.singleturn,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            MOVE=cast2dex(move, DexMove),
         )
 
 
@@ -4239,23 +4360,16 @@ class BattleMessage_formechange(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_formechange":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
-
-        poke = PokemonIdentifier.from_string(bm_split[2])
-
-        species = bm_split[3].strip()
+        tokens = MessageTokens.from_message(battle_message)
 
-        if "[from]" in battle_message:
-            from_str = bm_split[-1]
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-            eff_type = from_str.split(" ")[1][:-1]
-            eff_name = " ".join(from_str.split(" ")[2:])
+        species = tokens.ARGS[1].strip()
 
-            eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type)
-        else:
-            eff = None
+        eff = tokens.effect()
 
-        return BattleMessage_formechange(
+        return _construct(
+            BattleMessage_formechange,
             BMTYPE=BMType.formechange,
             BATTLE_MESSAGE=battle_message,
             POKEMON=poke,
@@ -4287,14 +4401,18 @@ class BattleMessage_terastallize(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_terastallize":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        poke = PokemonIdentifier.from_string(bm_split[2])
+        poke = PokemonIdentifier.from_string(tokens.ARGS[0])
 
-        tera_type = cast2dex(bm_split[3], DexType)
+        tera_type = cast2dex(tokens.ARGS[1], DexType)
 
-        return BattleMessage_terastallize(
-            BMTYPE=BMType.terastallize, BATTLE_MESSAGE=battle_message, POKEMON=poke, TYPE=tera_type
+        return _construct(
+            BattleMessage_terastallize,
+            BMTYPE=BMType.terastallize,
+            BATTLE_MESSAGE=battle_message,
+            POKEMON=poke,
+            TYPE=tera_type,
         )
 
 
@@ -4318,18 +4436,13 @@ class BattleMessage_fieldactivate(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_fieldactivate":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        if ":" in bm_split[2]:
-            eff_type = bm_split[2].split(" ")[0][:-1]
-            eff_name = " ".join(bm_split[2].split(" ")[1:])
-        else:
-            eff_type = "ability"
-            eff_name = bm_split[2]
-
-        eff = Effect(EFFECT_NAME=eff_name, EFFECT_TYPE=eff_type)
+        eff = _construct(Effect, **_split_effect(tokens.ARGS[0], "ability"))
 
-        return BattleMessage_fieldactivate(BMTYPE=BMType.fieldactivate, BATTLE_MESSAGE=battle_message, EFFECT=eff)
+        return _construct(
+            BattleMessage_fieldactivate, BMTYPE=BMType.fieldactivate, BATTLE_MESSAGE=battle_message, EFFECT=eff
+        )
 
 
 class BattleMessage_error(BattleMessage):
@@ -4352,9 +4465,11 @@ class BattleMessage_error(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_error":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_error(BMTYPE=BMType.error, BATTLE_MESSAGE=battle_message, MESSAGE=bm_split[2])
+        return _construct(
+            BattleMessage_error, BMTYPE=BMType.error, BATTLE_MESSAGE=battle_message, MESSAGE=tokens.ARGS[0]
+        )
 
 
 class BattleMessage_bigerror(BattleMessage):
@@ -4377,9 +4492,11 @@ class BattleMessage_bigerror(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_bigerror":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_bigerror(BMTYPE=BMType.bigerror, BATTLE_MESSAGE=battle_message, MESSAGE=bm_split[2])
+        return _construct(
+            BattleMessage_bigerror, BMTYPE=BMType.bigerror, BATTLE_MESSAGE=battle_message, MESSAGE=tokens.ARGS[0]
+        )
 
 
 class BattleMessage_init(BattleMessage):
@@ -4397,7 +4514,7 @@ class BattleMessage_init(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_init":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_init(BMTYPE=BMType.init, BATTLE_MESSAGE=battle_message)
+        return _construct(BattleMessage_init, BMTYPE=BMType.init, BATTLE_MESSAGE=battle_message)
 
 
 class BattleMessage_deinit(BattleMessage):
@@ -4415,7 +4532,7 @@ class BattleMessage_deinit(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_deinit":
         """Create a specific BattleMessage object from a raw message."""
-        return BattleMessage_deinit(BMTYPE=BMType.deinit, BATTLE_MESSAGE=battle_message)
+        return _construct(BattleMessage_deinit, BMTYPE=BMType.deinit, BATTLE_MESSAGE=battle_message)
 
 
 class BattleMessage_title(BattleMessage):
@@ -4438,9 +4555,9 @@ class BattleMessage_title(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_title":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_title(BMTYPE=BMType.title, BATTLE_MESSAGE=battle_message, TITLE=bm_split[2])
+        return _construct(BattleMessage_title, BMTYPE=BMType.title, BATTLE_MESSAGE=battle_message, TITLE=tokens.ARGS[0])
 
 
 class BattleMessage_join(BattleMessage):
@@ -4463,9 +4580,11 @@ class BattleMessage_join(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_join":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_join(BMTYPE=BMType.join, BATTLE_MESSAGE=battle_message, USERNAME=bm_split[2])
+        return _construct(
+            BattleMessage_join, BMTYPE=BMType.join, BATTLE_MESSAGE=battle_message, USERNAME=tokens.ARGS[0]
+        )
 
 
 class BattleMessage_leave(BattleMessage):
@@ -4488,9 +4607,11 @@ class BattleMessage_leave(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_leave":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_leave(BMTYPE=BMType.leave, BATTLE_MESSAGE=battle_message, USERNAME=bm_split[2])
+        return _construct(
+            BattleMessage_leave, BMTYPE=BMType.leave, BATTLE_MESSAGE=battle_message, USERNAME=tokens.ARGS[0]
+        )
 
 
 class BattleMessage_raw(BattleMessage):
@@ -4513,9 +4634,9 @@ class BattleMessage_raw(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_raw":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message, parse_tags=False)
 
-        return BattleMessage_raw(BMTYPE=BMType.raw, BATTLE_MESSAGE=battle_message, MESSAGE=bm_split[2])
+        return _construct(BattleMessage_raw, BMTYPE=BMType.raw, BATTLE_MESSAGE=battle_message, MESSAGE=tokens.ARGS[0])
 
 
 class BattleMessage_anim(BattleMessage):
@@ -4552,19 +4673,20 @@ class BattleMessage_anim(BattleMessage):
 
     def from_message(battle_message: str) -> "BattleMessage_anim":
         """Create a specific BattleMessage object from a raw message."""
-        bm_split = battle_message.split("|")
+        tokens = MessageTokens.from_message(battle_message)
 
-        source = PokemonIdentifier.from_string(bm_split[2])
-        move = bm_split[3]
+        source = PokemonIdentifier.from_string(tokens.ARGS[0])
+        move = tokens.ARGS[1]
 
-        if len(bm_split) > 5 and bm_split[5] == "[notarget]":
+        if "notarget" in tokens.TAGS:
             no_target = True
-            target = PokemonIdentifier.from_slot_string(bm_split[4])
+            target = PokemonIdentifier.from_string(tokens.ARGS[2])
         else:
             no_target = False
-            target = PokemonIdentifier.from_string(bm_split[4])
+            target = PokemonIdentifier.from_string(tokens.ARGS[2])
 
-        return BattleMessage_anim(
+        return _construct(
+            BattleMessage_anim,
             BMTYPE=BMType.anim,
             BATTLE_MESSAGE=battle_message,
             SOURCE=source,
@@ -4676,3 +4798,524 @@ bmtype_to_bmclass: Dict[BMType, Type["BattleMessage"]] = {
     BMType.raw: BattleMessage_raw,
     BMType.anim: BattleMessage_anim,
 }
+
+# Message keys whose subclass reports a different, canonical BMType
+bmtype_aliases: Dict[BMType, BMType] = {
+    BMType.mess: BMType.message,
+    BMType.j: BMType.join,
+    BMType.J: BMType.join,
+    BMType.l: BMType.leave,
+    BMType.L: BMType.leave,
+}
+
+_BMTYPE_KEYS = frozenset(bmtype.value for bmtype in BMType)
+
+# The BMType of each message key as raw bytes, for parsing frames without decoding them first
+_BMTYPE_BY_BYTES: Dict[bytes, BMType] = {
+    bmtype.value.encode("utf8"): bmtype_aliases.get(bmtype, bmtype) for bmtype in BMType
+}
+
+# Message keys that BattleMessage.parse_bytes leaves undecoded until first read, since their payload is free text or
+# HTML. This includes chat and html keys that can show up in battle rooms despite not having a BMType of their own
+BYTES_DEFERRED_KEYS = frozenset(
+    key.encode("utf8")
+    for key in [
+        "raw",
+        "html",
+        "uhtml",
+        "uhtmlchange",
+        "c",
+        "c:",
+        "chat",
+        "message",
+        "-message",
+        "-hint",
+        "inactive",
+        "inactiveoff",
+        "error",
+        "bigerror",
+    ]
+)
+
+
+class LazyBattleMessage:
+    """A stand-in for a BattleMessage that only runs the full parser once a parsed field is first read.
+
+    BMTYPE and BATTLE_MESSAGE are available immediately, since they only require looking at the message key. Reading
+    any other attribute (`SPECIES`, `EFFECT`, `ERR_STATE`, ...) parses the message with `BattleMessage.from_message`
+    exactly once, caches the resulting subclass, and forwards that and every later attribute read to it.
+
+    This is useful for consumers such as spectators or loggers that mostly dispatch on BMTYPE, and skip building the
+    PokemonIdentifier, Effect, and Dex values of messages they never inspect.
+
+    Note that BMTYPE is decided from the message key alone, so a message that later fails to parse will keep its
+    original BMTYPE here, while the parsed message (and its ERR_STATE) will report the failure.
+
+    Args:
+        battle_message (str): The newline-stripped single string battle message as sent by the server.
+        validate (bool, optional): Whether to run pydantic validation once the message is parsed. See
+            `BattleMessage.from_message`. Defaults to True.
+
+    Attributes:
+        BMTYPE (BMType): The message type of this battle message, or BMType.unknown if the message key isn't recognized.
+    """
+
+    __slots__ = ("BMTYPE", "_message", "_validate", "_parsed")
+
+    BMTYPE: BMType
+
+    def __init__(self, battle_message: str, validate: bool = True):  # noqa: D107
+        key = _message_key(battle_message)
+
+        if key is None:
+            self.BMTYPE = BMType.empty
+            self._message: Union[str, bytes] = ""
+        else:
+            try:
+                bmtype = BMType(key)
+            except ValueError:
+                bmtype = BMType.unknown
+            self.BMTYPE = bmtype_aliases.get(bmtype, bmtype)
+            self._message = battle_message
+
+        self._validate = validate
+        self._parsed: Optional[BattleMessage] = None
+
+    @staticmethod
+    def _from_bytes(line: bytes, key: bytes, validate: bool) -> "LazyBattleMessage":
+        """Create a LazyBattleMessage from a raw UTF-8 line, leaving it undecoded until BATTLE_MESSAGE is first read.
+
+        Args:
+            line (bytes): The newline-stripped raw line.
+            key (bytes): The line's message key.
+            validate (bool): Whether to run pydantic validation once the message is parsed.
+
+        Returns:
+            LazyBattleMessage: The unparsed, undecoded message.
+        """
+        lazy = object.__new__(LazyBattleMessage)
+        lazy.BMTYPE = _BMTYPE_BY_BYTES.get(key, BMType.unknown)
+        lazy._message = line
+        lazy._validate = validate
+        lazy._parsed = None
+
+        return lazy
+
+    @property
+    def BATTLE_MESSAGE(self) -> str:
+        """The raw message line as sent from showdown, decoded on first access if it was received as bytes."""
+        message = self._message
+        if not isinstance(message, str):
+            message = self._message = str(message, "utf8")
+        return message
+
+    @staticmethod
+    def from_message(battle_message: str, validate: bool = True) -> "LazyBattleMessage":
+        """Create a LazyBattleMessage from a raw message, deferring the parsing of every field besides BMTYPE.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+            validate (bool, optional): Whether to run pydantic validation once the message is parsed. See
+                `BattleMessage.from_message`. Defaults to True.
+
+        Returns:
+            LazyBattleMessage: The unparsed message.
+        """
+        return LazyBattleMessage(battle_message, validate=validate)
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether the full parser has already been run for this message."""
+        return self._parsed is not None
+
+    @property
+    def parsed(self) -> BattleMessage:
+        """The fully parsed BattleMessage subclass, parsing the message on first access."""
+        if self._parsed is None:
+            self._parsed = BattleMessage.from_message(self.BATTLE_MESSAGE, validate=self._validate)
+        return self._parsed
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward any attribute that isn't BMTYPE or BATTLE_MESSAGE to the parsed message.
+
+        Args:
+            name (str): The attribute being read.
+
+        Raises:
+            AttributeError: If the attribute is private, or doesn't exist on the parsed message.
+
+        Returns:
+            Any: The attribute's value on the parsed message.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.parsed, name)
+
+    def __repr__(self) -> str:
+        """Show the message type and raw message, without triggering a parse.
+
+        Returns:
+            str: The representation of this lazy message.
+        """
+        return f"LazyBattleMessage(BMTYPE={self.BMTYPE!r}, BATTLE_MESSAGE={self.BATTLE_MESSAGE!r})"
+
+
+def _parse_frame_bytes(
+    frame: Union[bytes, bytearray, memoryview],
+    is_selected: Callable[[bytes], bool],
+    skip_unselected: bool,
+    validate: bool,
+    errors: Optional[List[ParseFailure]],
+) -> List[Union[BattleMessage, LazyBattleMessage]]:
+    """Parse the selected lines of a raw UTF-8 frame, decoding nothing but the lines that are parsed.
+
+    The frame is split into lines as bytes, and each line's message key is looked up as bytes, so the frame is never
+    decoded as a whole. Unselected lines keep their raw bytes, which don't share memory with the given frame, so the
+    caller is free to reuse its receive buffer.
+
+    Args:
+        frame (Union[bytes, bytearray, memoryview]): The full frame as received from the server.
+        is_selected (Callable[[bytes], bool]): Whether a line with the given message key should be parsed.
+        skip_unselected (bool): Whether to drop unselected lines, rather than returning them as LazyBattleMessages.
+        validate (bool): Whether to run pydantic validation on the parsed fields.
+        errors (Optional[List[ParseFailure]]): A list that a ParseFailure is appended to for every line that fails to
+            parse, if any.
+
+    Returns:
+        List[Union[BattleMessage, LazyBattleMessage]]: The parsed and unparsed messages, in the same order as the lines.
+    """
+    # Split like `_frame_lines`, on b"\n" alone, since bytes.splitlines also splits on a lone b"\r"
+    lines = [line[:-1] if line.endswith(b"\r") else line for line in bytes(frame).split(b"\n")]
+    if lines[-1] == b"":
+        del lines[-1]
+    if lines and lines[0].startswith(b">"):
+        del lines[0]
+
+    messages = []
+    stats = instrumentation.active_stats
+
+    token = _TRUSTED.set(not validate)
+    try:
+        for line in lines:
+            if line.startswith(b"|"):
+                end = line.find(b"|", 1)
+                key = line[1:end] if end != -1 else line[1:]
+            else:
+                key = line
+
+            if is_selected(key):
+                line = line.decode("utf8")
+
+                if stats is None:
+                    bm, failure = _parse_message(line)
+                else:
+                    bm, failure = _timed_parse_message(line, stats)
+
+                if failure is not None:
+                    _report_failure(failure, errors)
+
+                messages.append(bm)
+            elif not skip_unselected:
+                messages.append(LazyBattleMessage._from_bytes(line, key, validate))
+    finally:
+        _TRUSTED.reset(token)
+
+    return messages
+
+
+class BattleMessageParser:
+    """A reusable parser that only fully decodes the BMTypes its consumer cares about.
+
+    Most consumers ignore a large share of battle messages (`|raw|`, `|html|`, `|j|`, `|c|`, `-hint`, `-anim`, ...).
+    A parser built with an allow-list or a deny-list of BMTypes reads just the message key of each line, and only runs
+    the full parser for selected messages. Every other message either comes back as an unparsed LazyBattleMessage
+    stub, or is skipped entirely, without any Dex casting or pydantic work.
+
+    Aliased message keys follow the BMType they alias, so allowing BMType.join also selects `|j|` and `|J|` messages.
+    Unrecognized message keys are only selected if BMType.unknown is.
+
+    Args:
+        allow (Optional[Iterable[BMType]], optional): The only BMTypes to fully parse. Defaults to None.
+        deny (Optional[Iterable[BMType]], optional): The BMTypes to not fully parse, if `allow` isn't given. Defaults to
+            None, which (with no allow-list either) fully parses every message.
+        skip_unselected (bool, optional): Whether to drop unselected messages from `parse_many` and `parse_block`, and
+            return None for them from `parse`, rather than returning an unparsed LazyBattleMessage. Defaults to False.
+        validate (bool, optional): Whether to run pydantic validation on the parsed fields. See
+            `BattleMessage.from_message`. Defaults to True.
+
+    Raises:
+        ValueError: If both an allow-list and a deny-list are given.
+
+    Attributes:
+        SELECTED (FrozenSet[BMType]): Every BMType that this parser fully parses.
+    """
+
+    __slots__ = (
+        "SELECTED",
+        "_selected_keys",
+        "_selected_byte_keys",
+        "_unknown_selected",
+        "_skip_unselected",
+        "_validate",
+    )
+
+    SELECTED: FrozenSet[BMType]
+
+    def __init__(  # noqa: D107
+        self,
+        allow: Optional[Iterable[BMType]] = None,
+        deny: Optional[Iterable[BMType]] = None,
+        skip_unselected: bool = False,
+        validate: bool = True,
+    ):
+        if allow is not None and deny is not None:
+            raise ValueError("A BattleMessageParser takes either an allow-list or a deny-list of BMTypes, not both")
+
+        if allow is not None:
+            allowed = set(allow)
+            selected = {bmtype for bmtype in BMType if bmtype_aliases.get(bmtype, bmtype) in allowed}
+        else:
+            denied = set(deny or [])
+            selected = {bmtype for bmtype in BMType if bmtype_aliases.get(bmtype, bmtype) not in denied}
+
+        self.SELECTED = frozenset(selected)
+        self._selected_keys = frozenset(bmtype.value for bmtype in selected)
+        self._selected_byte_keys = frozenset(key.encode("utf8") for key in self._selected_keys)
+        self._unknown_selected = BMType.unknown in selected
+        self._skip_unselected = skip_unselected
+        self._validate = validate
+
+    def is_selected(self, battle_message: str) -> bool:
+        """Check whether a raw message would be fully parsed, only looking at its message key.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+
+        Returns:
+            bool: Whether the message's BMType is selected by this parser.
+        """
+        # Like `_message_key`, a line without a leading `|` (such as a plain-text server notice) is all key
+        if battle_message.startswith("|"):
+            end = battle_message.find("|", 1)
+            key = battle_message[1:end] if end != -1 else battle_message[1:]
+        else:
+            key = battle_message
+
+        if key in self._selected_keys:
+            return True
+
+        return self._unknown_selected and key not in _BMTYPE_KEYS
+
+    def _is_key_selected(self, key: bytes) -> bool:
+        """Check whether a raw message key would be fully parsed. See `is_selected`.
+
+        Args:
+            key (bytes): The message key as raw bytes.
+
+        Returns:
+            bool: Whether the message key's BMType is selected by this parser.
+        """
+        if key in self._selected_byte_keys:
+            return True
+
+        return self._unknown_selected and key not in _BMTYPE_BY_BYTES
+
+    def parse(self, battle_message: str) -> Optional[Union[BattleMessage, LazyBattleMessage]]:
+        """Parse a single raw message if its BMType is selected.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+
+        Returns:
+            Optional[Union[BattleMessage, LazyBattleMessage]]: The parsed message if selected. Otherwise an unparsed
+                LazyBattleMessage, or None if this parser skips unselected messages.
+        """
+        if self.is_selected(battle_message):
+            return BattleMessage.from_message(battle_message, validate=self._validate)
+        elif self._skip_unselected:
+            return None
+        else:
+            return LazyBattleMessage(battle_message, validate=self._validate)
+
+    def parse_many(
+        self, lines: Iterable[str], errors: Optional[List[ParseFailure]] = None
+    ) -> List[Union[BattleMessage, LazyBattleMessage]]:
+        """Parse every selected message in a batch of lines. See `BattleMessage.parse_many`.
+
+        Args:
+            lines (Iterable[str]): The single string battle messages as sent by the server. Trailing newlines are
+                stripped.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every
+                selected line that fails to parse. If not given, failures are recorded with the current error sink
+                instead. Defaults to None.
+
+        Returns:
+            List[Union[BattleMessage, LazyBattleMessage]]: The parsed messages in the same order as the lines, with
+                unselected messages either left as unparsed LazyBattleMessages or skipped.
+        """
+        messages = []
+        stats = instrumentation.active_stats
+
+        token = _TRUSTED.set(not self._validate)
+        try:
+            for line in lines:
+                line = line.rstrip("\r\n")
+
+                if self.is_selected(line):
+                    if stats is None:
+                        bm, failure = _parse_message(line)
+                    else:
+                        bm, failure = _timed_parse_message(line, stats)
+
+                    if failure is not None:
+                        _report_failure(failure, errors)
+
+                    messages.append(bm)
+                elif not self._skip_unselected:
+                    messages.append(LazyBattleMessage(line, validate=self._validate))
+        finally:
+            _TRUSTED.reset(token)
+
+        return messages
+
+    def parse_block(
+        self, frame: str, errors: Optional[List[ParseFailure]] = None
+    ) -> List[Union[BattleMessage, LazyBattleMessage]]:
+        """Parse every selected message in a multi-line frame sent by the server. See `BattleMessage.parse_block`.
+
+        Args:
+            frame (str): The full frame as sent by the server.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every
+                selected line that fails to parse. If not given, failures are recorded with the current error sink
+                instead. Defaults to None.
+
+        Returns:
+            List[Union[BattleMessage, LazyBattleMessage]]: The parsed messages in the same order as the frame's lines,
+                with unselected messages either left as unparsed LazyBattleMessages or skipped.
+        """
+        return self.parse_many(_frame_lines(frame), errors=errors)
+
+    def parse_bytes(
+        self, frame: Union[bytes, bytearray, memoryview], errors: Optional[List[ParseFailure]] = None
+    ) -> List[Union[BattleMessage, LazyBattleMessage]]:
+        """Parse every selected message in a frame received as raw UTF-8 bytes. See `BattleMessage.parse_bytes`.
+
+        Only the lines of selected messages are decoded. Unselected messages are either skipped or left as undecoded
+        LazyBattleMessages, whatever their message key.
+
+        Args:
+            frame (Union[bytes, bytearray, memoryview]): The full frame as received from the server.
+            errors (Optional[List[ParseFailure]], optional): A list that a ParseFailure is appended to for every
+                selected line that fails to parse. If not given, failures are recorded with the current error sink
+                instead. Defaults to None.
+
+        Returns:
+            List[Union[BattleMessage, LazyBattleMessage]]: The parsed messages in the same order as the frame's lines,
+                with unselected messages either left as unparsed LazyBattleMessages or skipped.
+        """
+        return _parse_frame_bytes(frame, self._is_key_selected, self._skip_unselected, self._validate, errors)
+
+
+class RequestCache:
+    """Parses the `|request|` messages of a single battle, reusing the objects of anything unchanged since the last one.
+
+    The server sends a full request before every decision, describing the player's whole team and every active slot's
+    options, even though most turns only change a pokemon or two. A RequestCache remembers the decoded JSON of each
+    pokemon (by its ident) and active slot from the previous request, and hands back the same RequestPoke and
+    ActiveOption objects whenever their JSON is unchanged, skipping the PokemonDetails, condition, stat, and Dex
+    parsing that building them takes.
+
+    Since reused objects are shared between requests, they should be treated as read-only. Use one RequestCache per
+    battle (and per player), and call `clear` if it is reused for another one. The `hits` and `misses` counters hold
+    how many RequestPoke and ActiveOption objects were reused and built so far.
+    """
+
+    __slots__ = ("_pokemon", "_active", "hits", "misses")
+
+    def __init__(self):  # noqa: D107
+        self._pokemon: Dict[str, Tuple[Dict[str, Any], RequestPoke]] = {}
+        self._active: Dict[int, Tuple[Dict[str, Any], ActiveOption]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, battle_message: str, validate: bool = True) -> BattleMessage:
+        """Create a specific BattleMessage object from a raw message, like `BattleMessage.from_message`.
+
+        Messages other than non-empty requests are handed to `BattleMessage.from_message` as is, as are requests that
+        fail to parse, so that failures are reported the same way.
+
+        Args:
+            battle_message (str): The newline-stripped single string battle message as sent by the server.
+            validate (bool, optional): Whether to run pydantic validation on the parsed fields. See
+                `BattleMessage.from_message`. Defaults to True.
+
+        Returns:
+            BattleMessage: An initialized subclass of `BattleMessage`, for the corresponding class for this message
+                type.
+        """
+        if not battle_message.startswith("|request|") or battle_message == "|request|":
+            return BattleMessage.from_message(battle_message, validate=validate)
+
+        stats = instrumentation.active_stats
+        start = perf_counter_ns()
+
+        token = _TRUSTED.set(not validate)
+        try:
+            bm = _build_request(battle_message, jsonbackend.loads(_request_payload(battle_message)), self)
+        except Exception:
+            return BattleMessage.from_message(battle_message, validate=validate)
+        finally:
+            _TRUSTED.reset(token)
+
+        if stats is not None:
+            stats.record("BattleMessage", "request", perf_counter_ns() - start, False)
+
+        return bm
+
+    def clear(self) -> None:
+        """Forget every remembered pokemon and active slot.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self._pokemon.clear()
+        self._active.clear()
+
+    def _request_poke(self, p_data: Dict[str, Any]) -> RequestPoke:
+        """Get the RequestPoke of a pokemon, reusing the previous one if its JSON is unchanged.
+
+        Args:
+            p_data (Dict[str, Any]): The pokemon's entry in the request's `side.pokemon` list.
+
+        Returns:
+            RequestPoke: The details of the pokemon.
+        """
+        cached = self._pokemon.get(p_data["ident"])
+        if cached is not None and cached[0] == p_data:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        poke = _build_request_poke(p_data)
+        self._pokemon[p_data["ident"]] = (p_data, poke)
+        return poke
+
+    def _active_option(self, slot: int, ao_data: Dict[str, Any]) -> ActiveOption:
+        """Get the ActiveOption of an active slot, reusing the previous one if its JSON is unchanged.
+
+        Args:
+            slot (int): The index of the slot in the request's `active` list.
+            ao_data (Dict[str, Any]): The slot's entry in the request's `active` list.
+
+        Returns:
+            ActiveOption: The options available to the pokemon in this slot.
+        """
+        cached = self._active.get(slot)
+        if cached is not None and cached[0] == ao_data:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        option = _build_active_option(ao_data)
+        self._active[slot] = (ao_data, option)
+        return option
@@ -0,0 +1,220 @@
+# poketypes/showdown/corpus.py
+
+"""Contains helpers for parsing whole corpora of saved battle logs across several processes.
+
+Parsing is pure python, so a single process can only use one core. `parse_corpus` hands out battle log files to a pool
+of worker processes, each of which streams its battles with `iter_battle_log`, and gathers up a per-battle result along
+with the parse errors of the whole corpus, tallied by ERR_STATE.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .battlelog import iter_battle_log
+from .battlemessage import BattleMessage
+
+# Number of battle log files handed to a worker process at a time
+CORPUS_CHUNK_SIZE = 16
+
+
+class BattleLogResult(NamedTuple):
+    """The outcome of parsing a single battle log file as part of a corpus.
+
+    Attributes:
+        PATH (str): The path of the battle log that was parsed
+        MESSAGE_COUNT (int): The number of battle messages parsed from the log
+        ERROR_COUNTS (Dict[str, int]): The number of messages that failed to parse, keyed by their ERR_STATE
+        MESSAGES (Optional[List[BattleMessage]]): The parsed messages, if they were kept. Else None.
+        OUTPUT_PATH (Optional[str]): The path the parsed messages were written to, if an output directory was given.
+            Else None.
+        FAILURE (Optional[str]): A description of why the log couldn't be read at all (such as a corrupt gzip file),
+            if it failed.
+    """
+
+    PATH: str
+    MESSAGE_COUNT: int
+    ERROR_COUNTS: Dict[str, int]
+    MESSAGES: Optional[List[BattleMessage]] = None
+    OUTPUT_PATH: Optional[str] = None
+    FAILURE: Optional[str] = None
+
+
+class CorpusReport(NamedTuple):
+    """The outcome of parsing a whole corpus of battle log files.
+
+    Attributes:
+        BATTLES (List[BattleLogResult]): The result of every battle log, in the same order the paths were given
+        MESSAGE_COUNT (int): The total number of battle messages parsed across the corpus
+        ERROR_COUNTS (Dict[str, int]): The total number of messages that failed to parse across the corpus, keyed by
+            their ERR_STATE
+        FAILED_BATTLES (int): The number of battle logs that couldn't be read at all
+    """
+
+    BATTLES: List[BattleLogResult]
+    MESSAGE_COUNT: int
+    ERROR_COUNTS: Dict[str, int]
+    FAILED_BATTLES: int
+
+
+def _parse_battle_file(path: str, output_path: Optional[str], validate: bool, keep_messages: bool) -> BattleLogResult:
+    """Parse a single battle log file, optionally writing its messages out as JSON lines.
+
+    This runs inside the worker processes, so it has to live at the module level to be picklable.
+
+    Args:
+        path (str): The path of the battle log to parse.
+        output_path (Optional[str]): The path to write the parsed messages to, if any.
+        validate (bool): Whether to run pydantic validation on the parsed fields.
+        keep_messages (bool): Whether to send the parsed messages back with the result.
+
+    Returns:
+        BattleLogResult: The outcome of parsing this battle log.
+    """
+    messages = []
+    error_counts = Counter()
+    message_count = 0
+    output = None
+
+    try:
+        if output_path is not None:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            output = open(output_path, "w", encoding="utf8")
+
+        for bm in iter_battle_log(path, validate=validate):
+            message_count += 1
+
+            if bm.ERR_STATE is not None:
+                error_counts[bm.ERR_STATE] += 1
+            if keep_messages:
+                messages.append(bm)
+            if output is not None:
+                output.write(bm.model_dump_json())
+                output.write("\n")
+    except Exception as ex:
+        return BattleLogResult(
+            PATH=path,
+            MESSAGE_COUNT=message_count,
+            ERROR_COUNTS=dict(error_counts),
+            OUTPUT_PATH=output_path,
+            FAILURE=f"Failed to read battle log {path} due to a(n) {type(ex)}: {ex}",
+        )
+    finally:
+        if output is not None:
+            output.close()
+
+    return BattleLogResult(
+        PATH=path,
+        MESSAGE_COUNT=message_count,
+        ERROR_COUNTS=dict(error_counts),
+        MESSAGES=messages if keep_messages else None,
+        OUTPUT_PATH=output_path,
+    )
+
+
+def _check_unique_paths(paths: List[str]) -> None:
+    """Check that no battle log is given twice, which would have its output file written by two workers at once.
+
+    Args:
+        paths (List[str]): The absolute paths of the battle logs.
+
+    Raises:
+        ValueError: If a path is given more than once.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    duplicates = sorted(path for path, count in Counter(paths).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Battle logs can only be written to an output_dir once, but got duplicates: {duplicates}")
+
+
+def _output_paths(paths: List[str], output_dir: str) -> List[str]:
+    """Get the output path of every battle log, mirroring the logs' directories under the output directory.
+
+    Each log is written to `<its path relative to the logs' common directory>.jsonl`, so logs with the same name in
+    different directories (like `a/battle.log` and `b/battle.log`) get different output files.
+
+    Args:
+        paths (List[str]): The paths of the battle logs. Paths given more than once raise a ValueError.
+        output_dir (str): The directory to write the parsed messages to.
+
+    Returns:
+        List[str]: The output path of each battle log, in the same order.
+    """
+    absolute = [os.path.abspath(path) for path in paths]
+    _check_unique_paths(absolute)
+    if not absolute:
+        return []
+
+    root = os.path.commonpath([os.path.dirname(path) for path in absolute])
+    return [os.path.join(output_dir, f"{os.path.relpath(path, root)}.jsonl") for path in absolute]
+
+
+def parse_corpus(
+    paths: Iterable[Union[str, os.PathLike]],
+    workers: Optional[int] = None,
+    chunksize: int = CORPUS_CHUNK_SIZE,
+    validate: bool = True,
+    keep_messages: bool = False,
+    output_dir: Optional[Union[str, os.PathLike]] = None,
+) -> CorpusReport:
+    """Parse every battle log in a corpus, spreading the battles across a pool of worker processes.
+
+    Battle logs are handed to the workers `chunksize` files at a time, so the cost of sending work to a process is
+    amortized over several battles, and each worker streams its battles with `iter_battle_log`. Since battles are
+    parsed independently, throughput scales with the number of workers up to the number of cores.
+
+    By default only each battle's message and error counts are sent back to the main process, since pickling every
+    parsed message would cost most of the time and hold the whole corpus in memory. Set `keep_messages=True` to get
+    the messages back anyway for small corpora, or give an `output_dir` that each battle's messages are written to as
+    JSON lines (one `<log file name>.jsonl` file per battle, in the same subdirectories as the logs are in, relative to
+    the directory all of the logs share).
+
+    Args:
+        paths (Iterable[Union[str, os.PathLike]]): The paths of the battle logs to parse. See `iter_battle_log`.
+        workers (Optional[int], optional): The number of worker processes to use. If 1, battles are parsed in this
+            process without starting a pool. Defaults to None, which uses one worker per core.
+        chunksize (int, optional): The number of battle logs handed to a worker at a time. Defaults to
+            CORPUS_CHUNK_SIZE.
+        validate (bool, optional): Whether to run pydantic validation on the parsed fields. See
+            `BattleMessage.from_message`. Defaults to True.
+        keep_messages (bool, optional): Whether to return the parsed messages of every battle. Defaults to False.
+        output_dir (Optional[Union[str, os.PathLike]], optional): A directory to write the parsed messages of every
+            battle to, if any. With an output directory, every path must be a different file, or a ValueError is
+            raised. Defaults to None.
+
+    Returns:
+        CorpusReport: The per-battle results, and the parse errors of the whole corpus tallied by ERR_STATE.
+    """
+    paths = [os.fspath(path) for path in paths]
+    if output_dir is not None:
+        output_paths = _output_paths(paths, os.fspath(output_dir))
+    else:
+        output_paths = [None] * len(paths)
+
+    parse_battle = partial(_parse_battle_file, validate=validate, keep_messages=keep_messages)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        battles = [parse_battle(path, output_path) for path, output_path in zip(paths, output_paths)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            battles = list(executor.map(parse_battle, paths, output_paths, chunksize=chunksize))
+
+    error_counts = Counter()
+    for battle in battles:
+        error_counts.update(battle.ERROR_COUNTS)
+
+    return CorpusReport(
+        BATTLES=battles,
+        MESSAGE_COUNT=sum(battle.MESSAGE_COUNT for battle in battles),
+        ERROR_COUNTS=dict(error_counts),
+        FAILED_BATTLES=sum(battle.FAILURE is not None for battle in battles),
+    )
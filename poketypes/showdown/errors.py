@@ -0,0 +1,136 @@
+# poketypes/showdown/errors.py
+
+"""Contains the error sink that message parsing failures are reported to.
+
+Parsing never prints or writes anything itself. Instead, every message that fails to parse is recorded with the current
+ParseErrorSink, which tallies failures per message key and error state, keeps a bounded sample of failing lines, and
+logs a single warning the first time each new failure signature is seen. Logs go to the `poketypes` logger, which has
+no handlers unless the application configures some, so by default parsing stays free of I/O.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Failure signatures that no longer fit in a ParseErrorSink are tallied under this message key
+OVERFLOW_KEY = "*"
+
+
+def message_key(message: str) -> str:
+    """Get the message key of a raw showdown message, such as `-damage` for `|-damage|p2a: Espeon|45/100`.
+
+    Args:
+        message (str): The raw message line.
+
+    Returns:
+        str: The message key, or the whole message if it has no `|` separated key.
+    """
+    parts = message.split("|", 2)
+    return parts[1] if len(parts) > 1 else message
+
+
+class ParseErrorSink:
+    """A bounded, rate-limited record of message parsing failures.
+
+    Failures are grouped by their signature, the pair of the raw message key (like `-damage`, or a new key showdown
+    added that we don't know about yet) and the error state (like `PARSE_ERROR`). For each signature the sink keeps a
+    count, up to `max_examples` sample lines, and logs only once, when the signature is first seen. This way a single
+    broken or new message type costs one log entry, rather than one per line.
+
+    Args:
+        max_examples (int, optional): The maximum number of sample lines kept per signature. Defaults to 5.
+        max_signatures (int, optional): The maximum number of distinct signatures tracked. Failures with new signatures
+            past this are counted under the OVERFLOW_KEY message key instead. Defaults to 1024.
+        log (Optional[logging.Logger], optional): The logger to report new signatures to. Defaults to None, which
+            uses this module's logger.
+
+    Attributes:
+        counts (Counter[Tuple[str, str]]): The number of failures seen for each (message key, error state) signature
+        examples (Dict[Tuple[str, str], List[str]]): The sampled failing lines for each (message key, error state)
+            signature
+    """
+
+    counts: Counter[Tuple[str, str]]
+    examples: Dict[Tuple[str, str], List[str]]
+
+    def __init__(  # noqa: D107
+        self, max_examples: int = 5, max_signatures: int = 1024, log: Optional[logging.Logger] = None
+    ):
+        self.max_examples = max_examples
+        self.max_signatures = max_signatures
+        self.log = log or logger
+
+        self.counts = Counter()
+        self.examples = {}
+
+    def record(self, key: str, err_state: str, message: str, detail: str) -> None:
+        """Record a single message parsing failure.
+
+        Args:
+            key (str): The raw message key of the failed message.
+            err_state (str): The error state of the failure, like `PARSE_ERROR`.
+            message (str): The raw message line that failed to parse.
+            detail (str): A description of what went wrong, only used when logging a new signature.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        signature = (key, err_state)
+
+        if signature not in self.counts:
+            if len(self.counts) >= self.max_signatures:
+                signature = (OVERFLOW_KEY, err_state)
+            else:
+                self.log.warning("New %s failure for message key %r: %s", err_state, key, detail)
+
+        self.counts[signature] += 1
+
+        examples = self.examples.setdefault(signature, [])
+        if len(examples) < self.max_examples:
+            examples.append(message)
+
+    @property
+    def total(self) -> int:
+        """The total number of failures recorded."""
+        return sum(self.counts.values())
+
+    def clear(self) -> None:
+        """Forget every recorded failure, so that every signature will be logged again when next seen.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self.counts.clear()
+        self.examples.clear()
+
+
+_error_sink = ParseErrorSink()
+
+
+def get_error_sink() -> ParseErrorSink:
+    """Get the error sink that message parsing failures are currently reported to.
+
+    Returns:
+        ParseErrorSink: The current error sink.
+    """
+    return _error_sink
+
+
+def set_error_sink(sink: ParseErrorSink) -> ParseErrorSink:
+    """Replace the error sink that message parsing failures are reported to.
+
+    Args:
+        sink (ParseErrorSink): The new error sink, which can be any object with a matching `record` method.
+
+    Returns:
+        ParseErrorSink: The previous error sink, so it can be restored later.
+    """
+    global _error_sink
+
+    previous = _error_sink
+    _error_sink = sink
+    return previous
@@ -0,0 +1,474 @@
+# poketypes/showdown/features.py
+
+"""Contains StateEncoder, which encodes BattleStates into preallocated NumPy arrays of features for machine learning.
+
+Which features are encoded is declared with a FeatureSpec, by name. Categorical features (species, items, abilities,
+moves, types, status and weather) are encoded either as embedding indices, or as one-hot columns (multi-hot for moves)
+if they are listed in the spec's ONEHOT. Every other feature is a number, like the HP fraction or a boost stage.
+
+Each encoded batch holds four arrays, with one row per state:
+
+- POKEMON_INDICES, of shape (states, 2, ACTION_TEAM, columns): the embedding indices of every pokemon of each side
+- POKEMON_VALUES, of shape (states, 2, ACTION_TEAM, columns): the numeric and one-hot features of every pokemon
+- FIELD_INDICES, of shape (states, columns): the embedding indices of the battle's field features
+- FIELD_VALUES, of shape (states, columns): the numeric and one-hot features of the battle's field
+
+The encoding player's side always comes first, and each side's pokemon are in the order they were revealed. Embedding
+indices are the dense indices of the feature's Dex Enum (see poketypes.dex.dense_index), from 0 for an unknown (or
+missing) value, so they can index an embedding table directly. The columns of each feature are given by the encoder's
+COLUMNS.
+
+Encoding happens in two passes. Each state's pokemon are first copied into a preallocated array of raw integer columns,
+which is all the per-state Python work there is, and every feature is then computed from the raw columns of the whole
+batch at once with NumPy. The encoder reuses its arrays from one batch to the next, only growing them when a batch
+doesn't fit, so the arrays returned by each call are overwritten by the next one.
+
+NumPy is an optional dependency of poketypes, installed with the `ml` extra, and is only imported once an encoder is
+built.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..dex import DexAbility, DexItem, DexMove, DexPokemon, DexStatus, DexType, DexWeather, dense_index
+from ..dex.denseindex import require_numpy
+from .actions import ACTION_MOVES, ACTION_TEAM
+from .battlemessage import BMType, PokeStat
+from .state import BattleState, StateMessage
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The stats whose boost stages are encoded by the `boosts` feature, in column order
+BOOST_STATS: Tuple[PokeStat, ...] = (
+    PokeStat.attack,
+    PokeStat.defence,
+    PokeStat.special_attack,
+    PokeStat.special_defence,
+    PokeStat.speed,
+    PokeStat.accuracy,
+    PokeStat.evasion,
+)
+
+# The raw integer columns each pokemon is copied into before its features are computed
+_RAW_REVEALED = 0
+_RAW_SPECIES = 1
+_RAW_ITEM = 2
+_RAW_ABILITY = 3
+_RAW_MOVES = slice(4, 4 + ACTION_MOVES)
+_RAW_TERA_TYPE = _RAW_MOVES.stop
+_RAW_STATUS = _RAW_TERA_TYPE + 1
+_RAW_CUR_HP = _RAW_STATUS + 1
+_RAW_MAX_HP = _RAW_CUR_HP + 1
+_RAW_LEVEL = _RAW_MAX_HP + 1
+_RAW_ACTIVE = _RAW_LEVEL + 1
+_RAW_BOOSTS = slice(_RAW_ACTIVE + 1, _RAW_ACTIVE + 1 + len(BOOST_STATS))
+_RAW_WIDTH = _RAW_BOOSTS.stop
+# The number of raw columns of a whole state's pokemon
+_RAW_ROW = 2 * ACTION_TEAM * _RAW_WIDTH
+
+# The raw columns of a pokemon slot that wasn't revealed yet, with a max HP of 1 so its HP fraction is 0
+_UNREVEALED = tuple(1 if column == _RAW_MAX_HP else 0 for column in range(_RAW_WIDTH))
+# Padding for pokemon with fewer than ACTION_MOVES revealed moves, and for pokemon without boosts
+_NO_MOVES = (0,) * ACTION_MOVES
+_NO_BOOSTS = (0,) * len(BOOST_STATS)
+
+# The raw integer columns each battle's field is copied into
+_RAW_TURN = 0
+_RAW_WEATHER = 1
+_RAW_FIELD_WIDTH = 2
+
+# The Dex Enum and raw columns of each categorical pokemon feature
+POKEMON_CATEGORICAL = {
+    "species": (DexPokemon, slice(_RAW_SPECIES, _RAW_SPECIES + 1)),
+    "item": (DexItem, slice(_RAW_ITEM, _RAW_ITEM + 1)),
+    "ability": (DexAbility, slice(_RAW_ABILITY, _RAW_ABILITY + 1)),
+    "moves": (DexMove, _RAW_MOVES),
+    "tera_type": (DexType, slice(_RAW_TERA_TYPE, _RAW_TERA_TYPE + 1)),
+    "status": (DexStatus, slice(_RAW_STATUS, _RAW_STATUS + 1)),
+}
+# The number of columns of each numeric pokemon feature
+POKEMON_NUMERIC = {"revealed": 1, "active": 1, "hp": 1, "level": 1, "boosts": len(BOOST_STATS)}
+
+# The Dex Enum and raw columns of each categorical field feature
+FIELD_CATEGORICAL = {"weather": (DexWeather, slice(_RAW_WEATHER, _RAW_WEATHER + 1))}
+# The number of columns of each numeric field feature
+FIELD_NUMERIC = {"turn": 1}
+
+
+class FeatureSpec(NamedTuple):
+    """A declarative list of the features a StateEncoder encodes.
+
+    Attributes:
+        POKEMON (Tuple[str, ...]): The features of each pokemon, in column order. Categorical features are `species`,
+            `item`, `ability`, `moves` (the first ACTION_MOVES revealed moves), `tera_type` and `status`. Numeric
+            features are `revealed` (1 for a seen pokemon, 0 for padding), `active`, `hp` (the fraction of HP left),
+            `level` (divided by 100) and `boosts` (each of BOOST_STATS, divided by 6)
+        FIELD (Tuple[str, ...]): The features of the battle's field, in column order. `weather` is categorical, and
+            `turn` is the number of the current turn
+        ONEHOT (Tuple[str, ...]): The categorical features to encode as one-hot columns, rather than as embedding
+            indices
+        VERSION (Optional[int]): The version of the Dex Enums' dense indices to encode with, such as the one a model was
+            trained at. None uses the latest version
+    """
+
+    POKEMON: Tuple[str, ...] = (
+        "species",
+        "item",
+        "ability",
+        "moves",
+        "tera_type",
+        "status",
+        "revealed",
+        "active",
+        "hp",
+        "boosts",
+    )
+    FIELD: Tuple[str, ...] = ("weather", "turn")
+    ONEHOT: Tuple[str, ...] = ("tera_type", "status", "weather")
+    VERSION: Optional[int] = None
+
+
+class EncodedStates(NamedTuple):
+    """A batch of BattleStates, as encoded by a StateEncoder.
+
+    The arrays are views of the encoder's reused arrays, so they are only valid until the encoder's next call. Copy them
+    to keep them for longer.
+
+    Attributes:
+        POKEMON_INDICES (np.ndarray): An int32 array of shape (states, 2, ACTION_TEAM, columns) of the pokemon's
+            embedding indices
+        POKEMON_VALUES (np.ndarray): A float32 array of shape (states, 2, ACTION_TEAM, columns) of the pokemon's other
+            features
+        FIELD_INDICES (np.ndarray): An int32 array of shape (states, columns) of the field's embedding indices
+        FIELD_VALUES (np.ndarray): A float32 array of shape (states, columns) of the field's other features
+    """
+
+    POKEMON_INDICES: "np.ndarray"
+    POKEMON_VALUES: "np.ndarray"
+    FIELD_INDICES: "np.ndarray"
+    FIELD_VALUES: "np.ndarray"
+
+
+def _layout(
+    features: Sequence[str],
+    onehot: Sequence[str],
+    version: Optional[int],
+    categorical: Dict[str, Tuple],
+    numeric: Dict[str, int],
+) -> Tuple[Dict[str, slice], Dict[str, slice]]:
+    """Lay out the columns of a group of features, in the index and value arrays.
+
+    Args:
+        features (Sequence[str]): The names of the features, in column order. Unknown names raise a ValueError.
+        onehot (Sequence[str]): The categorical features to encode as one-hot columns.
+        version (Optional[int]): The version of the dense indices, which sets the width of one-hot columns.
+        categorical (Dict[str, Tuple]): The Dex Enum and raw columns of each known categorical feature.
+        numeric (Dict[str, int]): The number of columns of each known numeric feature.
+
+    Returns:
+        Tuple[Dict[str, slice], Dict[str, slice]]: The columns of each feature in the index array, and in the value
+            array.
+    """
+    index_columns: Dict[str, slice] = {}
+    value_columns: Dict[str, slice] = {}
+    index_width = value_width = 0
+
+    for name in features:
+        _check_feature(name, categorical, numeric)
+
+        if name in categorical and name not in onehot:
+            width = categorical[name][1].stop - categorical[name][1].start
+            index_columns[name] = slice(index_width, index_width + width)
+            index_width += width
+        else:
+            width = len(dense_index(categorical[name][0], version)) if name in categorical else numeric[name]
+            value_columns[name] = slice(value_width, value_width + width)
+            value_width += width
+
+    return index_columns, value_columns
+
+
+def _check_feature(name: str, categorical: Dict[str, Tuple], numeric: Dict[str, int]) -> None:
+    """Check that a feature of a FeatureSpec exists.
+
+    Args:
+        name (str): The name of the feature.
+        categorical (Dict[str, Tuple]): The known categorical features.
+        numeric (Dict[str, int]): The known numeric features.
+
+    Raises:
+        ValueError: If there is no such feature.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    if name not in categorical and name not in numeric:
+        raise ValueError(f"Unknown feature {name!r}, expected one of {sorted([*categorical, *numeric])}")
+
+
+def _width(columns: Dict[str, slice]) -> int:
+    """Count the columns of an array laid out by `_layout`."""
+    return max((column.stop for column in columns.values()), default=0)
+
+
+class StateEncoder:
+    """Encodes BattleStates into preallocated NumPy arrays of the features declared by a FeatureSpec.
+
+    The encoder's SPEC is its FeatureSpec, and its COLUMNS hold the columns of each feature, in whichever of the index
+    or value arrays of the feature's group (pokemon or field) it is encoded in.
+
+    Args:
+        spec (Optional[FeatureSpec], optional): The features to encode. Defaults to None, for FeatureSpec(), which has
+            every pokemon and field feature. Unknown feature names (or VERSIONs) raise a ValueError.
+        capacity (int, optional): The number of states to preallocate arrays for. Larger batches grow the arrays.
+            Defaults to 1. Building an encoder requires numpy, which raises an ImportError if it isn't installed.
+    """
+
+    def __init__(self, spec: Optional[FeatureSpec] = None, capacity: int = 1):  # noqa: D107
+        self._np = require_numpy("encoding battle states")
+        self.SPEC = spec = spec if spec is not None else FeatureSpec()
+
+        self._pokemon_index, self._pokemon_value = _layout(
+            spec.POKEMON, spec.ONEHOT, spec.VERSION, POKEMON_CATEGORICAL, POKEMON_NUMERIC
+        )
+        self._field_index, self._field_value = _layout(
+            spec.FIELD, spec.ONEHOT, spec.VERSION, FIELD_CATEGORICAL, FIELD_NUMERIC
+        )
+        self.COLUMNS: Dict[str, slice] = {
+            **self._pokemon_index,
+            **self._pokemon_value,
+            **self._field_index,
+            **self._field_value,
+        }
+
+        self._species = dense_index(DexPokemon, spec.VERSION).TO_DENSE
+        self._items = dense_index(DexItem, spec.VERSION).TO_DENSE
+        self._abilities = dense_index(DexAbility, spec.VERSION).TO_DENSE
+        self._moves = dense_index(DexMove, spec.VERSION).TO_DENSE
+        self._types = dense_index(DexType, spec.VERSION).TO_DENSE
+        self._statuses = dense_index(DexStatus, spec.VERSION).TO_DENSE
+        self._weathers = dense_index(DexWeather, spec.VERSION).TO_DENSE
+
+        self._capacity = 0
+        self._reserve(max(capacity, 1))
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the encoder's arrays to hold at least a number of states, keeping the raw columns already filled.
+
+        Args:
+            capacity (int): The number of states the arrays must hold.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        if capacity <= self._capacity:
+            return
+
+        np = self._np
+        capacity = max(capacity, self._capacity * 2)
+        filled = self._capacity
+
+        raw = np.zeros((capacity, 2, ACTION_TEAM, _RAW_WIDTH), dtype=np.int32)
+        raw_field = np.zeros((capacity, _RAW_FIELD_WIDTH), dtype=np.int32)
+        if filled:
+            raw[:filled] = self._raw
+            raw_field[:filled] = self._raw_field
+
+        self._raw = raw
+        self._raw_field = raw_field
+        self._raw_flat = raw.reshape(-1)
+        self._pokemon_indices = np.zeros((capacity, 2, ACTION_TEAM, _width(self._pokemon_index)), dtype=np.int32)
+        self._pokemon_values = np.zeros((capacity, 2, ACTION_TEAM, _width(self._pokemon_value)), dtype=np.float32)
+        self._field_indices = np.zeros((capacity, _width(self._field_index)), dtype=np.int32)
+        self._field_values = np.zeros((capacity, _width(self._field_value)), dtype=np.float32)
+        self._capacity = capacity
+
+    def encode(self, state: BattleState, player: str = "p1") -> EncodedStates:
+        """Encode a single state, as a batch of one.
+
+        Args:
+            state (BattleState): The state to encode.
+            player (str, optional): The player whose side comes first. Defaults to "p1".
+
+        Returns:
+            EncodedStates: The encoded state, valid until the encoder's next call.
+        """
+        return self.encode_batch((state,), player)
+
+    def encode_batch(self, states: Sequence[BattleState], player: str = "p1") -> EncodedStates:
+        """Encode a batch of states, such as the current states of many battles, into one array per feature group.
+
+        Args:
+            states (Sequence[BattleState]): The states to encode, one row each.
+            player (str, optional): The player whose side comes first, in every state. Defaults to "p1".
+
+        Returns:
+            EncodedStates: The encoded states, valid until the encoder's next call.
+        """
+        self._reserve(len(states))
+        for row, state in enumerate(states):
+            self._fill(row, state, player)
+
+        return self._finish(len(states))
+
+    def encode_replay(self, messages: Iterable[StateMessage], player: str = "p1") -> EncodedStates:
+        """Encode the state of a battle at the start of each of its turns, by replaying its messages.
+
+        Args:
+            messages (Iterable[StateMessage]): The parsed (or lazily parsed) messages of the battle, in order.
+            player (str, optional): The player whose side comes first. Defaults to "p1".
+
+        Returns:
+            EncodedStates: The encoded state at each `|turn|` message, in order, valid until the encoder's next call.
+        """
+        state = BattleState()
+        apply = state.apply
+        rows = 0
+
+        for message in messages:
+            apply(message)
+            if message.BMTYPE == BMType.turn:
+                self._reserve(rows + 1)
+                self._fill(rows, state, player)
+                rows += 1
+
+        return self._finish(rows)
+
+    def _fill(self, row: int, state: BattleState, player: str) -> None:
+        """Copy a state into a row of the raw columns.
+
+        The row's raw columns are gathered into one list, so that NumPy only converts them once per state.
+
+        Args:
+            row (int): The row to fill.
+            state (BattleState): The state to copy.
+            player (str): The player whose side comes first.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        species, items, abilities, moves, types, statuses = (
+            self._species,
+            self._items,
+            self._abilities,
+            self._moves,
+            self._types,
+            self._statuses,
+        )
+
+        raw: List[int] = []
+        foe = "p2" if player == "p1" else "p1"
+        for side in (state.SIDES.get(player), state.SIDES.get(foe)):
+            revealed = 0
+            for pokemon in islice(side.POKEMON.values(), ACTION_TEAM) if side is not None else ():
+                move_indices = [moves.get(move, 0) for move in islice(pokemon.MOVES, ACTION_MOVES)]
+                boosts = pokemon.BOOSTS
+
+                raw += (
+                    1,
+                    species.get(pokemon.SPECIES, 0),
+                    items.get(pokemon.ITEM, 0),
+                    abilities.get(pokemon.ABILITY, 0),
+                )
+                raw += move_indices
+                raw += _NO_MOVES[: ACTION_MOVES - len(move_indices)]
+                raw += (
+                    types.get(pokemon.TERASTALLIZED, 0),
+                    statuses.get(pokemon.STATUS, 0),
+                    pokemon.CUR_HP or 0,
+                    pokemon.MAX_HP or 1,
+                    pokemon.LEVEL or 100,
+                    pokemon.ACTIVE,
+                )
+                raw += [boosts.get(stat, 0) for stat in BOOST_STATS] if boosts else _NO_BOOSTS
+                revealed += 1
+
+            raw += _UNREVEALED * (ACTION_TEAM - revealed)
+
+        start, end = row * _RAW_ROW, (row + 1) * _RAW_ROW
+        self._raw_flat[start:end] = raw
+        self._raw_field[row] = (state.TURN, self._weathers.get(state.WEATHER, 0))
+
+    def _finish(self, rows: int) -> EncodedStates:
+        """Compute every feature of the filled rows from their raw columns, for the whole batch at once.
+
+        Args:
+            rows (int): The number of filled rows.
+
+        Returns:
+            EncodedStates: Views of the first rows of the feature arrays.
+        """
+        np = self._np
+        raw = self._raw[:rows]
+        raw_field = self._raw_field[:rows]
+        pokemon_indices = self._pokemon_indices[:rows]
+        pokemon_values = self._pokemon_values[:rows]
+        field_indices = self._field_indices[:rows]
+        field_values = self._field_values[:rows]
+
+        pokemon_values.fill(0)
+        field_values.fill(0)
+
+        _categorical(
+            np, raw, POKEMON_CATEGORICAL, self._pokemon_index, pokemon_indices, self._pokemon_value, pokemon_values
+        )
+        _categorical(
+            np, raw_field, FIELD_CATEGORICAL, self._field_index, field_indices, self._field_value, field_values
+        )
+
+        for name, column in self._pokemon_value.items():
+            if name == "revealed":
+                pokemon_values[..., column.start] = raw[..., _RAW_REVEALED]
+            elif name == "active":
+                pokemon_values[..., column.start] = raw[..., _RAW_ACTIVE]
+            elif name == "hp":
+                np.divide(raw[..., _RAW_CUR_HP], raw[..., _RAW_MAX_HP], out=pokemon_values[..., column.start])
+            elif name == "level":
+                np.divide(raw[..., _RAW_LEVEL], 100, out=pokemon_values[..., column.start])
+            elif name == "boosts":
+                np.divide(raw[..., _RAW_BOOSTS], 6, out=pokemon_values[..., column])
+
+        if "turn" in self._field_value:
+            field_values[:, self._field_value["turn"].start] = raw_field[:, _RAW_TURN]
+
+        return EncodedStates(
+            POKEMON_INDICES=pokemon_indices,
+            POKEMON_VALUES=pokemon_values,
+            FIELD_INDICES=field_indices,
+            FIELD_VALUES=field_values,
+        )
+
+
+def _categorical(
+    np: ModuleType,
+    raw: "np.ndarray",
+    categorical: Dict[str, Tuple],
+    index_columns: Dict[str, slice],
+    indices: "np.ndarray",
+    value_columns: Dict[str, slice],
+    values: "np.ndarray",
+) -> None:
+    """Encode a group's categorical features, as embedding indices or one-hot columns, from their raw columns.
+
+    Args:
+        np (ModuleType): The numpy module.
+        raw (np.ndarray): The raw columns of the batch.
+        categorical (Dict[str, Tuple]): The Dex Enum and raw columns of each categorical feature of the group.
+        index_columns (Dict[str, slice]): The columns of each feature encoded as embedding indices.
+        indices (np.ndarray): The batch's index array.
+        value_columns (Dict[str, slice]): The columns of each feature encoded in the value array.
+        values (np.ndarray): The batch's value array, zeroed.
+
+    Returns:
+        None: Nothing is returned.
+    """
+    for name, column in index_columns.items():
+        indices[..., column] = raw[..., categorical[name][1]]
+
+    for name, column in value_columns.items():
+        if name in categorical:
+            np.put_along_axis(values[..., column], raw[..., categorical[name][1]], 1, axis=-1)
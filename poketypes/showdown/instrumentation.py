@@ -0,0 +1,164 @@
+# poketypes/showdown/instrumentation.py
+
+"""Contains optional instrumentation for measuring how long each type of message takes to parse.
+
+Instrumentation is off by default, in which case parsing only pays for a single `is None` check per message. Once
+turned on with `enable_parse_stats`, every message parsed by `BattleMessage.from_message`, `Message.from_message` (or
+the batch parsing APIs built on them) is timed, and the timings are tallied per message key in a ParseStats object.
+The tallies are cheap to keep (a counter update and a bounded ring buffer append per message), so they can be left on
+in production and read with `ParseStats.snapshot` whenever needed.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Optional
+
+# Number of recent parse times kept per message key for estimating percentiles
+PARSE_STATS_WINDOW = 1024
+
+PERCENTILES = (50, 90, 99)
+
+
+class _KeyStats:
+    """The running parse tallies of a single message key."""
+
+    __slots__ = ("calls", "failures", "total_ns", "max_ns", "recent_ns")
+
+    def __init__(self, window: int):  # noqa: D107
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.recent_ns: Deque[int] = deque(maxlen=window)
+
+
+class ParseStats:
+    """Per message type parse counts, failures and latencies.
+
+    Timings are grouped first by the family of message (`BattleMessage` or `Message`), then by the raw message key,
+    such as `-damage` or `switch`. Unknown message keys are tallied under their own key, so new message types show up
+    in the stats as soon as showdown starts sending them.
+
+    Call counts, failure counts, and total and maximum parse times cover every recorded message. Percentiles are
+    estimated from the most recent `window` parse times of each message key, so memory use stays bounded.
+
+    Args:
+        window (int, optional): The number of recent parse times kept per message key for estimating percentiles.
+            Defaults to PARSE_STATS_WINDOW.
+    """
+
+    def __init__(self, window: int = PARSE_STATS_WINDOW):  # noqa: D107
+        self.window = window
+        self._stats: Dict[str, Dict[str, _KeyStats]] = {}
+
+    def record(self, family: str, key: str, elapsed_ns: int, failed: bool) -> None:
+        """Record how long a single message took to parse.
+
+        Args:
+            family (str): The family of message parsed, either `BattleMessage` or `Message`.
+            key (str): The raw message key of the parsed message.
+            elapsed_ns (int): How long parsing the message took, in nanoseconds.
+            failed (bool): Whether the message failed to parse.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        family_stats = self._stats.get(family)
+        if family_stats is None:
+            family_stats = self._stats[family] = {}
+
+        stats = family_stats.get(key)
+        if stats is None:
+            stats = family_stats[key] = _KeyStats(self.window)
+
+        stats.calls += 1
+        stats.failures += failed
+        stats.total_ns += elapsed_ns
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+        stats.recent_ns.append(elapsed_ns)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Summarize the stats recorded so far.
+
+        For example, `snapshot()["BattleMessage"]["-damage"]` could look like `{"calls": 1200, "failures": 0,
+        "total_s": 0.036, "mean_us": 30.0, "lines_per_s": 33333.3, "p50_us": 27.1, "p90_us": 41.9, "p99_us": 80.2,
+        "max_us": 152.3}`.
+
+        Returns:
+            Dict[str, Dict[str, Dict[str, float]]]: The stats of every message key seen, grouped by message family.
+        """
+        snapshot = {}
+
+        for family, family_stats in self._stats.items():
+            snapshot[family] = {}
+
+            for key, stats in family_stats.items():
+                recent = sorted(stats.recent_ns)
+
+                summary = {
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "total_s": stats.total_ns / 1e9,
+                    "mean_us": stats.total_ns / stats.calls / 1e3,
+                    "lines_per_s": stats.calls / stats.total_ns * 1e9 if stats.total_ns else 0.0,
+                }
+                for percentile in PERCENTILES:
+                    index = min(len(recent) - 1, len(recent) * percentile // 100)
+                    summary[f"p{percentile}_us"] = recent[index] / 1e3
+                summary["max_us"] = stats.max_ns / 1e3
+
+                snapshot[family][key] = summary
+
+        return snapshot
+
+    def clear(self) -> None:
+        """Forget every recorded parse time.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self._stats.clear()
+
+
+# The ParseStats that parse times are recorded to, or None if instrumentation is off
+active_stats: Optional[ParseStats] = None
+
+
+def enable_parse_stats(stats: Optional[ParseStats] = None) -> ParseStats:
+    """Turn on parse time instrumentation.
+
+    Args:
+        stats (Optional[ParseStats], optional): The ParseStats to record parse times to. Defaults to None, which creates
+            a new ParseStats.
+
+    Returns:
+        ParseStats: The ParseStats that parse times are now recorded to.
+    """
+    global active_stats
+
+    active_stats = stats if stats is not None else ParseStats()
+    return active_stats
+
+
+def disable_parse_stats() -> Optional[ParseStats]:
+    """Turn off parse time instrumentation.
+
+    Returns:
+        Optional[ParseStats]: The ParseStats that parse times were being recorded to, if instrumentation was on.
+    """
+    global active_stats
+
+    stats = active_stats
+    active_stats = None
+    return stats
+
+
+def get_parse_stats() -> Optional[ParseStats]:
+    """Get the ParseStats that parse times are currently recorded to.
+
+    Returns:
+        Optional[ParseStats]: The active ParseStats, or None if instrumentation is off.
+    """
+    return active_stats
@@ -0,0 +1,95 @@
+# poketypes/showdown/jsonbackend.py
+
+"""Contains the pluggable JSON decoder used for the JSON payloads of showdown messages, such as `|request|`.
+
+By default the fastest installed backend is used, trying `orjson`, then `ujson`, before falling back to the standard
+library's `json`. Neither faster library is a required dependency of poketypes, so install one alongside it (or both
+with the `fast-json` extra) to speed up request parsing. A specific backend (or any `loads`-like callable) can be
+chosen with `set_json_backend`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+JSONLoads = Callable[[Union[str, bytes]], Any]
+
+# The backends tried, in order, when picking the default backend
+JSON_BACKENDS: Tuple[str, ...] = ("orjson", "ujson", "json")
+
+
+def _import_backend(name: str) -> JSONLoads:
+    """Import the `loads` function of a JSON library by name.
+
+    Args:
+        name (str): The name of the JSON library, one of JSON_BACKENDS.
+
+    Returns:
+        JSONLoads: The library's `loads` function.
+    """
+    if name == "json":
+        return json.loads
+
+    return importlib.import_module(name).loads
+
+
+def _default_backend() -> Tuple[str, JSONLoads]:
+    """Pick the fastest installed JSON backend.
+
+    Returns:
+        Tuple[str, JSONLoads]: The name and `loads` function of the backend.
+    """
+    for name in JSON_BACKENDS:
+        try:
+            return name, _import_backend(name)
+        except ImportError:
+            continue
+
+    return "json", json.loads
+
+
+# The name and `loads` function of the JSON backend in use
+backend_name, loads = _default_backend()
+
+
+def get_json_backend() -> str:
+    """Get the name of the JSON backend in use.
+
+    Returns:
+        str: The name of the backend, or `custom` if a custom `loads` function was set.
+    """
+    return backend_name
+
+
+def set_json_backend(backend: Optional[Union[str, JSONLoads]] = None) -> Union[str, JSONLoads]:
+    """Replace the JSON backend used for message payloads.
+
+    Args:
+        backend (Optional[Union[str, JSONLoads]], optional): The name of a backend in JSON_BACKENDS (which raises an
+            ImportError if it isn't installed), or any callable that decodes a JSON string like `json.loads`. Defaults
+            to None, which picks the fastest installed backend.
+
+    Raises:
+        ValueError: If the backend name isn't one of JSON_BACKENDS.
+
+    Returns:
+        Union[str, JSONLoads]: The previous backend, to restore it later by passing it back to `set_json_backend`. This
+            is its name, or the previous `loads` function itself if it was a custom one.
+    """
+    global backend_name, loads
+
+    previous = loads if backend_name == "custom" else backend_name
+
+    if backend is None:
+        backend_name, loads = _default_backend()
+    elif isinstance(backend, str):
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend {backend!r}, expected one of {JSON_BACKENDS}")
+
+        backend_name, loads = backend, _import_backend(backend)
+    else:
+        backend_name, loads = "custom", backend
+
+    return previous
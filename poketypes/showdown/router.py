@@ -0,0 +1,335 @@
+# poketypes/showdown/router.py
+
+"""Contains an asyncio router that splits raw showdown websocket frames into per-room queues of parsed messages.
+
+Every frame sent by the server belongs to a single room. Frames for a room start with a `>ROOMID` line (such as
+`>battle-gen9ou-123`), while global frames (challstr, updateuser, pms, ...) have no room line at all. FrameRouter
+works out the room of each frame, parses its lines with BattleMessage (for battle rooms) or Message (for global and
+chat rooms), and puts the parsed messages on a bounded queue per room, so that a bot can run one consumer task per
+battle on a single event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from .battlemessage import BattleMessage, BattleMessageParser, LazyBattleMessage
+from .showdownmessage import Message
+
+# Maximum number of parsed messages waiting in a single room's queue before routing waits for its consumer, or drops
+# the room's oldest message if it has none
+ROOM_QUEUE_SIZE = 1024
+
+# The room id given to global frames, which have no `>ROOMID` line
+GLOBAL_ROOM = ""
+
+# Message keys after which the server sends nothing more to a room
+_CLOSING_PREFIXES = ("|deinit", "|noinit")
+
+RoutedMessage = Union[BattleMessage, LazyBattleMessage, Message]
+
+
+class FrameRouter:
+    """Routes raw showdown websocket frames to per-room queues of parsed messages.
+
+    Each room gets its own `asyncio.Queue` the first time a frame for it arrives, and is announced to `accept`.
+    Messages are put on a room's queue in the order the server sent them, and a room's queue is closed (its consumer's
+    `messages` iterator ends) when the server deinitializes the room, or when `close_room` is called.
+
+    Room queues are bounded by `queue_size`. When a room's consumer falls that far behind, `route` waits for it to
+    catch up before handing out any more messages, which in turn stops the websocket from being read, so memory stays
+    bounded no matter how many rooms are open. Since frames are routed in order, a stalled room holds up every other
+    room too, so consumers should hand off any slow work rather than doing it inline.
+
+    Only rooms with a consumer are waited on. A room counts as consumed once it is returned by `accept`, or subscribed
+    to with `messages` or `room`. Until then (and forever, for rooms nobody subscribes to, such as GLOBAL_ROOM for most
+    battle bots), a full room drops its oldest message to make room for each new one, and counts it in its queue's
+    `dropped`. Closing a room never waits either, since the None that ends a room's queue always fits.
+
+    Battle rooms (with ids starting with `battle-`) are parsed with `BattleMessage.parse_many`, or the given
+    BattleMessageParser, which also lets a router only fully parse the BMTypes a bot cares about. Every other room is
+    parsed line by line with `Message.from_message`.
+
+    Args:
+        queue_size (int, optional): The maximum number of messages waiting in a single room's queue. Defaults to
+            ROOM_QUEUE_SIZE.
+        parser (Optional[BattleMessageParser], optional): The parser to use for battle room lines. Defaults to None,
+            which parses every line with `BattleMessage.parse_many`.
+        validate (bool, optional): Whether to run pydantic validation on the parsed fields, when no parser is given. See
+            `BattleMessage.from_message`. Defaults to True.
+        announce_rooms (bool, optional): Whether to announce new rooms to `accept`. Turn this off if rooms are only
+            ever subscribed to by id with `messages`, so unaccepted announcements don't pile up. Defaults to True.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        queue_size: int = ROOM_QUEUE_SIZE,
+        parser: Optional[BattleMessageParser] = None,
+        validate: bool = True,
+        announce_rooms: bool = True,
+    ):
+        self.queue_size = queue_size
+        self.parser = parser
+        self.validate = validate
+        self.announce_rooms = announce_rooms
+
+        self._rooms: Dict[str, _RoomQueue] = {}
+
+        # Created on first use, since before python 3.10 queues bind to the event loop they were created in
+        self._new_rooms: Optional[asyncio.Queue] = None
+
+    @property
+    def rooms(self) -> List[str]:
+        """The ids of every currently open room."""
+        return list(self._rooms)
+
+    def room(self, room_id: str) -> asyncio.Queue:
+        """Get the queue of a room to consume it directly, opening the room if it isn't open yet.
+
+        Args:
+            room_id (str): The id of the room, or GLOBAL_ROOM for global messages.
+
+        Returns:
+            asyncio.Queue: The room's queue of parsed messages, which ends with a None once the room is closed.
+        """
+        queue = self._open_room(room_id)
+        queue.subscribed = True
+
+        return queue
+
+    def _open_room(self, room_id: str) -> _RoomQueue:
+        """Get the queue of a room, opening (and announcing) the room if it isn't open yet, without subscribing to it.
+
+        Args:
+            room_id (str): The id of the room, or GLOBAL_ROOM for global messages.
+
+        Returns:
+            _RoomQueue: The room's queue.
+        """
+        queue = self._rooms.get(room_id)
+        if queue is None:
+            queue = self._rooms[room_id] = _RoomQueue(self.queue_size)
+            if self.announce_rooms:
+                self._announcements().put_nowait((room_id, queue))
+
+        return queue
+
+    async def accept(self) -> Tuple[str, AsyncIterator[RoutedMessage]]:
+        """Wait for the next room to be opened.
+
+        A bot would usually loop over `accept`, starting a consumer task for each new room. The returned iterator is
+        bound to the room as it was opened, so it still yields every message even if the room is closed before the
+        consumer gets to it.
+
+        Returns:
+            Tuple[str, AsyncIterator[RoutedMessage]]: The id of the newly opened room, and an iterator over its
+                messages. See `messages`.
+        """
+        room_id, queue = await self._announcements().get()
+        queue.subscribed = True
+
+        return room_id, _iter_queue(queue)
+
+    def _announcements(self) -> asyncio.Queue:
+        """Get the queue that new rooms are announced on, creating it if needed.
+
+        Returns:
+            asyncio.Queue: The queue of (room id, room queue) pairs for `accept`.
+        """
+        if self._new_rooms is None:
+            self._new_rooms = asyncio.Queue()
+
+        return self._new_rooms
+
+    def messages(self, room_id: str) -> AsyncIterator[RoutedMessage]:
+        """Iterate over the parsed messages of a room, in order, until the room is closed.
+
+        The room is opened if it isn't open yet, so a consumer can subscribe to a room before the server first sends
+        anything to it.
+
+        Args:
+            room_id (str): The id of the room, or GLOBAL_ROOM for global messages.
+
+        Returns:
+            AsyncIterator[RoutedMessage]: An iterator over each parsed message sent to the room.
+        """
+        return _iter_queue(self.room(room_id))
+
+    def parse_frame(self, frame: str) -> List[RoutedMessage]:
+        """Parse every line of a frame, without routing them anywhere.
+
+        Args:
+            frame (str): The full frame as sent by the server.
+
+        Returns:
+            List[RoutedMessage]: The parsed messages, one per line of the frame (not counting the room line).
+        """
+        room_id, lines = _split_frame(frame)
+        return self._parse_lines(room_id, lines)
+
+    def _parse_lines(self, room_id: str, lines: List[str]) -> List[RoutedMessage]:
+        """Parse the lines of a frame sent to a room, as a battle room or as a global/chat room.
+
+        Args:
+            room_id (str): The id of the room the lines were sent to.
+            lines (List[str]): The lines of the frame, without the room line.
+
+        Returns:
+            List[RoutedMessage]: The parsed messages, one per line.
+        """
+        if room_id.startswith("battle-"):
+            if self.parser is not None:
+                return self.parser.parse_many(lines)
+            return BattleMessage.parse_many(lines, validate=self.validate)
+
+        return [Message.from_message(line) for line in lines]
+
+    async def route(self, frame: str) -> int:
+        """Parse a frame and put its messages on its room's queue, waiting for the room's consumer if the queue is full.
+
+        If the room has no consumer yet, a full queue drops its oldest message instead of waiting.
+
+        Args:
+            frame (str): The full frame as sent by the server.
+
+        Returns:
+            int: The number of messages routed.
+        """
+        room_id, lines = _split_frame(frame)
+        if not lines:
+            return 0
+
+        queue = self._open_room(room_id)
+        messages = self._parse_lines(room_id, lines)
+
+        for message in messages:
+            if not queue.full():
+                queue.put_nowait(message)
+            elif queue.subscribed:
+                await queue.put(message)
+            else:
+                queue.get_nowait()
+                queue.dropped += 1
+                queue.put_nowait(message)
+
+        if any(line.startswith(_CLOSING_PREFIXES) for line in lines):
+            await self.close_room(room_id)
+
+        return len(messages)
+
+    async def close_room(self, room_id: str) -> None:
+        """Close a room, ending its consumer's `messages` iterator once the messages already queued are consumed.
+
+        This never waits, even if the room's queue is full. If the server sends the same room id again later (such as
+        when rejoining a room), a new room is opened.
+
+        Args:
+            room_id (str): The id of the room to close.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        queue = self._rooms.pop(room_id, None)
+        if queue is not None:
+            queue.close()
+
+    async def run(self, frames: AsyncIterable[str]) -> None:
+        """Route every frame of a stream, such as an open websocket connection.
+
+        Every open room is closed once the stream ends or raises an exception, so that no consumer is left waiting on a
+        dead connection. If `run` is cancelled, the rooms are left open, and can be closed with `close`.
+
+        Args:
+            frames (AsyncIterable[str]): The stream of frames sent by the server.
+
+        Raises:
+            Exception: Any exception raised while reading the stream, re-raised once every room is closed.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        try:
+            async for frame in frames:
+                await self.route(frame)
+        except Exception:
+            await self.close()
+            raise
+
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every open room.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        for room_id in self.rooms:
+            await self.close_room(room_id)
+
+
+class _RoomQueue(asyncio.Queue):
+    """A room's bounded queue, which always has space for the None that closes it.
+
+    Besides the queue itself, it holds whether the room has a consumer (`subscribed`), and how many messages were
+    dropped while it had none (`dropped`).
+    """
+
+    def __init__(self, maxsize: int):  # noqa: D107
+        super().__init__(maxsize)
+        self.subscribed = False
+        self.dropped = 0
+        self._closed = False
+
+    def full(self) -> bool:
+        """Whether the queue is full, which a closed queue never is, so that its closing None always fits.
+
+        Returns:
+            bool: Whether putting another item would have to wait.
+        """
+        return not self._closed and super().full()
+
+    def close(self) -> None:
+        """Put the None that ends the room's messages, without waiting for space.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self._closed = True
+        self.put_nowait(None)
+
+
+async def _iter_queue(queue: asyncio.Queue) -> AsyncIterator[RoutedMessage]:
+    """Iterate over the messages of a room's queue, until the None that marks the room as closed.
+
+    Args:
+        queue (asyncio.Queue): The room's queue.
+
+    Yields:
+        RoutedMessage: Each message put on the queue.
+    """
+    while True:
+        message = await queue.get()
+        if message is None:
+            return
+        yield message
+
+
+def _split_frame(frame: str) -> Tuple[str, List[str]]:
+    """Split a frame into the id of its room and its message lines.
+
+    Args:
+        frame (str): The full frame as sent by the server.
+
+    Returns:
+        Tuple[str, List[str]]: The room id (GLOBAL_ROOM if the frame has no `>ROOMID` line), and the frame's non-empty
+            message lines.
+    """
+    # Only split on newlines, since str.splitlines would also split message payloads on characters like \u2028
+    lines = [line.rstrip("\r") for line in frame.split("\n")]
+
+    room_id = GLOBAL_ROOM
+    if lines and lines[0].startswith(">"):
+        room_id = lines.pop(0)[1:].strip()
+
+    return room_id, [line for line in lines if line]
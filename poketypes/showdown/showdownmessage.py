@@ -9,12 +9,15 @@ message corresponds to, and return the associated subclass (or an error detailin
 
 from __future__ import annotations
 
-import json
 from enum import Enum, unique
+from time import perf_counter_ns
 from typing import Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from . import instrumentation, jsonbackend
+from .errors import get_error_sink, message_key
+
 
 @unique
 class MType(str, Enum):
@@ -94,7 +97,9 @@ class Message(BaseModel):
     def from_message(message: str) -> "Message":
         """Create a specific Message object from a raw string message.
 
-        This is used for general Showdown Messages, compared to the BattleMessage class meant for battle details.
+        This is used for general Showdown Messages, compared to the BattleMessage class meant for battle details. If the
+        message can't be parsed, the failure is recorded with the current error sink (see
+        `poketypes.showdown.get_error_sink`), and a plain Message is returned.
 
         Args:
             message (str): The newline-stripped single string message as sent by the server.
@@ -102,34 +107,50 @@ class Message(BaseModel):
         Returns:
             Message: An initialized subclass of `Message`, for the corresponding class for this message type.
         """
-        try:
-            mtype = MType(message.split("|")[1])
-            m_class = mtype_to_mclass[mtype]
-        except ValueError:
-            print(f"Failed to identify which MType we should use for general message key {message.split('|')[1]}.")
+        stats = instrumentation.active_stats
+        if stats is None:
+            return _parse_message(message)
 
-            m = Message(MTYPE="unknown", MESSAGE=message)
+        start = perf_counter_ns()
+        m = _parse_message(message)
+        stats.record("Message", message_key(message), perf_counter_ns() - start, m.MTYPE == "unknown")
+
+        return m
 
-            return m
-        except KeyError:
-            print(f"MType {mtype} does not have a class in the dictionary!")
 
-            m = Message(MTYPE="unknown", MESSAGE=message)
+def _parse_message(message: str) -> Message:
+    """Create a specific Message object from a raw string message, recording any failure with the error sink.
 
-            return m
+    Args:
+        message (str): The newline-stripped single string message as sent by the server.
 
+    Returns:
+        Message: An initialized subclass of `Message`, or a plain Message if parsing failed.
+    """
+    key = message_key(message)
+
+    try:
+        mtype = MType(key)
+        m_class = mtype_to_mclass[mtype]
+    except ValueError:
+        err_state = "UNKNOWN_MTYPE"
+        detail = f"Failed to identify which MType we should use for general message key {key}."
+    except KeyError:
+        err_state = "MISSING_DICT_CLASS"
+        detail = f"MType {mtype} does not have a class in the dictionary!"
+    else:
         try:
-            m = m_class.from_message(message)
+            return m_class.from_message(message)
         except NotImplementedError:
-            print(f"MType {mtype}'s extraction implementation isn't ready yet!")
-
-            m = Message(MTYPE="unknown", MESSAGE=message)
+            err_state = "IMPLEMENTATION_NOT_READY"
+            detail = f"MType {mtype}'s extraction implementation isn't ready yet!"
         except Exception as ex:
-            print(f"MType {mtype} failed to build from message {message} due to a(n) {type(ex)}: {ex}")
+            err_state = "PARSE_ERROR"
+            detail = f"MType {mtype} failed to build from message {message} due to a(n) {type(ex)}: {ex}"
 
-            m = Message(MTYPE="unknown", MESSAGE=message)
+    get_error_sink().record(key, err_state, message, detail)
 
-        return m
+    return Message(MTYPE="unknown", MESSAGE=message)
 
 
 class Message_init(Message):
@@ -297,7 +318,7 @@ class Message_updateuser(Message):
         named = bool(int(m_split[3]))
         avatar = m_split[4]
 
-        u_set_json = json.loads(m_split[5])
+        u_set_json = jsonbackend.loads(m_split[5])
         u_set = UserSettings(
             BLOCK_CHALLENGES=u_set_json["blockChallenges"],
             BLOCK_PMS=u_set_json["blockPMs"],
@@ -382,7 +403,7 @@ class Message_customgroups(Message):
         """Create a specific Message object from a raw message."""
         m_split = message.split("|")
 
-        groups = json.loads(m_split[2])
+        groups = jsonbackend.loads(m_split[2])
 
         cgs = []
         for g in groups:
@@ -445,7 +466,7 @@ class Message_updatesearch(Message):
         """Create a specific Message object from a raw message."""
         m_split = message.split("|")
 
-        data = json.loads(m_split[2])
+        data = jsonbackend.loads(m_split[2])
 
         searching = data["searching"]
         games = data["games"]
@@ -477,7 +498,7 @@ class Message_updatechallenges(Message):
         """Create a specific Message object from a raw message."""
         m_split = message.split("|")
 
-        data = json.loads(m_split[2])
+        data = jsonbackend.loads(m_split[2])
 
         incoming = data["challengesFrom"]
 
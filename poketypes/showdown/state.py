@@ -0,0 +1,804 @@
+# poketypes/showdown/state.py
+
+"""Contains BattleState, an incremental tracker of a battle's state built from a stream of battle messages.
+
+BattleState.apply takes one parsed message at a time (a BattleMessage, or a LazyBattleMessage, which is only parsed if
+its BMTYPE changes the state) and updates the state in place, touching only the pokemon, side, or field the message is
+about. Messages that don't change the state, or that failed to parse, are ignored.
+
+The state is kept in plain `__slots__` classes rather than pydantic models, so that a single process can follow
+thousands of live battles without paying for validation or per-instance dicts on every update:
+
+- BattleState holds the format, turn, weather, terrain, other field conditions, and both sides
+- SideState holds a player's pokemon (keyed by IDENTITY, in the order they were revealed), which pokemon are in its
+  active slots, and its side conditions (like Stealth Rock or Reflect, with their layers)
+- PokemonState holds a pokemon's species, HP, status, stat boosts, volatile conditions, item, ability and used moves
+
+Condition names (side conditions, volatiles and field conditions) are stored in their `clean_name` form, like
+`STEALTHROCK` or `LEECHSEED`. The HP of an opponent's pokemon is only ever known as a percentage, out of 100.
+
+For search, a BattleState can be forked (or snapshotted and later restored) in a few microseconds. Forks share every
+SideState and PokemonState with the state they were forked from, and a side or pokemon is only copied the first time a
+message changes it in one of them. Each side and pokemon records which state owns it, and only the owner updates it in
+place, so the objects returned by `side`, `pokemon` and the SIDES dict should be treated as read-only.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from ..dex import DexAbility, DexItem, DexMove, DexPokemon, DexStatus, DexType, DexWeather, clean_name
+from .battlemessage import BattleMessage, BMType, LazyBattleMessage, PokemonIdentifier, PokeStat
+
+# The lowest and highest stage a stat can be boosted to
+MIN_BOOST = -6
+MAX_BOOST = 6
+
+StateMessage = Union[BattleMessage, LazyBattleMessage]
+
+
+class PokemonState:
+    """The known state of a single pokemon.
+
+    Boosts and volatile conditions only last while the pokemon is active, and are cleared when it switches out.
+
+    Args:
+        identity (str): The IDENTITY of the pokemon, like `ARCANINE`.
+        player (str): The player id of the pokemon's side.
+
+    Attributes:
+        IDENTITY (str): The unique identifier for the pokemon within its side, like `ARCANINE`
+        PLAYER (str): The player id of the pokemon's side
+        SPECIES (Optional[DexPokemon.ValueType]): The species of the pokemon, including its current forme. None until it
+            is first seen
+        LEVEL (int): The level of the pokemon
+        GENDER (Optional[str]): The gender of the pokemon, if it has one
+        CUR_HP (int): The current HP of the pokemon
+        MAX_HP (int): The maximum HP of the pokemon, which is 100 if its HP is only known as a percentage
+        STATUS (Optional[DexStatus.ValueType]): The status of the pokemon, or None if it has no status
+        ACTIVE (bool): Whether the pokemon is currently in one of its side's active slots
+        BOOSTS (Dict[PokeStat, int]): The non-zero stat boosts of the pokemon, from MIN_BOOST to MAX_BOOST
+        VOLATILES (Set[str]): The clean names of the pokemon's volatile conditions, like `CONFUSION` or `SUBSTITUTE`
+        ITEM (Optional[DexItem.ValueType]): The held item of the pokemon, or None if it is unknown or was used up or
+            removed
+        ABILITY (Optional[DexAbility.ValueType]): The last revealed ability of the pokemon, or None if it is unknown
+        TERASTALLIZED (Optional[DexType.ValueType]): The type the pokemon terastallized into, or None if it hasn't
+        MOVES (Dict[DexMove.ValueType, int]): The number of times the pokemon used each of its revealed moves
+    """
+
+    __slots__ = (
+        "IDENTITY",
+        "PLAYER",
+        "SPECIES",
+        "LEVEL",
+        "GENDER",
+        "CUR_HP",
+        "MAX_HP",
+        "STATUS",
+        "ACTIVE",
+        "BOOSTS",
+        "VOLATILES",
+        "ITEM",
+        "ABILITY",
+        "TERASTALLIZED",
+        "MOVES",
+        "_owner",
+    )
+
+    IDENTITY: str
+    PLAYER: str
+    SPECIES: Optional[DexPokemon.ValueType]
+    LEVEL: int
+    GENDER: Optional[str]
+    CUR_HP: int
+    MAX_HP: int
+    STATUS: Optional[DexStatus.ValueType]
+    ACTIVE: bool
+    BOOSTS: Dict[PokeStat, int]
+    VOLATILES: Set[str]
+    ITEM: Optional[DexItem.ValueType]
+    ABILITY: Optional[DexAbility.ValueType]
+    TERASTALLIZED: Optional[DexType.ValueType]
+    MOVES: Dict[DexMove.ValueType, int]
+
+    def __init__(self, identity: str, player: str):  # noqa: D107
+        self.IDENTITY = identity
+        self.PLAYER = player
+        self.SPECIES = None
+        self.LEVEL = 100
+        self.GENDER = None
+        self.CUR_HP = 100
+        self.MAX_HP = 100
+        self.STATUS = None
+        self.ACTIVE = False
+        self.BOOSTS = {}
+        self.VOLATILES = set()
+        self.ITEM = None
+        self.ABILITY = None
+        self.TERASTALLIZED = None
+        self.MOVES = {}
+        self._owner: Optional[object] = None
+
+    @property
+    def fainted(self) -> bool:
+        """Whether the pokemon has fainted."""
+        return self.STATUS == DexStatus.STATUS_FNT
+
+    def _copy(self, owner: object) -> PokemonState:
+        """Copy the pokemon for a state to update, without sharing any of its containers.
+
+        Args:
+            owner (object): The ownership token of the state the copy belongs to.
+
+        Returns:
+            PokemonState: The copy.
+        """
+        copy = PokemonState.__new__(PokemonState)
+        copy.IDENTITY = self.IDENTITY
+        copy.PLAYER = self.PLAYER
+        copy.SPECIES = self.SPECIES
+        copy.LEVEL = self.LEVEL
+        copy.GENDER = self.GENDER
+        copy.CUR_HP = self.CUR_HP
+        copy.MAX_HP = self.MAX_HP
+        copy.STATUS = self.STATUS
+        copy.ACTIVE = self.ACTIVE
+        copy.BOOSTS = self.BOOSTS.copy()
+        copy.VOLATILES = self.VOLATILES.copy()
+        copy.ITEM = self.ITEM
+        copy.ABILITY = self.ABILITY
+        copy.TERASTALLIZED = self.TERASTALLIZED
+        copy.MOVES = self.MOVES.copy()
+        copy._owner = owner
+        return copy
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"PokemonState({self.PLAYER}: {self.IDENTITY}, {self.CUR_HP}/{self.MAX_HP})"
+
+
+class SideState:
+    """The known state of a single player's side.
+
+    Args:
+        player (str): The player id of the side, like `p1`.
+
+    Attributes:
+        PLAYER (str): The player id of the side
+        USERNAME (Optional[str]): The username of the player, if known
+        TEAM_SIZE (Optional[int]): The number of pokemon in the player's team, if known
+        PREVIEW (List[DexPokemon.ValueType]): The species shown at team preview, in order
+        POKEMON (Dict[str, PokemonState]): Every revealed pokemon of the side, keyed by IDENTITY, in the order they were
+            revealed
+        ACTIVE (List[Optional[str]]): The IDENTITY of the pokemon in each active slot (`a`, `b`, ...), or None if the
+            slot is empty
+        CONDITIONS (Dict[str, int]): The side conditions of the side, keyed by clean name, with how many layers of each
+            are up
+    """
+
+    __slots__ = ("PLAYER", "USERNAME", "TEAM_SIZE", "PREVIEW", "POKEMON", "ACTIVE", "CONDITIONS", "_owner")
+
+    PLAYER: str
+    USERNAME: Optional[str]
+    TEAM_SIZE: Optional[int]
+    PREVIEW: List[DexPokemon.ValueType]
+    POKEMON: Dict[str, PokemonState]
+    ACTIVE: List[Optional[str]]
+    CONDITIONS: Dict[str, int]
+
+    def __init__(self, player: str):  # noqa: D107
+        self.PLAYER = player
+        self.USERNAME = None
+        self.TEAM_SIZE = None
+        self.PREVIEW = []
+        self.POKEMON = {}
+        self.ACTIVE = []
+        self.CONDITIONS = {}
+        self._owner: Optional[object] = None
+
+    def active_pokemon(self) -> List[PokemonState]:
+        """Get the pokemon in the side's active slots.
+
+        Returns:
+            List[PokemonState]: The pokemon in each non-empty active slot, in slot order.
+        """
+        return [self.POKEMON[identity] for identity in self.ACTIVE if identity is not None]
+
+    def _copy(self, owner: object) -> SideState:
+        """Copy the side for a state to update, still sharing its pokemon until they are updated.
+
+        Args:
+            owner (object): The ownership token of the state the copy belongs to.
+
+        Returns:
+            SideState: The copy.
+        """
+        copy = SideState.__new__(SideState)
+        copy.PLAYER = self.PLAYER
+        copy.USERNAME = self.USERNAME
+        copy.TEAM_SIZE = self.TEAM_SIZE
+        copy.PREVIEW = self.PREVIEW.copy()
+        copy.POKEMON = self.POKEMON.copy()
+        copy.ACTIVE = self.ACTIVE.copy()
+        copy.CONDITIONS = self.CONDITIONS.copy()
+        copy._owner = owner
+        return copy
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"SideState({self.PLAYER}, {len(self.POKEMON)} pokemon, active={self.ACTIVE})"
+
+
+class BattleState:
+    """The known state of a whole battle, updated one battle message at a time.
+
+    Attributes:
+        GEN (Optional[int]): The generation of the battle, if known
+        FORMAT (Optional[str]): The format name of the battle, if known
+        GAMETYPE (Optional[str]): The game type of the battle, like `singles` or `doubles`, if known
+        TURN (int): The current turn number, 0 before the first turn starts
+        WEATHER (Optional[DexWeather.ValueType]): The current weather, or None if there is none
+        TERRAIN (Optional[str]): The clean name of the current terrain, like `ELECTRICTERRAIN`, or None if there is none
+        FIELDS (Set[str]): The clean names of every other active field condition, like `TRICKROOM` or `GRAVITY`
+        SIDES (Dict[str, SideState]): The state of each side that was seen, keyed by player id
+        WINNER (Optional[str]): The username of the winner, once the battle is won
+        ENDED (bool): Whether the battle has ended, in a win or a tie
+    """
+
+    __slots__ = (
+        "GEN",
+        "FORMAT",
+        "GAMETYPE",
+        "TURN",
+        "WEATHER",
+        "TERRAIN",
+        "FIELDS",
+        "SIDES",
+        "WINNER",
+        "ENDED",
+        "_token",
+    )
+
+    GEN: Optional[int]
+    FORMAT: Optional[str]
+    GAMETYPE: Optional[str]
+    TURN: int
+    WEATHER: Optional[DexWeather.ValueType]
+    TERRAIN: Optional[str]
+    FIELDS: Set[str]
+    SIDES: Dict[str, SideState]
+    WINNER: Optional[str]
+    ENDED: bool
+
+    def __init__(self):  # noqa: D107
+        self.GEN = None
+        self.FORMAT = None
+        self.GAMETYPE = None
+        self.TURN = 0
+        self.WEATHER = None
+        self.TERRAIN = None
+        self.FIELDS = set()
+        self.SIDES = {}
+        self.WINNER = None
+        self.ENDED = False
+
+        # The sides and pokemon with this as their owner can be updated in place, while any others are shared with a
+        # fork or snapshot, and are copied before their first update
+        self._token = object()
+
+    @staticmethod
+    def from_messages(messages: Iterable[StateMessage]) -> BattleState:
+        """Build the state of a battle from its messages so far.
+
+        Args:
+            messages (Iterable[StateMessage]): The parsed messages of the battle, in order.
+
+        Returns:
+            BattleState: The state after applying every message.
+        """
+        state = BattleState()
+        state.apply_many(messages)
+        return state
+
+    def fork(self) -> BattleState:
+        """Fork the state, such as to explore a line of play in a search, without changing this state.
+
+        The fork shares every side and pokemon with this state. Whichever of the two states is updated first copies the
+        updated side or pokemon for itself, so forking costs the same no matter how much of the battle was seen.
+
+        Returns:
+            BattleState: The fork, equal to this state.
+        """
+        fork = BattleState.__new__(BattleState)
+        fork.GEN = self.GEN
+        fork.FORMAT = self.FORMAT
+        fork.GAMETYPE = self.GAMETYPE
+        fork.TURN = self.TURN
+        fork.WEATHER = self.WEATHER
+        fork.TERRAIN = self.TERRAIN
+        fork.FIELDS = self.FIELDS.copy()
+        fork.SIDES = self.SIDES.copy()
+        fork.WINNER = self.WINNER
+        fork.ENDED = self.ENDED
+        fork._token = object()
+
+        # Every side and pokemon is now shared, so neither state may update them in place anymore
+        self._token = object()
+
+        return fork
+
+    def snapshot(self) -> BattleState:
+        """Take a snapshot of the state, to roll back to later with `restore`.
+
+        Returns:
+            BattleState: The snapshot, which is a fork of this state that shouldn't be updated itself.
+        """
+        return self.fork()
+
+    def restore(self, snapshot: BattleState) -> None:
+        """Roll the state back to a snapshot (or any other state), sharing the snapshot's sides and pokemon.
+
+        The snapshot is left as it is, so the same snapshot can be restored again and again.
+
+        Args:
+            snapshot (BattleState): The snapshot to roll back to, as taken by `snapshot`.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        fork = snapshot.fork()
+        self.GEN = fork.GEN
+        self.FORMAT = fork.FORMAT
+        self.GAMETYPE = fork.GAMETYPE
+        self.TURN = fork.TURN
+        self.WEATHER = fork.WEATHER
+        self.TERRAIN = fork.TERRAIN
+        self.FIELDS = fork.FIELDS
+        self.SIDES = fork.SIDES
+        self.WINNER = fork.WINNER
+        self.ENDED = fork.ENDED
+        self._token = fork._token
+
+    def apply(self, message: StateMessage) -> None:
+        """Update the state with a single battle message.
+
+        Only the BMTYPE is read from messages that don't change the state, so LazyBattleMessages of those are never
+        parsed. Messages that failed to parse are ignored.
+
+        Args:
+            message (StateMessage): The parsed (or lazily parsed) battle message.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        handler = _HANDLERS.get(message.BMTYPE)
+        if handler is not None:
+            bm = _parsed(message)
+            if bm.ERR_STATE is None:
+                handler(self, bm)
+
+    def apply_many(self, messages: Iterable[StateMessage]) -> None:
+        """Update the state with each battle message of a batch, in order.
+
+        Args:
+            messages (Iterable[StateMessage]): The parsed (or lazily parsed) battle messages.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        handlers = _HANDLERS
+        for message in messages:
+            handler = handlers.get(message.BMTYPE)
+            if handler is not None:
+                bm = _parsed(message)
+                if bm.ERR_STATE is None:
+                    handler(self, bm)
+
+    def side(self, player: str) -> SideState:
+        """Get the state of a side.
+
+        Args:
+            player (str): The player id of the side, like `p1`.
+
+        Returns:
+            SideState: The side's state, which is empty if nothing about the side was seen yet.
+        """
+        side = self.SIDES.get(player)
+        return side if side is not None else SideState(player)
+
+    def pokemon(self, ident: PokemonIdentifier) -> Optional[PokemonState]:
+        """Get the state of a pokemon.
+
+        Args:
+            ident (PokemonIdentifier): The identifier of the pokemon, as given by battle messages.
+
+        Returns:
+            Optional[PokemonState]: The pokemon's state, or None if the pokemon wasn't seen yet.
+        """
+        side = self.SIDES.get(ident.PLAYER)
+        return side.POKEMON.get(ident.IDENTITY) if side is not None else None
+
+    def _side(self, player: str) -> SideState:
+        """Get the state of a side to update, adding the side if it wasn't seen yet, or copying it if it is shared.
+
+        Args:
+            player (str): The player id of the side.
+
+        Returns:
+            SideState: The side's state, owned by this state.
+        """
+        side = self.SIDES.get(player)
+        if side is None:
+            side = self.SIDES[player] = SideState(player)
+            side._owner = self._token
+        elif side._owner is not self._token:
+            side = self.SIDES[player] = side._copy(self._token)
+
+        return side
+
+    def _member(self, side: SideState, identity: str) -> PokemonState:
+        """Get the state of a side's pokemon to update, adding it if it wasn't seen yet, or copying it if it is shared.
+
+        Args:
+            side (SideState): The state of the pokemon's side, as returned by `_side`.
+            identity (str): The IDENTITY of the pokemon.
+
+        Returns:
+            PokemonState: The pokemon's state, owned by this state.
+        """
+        pokemon = side.POKEMON.get(identity)
+        if pokemon is None:
+            pokemon = side.POKEMON[identity] = PokemonState(identity, side.PLAYER)
+            pokemon._owner = self._token
+        elif pokemon._owner is not self._token:
+            pokemon = side.POKEMON[identity] = pokemon._copy(self._token)
+
+        return pokemon
+
+    def _pokemon(self, ident: PokemonIdentifier) -> PokemonState:
+        """Get the state of a pokemon to update, adding the pokemon if it wasn't seen yet.
+
+        Args:
+            ident (PokemonIdentifier): The identifier of the pokemon.
+
+        Returns:
+            PokemonState: The pokemon's state.
+        """
+        return self._member(self._side(ident.PLAYER), ident.IDENTITY)
+
+    def _enter(self, ident: PokemonIdentifier) -> PokemonState:
+        """Move a pokemon into its active slot, switching out the pokemon that was there.
+
+        Args:
+            ident (PokemonIdentifier): The identifier of the incoming pokemon, including its slot.
+
+        Returns:
+            PokemonState: The incoming pokemon's state.
+        """
+        side = self._side(ident.PLAYER)
+        slot = ord(ident.SLOT or "a") - 97
+
+        if len(side.ACTIVE) <= slot:
+            side.ACTIVE.extend([None] * (slot + 1 - len(side.ACTIVE)))
+
+        previous = side.ACTIVE[slot]
+        if previous is not None and previous != ident.IDENTITY:
+            outgoing = self._member(side, previous)
+            outgoing.ACTIVE = False
+            outgoing.BOOSTS.clear()
+            outgoing.VOLATILES.clear()
+
+        side.ACTIVE[slot] = ident.IDENTITY
+
+        pokemon = self._member(side, ident.IDENTITY)
+        pokemon.ACTIVE = True
+        return pokemon
+
+    def _apply_boost(self, ident: PokemonIdentifier, stat: PokeStat, amount: int) -> None:
+        """Change a pokemon's boost of a stat by an amount, within MIN_BOOST and MAX_BOOST.
+
+        Args:
+            ident (PokemonIdentifier): The identifier of the pokemon.
+            stat (PokeStat): The boosted stat.
+            amount (int): The number of stages to change the boost by, negative for a drop.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        boosts = self._pokemon(ident).BOOSTS
+
+        boost = max(MIN_BOOST, min(MAX_BOOST, boosts.get(stat, 0) + amount))
+        if boost:
+            boosts[stat] = boost
+        else:
+            boosts.pop(stat, None)
+
+    # Handlers for each BMType that changes the state, dispatched to by `apply`
+
+    def _on_player(self, bm: BattleMessage) -> None:
+        """Record a player's username."""
+        if bm.USERNAME:
+            self._side(bm.PLAYER).USERNAME = bm.USERNAME
+
+    def _on_teamsize(self, bm: BattleMessage) -> None:
+        """Record the size of a player's team."""
+        self._side(bm.PLAYER).TEAM_SIZE = bm.NUMBER
+
+    def _on_gametype(self, bm: BattleMessage) -> None:
+        """Record the game type."""
+        self.GAMETYPE = bm.GAMETYPE
+
+    def _on_gen(self, bm: BattleMessage) -> None:
+        """Record the generation."""
+        self.GEN = bm.GENNUM
+
+    def _on_tier(self, bm: BattleMessage) -> None:
+        """Record the format name."""
+        self.FORMAT = bm.FORMATNAME
+
+    def _on_poke(self, bm: BattleMessage) -> None:
+        """Record a species shown at team preview."""
+        self._side(bm.PLAYER).PREVIEW.append(bm.SPECIES)
+
+    def _on_turn(self, bm: BattleMessage) -> None:
+        """Start a new turn."""
+        self.TURN = bm.NUMBER
+
+    def _on_win(self, bm: BattleMessage) -> None:
+        """End the battle in a win."""
+        self.WINNER = bm.USERNAME
+        self.ENDED = True
+
+    def _on_tie(self, bm: BattleMessage) -> None:
+        """End the battle in a tie."""
+        self.ENDED = True
+
+    def _on_switch(self, bm: BattleMessage) -> None:
+        """Switch (or drag) a pokemon in."""
+        pokemon = self._enter(bm.POKEMON)
+        pokemon.SPECIES = bm.SPECIES
+        pokemon.LEVEL = bm.LEVEL
+        pokemon.GENDER = bm.GENDER
+        pokemon.CUR_HP = bm.CUR_HP
+        pokemon.MAX_HP = bm.MAX_HP
+        pokemon.STATUS = bm.STATUS
+
+    def _on_replace(self, bm: BattleMessage) -> None:
+        """Reveal the pokemon behind an Illusion, taking over its slot."""
+        pokemon = self._enter(bm.POKEMON)
+        pokemon.SPECIES = bm.SPECIES
+        pokemon.LEVEL = bm.LEVEL
+        pokemon.GENDER = bm.GENDER
+
+    def _on_detailschange(self, bm: BattleMessage) -> None:
+        """Permanently change a pokemon's details, such as after mega evolving."""
+        pokemon = self._pokemon(bm.POKEMON)
+        pokemon.SPECIES = bm.SPECIES
+        pokemon.LEVEL = bm.LEVEL
+        pokemon.GENDER = bm.GENDER
+
+    def _on_formechange(self, bm: BattleMessage) -> None:
+        """Change a pokemon's forme."""
+        self._pokemon(bm.POKEMON).SPECIES = bm.SPECIES
+
+    def _on_hp(self, bm: BattleMessage) -> None:
+        """Set a pokemon's HP and status from a damage, heal or sethp message."""
+        pokemon = self._pokemon(bm.POKEMON)
+        pokemon.CUR_HP = bm.CUR_HP
+        if bm.MAX_HP is not None:
+            pokemon.MAX_HP = bm.MAX_HP
+        pokemon.STATUS = bm.STATUS
+
+    def _on_faint(self, bm: BattleMessage) -> None:
+        """Faint a pokemon."""
+        pokemon = self._pokemon(bm.POKEMON)
+        pokemon.CUR_HP = 0
+        pokemon.STATUS = DexStatus.STATUS_FNT
+
+    def _on_status(self, bm: BattleMessage) -> None:
+        """Give a pokemon a status."""
+        self._pokemon(bm.POKEMON).STATUS = bm.STATUS
+
+    def _on_curestatus(self, bm: BattleMessage) -> None:
+        """Cure a pokemon's status."""
+        pokemon = self._pokemon(bm.POKEMON)
+        if not pokemon.fainted:
+            pokemon.STATUS = None
+
+    def _on_cureteam(self, bm: BattleMessage) -> None:
+        """Cure the status of every pokemon of a side."""
+        if bm.EFFECT.EFFECT_SOURCE is None:
+            return
+
+        side = self._side(bm.EFFECT.EFFECT_SOURCE.PLAYER)
+        for identity, pokemon in list(side.POKEMON.items()):
+            if pokemon.STATUS is not None and not pokemon.fainted:
+                self._member(side, identity).STATUS = None
+
+    def _on_boost(self, bm: BattleMessage) -> None:
+        """Raise a pokemon's stat."""
+        self._apply_boost(bm.POKEMON, bm.STAT, bm.AMOUNT)
+
+    def _on_unboost(self, bm: BattleMessage) -> None:
+        """Lower a pokemon's stat."""
+        self._apply_boost(bm.POKEMON, bm.STAT, -bm.AMOUNT)
+
+    def _on_setboost(self, bm: BattleMessage) -> None:
+        """Set a pokemon's boost of a stat."""
+        boosts = self._pokemon(bm.POKEMON).BOOSTS
+        boosts.pop(bm.STAT, None)
+        self._apply_boost(bm.POKEMON, bm.STAT, bm.AMOUNT)
+
+    def _on_clearboost(self, bm: BattleMessage) -> None:
+        """Clear every boost of a pokemon."""
+        self._pokemon(bm.POKEMON).BOOSTS.clear()
+
+    def _on_clearallboost(self, bm: BattleMessage) -> None:
+        """Clear every boost of every active pokemon."""
+        for player, side in list(self.SIDES.items()):
+            for identity in side.ACTIVE:
+                if identity is not None and side.POKEMON[identity].BOOSTS:
+                    self._member(self._side(player), identity).BOOSTS.clear()
+
+    def _on_clearpositiveboost(self, bm: BattleMessage) -> None:
+        """Clear a pokemon's positive boosts."""
+        boosts = self._pokemon(bm.POKEMON).BOOSTS
+        for stat in [stat for stat, boost in boosts.items() if boost > 0]:
+            del boosts[stat]
+
+    def _on_clearnegativeboost(self, bm: BattleMessage) -> None:
+        """Clear a pokemon's negative boosts."""
+        boosts = self._pokemon(bm.POKEMON).BOOSTS
+        for stat in [stat for stat, boost in boosts.items() if boost < 0]:
+            del boosts[stat]
+
+    def _on_invertboost(self, bm: BattleMessage) -> None:
+        """Invert a pokemon's boosts."""
+        boosts = self._pokemon(bm.POKEMON).BOOSTS
+        for stat, boost in boosts.items():
+            boosts[stat] = -boost
+
+    def _on_weather(self, bm: BattleMessage) -> None:
+        """Start or end the weather."""
+        self.WEATHER = None if bm.WEATHER == DexWeather.WEATHER_NONE else bm.WEATHER
+
+    def _on_fieldstart(self, bm: BattleMessage) -> None:
+        """Start a terrain or other field condition."""
+        name = clean_name(bm.EFFECT.EFFECT_NAME)
+        if name is None:
+            return
+        if name.endswith("TERRAIN"):
+            self.TERRAIN = name
+        else:
+            self.FIELDS.add(name)
+
+    def _on_fieldend(self, bm: BattleMessage) -> None:
+        """End a terrain or other field condition."""
+        name = clean_name(bm.EFFECT.EFFECT_NAME)
+        if name is None:
+            return
+        if name == self.TERRAIN:
+            self.TERRAIN = None
+        else:
+            self.FIELDS.discard(name)
+
+    def _on_sidestart(self, bm: BattleMessage) -> None:
+        """Start (or add a layer of) a side condition."""
+        conditions = self._side(bm.PLAYER).CONDITIONS
+        name = clean_name(bm.CONDITION)
+        conditions[name] = conditions.get(name, 0) + 1
+
+    def _on_sideend(self, bm: BattleMessage) -> None:
+        """End a side condition."""
+        self._side(bm.PLAYER).CONDITIONS.pop(clean_name(bm.CONDITION), None)
+
+    def _on_swapsideconditions(self, bm: BattleMessage) -> None:
+        """Swap the side conditions of both sides, as Court Change does."""
+        p1, p2 = self._side("p1"), self._side("p2")
+        p1.CONDITIONS, p2.CONDITIONS = p2.CONDITIONS, p1.CONDITIONS
+
+    def _on_volstart(self, bm: BattleMessage) -> None:
+        """Start a volatile condition on a pokemon."""
+        name = clean_name(bm.EFFECT.EFFECT_NAME) if bm.EFFECT is not None else None
+        if name is not None:
+            self._pokemon(bm.POKEMON).VOLATILES.add(name)
+
+    def _on_volend(self, bm: BattleMessage) -> None:
+        """End a volatile condition on a pokemon."""
+        name = clean_name(bm.EFFECT.EFFECT_NAME) if bm.EFFECT is not None else None
+        if name is not None:
+            self._pokemon(bm.POKEMON).VOLATILES.discard(name)
+
+    def _on_transform(self, bm: BattleMessage) -> None:
+        """Transform a pokemon into another."""
+        self._pokemon(bm.SOURCE).VOLATILES.add("TRANSFORM")
+
+    def _on_move(self, bm: BattleMessage) -> None:
+        """Record a pokemon using one of its own moves (moves called by another move, like Sleep Talk, are skipped)."""
+        if bm.EFFECT is None:
+            moves = self._pokemon(bm.POKEMON).MOVES
+            moves[bm.MOVE] = moves.get(bm.MOVE, 0) + 1
+
+    def _on_item(self, bm: BattleMessage) -> None:
+        """Reveal or give a pokemon's item."""
+        self._pokemon(bm.POKEMON).ITEM = bm.ITEM
+
+    def _on_enditem(self, bm: BattleMessage) -> None:
+        """Use up or remove a pokemon's item."""
+        self._pokemon(bm.POKEMON).ITEM = None
+
+    def _on_mega(self, bm: BattleMessage) -> None:
+        """Reveal a pokemon's mega stone as it mega evolves."""
+        self._pokemon(bm.POKEMON).ITEM = bm.MEGA_STONE
+
+    def _on_ability(self, bm: BattleMessage) -> None:
+        """Reveal a pokemon's ability."""
+        self._pokemon(bm.POKEMON).ABILITY = bm.ABILITY
+
+    def _on_terastallize(self, bm: BattleMessage) -> None:
+        """Terastallize a pokemon."""
+        self._pokemon(bm.POKEMON).TERASTALLIZED = bm.TYPE
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"BattleState(turn={self.TURN}, sides={list(self.SIDES.values())})"
+
+
+def _parsed(message: StateMessage) -> BattleMessage:
+    """Get the parsed BattleMessage behind a message, parsing a LazyBattleMessage if it wasn't already.
+
+    Args:
+        message (StateMessage): The parsed (or lazily parsed) battle message.
+
+    Returns:
+        BattleMessage: The parsed message, whose ERR_STATE tells whether parsing failed.
+    """
+    if isinstance(message, LazyBattleMessage):
+        return message.parsed
+    return message
+
+
+# The BattleState method that applies each BMType that changes the state
+_HANDLERS: Dict[BMType, Callable[[BattleState, BattleMessage], None]] = {
+    BMType.player: BattleState._on_player,
+    BMType.teamsize: BattleState._on_teamsize,
+    BMType.gametype: BattleState._on_gametype,
+    BMType.gen: BattleState._on_gen,
+    BMType.tier: BattleState._on_tier,
+    BMType.poke: BattleState._on_poke,
+    BMType.turn: BattleState._on_turn,
+    BMType.win: BattleState._on_win,
+    BMType.tie: BattleState._on_tie,
+    BMType.switch: BattleState._on_switch,
+    BMType.drag: BattleState._on_switch,
+    BMType.replace: BattleState._on_replace,
+    BMType.detailschange: BattleState._on_detailschange,
+    BMType.formechange: BattleState._on_formechange,
+    BMType.damage: BattleState._on_hp,
+    BMType.heal: BattleState._on_hp,
+    BMType.sethp: BattleState._on_hp,
+    BMType.faint: BattleState._on_faint,
+    BMType.status: BattleState._on_status,
+    BMType.curestatus: BattleState._on_curestatus,
+    BMType.cureteam: BattleState._on_cureteam,
+    BMType.boost: BattleState._on_boost,
+    BMType.unboost: BattleState._on_unboost,
+    BMType.setboost: BattleState._on_setboost,
+    BMType.clearboost: BattleState._on_clearboost,
+    BMType.clearallboost: BattleState._on_clearallboost,
+    BMType.clearpositiveboost: BattleState._on_clearpositiveboost,
+    BMType.clearnegativeboost: BattleState._on_clearnegativeboost,
+    BMType.invertboost: BattleState._on_invertboost,
+    BMType.weather: BattleState._on_weather,
+    BMType.fieldstart: BattleState._on_fieldstart,
+    BMType.fieldend: BattleState._on_fieldend,
+    BMType.sidestart: BattleState._on_sidestart,
+    BMType.sideend: BattleState._on_sideend,
+    BMType.swapsideconditions: BattleState._on_swapsideconditions,
+    BMType.volstart: BattleState._on_volstart,
+    BMType.volend: BattleState._on_volend,
+    BMType.transform: BattleState._on_transform,
+    BMType.move: BattleState._on_move,
+    BMType.item: BattleState._on_item,
+    BMType.enditem: BattleState._on_enditem,
+    BMType.mega: BattleState._on_mega,
+    BMType.ability: BattleState._on_ability,
+    BMType.terastallize: BattleState._on_terastallize,
+}
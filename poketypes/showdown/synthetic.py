@@ -0,0 +1,720 @@
+# poketypes/showdown/synthetic.py
+
+"""Contains a generator of synthetic showdown battle logs, for load testing parsers and building benchmark corpora.
+
+Real battle logs are hard to ship in bulk, so this module simulates random singles battles for any gen, entirely
+offline. Species, moves, items and abilities are drawn from the DexPokemon, DexMove, DexItem and DexAbility Enums
+(limited to those introduced by the battle's gen), and each battle is played out with consistent HP, status, weather and
+faint bookkeeping, so stateful consumers see a coherent battle, not just well-formed lines.
+
+The battles are not realistic in any competitive sense (damage and move choices are random), but every line is a
+syntactically valid showdown message that parses without errors, including `[from]`/`[of]` tags and the `request` JSON
+of the first player. Generation is seeded, so the same seed always produces the same battles.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import os
+import random
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..dex import DexAbility, DexItem, DexMove, DexPokemon, DexType
+
+SYNTHETIC_TEAM_SIZE = 6
+
+# Battles still going after this many turns end in a tie
+SYNTHETIC_MAX_TURNS = 200
+
+SYNTHETIC_TARGET_SIZE = 1 << 20
+
+# The highest national dex number, move number and ability number introduced by each gen
+_GEN_LIMITS: Dict[int, Tuple[int, int, int]] = {
+    1: (151, 165, 0),
+    2: (251, 251, 0),
+    3: (386, 354, 76),
+    4: (493, 467, 123),
+    5: (649, 559, 164),
+    6: (721, 621, 191),
+    7: (809, 742, 233),
+    8: (905, 850, 267),
+    9: (1025, 919, 310),
+}
+
+_STATUSES = ("brn", "par", "slp", "frz", "psn", "tox")
+_BOOST_STATS = ("atk", "def", "spa", "spd", "spe")
+_WEATHERS = ("RainDance", "SunnyDay", "Sandstorm")
+
+
+class _GenPools(NamedTuple):
+    """The display names that a synthetic battle of some gen draws from."""
+
+    SPECIES: List[str]
+    MOVES: List[str]
+    ITEMS: List[str]
+    ABILITIES: List[str]
+    TYPES: List[str]
+
+
+def _display_name(enum_name: str) -> str:
+    """Turn a Dex Enum entry name like `MOVE_SWORDSDANCE` into a display name like `Swordsdance`.
+
+    The result isn't the official name, but it cleans back to the same Dex Enum entry, which is all the parsers need.
+
+    Args:
+        enum_name (str): The name of the Dex Enum entry.
+
+    Returns:
+        str: The display name, without the Enum prefix.
+    """
+    return enum_name.split("_", 1)[1].title()
+
+
+@lru_cache(maxsize=None)
+def _gen_pools(gen: int) -> _GenPools:
+    """Collect the species, moves, items, abilities and types a synthetic battle of the given gen draws from.
+
+    Only base formes of the species introduced up to this gen are used, along with the moves and abilities introduced
+    up to this gen. Items are drawn from every DexItem, since DexItem doesn't track when items were introduced.
+
+    Args:
+        gen (int): The gen of the battle, from 1 to 9.
+
+    Returns:
+        _GenPools: The display names to draw from.
+    """
+    max_species, max_move, max_ability = _GEN_LIMITS[gen]
+
+    return _GenPools(
+        SPECIES=[
+            _display_name(name)
+            for name, value in DexPokemon.items()
+            if value % 1000 == 0 and 1 <= value // 1000 <= max_species
+        ],
+        MOVES=[
+            _display_name(name) for name, value in DexMove.items() if value % 100 == 0 and 1 <= value // 100 <= max_move
+        ],
+        ITEMS=[_display_name(name) for name, value in DexItem.items() if value > 0] if gen >= 2 else [],
+        # DexAbility values are 100 * (ability number + 1), with ABILITY_NOABILITY as number 0
+        ABILITIES=[
+            _display_name(name)
+            for name, value in DexAbility.items()
+            if value % 100 == 0 and 2 <= value // 100 <= max_ability + 1
+        ],
+        TYPES=[_display_name(name) for name, value in DexType.items() if value > 0],
+    )
+
+
+def _check_gens(gens: Optional[Iterable[int]]) -> List[int]:
+    """Check that synthetic battles can be generated for every given gen.
+
+    Args:
+        gens (Optional[Iterable[int]]): The gens to check, or None for every gen from 1 to 9.
+
+    Raises:
+        ValueError: If any gen is not between 1 and 9.
+
+    Returns:
+        List[int]: The checked gens.
+    """
+    gens = sorted(_GEN_LIMITS) if gens is None else list(gens)
+    for gen in gens:
+        if gen not in _GEN_LIMITS:
+            raise ValueError(f"Synthetic battles can only be generated for gens 1 to 9, not gen {gen}")
+
+    return gens
+
+
+def _showdown_id(name: str) -> str:
+    """Get the showdown id of a display name, as used in `request` JSON.
+
+    Args:
+        name (str): The display name.
+
+    Returns:
+        str: The lowercase id.
+    """
+    return name.lower()
+
+
+class _SynthPokemon:
+    """The state of a single pokemon over the course of a synthetic battle."""
+
+    __slots__ = ("name", "details", "moves", "item", "ability", "tera_type", "stats", "max_hp", "hp", "status")
+
+    def __init__(self, rng: random.Random, gen: int, species: str, pools: _GenPools):  # noqa: D107
+        self.name = species
+
+        details = f"{species}, L{rng.randint(70, 95)}"
+        if gen >= 2:
+            gender = rng.choice(("M", "F", None))
+            if gender is not None:
+                details += f", {gender}"
+            if rng.random() < 1 / 64:
+                details += ", shiny"
+        self.details = details
+
+        self.moves = rng.sample(pools.MOVES, 4)
+        self.item = rng.choice(pools.ITEMS) if pools.ITEMS and rng.random() < 0.9 else None
+        self.ability = rng.choice(pools.ABILITIES) if pools.ABILITIES else None
+        self.tera_type = rng.choice(pools.TYPES) if gen >= 9 else None
+
+        self.stats = {stat: rng.randint(100, 350) for stat in _BOOST_STATS}
+        self.max_hp = rng.randint(150, 400)
+        self.hp = self.max_hp
+        self.status: Optional[str] = None
+
+    @property
+    def fainted(self) -> bool:
+        """Whether this pokemon has fainted."""
+        return self.hp <= 0
+
+    @property
+    def condition(self) -> str:
+        """The public HP/status condition string of this pokemon, with HP shown in percentages."""
+        if self.fainted:
+            return "0 fnt"
+
+        condition = f"{max(1, math.ceil(100 * self.hp / self.max_hp))}/100"
+        return f"{condition} {self.status}" if self.status else condition
+
+    def request_data(self, player: str, active: bool, gen: int) -> Dict[str, object]:
+        """Build the `side.pokemon` entry of this pokemon in a `request` JSON.
+
+        Args:
+            player (str): The player id of this pokemon's side, like `p1`.
+            active (bool): Whether this pokemon is currently active.
+            gen (int): The gen of the battle.
+
+        Returns:
+            Dict[str, object]: The JSON-ready pokemon data.
+        """
+        condition = "0 fnt" if self.fainted else f"{self.hp}/{self.max_hp}"
+        if self.status and not self.fainted:
+            condition += f" {self.status}"
+
+        ability = _showdown_id(self.ability) if self.ability else "noability"
+
+        data = {
+            "ident": f"{player}: {self.name}",
+            "details": self.details,
+            "condition": condition,
+            "active": active,
+            "stats": self.stats,
+            "moves": [_showdown_id(move) for move in self.moves],
+            "baseAbility": ability,
+            "item": _showdown_id(self.item) if self.item else "",
+            "pokeball": "pokeball",
+            "ability": ability,
+        }
+        if gen >= 9:
+            data["commanding"] = False
+            data["reviving"] = False
+            data["teraType"] = self.tera_type
+            data["terastallized"] = ""
+
+        return data
+
+
+class _SynthSide:
+    """The state of one player's side over the course of a synthetic battle."""
+
+    __slots__ = ("player", "name", "team", "active", "stealth_rock", "terastallized")
+
+    def __init__(self, player: str, name: str, team: List[_SynthPokemon]):  # noqa: D107
+        self.player = player
+        self.name = name
+        self.team = team
+        self.active = team[0]
+        self.stealth_rock = False
+        self.terastallized = False
+
+    def ident(self, pokemon: Optional[_SynthPokemon] = None) -> str:
+        """Get the POKEMON identifier of a pokemon in the active slot, like `p1a: Kingambit`.
+
+        Args:
+            pokemon (Optional[_SynthPokemon], optional): The pokemon to identify. Defaults to None, which identifies the
+                currently active pokemon.
+
+        Returns:
+            str: The pokemon identifier.
+        """
+        return f"{self.player}a: {(pokemon or self.active).name}"
+
+    @property
+    def bench(self) -> List[_SynthPokemon]:
+        """The pokemon that could be switched in."""
+        return [pokemon for pokemon in self.team if pokemon is not self.active and not pokemon.fainted]
+
+    @property
+    def defeated(self) -> bool:
+        """Whether every pokemon on this side has fainted."""
+        return all(pokemon.fainted for pokemon in self.team)
+
+
+class _SynthBattle:
+    """A single randomly played synthetic battle, recording every line it produces.
+
+    Args:
+        gen (int): The gen of the battle, from 1 to 9.
+        seed (Optional[int]): The seed of the battle's random choices.
+        requests (bool): Whether to include the `request` JSON of the first player.
+    """
+
+    def __init__(self, gen: int, seed: Optional[int], requests: bool):  # noqa: D107
+        self.rng = random.Random(seed)
+        self.gen = gen
+        self.requests = requests
+        self.lines: List[str] = []
+        self.rqid = 0
+        self.timestamp = 1_600_000_000 + self.rng.randrange(100_000_000)
+        self.weather: Optional[str] = None
+        self.weather_turns = 0
+
+        pools = _gen_pools(gen)
+        self.sides = [
+            _SynthSide(
+                player,
+                f"synthetic-{player}-{self.rng.randrange(10_000)}",
+                [
+                    _SynthPokemon(self.rng, gen, species, pools)
+                    for species in self.rng.sample(pools.SPECIES, SYNTHETIC_TEAM_SIZE)
+                ],
+            )
+            for player in ("p1", "p2")
+        ]
+
+    def emit(self, *parts: object) -> None:
+        """Record a single message line made of the given `|` separated parts.
+
+        Args:
+            *parts (object): The message key and arguments.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self.lines.append("|" + "|".join(str(part) for part in parts))
+
+    def tick(self) -> None:
+        """Advance the battle clock and record a timestamp line.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        self.timestamp += self.rng.randint(5, 30)
+        self.emit("t:", self.timestamp)
+
+    def request(self, kind: str) -> None:
+        """Record a `request` message for the first player, if requests are enabled.
+
+        Args:
+            kind (str): The kind of request, one of `teampreview`, `active` or `forceswitch`.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        if not self.requests:
+            return
+
+        side = self.sides[0]
+        self.rqid += 1
+
+        request: Dict[str, object] = {}
+        if kind == "active":
+            active: Dict[str, object] = {
+                "moves": [
+                    {
+                        "move": move,
+                        "id": _showdown_id(move),
+                        "pp": 16,
+                        "maxpp": 16,
+                        "target": "normal",
+                        "disabled": False,
+                    }
+                    for move in side.active.moves
+                ]
+            }
+            if self.gen >= 9 and not side.terastallized:
+                active["canTerastallize"] = side.active.tera_type
+            request["active"] = [active]
+        elif kind == "forceswitch":
+            request["forceSwitch"] = [True]
+            request["noCancel"] = True
+        else:
+            request["teamPreview"] = True
+            request["maxTeamSize"] = SYNTHETIC_TEAM_SIZE
+
+        request["side"] = {
+            "name": side.name,
+            "id": side.player,
+            "pokemon": [
+                pokemon.request_data(side.player, kind != "teampreview" and pokemon is side.active, self.gen)
+                for pokemon in side.team
+            ],
+        }
+        request["rqid"] = self.rqid
+
+        self.emit("request", json.dumps(request, separators=(",", ":")))
+
+    def damage(self, side: _SynthSide, amount: int, *tags: str) -> None:
+        """Damage the active pokemon of a side, recording the damage and any resulting faint.
+
+        Args:
+            side (_SynthSide): The side whose active pokemon is damaged.
+            amount (int): The HP lost.
+            *tags (str): The `[from]`/`[of]` tags explaining the damage, if it wasn't from a move.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        side.active.hp = max(0, side.active.hp - amount)
+        self.emit("-damage", side.ident(), side.active.condition, *tags)
+
+        if side.active.fainted:
+            self.emit("faint", side.ident())
+
+    def switch_in(self, side: _SynthSide, pokemon: _SynthPokemon, key: str = "switch") -> None:
+        """Switch a pokemon into the active slot of a side, along with its entry effects.
+
+        Args:
+            side (_SynthSide): The side switching.
+            pokemon (_SynthPokemon): The pokemon switching in.
+            key (str, optional): The message key, either `switch` or `drag`. Defaults to `switch`.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        # Like the server, swap the incoming pokemon to the front of the team, so requests list the active pokemon first
+        position = side.team.index(pokemon)
+        side.team[0], side.team[position] = pokemon, side.team[0]
+
+        side.active = pokemon
+        self.emit(key, side.ident(), pokemon.details, pokemon.condition)
+
+        if side.stealth_rock:
+            self.damage(side, pokemon.max_hp // 8, "[from] Stealth Rock")
+        elif self.gen >= 3 and pokemon.ability and self.weather is None and self.rng.random() < 0.05:
+            self.weather = self.rng.choice(_WEATHERS)
+            self.weather_turns = 5
+            self.emit("-weather", self.weather, f"[from] ability: {pokemon.ability}", f"[of] {side.ident()}")
+
+    def use_move(self, side: _SynthSide, foe: _SynthSide) -> None:
+        """Play out the active pokemon of a side using a random move against the foe.
+
+        Args:
+            side (_SynthSide): The side whose active pokemon is moving.
+            foe (_SynthSide): The opposing side.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        rng = self.rng
+        user = side.active
+
+        if user.status in ("par", "slp", "frz") and rng.random() < 0.25:
+            self.emit("cant", side.ident(), user.status)
+            return
+        if user.status in ("slp", "frz") and rng.random() < 0.5:
+            self.emit("-curestatus", side.ident(), user.status, "[msg]")
+            user.status = None
+
+        if self.gen >= 9 and not side.terastallized and rng.random() < 0.1:
+            side.terastallized = True
+            self.emit("-terastallize", side.ident(), user.tera_type)
+
+        roll = rng.random()
+
+        if roll < 0.1:
+            self.emit("move", side.ident(), rng.choice(user.moves), side.ident())
+            self.emit("-boost", side.ident(), rng.choice(_BOOST_STATS), rng.randint(1, 2))
+            return
+
+        if roll < 0.14 and self.gen >= 4 and not foe.stealth_rock:
+            foe.stealth_rock = True
+            self.emit("move", side.ident(), "Stealth Rock", foe.ident())
+            self.emit("-sidestart", f"{foe.player}: {foe.name}", "move: Stealth Rock")
+            return
+
+        if roll < 0.17 and self.gen >= 2:
+            self.weather = rng.choice(_WEATHERS)
+            self.weather_turns = 5
+            self.emit("move", side.ident(), self.weather, side.ident())
+            self.emit("-weather", self.weather)
+            return
+
+        target = foe.active
+        self.emit("move", side.ident(), rng.choice(user.moves), foe.ident())
+
+        if rng.random() < 0.08:
+            self.emit("-miss", side.ident(), foe.ident())
+            return
+
+        effectiveness = rng.random()
+        if effectiveness < 0.03:
+            self.emit("-immune", foe.ident())
+            return
+        if rng.random() < 0.06:
+            self.emit("-crit", foe.ident())
+        if effectiveness < 0.18:
+            self.emit("-supereffective", foe.ident())
+        elif effectiveness < 0.33:
+            self.emit("-resisted", foe.ident())
+
+        self.damage(foe, rng.randint(target.max_hp // 10, target.max_hp * 3 // 5))
+
+        if not target.fainted:
+            if target.status is None and rng.random() < 0.1:
+                target.status = rng.choice(_STATUSES)
+                self.emit("-status", foe.ident(), target.status)
+            elif rng.random() < 0.1:
+                self.emit("-unboost", foe.ident(), rng.choice(_BOOST_STATS), 1)
+
+            if target.item and rng.random() < 0.05:
+                self.damage(side, user.max_hp // 6, f"[from] item: {target.item}", f"[of] {foe.ident()}")
+                return
+
+        if rng.random() < 0.08:
+            self.damage(side, user.max_hp // 10, "[from] Recoil")
+
+    def upkeep(self) -> None:
+        """Play out the end of turn weather, residual damage and healing.
+
+        Returns:
+            None: Nothing is returned.
+        """
+        if self.weather is not None:
+            self.weather_turns -= 1
+            if self.weather_turns <= 0:
+                self.weather = None
+                self.emit("-weather", "none")
+            else:
+                self.emit("-weather", self.weather, "[upkeep]")
+
+        for side in self.sides:
+            pokemon = side.active
+            if pokemon.fainted:
+                continue
+
+            if self.weather == "Sandstorm":
+                self.damage(side, pokemon.max_hp // 16, "[from] Sandstorm")
+            if not pokemon.fainted and pokemon.status in ("brn", "psn", "tox"):
+                self.damage(side, pokemon.max_hp // 8, f"[from] {pokemon.status}")
+            if not pokemon.fainted and pokemon.item and pokemon.hp < pokemon.max_hp and self.rng.random() < 0.4:
+                pokemon.hp = min(pokemon.max_hp, pokemon.hp + pokemon.max_hp // 16)
+                self.emit("-heal", side.ident(), pokemon.condition, f"[from] item: {pokemon.item}")
+
+        self.emit("upkeep")
+
+    def play(self) -> List[str]:
+        """Play out the whole battle.
+
+        Returns:
+            List[str]: Every line of the battle log, in order.
+        """
+        rng = self.rng
+        p1, p2 = self.sides
+
+        self.emit("init", "battle")
+        self.emit("title", f"{p1.name} vs. {p2.name}")
+        for side in self.sides:
+            self.emit("j", f"☆{side.name}")
+        self.tick()
+        self.emit("gametype", "singles")
+        for side in self.sides:
+            self.emit("player", side.player, side.name, rng.randrange(1, 300), rng.randint(1000, 2000))
+        for side in self.sides:
+            self.emit("teamsize", side.player, SYNTHETIC_TEAM_SIZE)
+        self.emit("gen", self.gen)
+        self.emit("tier", f"[Gen {self.gen}] Random Battle")
+        self.emit("rated", "")
+        self.emit("rule", "Species Clause: Limit one of each Pokémon")
+        self.emit("rule", "HP Percentage Mod: HP is shown in percentages")
+
+        if self.gen >= 5:
+            self.request("teampreview")
+            self.emit("clearpoke")
+            for side in self.sides:
+                for pokemon in side.team:
+                    self.emit("poke", side.player, pokemon.details, "item" if pokemon.item else "")
+            self.emit("teampreview")
+
+        self.emit("")
+        self.tick()
+        self.emit("start")
+        for side in self.sides:
+            self.switch_in(side, side.active)
+
+        for turn in range(1, SYNTHETIC_MAX_TURNS + 1):
+            self.emit("turn", turn)
+            self.request("active")
+            self.emit("")
+            self.tick()
+
+            # Faster pokemon move first, with speed ties broken at random
+            order = sorted(self.sides, key=lambda side: (side.active.stats["spe"], rng.random()), reverse=True)
+            for side in order:
+                foe = p2 if side is p1 else p1
+                if side.active.fainted or foe.active.fainted:
+                    continue
+
+                if side.bench and rng.random() < 0.1:
+                    self.switch_in(side, rng.choice(side.bench))
+                else:
+                    self.use_move(side, foe)
+
+            self.emit("")
+            self.upkeep()
+
+            for side in self.sides:
+                if side.defeated:
+                    winner = p2 if side is p1 else p1
+                    self.emit("win", winner.name)
+                    return self.lines
+
+            for side in self.sides:
+                if side.active.fainted:
+                    if side is p1:
+                        self.request("forceswitch")
+                    self.switch_in(side, rng.choice(side.bench))
+
+        self.emit("tie")
+        return self.lines
+
+
+def synthetic_battle(gen: int = 9, seed: Optional[int] = None, requests: bool = True) -> List[str]:
+    """Generate the log of a single random synthetic singles battle.
+
+    Args:
+        gen (int, optional): The gen of the battle, from 1 to 9. Defaults to 9.
+        seed (Optional[int], optional): The seed of the battle's random choices. The same seed always produces the same
+            battle. Defaults to None, which seeds from the system's randomness.
+        requests (bool, optional): Whether to include the `request` JSON sent to the first player before each decision.
+            Defaults to True.
+
+    Raises:
+        ValueError: If the gen is not between 1 and 9.
+
+    Returns:
+        List[str]: Every line of the battle log, in order, without trailing newlines.
+    """
+    if gen not in _GEN_LIMITS:
+        raise ValueError(f"Synthetic battles can only be generated for gens 1 to 9, not gen {gen}")
+
+    return _SynthBattle(gen, seed, requests).play()
+
+
+def iter_synthetic_log(
+    target_size: int = SYNTHETIC_TARGET_SIZE,
+    gens: Optional[Iterable[int]] = None,
+    seed: Optional[int] = None,
+    requests: bool = True,
+) -> Iterator[str]:
+    """Stream the lines of back to back synthetic battles, until at least `target_size` bytes have been generated.
+
+    Each battle starts with its own `|init|battle` line, so a stateful consumer sees a series of separate battles.
+    Only whole battles are generated, so the output overshoots `target_size` by at most one battle (usually a few
+    tens of kilobytes).
+
+    Args:
+        target_size (int, optional): The minimum number of UTF-8 bytes to generate, counting one newline per line.
+            Defaults to SYNTHETIC_TARGET_SIZE.
+        gens (Optional[Iterable[int]], optional): The gens to draw each battle's gen from, raising a ValueError if any
+            is not between 1 and 9. Defaults to None, which uses every gen from 1 to 9.
+        seed (Optional[int], optional): The seed that every battle's seed is drawn from. Defaults to None, which seeds
+            from the system's randomness.
+        requests (bool, optional): Whether to include the `request` JSON sent to the first player. Defaults to True.
+
+    Yields:
+        str: Each line of the generated battles, in order, without trailing newlines.
+    """
+    gens = _check_gens(gens)
+
+    rng = random.Random(seed)
+    size = 0
+
+    while size < target_size:
+        for line in synthetic_battle(rng.choice(gens), rng.getrandbits(64), requests):
+            size += len(line.encode("utf8")) + 1
+            yield line
+
+
+def write_synthetic_log(
+    path: Union[str, os.PathLike],
+    target_size: int = SYNTHETIC_TARGET_SIZE,
+    gens: Optional[Iterable[int]] = None,
+    seed: Optional[int] = None,
+    requests: bool = True,
+) -> int:
+    """Write back to back synthetic battles to a battle log file, gzip compressing it if the path ends with `.gz`.
+
+    The written log can be read back with `iter_battle_log`. See `iter_synthetic_log` for how the battles are generated.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the battle log file to write.
+        target_size (int, optional): The minimum number of uncompressed bytes to write. Defaults to
+            SYNTHETIC_TARGET_SIZE.
+        gens (Optional[Iterable[int]], optional): The gens to draw each battle's gen from, raising a ValueError if any
+            is not between 1 and 9. Defaults to None, which uses every gen from 1 to 9.
+        seed (Optional[int], optional): The seed that every battle's seed is drawn from. Defaults to None.
+        requests (bool, optional): Whether to include the `request` JSON sent to the first player. Defaults to True.
+
+    Returns:
+        int: The number of lines written.
+    """
+    path = os.fspath(path)
+    line_count = 0
+
+    with (gzip.open if path.endswith(".gz") else open)(path, "wt", encoding="utf8") as log:
+        for line in iter_synthetic_log(target_size, gens, seed, requests):
+            log.write(line)
+            log.write("\n")
+            line_count += 1
+
+    return line_count
+
+
+def write_synthetic_corpus(
+    output_dir: Union[str, os.PathLike],
+    battles: int,
+    gens: Optional[Iterable[int]] = None,
+    seed: Optional[int] = None,
+    compress: bool = False,
+    requests: bool = True,
+) -> List[str]:
+    """Write a corpus of synthetic battles, one battle log file per battle, ready to be handed to `parse_corpus`.
+
+    Args:
+        output_dir (Union[str, os.PathLike]): The directory to write the battle logs to. Created if it doesn't exist.
+        battles (int): The number of battles to generate.
+        gens (Optional[Iterable[int]], optional): The gens to draw each battle's gen from, raising a ValueError if any
+            is not between 1 and 9. Defaults to None, which uses every gen from 1 to 9.
+        seed (Optional[int], optional): The seed that every battle's seed is drawn from. Defaults to None.
+        compress (bool, optional): Whether to gzip compress each battle log. Defaults to False.
+        requests (bool, optional): Whether to include the `request` JSON sent to the first player. Defaults to True.
+
+    Returns:
+        List[str]: The paths of the written battle logs, in order.
+    """
+    gens = _check_gens(gens)
+
+    output_dir = os.fspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    rng = random.Random(seed)
+    paths = []
+
+    for battle in range(battles):
+        gen = rng.choice(gens)
+        path = os.path.join(output_dir, f"synthetic-gen{gen}-{battle:06d}.log{'.gz' if compress else ''}")
+
+        with (gzip.open if compress else open)(path, "wt", encoding="utf8") as log:
+            for line in synthetic_battle(gen, rng.getrandbits(64), requests):
+                log.write(line)
+                log.write("\n")
+
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,209 @@
+"""Example showdown battle message lines, grouped by the BMType they should parse into.
+
+Every line in here is expected to parse without an ERR_STATE, so these can be reused by any test that wants to
+exercise the full set of BattleMessage subclasses.
+"""
+
+from poketypes.showdown import BMType
+
+BM_EXAMPLES = {
+    BMType.player: ["|player|p1|colress-gpt-test1|colress|1520", "|player|p2|colress-gpt-test2|265|"],
+    BMType.teamsize: ["|teamsize|p1|6"],
+    BMType.gametype: ["|gametype|singles", "|gametype|doubles"],
+    BMType.gen: ["|gen|5"],
+    BMType.tier: ["|tier|[Gen 5] Random Battle"],
+    BMType.rated: ["|rated|"],
+    BMType.rule: ["|rule|HP Percentage Mod: HP is shown in percentages"],
+    BMType.clearpoke: ["|clearpoke"],
+    BMType.poke: ["|poke|p1|Metagross, L80|item", "|poke|p2|Flabébé, F|", "|poke|p2|Garchomp, M, shiny, tera:Fire|"],
+    BMType.start: ["|start"],
+    BMType.teampreview: ["|teampreview"],
+    BMType.empty: ["|"],
+    BMType.request: [
+        (
+            '|request|{"active":[{"moves":[{"move":"Swords Dance","id":"swordsdance","pp":32,"maxpp":32,'
+            '"target":"self","disabled":false},{"move":"Knock Off","id":"knockoff","pp":32,"maxpp":32,'
+            '"target":"normal","disabled":false}],"canTerastallize":"Dark"}],"side":{"name":"colress-gpt-test1",'
+            '"id":"p1","pokemon":[{"ident":"p1: Kingambit","details":"Kingambit, L80, F","condition":"253/253",'
+            '"active":true,"stats":{"atk":251,"def":219,"spa":139,"spd":155,"spe":107},"moves":["swordsdance",'
+            '"knockoff"],"baseAbility":"supremeoverlord","item":"leftovers","pokeball":"pokeball",'
+            '"ability":"supremeoverlord","commanding":false,"reviving":false,"teraType":"Dark",'
+            '"terastallized":""},{"ident":"p1: Toxapex","details":"Toxapex, L84, M","condition":"0 fnt",'
+            '"active":false,"stats":{"atk":114,"def":300,"spa":131,"spd":249,"spe":89},"moves":["toxic"],'
+            '"baseAbility":"regenerator","item":"blacksludge","pokeball":"pokeball","ability":"regenerator",'
+            '"commanding":false,"reviving":false,"teraType":"Steel","terastallized":""}]},"rqid":3}'
+        ),
+        (
+            '|request|{"forceSwitch":[true],"side":{"name":"colress-gpt-test2","id":"p2","pokemon":[{"ident":'
+            '"p2: Arcanine","details":"Arcanine, L84, M","condition":"180/281 brn","active":true,"stats":{"atk":'
+            '228,"def":180,"spa":213,"spd":180,"spe":197},"moves":["flareblitz","extremespeed"],"baseAbility":'
+            '"intimidate","item":"choiceband","pokeball":"pokeball"}]},"noCancel":true,"rqid":7}'
+        ),
+        (
+            '|request|{"teamPreview":true,"maxTeamSize":6,"side":{"name":"colress-gpt-test2","id":"p2","pokemon":'
+            '[{"ident":"p2: Arcanine","details":"Arcanine, L84, M","condition":"281/281","active":false,"stats":'
+            '{"atk":228,"def":180,"spa":213,"spd":180,"spe":197},"moves":["flareblitz"],"baseAbility":"intimidate",'
+            '"item":"","pokeball":"pokeball"}]},"rqid":1}'
+        ),
+    ],
+    BMType.inactive: ["|inactive|Battle timer is ON: inactive players will automatically lose when time's up."],
+    BMType.inactiveoff: ["|inactiveoff|Battle timer is now OFF."],
+    BMType.upkeep: ["|upkeep"],
+    BMType.turn: ["|turn|2"],
+    BMType.win: ["|win|colress-gpt-test2"],
+    BMType.tie: ["|tie"],
+    BMType.expire: ["|expire|"],
+    BMType.t: ["|t:|1696832299"],
+    BMType.move: [
+        "|move|p1a: Sceptile|Acrobatics|p2a: Espeon",
+        "|move|p1a: Kangaskhan|Fake Out||[still]",
+        "|move|p2a: Espeon|Stealth Rock|p1a: Sceptile|[from]ability: Magic Bounce",
+        "|move|p1a: Snorlax|Body Slam|p2a: Gengar|[from]Sleep Talk",
+    ],
+    BMType.switch: [
+        "|switch|p2a: Toxicroak|Toxicroak, L81, F|100/100",
+        "|switch|p1a: Scizor|Scizor-Mega, L75, M, shiny|240/240 par",
+    ],
+    BMType.drag: ["|drag|p1a: Toxapex|Toxapex, L84, M|300/300 tox"],
+    BMType.detailschange: ["|detailschange|p1a: Scizor|Scizor-Mega, L75, M"],
+    BMType.replace: ["|replace|p2a: Zoroark|Zoroark, L80, M"],
+    BMType.swap: ["|swap|p1a: Dugtrio|1", "|swap|p1a: Dugtrio|0|[from] move: Ally Switch|[of] p1b: Hatterene"],
+    BMType.cant: ["|cant|p1a: Snorlax|slp", "|cant|p2a: Gengar|Disable|Shadow Ball"],
+    BMType.faint: ["|faint|p2a: Umbreon"],
+    BMType.fail: [
+        "|-fail|p1a: Snorlax",
+        "|-fail|p1a: Snorlax|tox",
+        "|-fail|p2a: Gengar|move: Substitute|[weak]",
+        "|-fail|p2a: Gengar|unboost|[from] ability: Clear Body|[of] p2a: Gengar",
+    ],
+    BMType.block: ["|-block|p2a: Gengar|ability: Damp|[of] p1a: Quagsire"],
+    BMType.notarget: ["|-notarget|p1a: Sceptile", "|-notarget"],
+    BMType.miss: ["|-miss|p1a: Sceptile|p2a: Espeon", "|-miss|p1a: Sceptile"],
+    BMType.damage: [
+        "|-damage|p2a: Leavanny|180/281 tox|[from] psn",
+        "|-damage|p2a: Leavanny|0 fnt",
+        "|-damage|p1a: Sceptile|45/100|[from] item: Rocky Helmet|[of] p2a: Ferrothorn",
+    ],
+    BMType.heal: [
+        "|-heal|p2a: Leavanny|197/281 tox|[from] item: Leftovers",
+        "|-heal|p1a: Blissey|100/100",
+    ],
+    BMType.sethp: ["|-sethp|p2a: Exeggutor|94/100 par|[from] move: Pain Split|[silent]"],
+    BMType.status: ["|-status|p2a: Leavanny|tox"],
+    BMType.curestatus: ["|-curestatus|p2a: Leavanny|tox"],
+    BMType.cureteam: ["|-cureteam|p1a: Blissey|[from] move: Heal Bell"],
+    BMType.boost: ["|-boost|p1a: Scizor|atk|2"],
+    BMType.unboost: ["|-unboost|p2a: Espeon|spe|1"],
+    BMType.setboost: ["|-setboost|p1a: Azumarill|atk|6"],
+    BMType.invertboost: ["|-invertboost|p1a: Azumarill"],
+    BMType.clearboost: ["|-clearboost|p1a: Pikachu"],
+    BMType.clearallboost: ["|-clearallboost"],
+    BMType.clearpositiveboost: ["|-clearpositiveboost|p2a: Espeon|p1a: Tornadus|move: Spectral Thief"],
+    BMType.clearnegativeboost: ["|-clearnegativeboost|p1a: Pikachu"],
+    BMType.weather: [
+        "|-weather|RainDance|[from] ability: Drizzle|[of] p1a: Pelipper",
+        "|-weather|RainDance|[upkeep]",
+        "|-weather|none",
+    ],
+    BMType.fieldstart: [
+        "|-fieldstart|move: Electric Terrain|[from] ability: Electric Surge|[of] p1a: Pincurchin",
+        "|-fieldstart|move: Trick Room|[of] p1a: Hatterene",
+    ],
+    BMType.fieldend: ["|-fieldend|move: Electric Terrain", "|-fieldend|Trick Room"],
+    BMType.sidestart: ["|-sidestart|p1: colress-gpt-test1|move: Stealth Rock", "|-sidestart|p2: test2|Spikes"],
+    BMType.sideend: [
+        "|-sideend|p1: colress-gpt-test1|move: Stealth Rock|[of] p1a: Excadrill",
+        "|-sideend|p2: colress-gpt-test2|Reflect",
+        "|-sideend|p1: colress-gpt-test1|move: Spikes|[from] move: Defog|[of] p2a: Corviknight",
+    ],
+    BMType.swapsideconditions: ["|-swapsideconditions"],
+    BMType.volstart: [
+        "|-start|p1a: Gengar|typechange|Fire|[from] move: Burn Up",
+        "|-start|p1a: Gengar|typechange|Ghost/Poison",
+        "|-start|p2a: Espeon|confusion",
+        "|-start|p2a: Espeon|confusion|[from] ability: Own Tempo|[of] p2a: Espeon",
+        "|-start|p2a: Espeon|move: Yawn|[of] p1a: Slowking",
+        "|-start|p1a: Snorlax|Substitute",
+        "|-start|p1a: Snorlax|Disable|Body Slam",
+    ],
+    BMType.volend: [
+        "|-end|p2a: Espeon|confusion",
+        "|-end|p1a: Snorlax|Substitute",
+        "|-end|p1a: Snorlax|move: Yawn|[silent]",
+        "|-end|p1a: Snorlax|Disable|[silent]",
+    ],
+    BMType.crit: ["|-crit|p2a: Espeon"],
+    BMType.supereffective: ["|-supereffective|p2a: Espeon"],
+    BMType.resisted: ["|-resisted|p2a: Espeon"],
+    BMType.immune: ["|-immune|p2a: Gengar"],
+    BMType.item: [
+        "|-item|p2a: Ferrothorn|Air Balloon",
+        "|-item|p1a: Gengar|Choice Scarf|[from] move: Trick",
+        "|-item|p2a: Espeon|Leftovers|[from] ability: Frisk|[of] p1a: Gardevoir",
+    ],
+    BMType.enditem: [
+        "|-enditem|p2a: Ferrothorn|Air Balloon",
+        "|-enditem|p1a: Snorlax|Sitrus Berry|[eat]",
+        "|-enditem|p2a: Espeon|Leftovers|[from] move: Knock Off|[of] p1a: Kingambit",
+        "|-enditem|p2a: Ditto|Sitrus Berry|[from] stealeat|[move] Bug Bite|[of] p1a: Ariados",
+    ],
+    BMType.ability: ["|-ability|p1a: Gardevoir|Trace", "|-ability|p1a: Gardevoir|Swarm|[from] ability: Trace"],
+    BMType.endability: ["|-endability|p2a: Espeon"],
+    BMType.transform: [
+        "|-transform|p1a: Ditto|p2a: Espeon",
+        "|-transform|p1a: Ditto|p2a: Espeon|[from] ability: Imposter|[of] p1a: Ditto",
+    ],
+    BMType.mega: ["|-mega|p1a: Absol|Absol|Absolite"],
+    BMType.primal: ["|-primal|p1a: Groudon|Red Orb"],
+    BMType.zpower: ["|-zpower|p1a: Pikachu"],
+    BMType.zbroken: ["|-zbroken|p2a: Espeon"],
+    BMType.activate: [
+        "|-activate|p1a: Snorlax|confusion",
+        "|-activate|p2a: Espeon|Protect",
+        "|-activate|p2a: Espeon|move: Protect",
+        "|-activate|p1a: Gengar|ability: Mummy|Battle Armor|[of] p2a: Cofagrigus",
+        "|-activate|p1a: Gengar|item: Leftovers|[consumed]",
+        "|-activate|p2a: Ferrothorn|ability: Iron Barbs|[of] p1a: Sceptile",
+    ],
+    BMType.hint: ["|-hint|Sleep Clause Mod activated."],
+    BMType.center: ["|-center"],
+    BMType.message: ["|-message|colress-gpt-test1 forfeited."],
+    BMType.mess: ["|message|colress-gpt-test1 forfeited."],
+    BMType.combine: ["|-combine"],
+    BMType.prepare: ["|-prepare|p1a: Sceptile|Solar Beam"],
+    BMType.mustrecharge: ["|-mustrecharge|p1a: Snorlax"],
+    BMType.nothing: ["|-nothing"],
+    BMType.hitcount: ["|-hitcount|p2a: Espeon|3"],
+    BMType.singlemove: ["|-singlemove|p1a: Gengar|Destiny Bond"],
+    BMType.singleturn: ["|-singleturn|p1a: Snorlax|Protect", "|-singleturn|p2a: Espeon|move: Focus Punch"],
+    BMType.formechange: [
+        "|-formechange|p1a: Aegislash|Aegislash-Blade",
+        "|-formechange|p1a: Minior|Minior-Meteor|[from] ability: Shields Down",
+    ],
+    BMType.terastallize: ["|-terastallize|p1a: Kingambit|Dark"],
+    BMType.fieldactivate: ["|-fieldactivate|move: Perish Song", "|-fieldactivate|Perish Song"],
+    BMType.error: ["|error|[Invalid choice] There's nothing to choose"],
+    BMType.bigerror: ["|bigerror|The battle has crashed."],
+    BMType.init: ["|init|battle"],
+    BMType.deinit: ["|deinit"],
+    BMType.title: ["|title|colress-gpt-test1 vs. colress-gpt-test2"],
+    BMType.j: ["|j|☆colress-gpt-test1"],
+    BMType.J: ["|J|colress-gpt-test1"],
+    BMType.join: ["|join|colress-gpt-test1"],
+    BMType.l: ["|l|☆colress-gpt-test1"],
+    BMType.L: ["|L|colress-gpt-test1"],
+    BMType.leave: ["|leave|colress-gpt-test1"],
+    BMType.raw: ["|raw|colress-gpt-test1's rating: 1520 &rarr; <strong>1535</strong>"],
+    BMType.anim: [
+        "|-anim|p1a: Sceptile|Leaf Blade|p2a: Espeon",
+        "|-anim|p1a: Sceptile|Solar Beam|p2a: Espeon|[notarget]",
+    ],
+}
+
+# These BMTypes have a dictionary entry, but their parser intentionally raises NotImplementedError
+NOT_IMPLEMENTED_EXAMPLES = {
+    BMType.swapboost: ["|-swapboost|p1a: Shuckle|p2a: Espeon|atk, spa"],
+    BMType.copyboost: ["|-copyboost|p1a: Smeargle|p2a: Espeon"],
+    BMType.burst: ["|-burst|p1a: Necrozma|Necrozma-Ultra|Ultranecrozium Z"],
+    BMType.waiting: ["|-waiting|p1a: Sceptile|p1b: Emboar"],
+}
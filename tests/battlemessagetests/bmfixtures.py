@@ -0,0 +1,54 @@
+"""Helpers for loading the per-gen battle logs under tests/fixtures/battlelogs.
+
+Every fixture log is a full random battle as recorded by showdown, and every line in it is expected to parse without an
+ERR_STATE. The same logs are replayed by the benchmark suite in `benchmarks/bench_battlemessage.py`.
+"""
+
+from pathlib import Path
+from typing import List
+
+from poketypes.showdown import BattleMessage
+
+FIXTURE_DIR = Path(__file__).parents[1] / "fixtures" / "battlelogs"
+
+GENS = range(1, 10)
+
+
+def fixture_path(gen: int) -> Path:
+    """Get the path of the fixture log for a generation.
+
+    Args:
+        gen (int): The generation of the fixture log.
+
+    Returns:
+        Path: The path of the fixture log.
+    """
+    return FIXTURE_DIR / f"gen{gen}randombattle.log"
+
+
+def fixture_lines(gen: int) -> List[str]:
+    """Read the lines of the fixture log for a generation.
+
+    Args:
+        gen (int): The generation of the fixture log.
+
+    Returns:
+        List[str]: The newline-stripped lines of the fixture log.
+    """
+    return fixture_path(gen).read_text(encoding="utf8").splitlines()
+
+
+def parse_fixture(gen: int) -> List[BattleMessage]:
+    """Parse the fixture log for a generation, checking that every line parsed without an error.
+
+    Args:
+        gen (int): The generation of the fixture log.
+
+    Returns:
+        List[BattleMessage]: The parsed messages of the fixture log.
+    """
+    errors = []
+    messages = BattleMessage.parse_many(fixture_lines(gen), errors=errors)
+
+    assert errors == []
+    return messages
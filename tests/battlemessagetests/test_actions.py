@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from poketypes.showdown import BattleMessage, encode_request, synthetic_battle
+from poketypes.showdown.actions import (
+    ACTION_SLOTS,
+    PASS_ACTION,
+    SLOT_ACTIONS,
+    SWITCH_ACTION,
+    choice_table,
+    move_action,
+    switch_action,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _poke(name, active=False, condition="100/100", **extra):
+    return {
+        "ident": f"p1: {name}",
+        "details": f"{name}, L50",
+        "condition": condition,
+        "active": active,
+        "stats": {"atk": 100, "def": 100, "spa": 100, "spd": 100, "spe": 100},
+        "moves": ["protect"],
+        "baseAbility": "pressure",
+        "item": "",
+        "pokeball": "pokeball",
+        "ability": "pressure",
+        **extra,
+    }
+
+
+def _move(move_id, target="normal", disabled=False):
+    return {"move": move_id, "id": move_id, "pp": 10, "maxpp": 10, "target": target, "disabled": disabled}
+
+
+def _request(team, **fields):
+    request = {**fields, "side": {"name": "colress-gpt-test1", "id": "p1", "pokemon": team}}
+    return BattleMessage.from_message("|request|" + json.dumps(request))
+
+
+DOUBLES_TEAM = [
+    _poke("Kingambit", active=True),
+    _poke("Amoonguss", active=True),
+    _poke("Garchomp"),
+    _poke("Rotom", condition="0 fnt"),
+]
+
+
+@pytest.mark.parametrize("gen", range(1, 10))
+def test_synthetic_singles_requests(gen):
+    for line in synthetic_battle(gen, gen):
+        if not line.startswith("|request|"):
+            continue
+
+        request = BattleMessage.from_message(line)
+        legal = encode_request(request)
+
+        assert legal.MASK.shape == (ACTION_SLOTS, SLOT_ACTIONS)
+        assert legal.MASK.dtype == np.bool_
+        assert not legal.MASK[1:].any()
+
+        if request.REQUEST_TYPE == "ACTIVE" and request.POKEMON[0].CUR_HP == 0:
+            assert list(np.flatnonzero(legal.MASK[0])) == [PASS_ACTION]
+        elif request.REQUEST_TYPE == "ACTIVE":
+            option = request.ACTIVE_OPTIONS[0]
+            assert legal.SLOTS == 1
+            assert legal.MASK[0, move_action(0)] == (not option.MOVES[0].DISABLED)
+            assert legal.MASK[0, move_action(0, "terastallize")] == (option.CAN_TERA and not option.MOVES[0].DISABLED)
+            assert not legal.MASK[0, move_action(0, "", 1)]
+            assert not legal.MASK[0, PASS_ACTION]
+        elif request.REQUEST_TYPE == "FORCESWITCH":
+            assert legal.MASK[0, SWITCH_ACTION:PASS_ACTION].any()
+            assert not legal.MASK[0, :SWITCH_ACTION].any()
+
+        for action in np.flatnonzero(legal.MASK[0]):
+            assert legal.choose([action])
+
+
+def test_doubles_targets_and_switches():
+    request = _request(
+        DOUBLES_TEAM,
+        active=[
+            {"moves": [_move("kowtowcleave"), _move("swordsdance", "self"), _move("protect", "self", disabled=True)]},
+            {
+                "moves": [_move("pollenpuff", "any"), _move("ragepowder", "self")],
+                "trapped": True,
+                "canTerastallize": "Water",
+            },
+        ],
+    )
+    legal = encode_request(request)
+
+    assert legal.SLOTS == 2
+    assert [legal.CHOICES[0][a] for a in np.flatnonzero(legal.MASK[0])] == [
+        "move 1 +1",
+        "move 1 +2",
+        "move 1 -2",
+        "move 2",
+        "switch 3",
+    ]
+    assert [legal.CHOICES[1][a] for a in np.flatnonzero(legal.MASK[1])] == [
+        "move 1 +1",
+        "move 1 +2",
+        "move 1 -1",
+        "move 1 +1 terastallize",
+        "move 1 +2 terastallize",
+        "move 1 -1 terastallize",
+        "move 2",
+        "move 2 terastallize",
+    ]
+
+    assert legal.choose([move_action(0, "", 2), move_action(1, "terastallize")]) == "move 1 +2, move 2 terastallize"
+    with pytest.raises(ValueError):
+        legal.choose([switch_action(3), move_action(1)])
+    with pytest.raises(ValueError):
+        legal.choose([move_action(1)])
+
+
+def test_doubles_forceswitch():
+    team = [_poke("Kingambit", active=True, condition="0 fnt"), *DOUBLES_TEAM[1:]]
+
+    legal = encode_request(_request(team, forceSwitch=[True, False]))
+    assert legal.REQUEST_TYPE == "FORCESWITCH"
+    assert list(np.flatnonzero(legal.MASK[0])) == [switch_action(2)]
+    assert list(np.flatnonzero(legal.MASK[1])) == [PASS_ACTION]
+    assert legal.choose([switch_action(2), PASS_ACTION]) == "switch 3, pass"
+
+    legal = encode_request(_request(team, forceSwitch=[True, True]))
+    assert list(np.flatnonzero(legal.MASK[1])) == [switch_action(2), PASS_ACTION]
+
+
+def test_revival_blessing():
+    team = [_poke("Pawmot", active=True, reviving=True), _poke("Garchomp"), _poke("Rotom", condition="0 fnt")]
+
+    legal = encode_request(_request(team, forceSwitch=[True]))
+
+    assert list(np.flatnonzero(legal.MASK[0])) == [switch_action(2)]
+
+
+def test_teampreview_and_wait():
+    legal = encode_request(_request(DOUBLES_TEAM, teamPreview=True))
+    assert list(np.flatnonzero(legal.MASK[0])) == [switch_action(p) for p in range(4)]
+    assert legal.choose([switch_action(2)]) == "team 3"
+
+    legal = encode_request(_request(DOUBLES_TEAM, wait=True))
+    assert legal.SLOTS == 0
+    assert not legal.MASK.any()
+    assert legal.choose([]) == ""
+
+
+def test_choice_table_is_shared():
+    assert choice_table("ACTIVE") is choice_table("ACTIVE")
+    assert choice_table("ACTIVE")[0][move_action(3, "dynamax", -1)] == "move 4 -1 dynamax"
+    assert choice_table("FORCESWITCH")[0][move_action(0)] == ""
+
+
+def test_triples_rejected():
+    request = _request(DOUBLES_TEAM, forceSwitch=[True, False, False])
+
+    with pytest.raises(ValueError):
+        encode_request(request)
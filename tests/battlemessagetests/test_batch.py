@@ -0,0 +1,65 @@
+from poketypes.showdown import BattleMessage, BMType, ParseFailure
+
+from bmexamples import BM_EXAMPLES
+
+EXAMPLE_LINES = [line for lines in BM_EXAMPLES.values() for line in lines]
+
+FRAME = """>battle-gen9randombattle-1
+|
+|t:|1696362055
+|move|p1a: Sceptile|Leaf Blade|p2a: Espeon
+|-damage|p2a: Espeon|45/100
+|notarealmessage|p1a: Sceptile
+|turn|2"""
+
+
+def test_parse_many_matches_from_message():
+    assert BattleMessage.parse_many(EXAMPLE_LINES) == [BattleMessage.from_message(line) for line in EXAMPLE_LINES]
+    assert BattleMessage.parse_many(EXAMPLE_LINES, validate=False) == BattleMessage.parse_many(EXAMPLE_LINES)
+
+
+def test_parse_many_strips_newlines():
+    assert BattleMessage.parse_many(["|turn|2\n", "|turn|3\r\n"]) == [
+        BattleMessage.from_message("|turn|2"),
+        BattleMessage.from_message("|turn|3"),
+    ]
+
+
+def test_parse_block():
+    messages = BattleMessage.parse_block(FRAME)
+
+    assert [bm.BMTYPE for bm in messages] == [
+        BMType.empty,
+        BMType.t,
+        BMType.move,
+        BMType.damage,
+        BMType.unknown,
+        BMType.turn,
+    ]
+
+
+def test_parse_block_collects_errors(capsys):
+    errors = []
+    messages = BattleMessage.parse_block(FRAME, errors=errors)
+
+    assert capsys.readouterr().out == ""
+    assert len(errors) == 1
+    assert isinstance(errors[0], ParseFailure)
+    assert errors[0].BATTLE_MESSAGE == "|notarealmessage|p1a: Sceptile"
+    assert errors[0].ERR_STATE == messages[4].ERR_STATE == "UNKNOWN_BMTYPE"
+
+
+def test_parse_error_detail():
+    errors = []
+    bm = BattleMessage.parse_many(["|turn|two"], errors=errors)[0]
+
+    assert bm.ERR_STATE == "PARSE_ERROR"
+    assert errors[0].ERR_STATE == "PARSE_ERROR"
+    assert "ValueError" in errors[0].DETAIL
+
+
+def test_from_message_without_key():
+    bm = BattleMessage.from_message(">battle-gen9randombattle-1")
+
+    assert bm.BMTYPE == BMType.unknown
+    assert bm.ERR_STATE == "UNKNOWN_BMTYPE"
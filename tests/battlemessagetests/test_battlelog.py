@@ -0,0 +1,67 @@
+import gzip
+import io
+
+import pytest
+
+from poketypes.showdown import BattleMessage, iter_battle_log
+
+from bmexamples import BM_EXAMPLES
+
+EXAMPLE_LINES = [line for lines in BM_EXAMPLES.values() for line in lines]
+EXAMPLE_LOG = "\n".join(EXAMPLE_LINES) + "\n"
+
+
+def expected_messages(lines=EXAMPLE_LINES):
+    return [BattleMessage.from_message(line) for line in lines]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_iter_battle_log_chunk_boundaries(tmp_path, chunk_size):
+    path = tmp_path / "battle.log"
+    path.write_text(EXAMPLE_LOG, encoding="utf8")
+
+    assert list(iter_battle_log(path, chunk_size=chunk_size)) == expected_messages()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64, 1 << 20])
+def test_iter_battle_log_gzip(tmp_path, chunk_size):
+    path = tmp_path / "battle.log.gz"
+    path.write_bytes(gzip.compress(EXAMPLE_LOG.encode("utf8")))
+
+    assert list(iter_battle_log(str(path), chunk_size=chunk_size)) == expected_messages()
+
+
+def test_iter_battle_log_multi_member_gzip():
+    half = len(EXAMPLE_LINES) // 2
+    first = "\n".join(EXAMPLE_LINES[:half]) + "\n"
+    second = "\n".join(EXAMPLE_LINES[half:])
+
+    log = io.BytesIO(gzip.compress(first.encode("utf8")) + gzip.compress(second.encode("utf8")))
+
+    assert list(iter_battle_log(log, chunk_size=50)) == expected_messages()
+
+
+def test_iter_battle_log_file_objects():
+    assert list(iter_battle_log(io.StringIO(EXAMPLE_LOG), chunk_size=10)) == expected_messages()
+    assert list(iter_battle_log(io.BytesIO(EXAMPLE_LOG.encode("utf8")), chunk_size=10)) == expected_messages()
+
+
+def test_iter_battle_log_skips_non_messages():
+    log = ">battle-gen9randombattle-1\r\n\r\n|\r\n|c|☆Flabébé|héllo\r\n\r\n|turn|2"
+
+    messages = list(iter_battle_log(io.BytesIO(log.encode("utf8")), chunk_size=1))
+
+    assert messages == expected_messages(["|", "|c|☆Flabébé|héllo", "|turn|2"])
+
+
+def test_iter_battle_log_errors():
+    errors = []
+
+    messages = list(iter_battle_log(io.StringIO("|turn|2\n|notarealmessage|\n"), errors=errors))
+
+    assert len(messages) == 2
+    assert [failure.ERR_STATE for failure in errors] == ["UNKNOWN_BMTYPE"]
+
+
+def test_iter_battle_log_empty():
+    assert list(iter_battle_log(io.BytesIO(b""))) == []
@@ -0,0 +1,106 @@
+import pytest
+
+from poketypes.showdown import BattleMessage, BattleMessageParser, BMType, LazyBattleMessage
+
+from bmfixtures import GENS, fixture_lines
+
+RAW_LINE = '|raw|<div class="broadcast-blue"><b>Flabébé used Moonblast!</b></div>'
+CHAT_LINE = "|c|☆colress-gpt-test1|glhf"
+
+FRAME = "\n".join(
+    [
+        ">battle-gen9randombattle-1",
+        "|",
+        "|t:|1696835200",
+        RAW_LINE,
+        CHAT_LINE,
+        "|move|p1a: Kingambit|Swords Dance|p1a: Kingambit",
+        "|-boost|p1a: Kingambit|atk|2",
+    ]
+)
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_parse_bytes_matches_parse_block(wrap):
+    frame = "\n".join(line for gen in GENS for line in fixture_lines(gen))
+
+    expected = BattleMessage.parse_block(frame)
+    messages = BattleMessage.parse_bytes(wrap(frame.encode("utf8")))
+
+    assert len(messages) == len(expected)
+    for bm, expected_bm in zip(messages, expected):
+        if isinstance(bm, LazyBattleMessage):
+            assert bm.BMTYPE == expected_bm.BMTYPE
+            bm = bm.parsed
+        assert bm == expected_bm
+
+
+def test_parse_bytes_defers_text_payloads():
+    messages = BattleMessage.parse_bytes(FRAME.encode("utf8"))
+
+    assert [m.BMTYPE for m in messages] == [
+        BMType.empty,
+        BMType.t,
+        BMType.raw,
+        BMType.unknown,
+        BMType.move,
+        BMType.boost,
+    ]
+
+    raw, chat = messages[2], messages[3]
+    assert isinstance(raw, LazyBattleMessage)
+    assert isinstance(chat, LazyBattleMessage)
+    assert not raw.is_parsed
+
+    assert raw.BATTLE_MESSAGE == RAW_LINE
+    assert raw.MESSAGE == '<div class="broadcast-blue"><b>Flabébé used Moonblast!</b></div>'
+    assert chat.BATTLE_MESSAGE == CHAT_LINE
+
+
+def test_parse_bytes_reused_buffer():
+    buffer = bytearray(FRAME.encode("utf8"))
+    messages = BattleMessage.parse_bytes(memoryview(buffer))
+
+    buffer[:] = b"\0" * len(buffer)
+
+    assert messages[2].BATTLE_MESSAGE == RAW_LINE
+
+
+def test_parse_bytes_crlf_and_errors():
+    errors = []
+    messages = BattleMessage.parse_bytes(b"|turn|3\r\n|notarealmessage|\r\n", errors=errors)
+
+    assert messages[0].BMTYPE == BMType.turn
+    assert messages[0].NUMBER == 3
+    assert messages[1].ERR_STATE == "UNKNOWN_BMTYPE"
+    assert [failure.BATTLE_MESSAGE for failure in errors] == ["|notarealmessage|"]
+
+
+def test_parser_parse_bytes():
+    frame = FRAME.encode("utf8")
+
+    parser = BattleMessageParser(allow=[BMType.move, BMType.boost])
+    messages = parser.parse_bytes(frame)
+
+    assert [type(m) is LazyBattleMessage for m in messages] == [True, True, True, True, False, False]
+    assert messages[4].BMTYPE == BMType.move
+
+    skipping = BattleMessageParser(allow=[BMType.raw], skip_unselected=True)
+    assert [m.BMTYPE for m in skipping.parse_bytes(frame)] == [BMType.raw]
+
+    unknown = BattleMessageParser(allow=[BMType.unknown], skip_unselected=True)
+    assert [m.BATTLE_MESSAGE for m in unknown.parse_bytes(frame)] == [CHAT_LINE]
+
+
+def test_parse_bytes_matches_parse_block_on_unicode_line_breaks():
+    chat = "|c|☆colress-gpt-test1|gl\u2028hf\x0c!"
+    frame = f">battle-gen9randombattle-1\n{chat}\r\n|turn|2\n"
+
+    for messages in (
+        BattleMessage.parse_block(frame),
+        BattleMessage.parse_bytes(frame.encode("utf8")),
+        BattleMessageParser(allow=[BMType.turn]).parse_block(frame),
+        BattleMessageParser(allow=[BMType.turn]).parse_bytes(frame.encode("utf8")),
+    ):
+        assert [m.BMTYPE for m in messages] == [BMType.unknown, BMType.turn]
+        assert messages[0].BATTLE_MESSAGE == chat
@@ -0,0 +1,47 @@
+import pytest
+
+from poketypes.dex import DexStatus
+from poketypes.showdown import BattleMessage, parse_condition
+
+
+@pytest.mark.parametrize(
+    "condition,expected",
+    [
+        ("180/281 tox", (180, 281, DexStatus.STATUS_TOX)),
+        ("45/100", (45, 100, None)),
+        ("100/100 par", (100, 100, DexStatus.STATUS_PAR)),
+        ("0 fnt", (0, None, DexStatus.STATUS_FNT)),
+        ("0", (0, None, None)),
+    ],
+)
+def test_parse_condition(condition, expected):
+    assert parse_condition(condition) == expected
+
+
+def test_parse_condition_cached():
+    parse_condition.cache_clear()
+    parse_condition("180/281 tox")
+    parse_condition("180/281 tox")
+
+    assert parse_condition.cache_info().hits == 1
+
+
+def test_parse_condition_unknown_status():
+    with pytest.raises(ValueError):
+        parse_condition("180/281 notastatus")
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "|-damage|p2a: Leavanny|180/281 tox|[from] psn",
+        "|-heal|p2a: Leavanny|180/281 tox|[from] item: Leftovers",
+        "|-sethp|p2a: Leavanny|180/281 tox",
+        "|switch|p2a: Leavanny|Leavanny, L88, F|180/281 tox",
+        "|drag|p2a: Leavanny|Leavanny, L88, F|180/281 tox",
+    ],
+)
+def test_condition_messages(line):
+    bm = BattleMessage.from_message(line)
+
+    assert (bm.CUR_HP, bm.MAX_HP, bm.STATUS) == (180, 281, DexStatus.STATUS_TOX)
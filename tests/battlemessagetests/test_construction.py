@@ -0,0 +1,63 @@
+import pytest
+from pydantic import BaseModel
+
+from poketypes.showdown import BattleMessage
+from poketypes.showdown.battlemessage import bmtype_to_bmclass
+
+from bmexamples import BM_EXAMPLES, NOT_IMPLEMENTED_EXAMPLES
+
+EXAMPLE_LINES = [(bmtype, line) for bmtype, lines in BM_EXAMPLES.items() for line in lines]
+
+
+def test_examples_cover_every_bmclass():
+    covered = set(BM_EXAMPLES) | set(NOT_IMPLEMENTED_EXAMPLES)
+    assert set(bmtype_to_bmclass) <= covered
+
+
+@pytest.mark.parametrize("bmtype,line", EXAMPLE_LINES)
+def test_trusted_matches_validated(bmtype, line):
+    validated = BattleMessage.from_message(line)
+    trusted = BattleMessage.from_message(line, validate=False)
+
+    assert validated.ERR_STATE is None
+    assert type(trusted) is type(validated) is bmtype_to_bmclass[bmtype]
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+
+
+def assert_same_types(trusted, validated, path):
+    assert type(trusted) is type(validated), path
+
+    if isinstance(validated, BaseModel):
+        for field in type(validated).model_fields:
+            assert_same_types(getattr(trusted, field), getattr(validated, field), f"{path}.{field}")
+    elif isinstance(validated, list):
+        for e, (t, v) in enumerate(zip(trusted, validated)):
+            assert_same_types(t, v, f"{path}[{e}]")
+    elif isinstance(validated, dict):
+        for (tk, tv), (vk, vv) in zip(trusted.items(), validated.items()):
+            assert_same_types(tk, vk, f"{path}[{vk!r}]")
+            assert_same_types(tv, vv, f"{path}[{vk!r}]")
+
+
+@pytest.mark.parametrize("bmtype,line", EXAMPLE_LINES)
+def test_trusted_field_types(bmtype, line):
+    validated = BattleMessage.from_message(line)
+    trusted = BattleMessage.from_message(line, validate=False)
+
+    assert_same_types(trusted, validated, bmtype.name)
+
+
+@pytest.mark.parametrize("bmtype,line", [(t, ln) for t, lines in NOT_IMPLEMENTED_EXAMPLES.items() for ln in lines])
+def test_trusted_not_implemented(bmtype, line):
+    trusted = BattleMessage.from_message(line, validate=False)
+
+    assert trusted.ERR_STATE == "IMPLEMENTATION_NOT_READY"
+    assert trusted == BattleMessage.from_message(line)
+
+
+def test_trusted_mode_does_not_leak():
+    BattleMessage.from_message("|turn|2", validate=False)
+
+    with pytest.raises(ValueError):
+        bmtype_to_bmclass["turn"].from_message("|turn|two")
@@ -0,0 +1,93 @@
+import gzip
+import json
+
+import pytest
+
+from poketypes.showdown import BattleMessage, parse_corpus
+
+from bmexamples import BM_EXAMPLES
+
+EXAMPLE_LINES = [line for lines in BM_EXAMPLES.values() for line in lines]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    paths = []
+    for battle in range(5):
+        lines = EXAMPLE_LINES[battle::5] + ["|notarealmessage|"] * battle
+        path = tmp_path / f"battle-{battle}.log"
+        path.write_text("\n".join(lines), encoding="utf8")
+        paths.append(path)
+
+    gz_path = tmp_path / "battle-gz.log.gz"
+    gz_path.write_bytes(gzip.compress("\n".join(EXAMPLE_LINES[:10]).encode("utf8")))
+    paths.append(gz_path)
+
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_corpus(corpus, workers):
+    report = parse_corpus(corpus, workers=workers, chunksize=2, keep_messages=True)
+
+    assert [battle.PATH for battle in report.BATTLES] == [str(path) for path in corpus]
+    assert report.BATTLES[1].MESSAGES == [BattleMessage.from_message(line) for line in EXAMPLE_LINES[1::5]] + [
+        BattleMessage.from_message("|notarealmessage|")
+    ]
+    assert report.MESSAGE_COUNT == len(EXAMPLE_LINES) + 10 + 10
+    assert report.ERROR_COUNTS == {"UNKNOWN_BMTYPE": 10}
+    assert report.FAILED_BATTLES == 0
+
+
+def test_parse_corpus_summaries_only(corpus):
+    report = parse_corpus(corpus, workers=1)
+
+    assert all(battle.MESSAGES is None for battle in report.BATTLES)
+    assert report.MESSAGE_COUNT == len(EXAMPLE_LINES) + 10 + 10
+    assert report.ERROR_COUNTS == {"UNKNOWN_BMTYPE": 10}
+
+
+def test_parse_corpus_output_dir(corpus, tmp_path):
+    report = parse_corpus(corpus[:2], workers=2, output_dir=tmp_path / "parsed")
+
+    for battle in report.BATTLES:
+        assert battle.MESSAGES is None
+
+        with open(battle.OUTPUT_PATH, encoding="utf8") as f:
+            written = [json.loads(line) for line in f]
+
+        assert len(written) == battle.MESSAGE_COUNT
+        assert written[0]["BMTYPE"] == BattleMessage.from_message(EXAMPLE_LINES[0]).BMTYPE.value
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_corpus_output_dir_same_names(tmp_path, workers):
+    paths = []
+    for folder, lines in (("a", EXAMPLE_LINES[:3]), ("b", EXAMPLE_LINES[3:10])):
+        (tmp_path / folder).mkdir()
+        path = tmp_path / folder / "battle.log"
+        path.write_text("\n".join(lines), encoding="utf8")
+        paths.append(path)
+
+    report = parse_corpus(paths, workers=workers, chunksize=1, output_dir=tmp_path / "parsed")
+
+    assert [battle.OUTPUT_PATH for battle in report.BATTLES] == [
+        str(tmp_path / "parsed" / "a" / "battle.log.jsonl"),
+        str(tmp_path / "parsed" / "b" / "battle.log.jsonl"),
+    ]
+    for battle in report.BATTLES:
+        with open(battle.OUTPUT_PATH, encoding="utf8") as f:
+            assert sum(1 for _ in f) == battle.MESSAGE_COUNT
+
+    with pytest.raises(ValueError):
+        parse_corpus([paths[0], paths[0]], output_dir=tmp_path / "parsed")
+
+
+def test_parse_corpus_unreadable(tmp_path):
+    broken = tmp_path / "broken.log.gz"
+    broken.write_bytes(b"\x1f\x8bnot really gzip")
+
+    report = parse_corpus([broken, tmp_path / "missing.log"], workers=1)
+
+    assert report.FAILED_BATTLES == 2
+    assert all(battle.FAILURE is not None for battle in report.BATTLES)
@@ -0,0 +1,46 @@
+import pytest
+from pydantic import ValidationError
+
+from poketypes.dex import DexPokemon, DexType
+from poketypes.showdown import BattleMessage, PokemonDetails
+
+
+@pytest.mark.parametrize(
+    "details,expected",
+    [
+        ("Toxicroak, L81, F", dict(SPECIES=DexPokemon.POKEMON_TOXICROAK, LEVEL=81, GENDER="F")),
+        ("Scizor-Mega, L75, M, shiny", dict(SPECIES=DexPokemon.POKEMON_SCIZORMEGA, LEVEL=75, GENDER="M", SHINY=True)),
+        ("Metagross", dict(SPECIES=DexPokemon.POKEMON_METAGROSS)),
+        ("Garchomp, M, tera:Fire", dict(SPECIES=DexPokemon.POKEMON_GARCHOMP, GENDER="M", TERA="Fire")),
+    ],
+)
+def test_details_fields(details, expected):
+    assert PokemonDetails.from_details_string(details) == PokemonDetails(**expected)
+
+
+def test_details_shared():
+    first = PokemonDetails.from_details_string("Toxicroak, L81, F")
+
+    assert PokemonDetails.from_details_string("Toxicroak, L81, F") is first
+
+    with pytest.raises(ValidationError):
+        first.LEVEL = 50
+
+
+def test_details_used_by_messages():
+    switch = BattleMessage.from_message("|switch|p2a: Toxicroak|Toxicroak, L81, F|100/100")
+    detailschange = BattleMessage.from_message("|detailschange|p1a: Toxicroak|Toxicroak, L81, F")
+
+    for bm in [switch, detailschange]:
+        assert bm.SPECIES == DexPokemon.POKEMON_TOXICROAK
+        assert bm.LEVEL == 81
+        assert bm.GENDER == "F"
+
+
+def test_poke_tera_and_item():
+    with_item = BattleMessage.from_message("|poke|p1|Metagross, L80, tera:Steel|item")
+    without_item = BattleMessage.from_message("|poke|p1|Metagross, L80|")
+
+    assert with_item.TERA == DexType.TYPE_STEEL
+    assert with_item.HAS_ITEM
+    assert not without_item.HAS_ITEM
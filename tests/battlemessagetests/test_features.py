@@ -0,0 +1,128 @@
+import pytest
+
+from poketypes.dex import DexMove, DexPokemon, DexStatus, DexType, DexWeather, dense_index
+from poketypes.showdown import BattleMessage, BattleState, BMType, FeatureSpec, StateEncoder, synthetic_battle
+from poketypes.showdown.actions import ACTION_TEAM
+
+from bmfixtures import GENS, parse_fixture
+
+np = pytest.importorskip("numpy")
+
+
+def _dense(dex_class, value):
+    return dense_index(dex_class).TO_DENSE[value]
+
+
+def _state(*lines):
+    return BattleState.from_messages(BattleMessage.parse_many(lines))
+
+
+DOUBLES_START = [
+    "|player|p1|colress-gpt-test1|1|",
+    "|player|p2|colress-gpt-test2|2|",
+    "|gametype|doubles",
+    "|gen|9",
+    "|switch|p1a: Kingambit|Kingambit, L79, M|137/274",
+    "|switch|p1b: Amoonguss|Amoonguss, L86, F|330/330",
+    "|switch|p2a: Garchomp|Garchomp, L77, M|100/100",
+    "|-weather|RainDance",
+    "|-boost|p1a: Kingambit|atk|2",
+    "|-unboost|p2a: Garchomp|spe|1",
+    "|-status|p2a: Garchomp|brn",
+    "|-terastallize|p1a: Kingambit|Fairy",
+    "|move|p1a: Kingambit|Kowtow Cleave|p2a: Garchomp",
+    "|turn|1",
+]
+
+
+def test_encode_state():
+    encoder = StateEncoder()
+    encoded = encoder.encode(_state(*DOUBLES_START))
+    columns = encoder.COLUMNS
+
+    assert encoded.POKEMON_INDICES.shape == (1, 2, ACTION_TEAM, columns["moves"].stop)
+    assert encoded.POKEMON_INDICES.dtype == np.int32
+    assert encoded.POKEMON_VALUES.dtype == np.float32
+
+    kingambit = encoded.POKEMON_INDICES[0, 0, 0]
+    assert kingambit[columns["species"]] == [_dense(DexPokemon, DexPokemon.POKEMON_KINGAMBIT)]
+    assert list(kingambit[columns["moves"]]) == [_dense(DexMove, DexMove.MOVE_KOWTOWCLEAVE), 0, 0, 0]
+    assert kingambit[columns["item"]] == [0]
+
+    values = encoded.POKEMON_VALUES[0, 0, 0]
+    assert values[columns["hp"]] == [0.5]
+    assert values[columns["active"]] == [1]
+    assert values[columns["revealed"]] == [1]
+    assert values[columns["boosts"]][0] == pytest.approx(2 / 6)
+    assert list(np.flatnonzero(values[columns["tera_type"]])) == [_dense(DexType, DexType.TYPE_FAIRY)]
+    assert list(np.flatnonzero(values[columns["status"]])) == [0]
+
+    garchomp = encoded.POKEMON_VALUES[0, 1, 0]
+    assert list(np.flatnonzero(garchomp[columns["status"]])) == [_dense(DexStatus, DexStatus.STATUS_BRN)]
+    assert garchomp[columns["boosts"]][4] == pytest.approx(-1 / 6)
+
+    # Unrevealed pokemon are all padding
+    assert not encoded.POKEMON_INDICES[0, 1, 1:].any()
+    assert not encoded.POKEMON_VALUES[0, 1, 1:, columns["revealed"]].any()
+    assert not encoded.POKEMON_VALUES[0, 1, 1:, columns["hp"]].any()
+
+    field = encoded.FIELD_VALUES[0]
+    assert list(np.flatnonzero(field[columns["weather"]])) == [_dense(DexWeather, DexWeather.WEATHER_RAINDANCE)]
+    assert field[columns["turn"]] == [1]
+
+
+def test_player_perspective():
+    state = _state(*DOUBLES_START)
+    encoder = StateEncoder()
+
+    p1 = encoder.encode(state).POKEMON_INDICES.copy()
+    p2 = encoder.encode(state, player="p2").POKEMON_INDICES
+
+    assert (p1[:, 0] == p2[:, 1]).all()
+    assert (p1[:, 1] == p2[:, 0]).all()
+
+
+def test_custom_spec():
+    spec = FeatureSpec(POKEMON=("hp", "moves", "species"), FIELD=("turn",), ONEHOT=("moves",))
+    encoder = StateEncoder(spec)
+    encoded = encoder.encode(_state(*DOUBLES_START))
+
+    assert encoder.COLUMNS["species"] == slice(0, 1)
+    assert encoder.COLUMNS["moves"] == slice(1, 1 + len(dense_index(DexMove)))
+    assert encoded.POKEMON_INDICES.shape[-1] == 1
+    assert encoded.FIELD_INDICES.shape == (1, 0)
+    assert encoded.FIELD_VALUES.shape == (1, 1)
+
+    moves = encoded.POKEMON_VALUES[0, 0, 0, encoder.COLUMNS["moves"]]
+    assert list(np.flatnonzero(moves)) == [0, _dense(DexMove, DexMove.MOVE_KOWTOWCLEAVE)]
+
+    with pytest.raises(ValueError):
+        StateEncoder(FeatureSpec(POKEMON=("hp", "nickname")))
+
+
+@pytest.mark.parametrize("gen", GENS)
+def test_replay_matches_batch(gen):
+    messages = parse_fixture(gen)
+    encoder = StateEncoder()
+
+    turns = [i for i, m in enumerate(messages) if m.BMTYPE == BMType.turn]
+    states = [BattleState.from_messages(messages[: i + 1]) for i in turns]
+    batch = [array.copy() for array in encoder.encode_batch(states)]
+    replay = encoder.encode_replay(messages)
+
+    assert len(replay.POKEMON_INDICES) == len(turns)
+    for expected, actual in zip(batch, replay):
+        assert (expected == actual).all()
+
+
+def test_arrays_are_reused():
+    encoder = StateEncoder(capacity=4)
+    states = [BattleState.from_messages(BattleMessage.parse_many(synthetic_battle(9, seed))) for seed in range(3)]
+
+    first = encoder.encode_batch(states)
+    second = encoder.encode_batch(states[:2])
+    assert np.shares_memory(first.POKEMON_VALUES, second.POKEMON_VALUES)
+
+    grown = encoder.encode_batch(states * 3)
+    assert len(grown.POKEMON_VALUES) == 9
+    assert not np.shares_memory(first.POKEMON_VALUES, grown.POKEMON_VALUES)
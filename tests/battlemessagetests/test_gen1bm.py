@@ -0,0 +1,30 @@
+from poketypes.dex import DexGen, DexStatus
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(1)
+
+
+def test_gen1_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+    tier = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.tier)
+
+    assert gen.GENNUM == DexGen.GEN_1
+    assert tier.FORMATNAME == "[Gen 1] Random Battle"
+
+
+def test_gen1_paralysis():
+    status = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.status)
+    cant = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.cant)
+
+    assert status.STATUS == DexStatus.STATUS_PAR
+    assert cant.POKEMON == status.POKEMON
+    assert cant.REASON == "par"
+
+
+def test_gen1_switches_keep_status():
+    tauros = [bm for bm in MESSAGES if bm.BMTYPE == BMType.switch and bm.POKEMON.IDENTITY == "TAUROS"]
+
+    assert [bm.STATUS for bm in tauros] == [None, DexStatus.STATUS_PAR]
+    assert tauros[1].CUR_HP == 58
@@ -0,0 +1,32 @@
+from poketypes.dex import DexGen
+from poketypes.showdown import BMType
+from poketypes.showdown.battlemessage import EffectType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(2)
+
+
+def test_gen2_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_2
+
+
+def test_gen2_spikes_and_phazing():
+    spikes = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.sidestart)
+    drags = [bm for bm in MESSAGES if bm.BMTYPE == BMType.drag]
+    spikes_damage = [bm for bm in MESSAGES if bm.BMTYPE == BMType.damage and bm.EFFECT is not None]
+
+    assert spikes.PLAYER == "p2"
+    assert spikes.CONDITION == "Spikes"
+    assert [bm.POKEMON.IDENTITY for bm in drags] == ["TYRANITAR", "TYRANITAR"]
+    assert all(bm.EFFECT.EFFECT_NAME == "Spikes" for bm in spikes_damage)
+
+
+def test_gen2_leftovers():
+    leftovers = [bm for bm in MESSAGES if bm.BMTYPE == BMType.heal and bm.EFFECT is not None]
+    leftovers = [bm for bm in leftovers if bm.EFFECT.EFFECT_TYPE == EffectType.item]
+
+    assert len(leftovers) == 5
+    assert {bm.EFFECT.EFFECT_NAME for bm in leftovers} == {"Leftovers"}
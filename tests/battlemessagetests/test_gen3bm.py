@@ -0,0 +1,37 @@
+from poketypes.dex import DexGen, DexWeather
+from poketypes.showdown import BMType, PokemonIdentifier
+from poketypes.showdown.battlemessage import EffectType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(3)
+
+
+def test_gen3_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_3
+
+
+def test_gen3_sand_stream():
+    weather = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.weather)
+
+    assert weather.WEATHER == DexWeather.WEATHER_SANDSTORM
+    assert weather.EFFECT.EFFECT_TYPE == EffectType.ability
+    assert weather.EFFECT.EFFECT_NAME == "Sand Stream"
+    assert weather.EFFECT.EFFECT_SOURCE == PokemonIdentifier.from_string("p2a: Tyranitar")
+
+
+def test_gen3_intimidate_and_levitate():
+    ability = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.ability)
+    immune = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.immune)
+
+    assert ability.POKEMON.IDENTITY == "SALAMENCE"
+    assert immune.POKEMON.IDENTITY == "GENGAR"
+
+
+def test_gen3_drain_source():
+    drains = [bm for bm in MESSAGES if bm.BMTYPE == BMType.heal and bm.EFFECT is not None]
+
+    assert len(drains) == 2
+    assert all(bm.EFFECT.EFFECT_SOURCE.IDENTITY == "SWAMPERT" for bm in drains)
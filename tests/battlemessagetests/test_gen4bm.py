@@ -0,0 +1,37 @@
+from poketypes.dex import DexGen, DexItem, DexPokemon
+from poketypes.showdown import BMType
+from poketypes.showdown.battlemessage import EffectType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(4)
+
+
+def test_gen4_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_4
+
+
+def test_gen4_trick():
+    items = [bm for bm in MESSAGES if bm.BMTYPE == BMType.item]
+
+    assert [(bm.POKEMON.IDENTITY, bm.ITEM) for bm in items] == [
+        ("LUCARIO", DexItem.ITEM_CHOICESCARF),
+        ("ROTOM", DexItem.ITEM_LIFEORB),
+    ]
+    assert all(bm.EFFECT.EFFECT_TYPE == EffectType.move and bm.EFFECT.EFFECT_NAME == "Trick" for bm in items)
+
+
+def test_gen4_uturn_switch_and_formes():
+    switches = [bm for bm in MESSAGES if bm.BMTYPE == BMType.switch]
+
+    assert DexPokemon.POKEMON_ROTOMWASH in [bm.SPECIES for bm in switches]
+    assert [bm.POKEMON.IDENTITY for bm in switches].count("LUCARIO") == 1
+
+
+def test_gen4_life_orb_recoil():
+    life_orb = [bm for bm in MESSAGES if bm.BMTYPE == BMType.damage and bm.EFFECT is not None]
+    life_orb = [bm for bm in life_orb if bm.EFFECT.EFFECT_NAME == "Life Orb"]
+
+    assert [bm.CUR_HP for bm in life_orb] == [23, 13]
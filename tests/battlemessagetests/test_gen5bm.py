@@ -0,0 +1,34 @@
+from poketypes.dex import DexGen, DexStatus
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(5)
+
+
+def test_gen5_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_5
+
+
+def test_gen5_leech_seed():
+    seeded = [bm for bm in MESSAGES if bm.BMTYPE == BMType.damage and bm.EFFECT is not None]
+    seeded = [bm for bm in seeded if bm.EFFECT.EFFECT_NAME == "Leech Seed"]
+
+    assert len(seeded) == 1
+    assert seeded[0].POKEMON.IDENTITY == "EXCADRILL"
+    assert seeded[0].EFFECT.EFFECT_SOURCE.IDENTITY == "FERROTHORN"
+
+
+def test_gen5_quiver_dance_boosts():
+    boosts = [bm for bm in MESSAGES if bm.BMTYPE == BMType.boost and bm.POKEMON.IDENTITY == "VOLCARONA"]
+
+    assert len(boosts) == 3
+
+
+def test_gen5_burn_damage_keeps_status():
+    burned = [bm for bm in MESSAGES if bm.BMTYPE == BMType.damage and bm.POKEMON.IDENTITY == "VOLCARONA"]
+
+    assert burned[-2].STATUS == DexStatus.STATUS_BRN
+    assert burned[-1].CUR_HP == 0
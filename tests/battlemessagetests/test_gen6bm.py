@@ -0,0 +1,35 @@
+from poketypes.dex import DexGen, DexItem, DexPokemon
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(6)
+
+
+def test_gen6_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_6
+
+
+def test_gen6_mega_evolution():
+    detailschange = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.detailschange)
+    mega = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.mega)
+
+    assert detailschange.SPECIES == DexPokemon.POKEMON_GARCHOMPMEGA
+    assert mega.POKEMON == detailschange.POKEMON
+    assert mega.BASE_SPECIES == DexPokemon.POKEMON_GARCHOMP
+    assert mega.MEGA_STONE == DexItem.ITEM_GARCHOMPITE
+
+
+def test_gen6_stance_change():
+    formechange = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.formechange)
+
+    assert formechange.EFFECT.EFFECT_NAME == "Stance Change"
+
+
+def test_gen6_illusion():
+    replace = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.replace)
+
+    assert replace.POKEMON.IDENTITY == "ZOROARK"
+    assert replace.SPECIES == DexPokemon.POKEMON_ZOROARK
@@ -0,0 +1,35 @@
+from poketypes.dex import DexGen, DexPokemon
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(7)
+
+
+def test_gen7_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_7
+
+
+def test_gen7_z_move():
+    zpower = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.zpower)
+    z_move = MESSAGES[MESSAGES.index(zpower) + 1]
+
+    assert zpower.POKEMON.IDENTITY == "TAPU KOKO"
+    assert z_move.BMTYPE == BMType.move
+    assert z_move.POKEMON == zpower.POKEMON
+
+
+def test_gen7_terrain():
+    fieldstart = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.fieldstart)
+    fieldend = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.fieldend)
+
+    assert fieldstart.EFFECT.EFFECT_NAME == fieldend.EFFECT.EFFECT_NAME == "Electric Terrain"
+    assert fieldstart.EFFECT.EFFECT_SOURCE.IDENTITY == "TAPU KOKO"
+
+
+def test_gen7_disguise():
+    detailschange = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.detailschange)
+
+    assert detailschange.SPECIES == DexPokemon.POKEMON_MIMIKYUBUSTED
@@ -0,0 +1,33 @@
+from poketypes.dex import DexGen
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(8)
+
+
+def test_gen8_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_8
+
+
+def test_gen8_multi_hit():
+    hitcount = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.hitcount)
+
+    assert hitcount.POKEMON.IDENTITY == "CORVIKNIGHT"
+    assert hitcount.NUM == 2
+
+
+def test_gen8_libero():
+    typechanges = [bm for bm in MESSAGES if bm.BMTYPE == BMType.volstart]
+
+    assert len(typechanges) == 2
+    assert all(bm.EFFECT.EFFECT_NAME == "Libero" for bm in typechanges)
+
+
+def test_gen8_black_sludge():
+    black_sludge = [bm for bm in MESSAGES if bm.BMTYPE == BMType.heal and bm.EFFECT is not None]
+    black_sludge = [bm for bm in black_sludge if bm.EFFECT.EFFECT_NAME == "Black Sludge"]
+
+    assert {bm.POKEMON.IDENTITY for bm in black_sludge} == {"TOXAPEX"}
@@ -0,0 +1,40 @@
+from poketypes.dex import DexGen, DexItem, DexType
+from poketypes.showdown import BMType
+
+from bmfixtures import parse_fixture
+
+MESSAGES = parse_fixture(9)
+
+
+def test_gen9_log_header():
+    gen = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.gen)
+
+    assert gen.GENNUM == DexGen.GEN_9
+
+
+def test_gen9_terastallization():
+    terastallize = [bm for bm in MESSAGES if bm.BMTYPE == BMType.terastallize]
+
+    assert [(bm.POKEMON.IDENTITY, bm.TYPE) for bm in terastallize] == [
+        ("KINGAMBIT", DexType.TYPE_DARK),
+        ("DRAGONITE", DexType.TYPE_NORMAL),
+    ]
+
+
+def test_gen9_booster_energy():
+    enditem = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.enditem)
+
+    assert enditem.POKEMON.IDENTITY == "IRON VALIANT"
+    assert enditem.ITEM == DexItem.ITEM_BOOSTERENERGY
+
+
+def test_gen9_winner():
+    assert MESSAGES[-1].BMTYPE == BMType.win
+    assert MESSAGES[-1].USERNAME == "colress-gpt-test2"
+
+
+def test_gen9_quark_drive_from_item():
+    activate = next(bm for bm in MESSAGES if bm.BMTYPE == BMType.activate and bm.POKEMON.IDENTITY == "IRON VALIANT")
+
+    assert activate.EFFECT.EFFECT_NAME == "Quark Drive"
+    assert activate.EFFECT.SEC_EFFECT_NAME == "[fromitem]"
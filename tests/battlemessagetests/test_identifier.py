@@ -0,0 +1,38 @@
+import pytest
+from pydantic import ValidationError
+
+from poketypes.showdown import BattleMessage, PokemonIdentifier
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("p1a: Arcanine", dict(IDENTITY="ARCANINE", PLAYER="p1", SLOT="a")),
+        ("p2: Arcanine", dict(IDENTITY="ARCANINE", PLAYER="p2", SLOT=None)),
+        ("p3b: Mr. Mime", dict(IDENTITY="MR. MIME", PLAYER="p3", SLOT="b")),
+        ("p1: Type: Null", dict(IDENTITY="TYPE: NULL", PLAYER="p1", SLOT=None)),
+    ],
+)
+def test_identifier_fields(string, expected):
+    assert PokemonIdentifier.from_string(string) == PokemonIdentifier(**expected)
+
+
+def test_identifier_interned():
+    first = PokemonIdentifier.from_string("p1a: Arcanine")
+
+    assert PokemonIdentifier.from_string("p1a: Arcanine") is first
+    assert {first: 1}[PokemonIdentifier(IDENTITY="ARCANINE", PLAYER="p1", SLOT="a")] == 1
+
+    with pytest.raises(ValidationError):
+        first.SLOT = "b"
+
+    PokemonIdentifier.from_string.cache_clear()
+    assert PokemonIdentifier.from_string("p1a: Arcanine") is not first
+
+
+def test_identifier_shared_by_messages():
+    move = BattleMessage.from_message("|move|p1a: Sceptile|Leaf Blade|p2a: Espeon")
+    damage = BattleMessage.from_message("|-damage|p2a: Espeon|45/100|[from] Leech Seed|[of] p1a: Sceptile")
+
+    assert damage.POKEMON is move.TARGET
+    assert damage.EFFECT.EFFECT_SOURCE is move.POKEMON
@@ -0,0 +1,66 @@
+import pytest
+
+from poketypes.showdown import BattleMessage, BMType, LazyBattleMessage
+
+from bmexamples import BM_EXAMPLES
+
+EXAMPLE_LINES = [(bmtype, line) for bmtype, lines in BM_EXAMPLES.items() for line in lines]
+
+
+@pytest.mark.parametrize("bmtype,line", EXAMPLE_LINES)
+def test_lazy_bmtype_without_parsing(bmtype, line):
+    lazy = LazyBattleMessage.from_message(line)
+
+    assert lazy.BMTYPE == BattleMessage.from_message(line).BMTYPE
+    assert not lazy.is_parsed
+
+
+@pytest.mark.parametrize("bmtype,line", EXAMPLE_LINES)
+def test_lazy_fields_match_eager(bmtype, line):
+    eager = BattleMessage.from_message(line)
+    lazy = LazyBattleMessage.from_message(line)
+
+    for field in type(eager).model_fields:
+        assert getattr(lazy, field) == getattr(eager, field)
+
+    assert lazy.is_parsed
+    assert lazy.parsed == eager
+
+
+def test_lazy_parses_once():
+    lazy = LazyBattleMessage.from_message("|switch|p1a: Sceptile|Sceptile, L82, M|100/100")
+
+    parsed = lazy.parsed
+    assert lazy.SPECIES == parsed.SPECIES
+    assert lazy.parsed is parsed
+
+
+def test_lazy_trusted():
+    line = "|-damage|p2a: Espeon|45/100|[from] item: Life Orb"
+    lazy = LazyBattleMessage.from_message(line, validate=False)
+
+    assert lazy.EFFECT == BattleMessage.from_message(line).EFFECT
+
+
+def test_lazy_unknown_bmtype():
+    lazy = LazyBattleMessage.from_message("|notarealmessage|p1a: Sceptile")
+
+    assert lazy.BMTYPE == BMType.unknown
+    assert lazy.ERR_STATE == "UNKNOWN_BMTYPE"
+
+
+def test_lazy_missing_attribute():
+    lazy = LazyBattleMessage.from_message("|turn|2")
+
+    with pytest.raises(AttributeError):
+        lazy.SPECIES
+
+
+@pytest.mark.parametrize(
+    "line,bmtype", [("foo", BMType.unknown), ("|request", BMType.empty), ("|request|", BMType.empty)]
+)
+def test_lazy_lines_without_key(line, bmtype):
+    lazy = LazyBattleMessage.from_message(line)
+
+    assert lazy.BMTYPE == bmtype == BattleMessage.from_message(line).BMTYPE
+    assert lazy.parsed == BattleMessage.from_message(line)
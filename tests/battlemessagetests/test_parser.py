@@ -0,0 +1,83 @@
+import pytest
+
+from poketypes.showdown import BattleMessage, BattleMessageParser, BMType, LazyBattleMessage
+
+from bmexamples import BM_EXAMPLES
+
+EXAMPLE_LINES = [line for lines in BM_EXAMPLES.values() for line in lines]
+
+FRAME = """>battle-gen9randombattle-1
+|j|☆colress
+|raw|<b>hi</b>
+|move|p1a: Sceptile|Leaf Blade|p2a: Espeon
+|-damage|p2a: Espeon|45/100
+|-anim|p1a: Sceptile|Leaf Blade|p2a: Espeon
+|notarealmessage|p1a: Sceptile
+|turn|2"""
+
+
+def test_parser_allow():
+    parser = BattleMessageParser(allow=[BMType.move, BMType.damage, BMType.join])
+    messages = parser.parse_block(FRAME)
+
+    assert [type(bm) for bm in messages] == [
+        type(BattleMessage.from_message("|j|☆colress")),
+        LazyBattleMessage,
+        type(BattleMessage.from_message("|move|p1a: Sceptile|Leaf Blade|p2a: Espeon")),
+        type(BattleMessage.from_message("|-damage|p2a: Espeon|45/100")),
+        LazyBattleMessage,
+        LazyBattleMessage,
+        LazyBattleMessage,
+    ]
+    assert not any(bm.is_parsed for bm in messages if isinstance(bm, LazyBattleMessage))
+    assert messages[6].BMTYPE == BMType.turn
+
+
+def test_parser_deny_and_skip():
+    parser = BattleMessageParser(deny=[BMType.join, BMType.raw, BMType.anim], skip_unselected=True)
+    errors = []
+    messages = parser.parse_block(FRAME, errors=errors)
+
+    assert [bm.BMTYPE for bm in messages] == [BMType.move, BMType.damage, BMType.unknown, BMType.turn]
+    assert [failure.ERR_STATE for failure in errors] == ["UNKNOWN_BMTYPE"]
+
+    assert parser.parse("|raw|<b>hi</b>") is None
+    assert parser.parse("|turn|2") == BattleMessage.from_message("|turn|2")
+
+
+def test_parser_unknown_keys():
+    assert not BattleMessageParser(allow=[BMType.turn]).is_selected("|notarealmessage|")
+    assert BattleMessageParser(allow=[BMType.unknown]).is_selected("|notarealmessage|")
+    assert BattleMessageParser(deny=[BMType.unknown], skip_unselected=True).parse_many(["|notarealmessage|"]) == []
+
+
+def test_parser_plain_text_lines():
+    frame = "\n".join(
+        [
+            ">battle-gen9randombattle-1",
+            "|move|p1a: Sceptile|Leaf Blade|p2a: Espeon",
+            "The server will restart soon.",
+            "xturn",
+            "|turn|2",
+        ]
+    )
+    parser = BattleMessageParser(allow=[BMType.turn])
+
+    for messages in (parser.parse_block(frame), parser.parse_bytes(frame.encode("utf8"))):
+        assert [bm.BMTYPE for bm in messages] == [BMType.move, BMType.unknown, BMType.unknown, BMType.turn]
+        assert [isinstance(bm, LazyBattleMessage) for bm in messages] == [True, True, True, False]
+
+    assert parser.parse("The server will restart soon.").BMTYPE == BMType.unknown
+    assert BattleMessageParser(allow=[BMType.unknown]).is_selected("xturn")
+
+
+def test_parser_defaults_match_parse_many():
+    parser = BattleMessageParser(validate=False)
+
+    assert parser.SELECTED == frozenset(BMType)
+    assert parser.parse_many(EXAMPLE_LINES) == BattleMessage.parse_many(EXAMPLE_LINES)
+
+
+def test_parser_allow_and_deny():
+    with pytest.raises(ValueError):
+        BattleMessageParser(allow=[BMType.move], deny=[BMType.raw])
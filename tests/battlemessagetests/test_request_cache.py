@@ -0,0 +1,70 @@
+import pytest
+
+from poketypes.showdown import BattleMessage, BMType, RequestCache, synthetic_battle
+
+NICKNAME_REQUEST = (
+    '|request|{"wait":true,"side":{"name":"colress-gpt-test1","id":"p1","pokemon":[{"ident":"p1: Pipe|Dream",'
+    '"details":"Kingambit, L79, M","condition":"274/274","active":true,"stats":{"atk":258,"def":218,"spa":148,'
+    '"spd":170,"spe":123},"moves":["swordsdance","kowtowcleave","ironhead","suckerpunch"],'
+    '"baseAbility":"supremeoverlord",'
+    '"item":"leftovers","pokeball":"pokeball","ability":"supremeoverlord","commanding":false,"reviving":false,'
+    '"teraType":"Dark","terastallized":""}]}}'
+)
+
+
+def _requests(gen, seed):
+    return [line for line in synthetic_battle(gen, seed) if line.startswith("|request|")]
+
+
+@pytest.mark.parametrize("gen", [1, 4, 7, 8, 9])
+@pytest.mark.parametrize("validate", [True, False])
+def test_request_cache_matches_from_message(gen, validate):
+    cache = RequestCache()
+
+    for line in _requests(gen, gen):
+        assert cache.parse(line, validate=validate) == BattleMessage.from_message(line, validate=validate)
+
+
+def test_request_cache_reuses_unchanged_pokemon():
+    cache = RequestCache()
+    requests = _requests(9, 3)
+
+    previous = {p.IDENT: p for p in cache.parse(requests[0]).POKEMON}
+    reused = 0
+    for line in requests[1:]:
+        pokemon = cache.parse(line).POKEMON
+        reused += sum(p is previous.get(p.IDENT) for p in pokemon)
+        previous = {p.IDENT: p for p in pokemon}
+
+    assert reused > 0
+    assert cache.hits >= reused
+    assert cache.misses >= 6
+
+
+def test_request_cache_rebuilds_changed_pokemon():
+    cache = RequestCache()
+    first = cache.parse(NICKNAME_REQUEST).POKEMON[0]
+    second = cache.parse(NICKNAME_REQUEST.replace("274/274", "100/274")).POKEMON[0]
+
+    assert second is not first
+    assert second.CUR_HP == 100
+    assert cache.parse(NICKNAME_REQUEST.replace("274/274", "100/274")).POKEMON[0] is second
+
+    cache.clear()
+    assert cache.parse(NICKNAME_REQUEST.replace("274/274", "100/274")).POKEMON[0] is not second
+
+
+def test_request_with_pipe_in_nickname():
+    bm = BattleMessage.from_message(NICKNAME_REQUEST)
+
+    assert bm.BMTYPE == BMType.request
+    assert bm.POKEMON[0].IDENT.IDENTITY == "PIPE|DREAM"
+    assert RequestCache().parse(NICKNAME_REQUEST) == bm
+
+
+def test_request_cache_other_messages():
+    cache = RequestCache()
+
+    assert cache.parse("|turn|3").NUMBER == 3
+    assert cache.parse("|request|").BMTYPE == BMType.empty
+    assert cache.parse('|request|{"side":').ERR_STATE == "PARSE_ERROR"
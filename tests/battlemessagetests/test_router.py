@@ -0,0 +1,183 @@
+import asyncio
+
+from poketypes.dex import DexMove
+from poketypes.showdown import (
+    GLOBAL_ROOM,
+    BattleMessageParser,
+    BMType,
+    FrameRouter,
+    LazyBattleMessage,
+    Message,
+    MType,
+    synthetic_battle,
+)
+
+BATTLE_FRAME = ">battle-gen9randombattle-1\n|\n|t:|1696835200\n|move|p1a: Kingambit|Swords Dance|p1a: Kingambit\n"
+
+
+async def _collect(messages):
+    return [m async for m in messages]
+
+
+def test_route_battle_frame():
+    async def main():
+        router = FrameRouter()
+
+        assert await router.route(BATTLE_FRAME) == 3
+        assert router.rooms == ["battle-gen9randombattle-1"]
+
+        room_id, messages = await router.accept()
+        assert room_id == "battle-gen9randombattle-1"
+
+        await router.close_room(room_id)
+        return await _collect(messages)
+
+    messages = asyncio.run(main())
+
+    assert [m.BMTYPE for m in messages] == [BMType.empty, BMType.t, BMType.move]
+    assert messages[2].POKEMON.IDENTITY == "KINGAMBIT"
+
+
+def test_route_global_frame():
+    async def main():
+        router = FrameRouter()
+        messages = router.messages(GLOBAL_ROOM)
+
+        await router.route("|challstr|4|abcdef")
+        await router.close()
+
+        return await _collect(messages)
+
+    messages = asyncio.run(main())
+
+    assert len(messages) == 1
+    assert isinstance(messages[0], Message)
+    assert messages[0].MTYPE == MType.challstr
+
+
+def test_deinit_closes_room():
+    async def main():
+        router = FrameRouter()
+        await router.route(BATTLE_FRAME)
+        await router.route(">battle-gen9randombattle-1\n|deinit")
+
+        assert router.rooms == []
+
+        _, messages = await router.accept()
+        return await _collect(messages)
+
+    messages = asyncio.run(main())
+
+    assert messages[-1].BMTYPE == BMType.deinit
+
+
+def test_per_room_ordering_many_rooms():
+    battles = {f"battle-gen{gen}randombattle-{gen}": synthetic_battle(gen, gen) for gen in range(1, 10)}
+
+    async def frames():
+        # Interleave the battles a few lines at a time, the way a server multiplexing many rooms would
+        offsets = {room_id: 0 for room_id in battles}
+        while offsets:
+            for room_id in list(offsets):
+                start, end = offsets[room_id], offsets[room_id] + 5
+                lines = battles[room_id][start:end]
+                offsets[room_id] = end
+                if not lines:
+                    del offsets[room_id]
+                    continue
+                yield f">{room_id}\n" + "\n".join(lines)
+                await asyncio.sleep(0)
+
+    async def consume(messages):
+        return [m.BATTLE_MESSAGE async for m in messages]
+
+    async def main():
+        router = FrameRouter(queue_size=8)
+        consumers = {}
+
+        async def accept_rooms():
+            while len(consumers) < len(battles):
+                room_id, messages = await router.accept()
+                consumers[room_id] = asyncio.create_task(consume(messages))
+
+        acceptor = asyncio.create_task(accept_rooms())
+        await router.run(frames())
+        await acceptor
+
+        return {room_id: await task for room_id, task in consumers.items()}
+
+    received = asyncio.run(main())
+
+    assert received == battles
+
+
+def test_backpressure():
+    async def main():
+        router = FrameRouter(queue_size=2, announce_rooms=False)
+        messages = router.messages("battle-gen9randombattle-1")
+        route = asyncio.create_task(router.route(BATTLE_FRAME))
+
+        await asyncio.sleep(0.01)
+        assert not route.done()
+        assert router.room("battle-gen9randombattle-1").qsize() == 2
+
+        first = await messages.__anext__()
+        await asyncio.wait_for(route, 1)
+
+        return first
+
+    assert asyncio.run(main()).BMTYPE == BMType.empty
+
+
+def test_unconsumed_rooms_drop_messages():
+    async def main():
+        router = FrameRouter(queue_size=2)
+        battle = router.messages("battle-gen9randombattle-2")
+
+        # Neither the global room nor the announced battle room is ever consumed
+        for turn in range(5):
+            await asyncio.wait_for(router.route(f"|challstr|4|{turn}"), 1)
+            await asyncio.wait_for(router.route(f">battle-gen9randombattle-1\n|turn|{turn}"), 1)
+        await asyncio.wait_for(router.route(">battle-gen9randombattle-2\n|turn|1"), 1)
+
+        unconsumed = router.room("battle-gen9randombattle-1")
+        assert [m.NUMBER for m in (unconsumed.get_nowait(), unconsumed.get_nowait())] == [3, 4]
+        assert unconsumed.dropped == 3
+
+        # Closing full rooms doesn't wait for them to be consumed
+        await router.route("|challstr|4|5")
+        await asyncio.wait_for(router.close(), 1)
+
+        return await _collect(battle)
+
+    assert [m.NUMBER for m in asyncio.run(main())] == [1]
+
+
+def test_router_with_parser():
+    async def main():
+        router = FrameRouter(parser=BattleMessageParser(allow=[BMType.move]))
+        await router.route(BATTLE_FRAME)
+        await router.close()
+
+        _, messages = await router.accept()
+        return await _collect(messages)
+
+    messages = asyncio.run(main())
+
+    assert isinstance(messages[0], LazyBattleMessage)
+    assert not isinstance(messages[2], LazyBattleMessage)
+    assert messages[2].MOVE == DexMove.MOVE_SWORDSDANCE
+
+
+def test_parse_frame():
+    router = FrameRouter()
+
+    assert [m.BMTYPE for m in router.parse_frame(BATTLE_FRAME)] == [BMType.empty, BMType.t, BMType.move]
+    assert [m.MTYPE for m in router.parse_frame("|challstr|4|abcdef")] == [MType.challstr]
+
+
+def test_split_frame_on_newlines_only():
+    router = FrameRouter()
+    frame = ">battle-gen9randombattle-1\r\n|c|☆colress-gpt-test1|gl\u2028>battle-gen9ou-2\r\n|turn|2"
+
+    assert [m.BMTYPE for m in router.parse_frame(frame)] == [BMType.unknown, BMType.turn]
@@ -0,0 +1,279 @@
+import copy
+
+import pytest
+
+from poketypes.dex import DexItem, DexMove, DexStatus, DexType, DexWeather
+from poketypes.showdown import (
+    BattleMessage,
+    BattleMessageParser,
+    BattleState,
+    BMType,
+    LazyBattleMessage,
+    PokemonIdentifier,
+    synthetic_battle,
+)
+from poketypes.showdown.battlemessage import PokeStat
+
+from bmfixtures import GENS, parse_fixture
+
+
+def _state(*lines):
+    return BattleState.from_messages(BattleMessage.parse_many(lines))
+
+
+def _fields(obj):
+    return {name: copy.deepcopy(getattr(obj, name)) for name in obj.__slots__ if not name.startswith("_")}
+
+
+def _dump(state):
+    return _fields(state) | {
+        "SIDES": {
+            player: _fields(side) | {"POKEMON": {identity: _fields(p) for identity, p in side.POKEMON.items()}}
+            for player, side in state.SIDES.items()
+        }
+    }
+
+
+DOUBLES_START = [
+    "|player|p1|colress-gpt-test1|1|",
+    "|player|p2|colress-gpt-test2|2|",
+    "|teamsize|p1|4",
+    "|gametype|doubles",
+    "|gen|9",
+    "|tier|[Gen 9] Random Doubles Battle",
+    "|poke|p1|Kingambit, L79, M|",
+    "|switch|p1a: Kingambit|Kingambit, L79, M|274/274",
+    "|switch|p1b: Amoonguss|Amoonguss, L86, F|330/330",
+    "|switch|p2a: Garchomp|Garchomp, L77, M|100/100",
+    "|switch|p2b: Rotom|Rotom-Wash, L84|100/100",
+    "|turn|1",
+]
+
+
+@pytest.mark.parametrize("gen", GENS)
+def test_fixture_logs(gen):
+    messages = parse_fixture(gen)
+    state = BattleState.from_messages(messages)
+
+    assert state.ENDED
+    assert state.WINNER in ("colress-gpt-test1", "colress-gpt-test2")
+    assert state.TURN == max(m.NUMBER for m in messages if m.BMTYPE == BMType.turn)
+    assert set(state.SIDES) == {"p1", "p2"}
+
+    for side in state.SIDES.values():
+        assert len(side.ACTIVE) == 1
+        for pokemon in side.POKEMON.values():
+            assert pokemon.SPECIES is not None
+            assert pokemon.ACTIVE == (pokemon.IDENTITY in side.ACTIVE)
+            assert pokemon.fainted == (pokemon.CUR_HP == 0)
+            assert all(-6 <= boost <= 6 and boost != 0 for boost in pokemon.BOOSTS.values())
+
+    fainted = sum(pokemon.fainted for side in state.SIDES.values() for pokemon in side.POKEMON.values())
+    assert fainted == sum(m.BMTYPE == BMType.faint for m in messages)
+
+
+def test_lazy_messages_match():
+    lines = synthetic_battle(9, 7)
+
+    eager = BattleState.from_messages(BattleMessage.parse_many(lines))
+    lazy = BattleState.from_messages(BattleMessageParser(allow=[]).parse_many(lines))
+
+    assert _dump(eager) == _dump(lazy)
+
+
+def test_doubles_switches_and_boosts():
+    state = _state(
+        *DOUBLES_START,
+        "|-boost|p1a: Kingambit|atk|2",
+        "|-boost|p1a: Kingambit|atk|6",
+        "|-unboost|p2b: Rotom|spe|1",
+        "|-start|p1a: Kingambit|confusion",
+        "|-start|p2a: Garchomp|move: Leech Seed",
+        "|switch|p1a: Gholdengo|Gholdengo, L77|280/280",
+    )
+
+    p1 = state.SIDES["p1"]
+    assert state.GAMETYPE == "doubles"
+    assert state.GEN == 9
+    assert p1.USERNAME == "colress-gpt-test1"
+    assert p1.TEAM_SIZE == 4
+    assert len(p1.PREVIEW) == 1
+    assert p1.ACTIVE == ["GHOLDENGO", "AMOONGUSS"]
+
+    kingambit = p1.POKEMON["KINGAMBIT"]
+    assert not kingambit.ACTIVE
+    assert kingambit.BOOSTS == {}
+    assert kingambit.VOLATILES == set()
+
+    rotom = state.pokemon(PokemonIdentifier(IDENTITY="ROTOM", PLAYER="p2"))
+    assert rotom.BOOSTS == {PokeStat.speed: -1}
+    assert state.SIDES["p2"].POKEMON["GARCHOMP"].VOLATILES == {"LEECHSEED"}
+
+    state.apply(BattleMessage.from_message("|-boost|p1a: Gholdengo|spa|8"))
+    assert p1.POKEMON["GHOLDENGO"].BOOSTS == {PokeStat.special_attack: 6}
+    state.apply(BattleMessage.from_message("|-clearallboost"))
+    assert p1.POKEMON["GHOLDENGO"].BOOSTS == {}
+    assert rotom.BOOSTS == {}
+
+
+def test_hp_status_and_items():
+    state = _state(
+        *DOUBLES_START,
+        "|-damage|p1a: Kingambit|180/274 tox|[from] item: Life Orb",
+        "|-heal|p2a: Garchomp|75/100|[from] item: Leftovers",
+        "|-item|p2a: Garchomp|Leftovers",
+        "|-status|p2b: Rotom|par",
+        "|-enditem|p1b: Amoonguss|Sitrus Berry|[eat]",
+        "|-ability|p2a: Garchomp|Rough Skin",
+        "|-terastallize|p1a: Kingambit|Fairy",
+        "|move|p1a: Kingambit|Kowtow Cleave|p2a: Garchomp",
+        "|move|p1a: Kingambit|Kowtow Cleave|p2a: Garchomp",
+        "|move|p1a: Kingambit|Sucker Punch|p2a: Garchomp|[from]move: Sleep Talk",
+        "|-damage|p2b: Rotom|0 fnt",
+        "|faint|p2b: Rotom",
+    )
+
+    kingambit = state.SIDES["p1"].POKEMON["KINGAMBIT"]
+    assert (kingambit.CUR_HP, kingambit.MAX_HP, kingambit.STATUS) == (180, 274, DexStatus.STATUS_TOX)
+    assert kingambit.TERASTALLIZED == DexType.TYPE_FAIRY
+    assert kingambit.MOVES == {DexMove.MOVE_KOWTOWCLEAVE: 2}
+
+    garchomp = state.SIDES["p2"].POKEMON["GARCHOMP"]
+    assert (garchomp.CUR_HP, garchomp.MAX_HP) == (75, 100)
+    assert garchomp.ITEM == DexItem.ITEM_LEFTOVERS
+    assert garchomp.ABILITY is not None
+
+    assert state.SIDES["p1"].POKEMON["AMOONGUSS"].ITEM is None
+    rotom = state.SIDES["p2"].POKEMON["ROTOM"]
+    assert rotom.fainted
+    assert rotom.CUR_HP == 0
+
+    state.apply(BattleMessage.from_message("|-cureteam|p2a: Garchomp|[from] move: Aromatherapy"))
+    assert rotom.fainted
+
+
+def test_field_and_side_conditions():
+    state = _state(
+        *DOUBLES_START,
+        "|-weather|RainDance",
+        "|-fieldstart|move: Electric Terrain",
+        "|-fieldstart|move: Trick Room|[of] p1a: Kingambit",
+        "|-sidestart|p1: colress-gpt-test1|Spikes",
+        "|-sidestart|p1: colress-gpt-test1|Spikes",
+        "|-sidestart|p2: colress-gpt-test2|move: Reflect",
+    )
+
+    assert state.WEATHER == DexWeather.WEATHER_RAINDANCE
+    assert state.TERRAIN == "ELECTRICTERRAIN"
+    assert state.FIELDS == {"TRICKROOM"}
+    assert state.SIDES["p1"].CONDITIONS == {"SPIKES": 2}
+
+    state.apply_many(
+        BattleMessage.parse_many(
+            [
+                "|-swapsideconditions|",
+                "|-sideend|p2: colress-gpt-test2|Spikes",
+                "|-weather|none",
+                "|-fieldend|move: Electric Terrain",
+                "|-fieldend|move: Trick Room",
+            ]
+        )
+    )
+
+    assert state.SIDES["p1"].CONDITIONS == {"REFLECT": 1}
+    assert state.SIDES["p2"].CONDITIONS == {}
+    assert state.WEATHER is None
+    assert state.TERRAIN is None
+    assert state.FIELDS == set()
+
+
+def test_empty_effects_are_ignored():
+    state = _state(*DOUBLES_START, "|-fieldstart|move: Trick Room", "|-start|p1a: Kingambit|Leech Seed")
+    expected = _dump(state)
+
+    state.apply_many(
+        BattleMessage.parse_many(["|-fieldstart|", "|-fieldend|", "|-start|p1a: Kingambit|", "|-end|p1a: Kingambit|"])
+    )
+
+    assert _dump(state) == expected
+
+
+def test_unknown_and_unseen():
+    state = _state("|notarealmessage|", "|-boost|p1a: Kingambit|atk|1")
+
+    assert state.SIDES["p1"].POKEMON["KINGAMBIT"].BOOSTS == {PokeStat.attack: 1}
+    assert state.side("p2").POKEMON == {}
+    assert "p2" not in state.SIDES
+    assert state.pokemon(PokemonIdentifier(IDENTITY="GARCHOMP", PLAYER="p2")) is None
+
+
+def test_failed_lazy_messages_are_ignored():
+    lines = ["|switch|p1a: X|Notamon, L50|100/100", "|-damage|p1a: X|abc"]
+
+    state = _state(*DOUBLES_START)
+    expected = _dump(state)
+    for line in lines:
+        state.apply(LazyBattleMessage(line))
+    assert _dump(state) == expected
+
+    state.apply_many(LazyBattleMessage(line) for line in lines)
+    assert _dump(state) == expected
+
+
+def test_fork_is_independent():
+    lines = synthetic_battle(9, 11)
+    messages = BattleMessage.parse_many(lines)
+    half = len(messages) // 2
+
+    state = BattleState.from_messages(messages[:half])
+    before = _dump(state)
+
+    fork = state.fork()
+    assert _dump(fork) == before
+    assert fork.SIDES["p1"] is state.SIDES["p1"]
+
+    fork.apply_many(messages[half:])
+    assert _dump(state) == before
+    assert _dump(fork) == _dump(BattleState.from_messages(messages))
+
+    # Updating the original after the fork must not leak into the fork either
+    state.apply_many(messages[half:])
+    assert _dump(state) == _dump(fork)
+
+
+def test_fork_copies_only_what_changes():
+    state = _state(*DOUBLES_START)
+    fork = state.fork()
+
+    fork.apply(BattleMessage.from_message("|-damage|p2a: Garchomp|50/100"))
+
+    assert fork.SIDES["p1"] is state.SIDES["p1"]
+    assert fork.SIDES["p2"] is not state.SIDES["p2"]
+    assert fork.SIDES["p2"].POKEMON["ROTOM"] is state.SIDES["p2"].POKEMON["ROTOM"]
+    assert fork.SIDES["p2"].POKEMON["GARCHOMP"].CUR_HP == 50
+    assert state.SIDES["p2"].POKEMON["GARCHOMP"].CUR_HP == 100
+
+
+def test_snapshot_and_restore():
+    state = _state(*DOUBLES_START)
+    snapshot = state.snapshot()
+    before = _dump(state)
+
+    for _ in range(3):
+        state.apply_many(
+            BattleMessage.parse_many(
+                [
+                    "|-boost|p1a: Kingambit|atk|2",
+                    "|-start|p1a: Kingambit|confusion",
+                    "|-sidestart|p2: colress-gpt-test2|Spikes",
+                    "|-fieldstart|move: Trick Room",
+                    "|switch|p2a: Gholdengo|Gholdengo, L77|100/100",
+                    "|turn|2",
+                ]
+            )
+        )
+        assert _dump(state) != before
+
+        state.restore(snapshot)
+        assert _dump(state) == before
+        assert _dump(snapshot) == before
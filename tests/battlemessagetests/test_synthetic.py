@@ -0,0 +1,94 @@
+import pytest
+
+from poketypes.dex import DexPokemon
+from poketypes.showdown import (
+    BattleMessage,
+    BMType,
+    iter_battle_log,
+    iter_synthetic_log,
+    parse_corpus,
+    synthetic_battle,
+    write_synthetic_corpus,
+    write_synthetic_log,
+)
+
+GEN_MAX_SPECIES = {1: 151, 4: 493, 9: 1025}
+
+
+@pytest.mark.parametrize("gen", range(1, 10))
+def test_synthetic_battle_parses(gen):
+    for seed in range(5):
+        lines = synthetic_battle(gen, seed)
+
+        errors = []
+        messages = BattleMessage.parse_many(lines, errors=errors)
+
+        assert errors == []
+        assert messages[0].BMTYPE == BMType.init
+        assert messages[-1].BMTYPE in (BMType.win, BMType.tie)
+        assert any(m.BMTYPE == BMType.request for m in messages)
+        assert any(m.BMTYPE == BMType.move for m in messages)
+
+
+@pytest.mark.parametrize("gen", GEN_MAX_SPECIES)
+def test_synthetic_battle_species_match_gen(gen):
+    messages = BattleMessage.parse_many(synthetic_battle(gen, 0))
+
+    gen_messages = [m for m in messages if m.BMTYPE == BMType.gen]
+    assert gen_messages[0].GENNUM == gen
+
+    for m in messages:
+        if m.BMTYPE == BMType.switch:
+            assert 0 < m.SPECIES // 1000 <= GEN_MAX_SPECIES[gen]
+            assert m.SPECIES in DexPokemon.values()
+
+
+def test_synthetic_battle_seeded():
+    assert synthetic_battle(9, 42) == synthetic_battle(9, 42)
+    assert synthetic_battle(9, 42) != synthetic_battle(9, 43)
+
+
+def test_synthetic_battle_without_requests():
+    lines = synthetic_battle(9, 0, requests=False)
+
+    assert not any(line.startswith("|request|") for line in lines)
+
+
+def test_synthetic_battle_bad_gen():
+    with pytest.raises(ValueError):
+        synthetic_battle(10)
+
+    with pytest.raises(ValueError):
+        list(iter_synthetic_log(1000, gens=[0]))
+
+
+def test_iter_synthetic_log_target_size():
+    lines = list(iter_synthetic_log(200_000, gens=[7, 8], seed=1))
+
+    assert sum(len(line.encode("utf8")) + 1 for line in lines) >= 200_000
+    assert sum(line == "|init|battle" for line in lines) > 1
+    assert lines == list(iter_synthetic_log(200_000, gens=[7, 8], seed=1))
+
+
+@pytest.mark.parametrize("name", ["synthetic.log", "synthetic.log.gz"])
+def test_write_synthetic_log(tmp_path, name):
+    path = tmp_path / name
+    line_count = write_synthetic_log(path, 50_000, seed=3)
+
+    errors = []
+    messages = list(iter_battle_log(path, errors=errors))
+
+    assert len(messages) == line_count
+    assert errors == []
+
+
+def test_write_synthetic_corpus(tmp_path):
+    paths = write_synthetic_corpus(tmp_path, 4, gens=[5, 6], seed=7, compress=True)
+
+    assert len(paths) == 4
+    assert all(path.endswith(".log.gz") for path in paths)
+
+    report = parse_corpus(paths, workers=1)
+
+    assert report.FAILED_BATTLES == 0
+    assert report.ERROR_COUNTS == {}
@@ -0,0 +1,65 @@
+from poketypes.dex import DexItem
+from poketypes.showdown import BattleMessage, MessageTokens
+from poketypes.showdown.battlemessage import EffectType, PokemonIdentifier
+
+
+def test_tokens_split_args_and_tags():
+    tokens = MessageTokens.from_message("|-damage|p2a: Leavanny|180/281 tox|[from] item: Life Orb|[of] p1a: Sceptile")
+
+    assert tokens.ARGS == ["p2a: Leavanny", "180/281 tox"]
+    assert tokens.TAGS == {"from": "item: Life Orb", "of": "p1a: Sceptile"}
+
+
+def test_tokens_flag_tags():
+    tokens = MessageTokens.from_message("|move|p1a: Kangaskhan|Fake Out||[still]")
+
+    assert tokens.ARGS == ["p1a: Kangaskhan", "Fake Out", ""]
+    assert tokens.TAGS == {"still": ""}
+    assert tokens.arg(2) is None
+    assert tokens.arg(5) is None
+    assert tokens.first_tag() == "[still]"
+
+
+def test_tokens_effect():
+    tokens = MessageTokens.from_message("|-heal|p2a: Espeon|100/100|[from] drain|[of] p1a: Sceptile")
+    effect = tokens.effect("move")
+
+    assert effect.EFFECT_TYPE == EffectType.move
+    assert effect.EFFECT_NAME == "drain"
+    assert effect.EFFECT_SOURCE == PokemonIdentifier.from_string("p1a: Sceptile")
+
+    assert MessageTokens.from_message("|-heal|p2a: Espeon|100/100").effect() is None
+
+
+def test_tokens_free_text():
+    assert MessageTokens.from_message("|-message|[hi] there|a", parse_tags=False) == (["[hi] there", "a"], {})
+
+    # Bracketed text that isn't a lowercase tag name stays positional
+    assert MessageTokens.from_message("|tier|[Gen 9] Random Battle").ARGS == ["[Gen 9] Random Battle"]
+    assert BattleMessage.from_message("|tier|[Gen 9] Random Battle").FORMATNAME == "[Gen 9] Random Battle"
+
+
+def test_enditem_effect():
+    bm = BattleMessage.from_message("|-enditem|p1a: Sceptile|Air Balloon|[from] move: Knock Off|[of] p2a: Espeon")
+
+    assert bm.ITEM == DexItem.ITEM_AIRBALLOON
+    assert bm.EFFECT.EFFECT_TYPE == EffectType.move
+    assert bm.EFFECT.EFFECT_NAME == "Knock Off"
+    assert bm.EFFECT.EFFECT_SOURCE == PokemonIdentifier.from_string("p2a: Espeon")
+
+
+def test_ability_effect_source():
+    bm = BattleMessage.from_message("|-ability|p1a: Gardevoir|Swarm|[from] ability: Trace|[of] p2a: Leavanny")
+
+    assert bm.EFFECT.EFFECT_NAME == "Trace"
+    assert bm.EFFECT.EFFECT_SOURCE == PokemonIdentifier.from_string("p2a: Leavanny")
+
+
+def test_activate_secondary_effect():
+    def sec_effect(line):
+        return BattleMessage.from_message(line).EFFECT.SEC_EFFECT_NAME
+
+    assert sec_effect("|-activate|p1a: Iron Valiant|ability: Quark Drive|[fromitem]") == "[fromitem]"
+    assert sec_effect("|-activate|p2a: Espeon|ability: Mummy|Battle Armor|[of] p1a: Cofagrigus") == "Battle Armor"
+    assert sec_effect("|-activate|p2a: Espeon|item: Sitrus Berry|[consumed]") is None
+    assert sec_effect("|-activate|p2a: Espeon|move: Protect|[of] p1a: Sceptile") is None
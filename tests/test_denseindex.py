@@ -0,0 +1,109 @@
+import subprocess
+import sys
+
+import pytest
+
+from poketypes.dex import DexPokemon, DexType, dense_index, dense_index_version, denseindex
+from poketypes.dex.denseindex import build_dense_data, load_dense_data, require_numpy
+from poketypes.dex.dexdata import DEX_PREFIXES
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def dense_data(monkeypatch):
+    """Replace the loaded dense data for a test, clearing the dense indices built from it."""
+    monkeypatch.setattr(denseindex, "_dense_indices", {})
+
+    def replace(data):
+        monkeypatch.setattr(denseindex, "_dense_data", data)
+
+    return replace
+
+
+@pytest.mark.parametrize("dex_class", list(DEX_PREFIXES), ids=lambda d: d.DESCRIPTOR.name)
+def test_dense_index_covers_enum(dex_class):
+    index = dense_index(dex_class)
+
+    assert index.VERSION == dense_index_version()
+    assert set(index.IDS) == set(dex_class.values())
+    assert len(index) == len(set(dex_class.values()))
+    assert index.TO_DENSE[0] == 0
+    assert [index.TO_DENSE[value] for value in index.IDS] == list(range(len(index)))
+
+    ids = np.array(index.IDS, dtype=np.int64)
+    assert (index.to_dense(ids) == np.arange(len(index))).all()
+    assert (index.from_dense(np.arange(len(index))) == ids).all()
+
+
+def test_dense_data_is_loaded_lazily():
+    # A fresh interpreter, since this one has long since loaded the dense data
+    check = "import poketypes.dex, poketypes.showdown; print(poketypes.dex.denseindex._dense_data is None)"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "True"
+    assert dense_index_version() == load_dense_data()["version"]
+
+
+def test_dense_data_is_up_to_date():
+    assert build_dense_data(load_dense_data()) is load_dense_data()
+
+
+def test_vectorized_lookups():
+    index = dense_index(DexPokemon)
+    ids = np.array([[DexPokemon.POKEMON_MAGIKARP, 0], [DexPokemon.POKEMON_SCIZORMEGA, 123456789]])
+
+    dense = index.to_dense(ids)
+    assert dense.shape == (2, 2)
+    assert dense.dtype == np.int32
+    assert dense[0, 0] == index.TO_DENSE[DexPokemon.POKEMON_MAGIKARP]
+    assert dense[1, 1] == 0
+
+    assert list(index.from_dense(dense[:, 0])) == [DexPokemon.POKEMON_MAGIKARP, DexPokemon.POKEMON_SCIZORMEGA]
+    with pytest.raises(IndexError):
+        index.from_dense([len(index)])
+
+
+def test_require_numpy(monkeypatch):
+    assert require_numpy("testing") is np
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="required for testing.*poketypes\\[ml\\]"):
+        require_numpy("testing")
+
+
+def test_new_values_are_appended(dense_data):
+    current = load_dense_data()
+    old_types = [value for value in current["enums"]["DexType"]["ids"] if value != DexType.TYPE_FAIRY] + [404]
+
+    previous = {
+        "version": 1,
+        "enums": {
+            name: {"ids": old_types if name == "DexType" else order["ids"], "sizes": [len(order["ids"])]}
+            for name, order in current["enums"].items()
+            if name != "DexWeather"
+        },
+    }
+    previous["enums"]["DexType"]["sizes"] = [len(old_types)]
+
+    data = build_dense_data(previous)
+    assert data["version"] == 2
+    assert data["enums"]["DexType"]["ids"] == old_types + [DexType.TYPE_FAIRY]
+    assert data["enums"]["DexType"]["sizes"] == [len(old_types), len(old_types) + 1]
+    assert data["enums"]["DexWeather"]["sizes"][0] == 0
+    assert data["enums"]["DexPokemon"] == {"ids": current["enums"]["DexPokemon"]["ids"], "sizes": [1410, 1410]}
+    assert build_dense_data(data) is data
+
+    dense_data(data)
+    latest, trained = dense_index(DexType), dense_index(DexType, version=1)
+
+    assert latest.VERSION == 2
+    assert latest.TO_DENSE[DexType.TYPE_FAIRY] == len(old_types)
+    assert DexType.TYPE_FAIRY not in trained.TO_DENSE
+    assert list(trained.to_dense([DexType.TYPE_FAIRY, DexType.TYPE_FIRE])) == [0, latest.TO_DENSE[DexType.TYPE_FIRE]]
+    assert dense_index(DexType, version=1) is trained
+
+    with pytest.raises(ValueError):
+        dense_index(DexType, version=3)
+    with pytest.raises(ValueError):
+        dense_index(DexType, version=0)
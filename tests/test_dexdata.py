@@ -0,0 +1,123 @@
+import random
+import unicodedata
+
+import pytest
+
+from poketypes.dex import (
+    DexAbility,
+    DexGen,
+    DexItem,
+    DexMove,
+    DexPokemon,
+    DexStat,
+    DexStatus,
+    DexType,
+    cast2dex,
+    cast2dex_many,
+    clean_name,
+    dex_lookup,
+)
+from poketypes.dex.dexdata import DEX_PREFIXES
+
+
+@pytest.mark.parametrize("dex_class", list(DEX_PREFIXES), ids=lambda d: d.DESCRIPTOR.name)
+def test_cast2dex_matches_enum(dex_class):
+    prefix = DEX_PREFIXES[dex_class]
+
+    for name, value in dex_class.items():
+        assert cast2dex(name.removeprefix(prefix), dex_class) == value == dex_class.Value(name)
+
+
+@pytest.mark.parametrize(
+    "name,dex_class,expected",
+    [
+        ("Scizor-Mega", DexPokemon, DexPokemon.POKEMON_SCIZORMEGA),
+        ("Magikarp", DexPokemon, DexPokemon.POKEMON_MAGIKARP),
+        ("U-turn", DexMove, DexMove.MOVE_UTURN),
+        ("King's Rock", DexItem, DexItem.ITEM_KINGSROCK),
+        ("Intimidate", DexAbility, DexAbility.ABILITY_INTIMIDATE),
+        ("tox", DexStatus, DexStatus.STATUS_TOX),
+        ("Fire", DexType, DexType.TYPE_FIRE),
+        ("spa", DexStat, DexStat.STAT_SPA),
+        ("9", DexGen, DexGen.GEN_9),
+    ],
+)
+def test_cast2dex_display_names(name, dex_class, expected):
+    assert cast2dex(name, dex_class) == expected
+
+
+def test_cast2dex_empty():
+    assert cast2dex(None, DexPokemon) is None
+    assert cast2dex("", DexPokemon) is None
+
+
+def test_cast2dex_unknown():
+    with pytest.raises(ValueError, match="POKEMON_NOTAPOKEMON"):
+        cast2dex("Not a Pokemon", DexPokemon)
+
+    # Failed casts are not cached, so they keep failing
+    with pytest.raises(ValueError):
+        cast2dex("Not a Pokemon", DexPokemon)
+
+
+def test_cast2dex_many():
+    names = ["Scizor-Mega", None, "Magikarp", "Scizor-Mega"]
+
+    assert cast2dex_many(names, DexPokemon) == [cast2dex(name, DexPokemon) for name in names]
+    assert cast2dex_many(iter(["U-turn"]), DexMove) == [DexMove.MOVE_UTURN]
+
+
+def test_dex_lookup_shared():
+    assert dex_lookup(DexPokemon) is dex_lookup(DexPokemon)
+    assert dex_lookup(DexPokemon)["SCIZORMEGA"] == DexPokemon.POKEMON_SCIZORMEGA
+
+
+def legacy_clean_name(name):
+    """The chained-replace clean_name that the translation table version must match exactly."""
+    if name is None or name == "":
+        return None
+
+    return (
+        unicodedata.normalize(
+            "NFKD",
+            name.upper()
+            .replace("-", "")
+            .replace("’", "")
+            .replace("'", "")
+            .replace(" ", "")
+            .replace("*", "")
+            .replace(":", "")
+            .replace("%", "")
+            .replace(".", "")
+            .replace(")", "")
+            .replace("(", ""),
+        )
+        .encode("ASCII", "ignore")
+        .decode("ASCII")
+    )
+
+
+@pytest.mark.parametrize("dex_class", list(DEX_PREFIXES), ids=lambda d: d.DESCRIPTOR.name)
+def test_clean_name_matches_legacy_on_enums(dex_class):
+    for name in dex_class.keys():
+        entry = name.removeprefix(DEX_PREFIXES[dex_class])
+
+        for variant in (name, entry, entry.lower(), entry.title(), entry.replace("_", " "), f"{entry.title()}-Mega"):
+            assert clean_name(variant) == legacy_clean_name(variant), variant
+
+
+@pytest.mark.parametrize(
+    "name",
+    [None, "", "Flabébé", "Farfetch’d", "Mr. Mime", "Type: Null", "Zygarde-10%", "Porygon-Z", "(Dynamax)", "Ｆｕｌｌ"],
+)
+def test_clean_name_matches_legacy_on_display_names(name):
+    assert clean_name(name) == legacy_clean_name(name)
+
+
+def test_clean_name_matches_legacy_on_random_strings():
+    rng = random.Random(0)
+    alphabet = "abcXYZ09 -’'*:%.)(_éÉüñßıİﬁ０ー－"
+
+    for _ in range(5000):
+        name = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        assert clean_name(name) == legacy_clean_name(name), name
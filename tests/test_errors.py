@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from poketypes.showdown import BattleMessage, Message, ParseErrorSink, get_error_sink, set_error_sink
+from poketypes.showdown.errors import OVERFLOW_KEY
+
+
+@pytest.fixture
+def sink():
+    sink = ParseErrorSink(max_examples=2, max_signatures=3)
+    previous = set_error_sink(sink)
+    yield sink
+    set_error_sink(previous)
+
+
+def test_failures_are_not_printed(sink, capsys):
+    BattleMessage.from_message("|notarealmessage|p1a: Sceptile")
+    BattleMessage.from_message("|turn|two")
+    Message.from_message("|notarealmessage|hi")
+
+    assert capsys.readouterr() == ("", "")
+    assert sink.counts == {
+        ("notarealmessage", "UNKNOWN_BMTYPE"): 1,
+        ("turn", "PARSE_ERROR"): 1,
+        ("notarealmessage", "UNKNOWN_MTYPE"): 1,
+    }
+
+
+def test_sink_counts_and_samples(sink):
+    for turn in ["one", "two", "three"]:
+        BattleMessage.from_message(f"|turn|{turn}")
+
+    assert sink.counts[("turn", "PARSE_ERROR")] == 3
+    assert sink.examples[("turn", "PARSE_ERROR")] == ["|turn|one", "|turn|two"]
+    assert sink.total == 3
+
+    sink.clear()
+    assert sink.total == 0
+
+
+def test_sink_logs_once_per_signature(sink, caplog):
+    with caplog.at_level(logging.WARNING, logger="poketypes"):
+        for _ in range(10):
+            BattleMessage.from_message("|turn|two")
+            BattleMessage.from_message("|notarealmessage|")
+
+    assert len(caplog.records) == 2
+    assert "PARSE_ERROR" in caplog.records[0].getMessage()
+
+
+def test_sink_bounds_signatures(sink):
+    for key in range(5):
+        BattleMessage.from_message(f"|notarealmessage{key}|")
+
+    assert len(sink.counts) == 4
+    assert sink.counts[(OVERFLOW_KEY, "UNKNOWN_BMTYPE")] == 2
+
+
+def test_batch_errors_bypass_sink(sink):
+    errors = []
+    BattleMessage.parse_many(["|turn|two"], errors=errors)
+
+    assert len(errors) == 1
+    assert sink.total == 0
+
+    BattleMessage.parse_many(["|turn|two"])
+    assert sink.total == 1
+
+
+def test_default_sink():
+    assert isinstance(get_error_sink(), ParseErrorSink)
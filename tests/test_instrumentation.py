@@ -0,0 +1,71 @@
+import pytest
+
+from poketypes.showdown import (
+    BattleMessage,
+    BattleMessageParser,
+    BMType,
+    Message,
+    ParseStats,
+    disable_parse_stats,
+    enable_parse_stats,
+    get_parse_stats,
+)
+
+
+@pytest.fixture
+def stats():
+    stats = enable_parse_stats(ParseStats(window=4))
+    yield stats
+    disable_parse_stats()
+
+
+def test_disabled_by_default():
+    assert get_parse_stats() is None
+
+
+def test_battle_message_stats(stats):
+    for turn in range(10):
+        BattleMessage.from_message(f"|turn|{turn}")
+    BattleMessage.from_message("|turn|two")
+    BattleMessage.parse_many(["|-damage|p2a: Espeon|45/100", "|notarealmessage|"])
+
+    snapshot = stats.snapshot()["BattleMessage"]
+
+    assert snapshot["turn"]["calls"] == 11
+    assert snapshot["turn"]["failures"] == 1
+    assert snapshot["-damage"]["calls"] == 1
+    assert snapshot["notarealmessage"]["failures"] == 1
+
+    turn = snapshot["turn"]
+    assert 0 < turn["p50_us"] <= turn["p90_us"] <= turn["p99_us"] <= turn["max_us"]
+    assert turn["total_s"] > 0
+    assert turn["lines_per_s"] == pytest.approx(turn["calls"] / turn["total_s"])
+
+
+def test_message_stats(stats):
+    Message.from_message("|challstr|4|abc")
+    Message.from_message("|notarealmessage|")
+
+    snapshot = stats.snapshot()["Message"]
+
+    assert snapshot["challstr"]["calls"] == 1
+    assert snapshot["challstr"]["failures"] == 0
+    assert snapshot["notarealmessage"]["failures"] == 1
+
+
+def test_parser_stats_only_selected(stats):
+    BattleMessageParser(allow=[BMType.turn]).parse_many(["|turn|2", "|-damage|p2a: Espeon|45/100"])
+
+    assert list(stats.snapshot()["BattleMessage"]) == ["turn"]
+
+
+def test_disable(stats):
+    assert disable_parse_stats() is stats
+
+    BattleMessage.from_message("|turn|2")
+    assert stats.snapshot() == {}
+
+    enable_parse_stats(stats)
+    BattleMessage.from_message("|turn|2")
+    stats.clear()
+    assert stats.snapshot() == {}
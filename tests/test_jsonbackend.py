@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from poketypes.showdown import BattleMessage, Message, get_json_backend, set_json_backend
+from poketypes.showdown.jsonbackend import JSON_BACKENDS
+
+REQUEST = (
+    '|request|{"wait":true,"side":{"name":"colress-gpt-test1","id":"p1","pokemon":[{"ident":"p1: Kingambit",'
+    '"details":"Kingambit, L79, M","condition":"274/274","active":true,"stats":{"atk":258,"def":218,"spa":148,'
+    '"spd":170,"spe":123},"moves":["swordsdance","kowtowcleave","ironhead","suckerpunch"],'
+    '"baseAbility":"supremeoverlord",'
+    '"item":"leftovers","pokeball":"pokeball","ability":"supremeoverlord","commanding":false,"reviving":false,'
+    '"teraType":"Dark","terastallized":""}]}}'
+)
+
+
+@pytest.fixture
+def restore_backend():
+    previous = get_json_backend()
+    yield
+    set_json_backend(previous if previous != "custom" else None)
+
+
+def test_default_backend():
+    assert get_json_backend() in JSON_BACKENDS
+
+
+def test_set_json_backend(restore_backend):
+    expected = BattleMessage.from_message(REQUEST)
+
+    previous = set_json_backend("json")
+    assert previous in JSON_BACKENDS
+    assert get_json_backend() == "json"
+    assert BattleMessage.from_message(REQUEST) == expected
+
+    calls = []
+
+    def loads(payload):
+        calls.append(payload)
+        return json.loads(payload)
+
+    assert set_json_backend(loads) == "json"
+    assert get_json_backend() == "custom"
+    assert BattleMessage.from_message(REQUEST) == expected
+    groups = Message.from_message('|customgroups|[{"symbol":"+","name":"Voice","type":"normal"}]').CUSTOM_GROUPS
+    assert groups[0].NAME == "Voice"
+    assert len(calls) == 2
+
+    set_json_backend()
+    assert get_json_backend() == previous
+
+
+def test_restore_custom_json_backend(restore_backend):
+    def loads(payload):
+        return json.loads(payload)
+
+    set_json_backend(loads)
+    previous = set_json_backend("json")
+    assert previous is loads
+
+    assert set_json_backend(previous) == "json"
+    assert get_json_backend() == "custom"
+    assert set_json_backend("json") is loads
+
+
+def test_set_unknown_json_backend(restore_backend):
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
@@ -0,0 +1,184 @@
+import json
+
+import pytest
+
+from poketypes.dex import (
+    POKEDEX,
+    DexAbility,
+    DexItem,
+    DexMove,
+    DexMoveCategory,
+    DexMoveTarget,
+    DexPokemon,
+    DexStat,
+    DexType,
+    Pokedex,
+    PokedexGen,
+)
+
+POKEDEX_DATA = {
+    "magikarp": {
+        "num": 129,
+        "name": "Magikarp",
+        "types": ["Water"],
+        "baseStats": {"hp": 20, "atk": 10, "def": 55, "spa": 15, "spd": 20, "spe": 80},
+        "abilities": {"0": "Swift Swim", "H": "Rattled"},
+    },
+    "gastrodon": {
+        "num": 423,
+        "name": "Gastrodon",
+        "types": ["Water", "Ground"],
+        "baseStats": {"hp": 111, "atk": 83, "def": 68, "spa": 92, "spd": 82, "spe": 39},
+        "abilities": {"0": "Sticky Hold", "1": "Storm Drain", "H": "Sand Force"},
+        "cosmeticFormes": ["Gastrodon-East"],
+    },
+    "missingno": {"num": 0, "name": "MissingNo.", "types": ["Bird"], "baseStats": {}},
+}
+
+MOVES_DATA = {
+    "uturn": {
+        "name": "U-turn",
+        "accuracy": 100,
+        "basePower": 70,
+        "category": "Physical",
+        "pp": 20,
+        "priority": 0,
+        "flags": {"contact": 1, "protect": 1, "mirror": 1, "metronome": 1},
+        "selfSwitch": True,
+        "target": "normal",
+        "type": "Bug",
+    },
+    "swordsdance": {
+        "name": "Swords Dance",
+        "accuracy": True,
+        "basePower": 0,
+        "category": "Status",
+        "pp": 20,
+        "priority": 0,
+        "flags": {"snatch": 1, "dance": 1},
+        "boosts": {"atk": 2},
+        "target": "self",
+        "type": "Normal",
+    },
+    "bonemerang": {
+        "name": "Bonemerang",
+        "accuracy": 90,
+        "basePower": 50,
+        "category": "Physical",
+        "pp": 10,
+        "priority": 0,
+        "flags": {"protect": 1},
+        "multihit": 2,
+        "target": "normal",
+        "type": "Ground",
+    },
+}
+
+ITEMS_DATA = {
+    "leftovers": {"name": "Leftovers", "fling": {"basePower": 10}},
+    "sitrusberry": {"name": "Sitrus Berry", "isBerry": True, "naturalGift": {"basePower": 80, "type": "Psychic"}},
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Write a small gen 9 data set, with no data for any other gen."""
+    for table, data in (("pokedex", POKEDEX_DATA), ("moves", MOVES_DATA), ("items", ITEMS_DATA)):
+        (tmp_path / f"gen9_{table}.json").write_text(json.dumps(data), encoding="utf8")
+
+    return tmp_path
+
+
+def test_pokemon(data_dir):
+    magikarp = Pokedex(data_dir).Gen(9).Pokemon(DexPokemon.POKEMON_MAGIKARP)
+
+    assert magikarp.name == "Magikarp"
+    assert magikarp.id == magikarp.base_id == DexPokemon.POKEMON_MAGIKARP
+    assert magikarp.types == [DexType.TYPE_WATER]
+    assert magikarp.base_stats.spe_stat == 80
+    assert magikarp.abilities == [DexAbility.ABILITY_SWIFTSWIM, DexAbility.ABILITY_RATTLED]
+
+
+def test_cosmetic_formes(data_dir):
+    east = Pokedex(data_dir).Gen(9).Pokemon(DexPokemon.POKEMON_GASTRODONEAST)
+
+    assert east.name == "Gastrodon-East"
+    assert east.base_name == "Gastrodon"
+    assert east.base_id == DexPokemon.POKEMON_GASTRODON
+    assert east.types == [DexType.TYPE_WATER, DexType.TYPE_GROUND]
+
+
+def test_moves(data_dir):
+    gen = Pokedex(data_dir).Gen(9)
+
+    uturn = gen.Move(DexMove.MOVE_UTURN)
+    assert uturn.base_power == 70
+    assert uturn.accuracy == 100
+    assert uturn.category == DexMoveCategory.MOVECATEGORY_PHYSICAL
+    assert uturn.target == DexMoveTarget.MOVETARGET_NORMAL
+    assert uturn.mtype == DexType.TYPE_BUG
+    assert uturn.selfswitch_standard and not uturn.selfswitch_volatile
+    assert uturn.flag_contact and uturn.flag_protect and not uturn.flag_sound
+
+    swords_dance = gen.Move(DexMove.MOVE_SWORDSDANCE)
+    assert swords_dance.accuracy is None
+    assert swords_dance.boosts == {DexStat.STAT_ATTACK: 2}
+    assert swords_dance.flag_dance
+
+    assert gen.Move(DexMove.MOVE_BONEMERANG).multihit == (2, 2)
+
+
+def test_items(data_dir):
+    gen = Pokedex(data_dir).Gen(9)
+
+    assert gen.Item(DexItem.ITEM_LEFTOVERS).fling_basepower == 10
+
+    sitrus = gen.Item(DexItem.ITEM_SITRUSBERRY)
+    assert sitrus.is_berry
+    assert sitrus.naturalgift_base_power == 80
+    assert sitrus.naturalgift_type == DexType.TYPE_PSYCHIC
+
+
+def test_lazy_loading(data_dir):
+    pokedex = Pokedex(data_dir)
+    gen = pokedex.Gen(9)
+
+    # Only the looked up table is read, so the other tables' files aren't needed yet
+    (data_dir / "gen9_moves.json").unlink()
+    assert gen.Pokemon(DexPokemon.POKEMON_MAGIKARP).name == "Magikarp"
+    assert gen.Item(DexItem.ITEM_LEFTOVERS).name == "Leftovers"
+    with pytest.raises(FileNotFoundError):
+        gen.Move(DexMove.MOVE_UTURN)
+
+    # Other gens have no data at all, which only matters once they are looked up
+    assert pokedex.Gen(1).GEN == 1
+    with pytest.raises(FileNotFoundError):
+        pokedex.Gen(1).Pokemon(DexPokemon.POKEMON_MAGIKARP)
+
+
+def test_caching(data_dir):
+    pokedex = Pokedex(data_dir)
+    magikarp = pokedex.Gen(9).Pokemon(DexPokemon.POKEMON_MAGIKARP)
+
+    assert pokedex.Gen(9) is pokedex.Gen()
+    assert pokedex.Gen(9).Pokemon(DexPokemon.POKEMON_MAGIKARP) is magikarp
+
+    # Cached models are served without reading the data again
+    (data_dir / "gen9_pokedex.json").unlink()
+    assert pokedex.Gen(9).Pokemon(DexPokemon.POKEMON_MAGIKARP) is magikarp
+
+
+def test_unknown_lookups(data_dir):
+    pokedex = Pokedex(data_dir)
+
+    with pytest.raises(ValueError):
+        pokedex.Gen(9).Pokemon(DexPokemon.POKEMON_PIKACHU)
+    with pytest.raises(ValueError):
+        pokedex.Gen(10)
+    with pytest.raises(ValueError):
+        pokedex.Gen(0)
+
+
+def test_default_pokedex():
+    assert isinstance(POKEDEX.Gen(5), PokedexGen)
+    assert POKEDEX.Gen(5).GEN == 5